@@ -832,6 +832,7 @@ def get_default_crm_config() -> dict[str, Any]:
         "enable_api": True,
         "deals_per_page": 25,
         "contacts_per_page": 50,
+        "max_page_size": 100,
         "default_pipeline_stages": [
             "Prospecting",
             "Negotiation",
@@ -876,6 +877,11 @@ def configure_crm_module(
             type=int,
             default=int(defaults["contacts_per_page"]),
         ),
+        "max_page_size": click.prompt(
+            "Maximum API page size",
+            type=int,
+            default=int(defaults["max_page_size"]),
+        ),
         "default_pipeline_stages": list(defaults["default_pipeline_stages"]),
     }
 
@@ -986,6 +992,7 @@ def _get_crm_settings_addition(config: dict[str, Any]) -> str:
 # CRM Module Settings
 CRM_DEALS_PER_PAGE = {config["deals_per_page"]}
 CRM_CONTACTS_PER_PAGE = {config["contacts_per_page"]}
+CRM_MAX_PAGE_SIZE = {config.get("max_page_size", 100)}
 CRM_ENABLE_API = {config["enable_api"]}
 """
     if config["enable_api"]:
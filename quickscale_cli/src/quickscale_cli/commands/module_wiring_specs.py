@@ -153,6 +153,7 @@ def _crm_wiring(options: Mapping[str, Any]) -> ModuleWiringSpec:
     settings: dict[str, Any] = {
         "CRM_DEALS_PER_PAGE": int(options.get("deals_per_page", 25)),
         "CRM_CONTACTS_PER_PAGE": int(options.get("contacts_per_page", 50)),
+        "CRM_MAX_PAGE_SIZE": int(options.get("max_page_size", 100)),
         "CRM_ENABLE_API": enable_api,
     }
 
@@ -291,6 +292,7 @@ def _storage_wiring(options: Mapping[str, Any]) -> ModuleWiringSpec:
     return ModuleWiringSpec(
         apps=("quickscale_modules_storage",),
         settings=settings,
+        url_includes=(("storage/", "quickscale_modules_storage.urls"),),
     )
 
 
@@ -586,6 +586,9 @@ class TestModuleWiringSpecs:
         assert settings["QUICKSCALE_STORAGE_BACKEND"] == "local"
         assert settings["MEDIA_URL"] == "/media/"
         assert "STORAGES" not in settings
+        assert specs["storage"].url_includes == (
+            ("storage/", "quickscale_modules_storage.urls"),
+        )
 
     def test_storage_wiring_s3_sets_s3_backend(self):
         """Storage wiring should configure S3-compatible backend in cloud mode."""
@@ -1480,6 +1483,7 @@ class TestCRMModuleConfig:
         assert config["enable_api"] is True
         assert config["deals_per_page"] == 25
         assert config["contacts_per_page"] == 50
+        assert config["max_page_size"] == 100
 
     def test_configure_crm_non_interactive(self):
         """Test non-interactive CRM configuration"""
@@ -1493,12 +1497,13 @@ class TestCRMModuleConfig:
     def test_configure_crm_interactive(self, mock_confirm, mock_prompt):
         """Test interactive CRM configuration"""
         mock_confirm.return_value = False
-        mock_prompt.side_effect = [30, 100]
+        mock_prompt.side_effect = [30, 100, 200]
 
         config = configure_crm_module(non_interactive=False)
         assert config["enable_api"] is False
         assert config["deals_per_page"] == 30
         assert config["contacts_per_page"] == 100
+        assert config["max_page_size"] == 200
 
     def test_crm_in_module_configurators(self):
         """Test CRM is registered in MODULE_CONFIGURATORS"""
@@ -1621,6 +1626,7 @@ class TestApplyCRMConfiguration:
         assert "quickscale_modules_crm" in settings
         assert "'CRM_DEALS_PER_PAGE': 25" in settings
         assert "'CRM_CONTACTS_PER_PAGE': 50" in settings
+        assert "'CRM_MAX_PAGE_SIZE': 100" in settings
         assert "'CRM_ENABLE_API': True" in settings
         assert "REST_FRAMEWORK" in settings
 
@@ -5,7 +5,14 @@ from django.contrib import admin
 from django.contrib.auth import get_user_model
 from markdownx.admin import MarkdownxModelAdmin
 
-from .models import AuthorProfile, BlogMediaAsset, Category, Post, Tag
+from .models import (
+    AuthorProfile,
+    BlogApiToken,
+    BlogMediaAsset,
+    Category,
+    Post,
+    Tag,
+)
 
 
 class PostAdminForm(forms.ModelForm):
@@ -72,6 +79,22 @@ class BlogMediaAssetAdmin(admin.ModelAdmin):
     readonly_fields = ["width", "height", "created_at"]
 
 
+@admin.register(BlogApiToken)
+class BlogApiTokenAdmin(admin.ModelAdmin):
+    """Admin for revoking blog API tokens (issue them with blog_issue_api_token)"""
+
+    list_display = ["name", "user", "is_active", "expires_at", "created_at"]
+    list_filter = ["is_active"]
+    list_editable = ["is_active"]
+    search_fields = ["name", "user__username"]
+    raw_id_fields = ["user"]
+    readonly_fields = ["token_hash", "created_at"]
+
+    def has_add_permission(self, request) -> bool:  # type: ignore[no-untyped-def]
+        """Tokens are issued from the command line so the secret is shown once"""
+        return False
+
+
 @admin.register(Post)
 class PostAdmin(MarkdownxModelAdmin):
     """Admin for blog posts with Markdown support"""
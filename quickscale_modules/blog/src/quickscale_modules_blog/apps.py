@@ -13,5 +13,4 @@ class QuickscaleBlogConfig(AppConfig):
 
     def ready(self) -> None:
         """Import signal handlers when app is ready"""
-        # No signals needed for blog module yet
-        pass
+        import quickscale_modules_blog.signals  # noqa: F401
@@ -0,0 +1,116 @@
+"""Generation-versioned caching for QuickScale blog list pages"""
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from functools import cached_property
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.paginator import Paginator
+from django.utils import timezone
+
+DEFAULT_BLOG_CACHE_ALIAS = "default"
+DEFAULT_BLOG_LIST_CACHE_TIMEOUT = 60 * 60
+_GENERATION_KEY = "quickscale:blog:generation"
+_GENERATION_CHANGED_AT_KEY = "quickscale:blog:generation:changed_at"
+
+T = TypeVar("T")
+
+
+def get_blog_cache_alias() -> str:
+    """Return the cache alias used for blog list caching."""
+    return str(getattr(settings, "BLOG_CACHE_ALIAS", DEFAULT_BLOG_CACHE_ALIAS))
+
+
+def get_blog_cache() -> BaseCache:
+    """Return the cache backend used for blog list caching."""
+    return caches[get_blog_cache_alias()]
+
+
+def get_list_cache_timeout() -> int:
+    """Return the list cache timeout in seconds; 0 disables list caching.
+
+    Entries are keyed by the content generation, so the timeout only bounds
+    how long superseded entries occupy the cache.
+    """
+    return int(
+        getattr(settings, "BLOG_LIST_CACHE_TIMEOUT", DEFAULT_BLOG_LIST_CACHE_TIMEOUT)
+    )
+
+
+def get_content_generation() -> int:
+    """Return the current blog content generation.
+
+    A missing counter (cold or evicted cache) is seeded from the clock so it
+    never repeats a generation that earlier cache entries were stored under.
+    """
+    cache = get_blog_cache()
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, time.time_ns() // 1000, timeout=None)
+        generation = cache.get(_GENERATION_KEY, 0)
+    return int(generation)
+
+
+def get_content_changed_at() -> datetime:
+    """Return when the blog content generation last advanced.
+
+    A missing timestamp is seeded with the current time, so content changed
+    before the cache was cleared is never reported as older than it is.
+    """
+    cache = get_blog_cache()
+    changed_at = cache.get(_GENERATION_CHANGED_AT_KEY)
+    if changed_at is None:
+        cache.add(_GENERATION_CHANGED_AT_KEY, timezone.now(), timeout=None)
+        changed_at = cache.get(_GENERATION_CHANGED_AT_KEY) or timezone.now()
+    return changed_at
+
+
+def bump_content_generation() -> int:
+    """Invalidate every cached list page by advancing the content generation."""
+    cache = get_blog_cache()
+    try:
+        generation = int(cache.incr(_GENERATION_KEY))
+    except ValueError:
+        get_content_generation()
+        generation = int(cache.incr(_GENERATION_KEY))
+    cache.set(_GENERATION_CHANGED_AT_KEY, timezone.now(), timeout=None)
+    return generation
+
+
+def build_list_cache_key(*parts: Any) -> str:
+    """Return a list cache key scoped to the current content generation."""
+    scope = ":".join(str(part) for part in parts)
+    return f"quickscale:blog:list:{get_content_generation()}:{scope}"
+
+
+def get_or_set_list_value(key: str, loader: Callable[[], T]) -> T:
+    """Return a cached list value, loading and storing it on a miss."""
+    timeout = get_list_cache_timeout()
+    if timeout <= 0:
+        return loader()
+
+    cache = get_blog_cache()
+    value = cache.get(key)
+    if value is None:
+        value = loader()
+        cache.set(key, value, timeout)
+    return value
+
+
+class GenerationCachedPaginator(Paginator):
+    """Paginator whose ``COUNT(*)`` is cached under a generation-scoped key"""
+
+    def __init__(self, *args: Any, count_cache_key: str = "", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self) -> int:
+        """Return the total number of objects, cached when a key is set."""
+        parent = super()
+        if not self.count_cache_key:
+            return parent.count
+        return get_or_set_list_value(self.count_cache_key, lambda: parent.count)
@@ -0,0 +1,84 @@
+"""Conditional GET validators for QuickScale blog pages and feeds
+
+Validators are computed before the view runs so that a matching
+``If-None-Match`` or ``If-Modified-Since`` short-circuits to ``304 Not
+Modified`` without loading posts or rendering templates. Entity tags embed the
+blog content generation, which advances on every Post, Category or Tag change.
+Timestamps are the later of ``updated_at`` and the time the generation last
+advanced, because tag and category changes do not touch ``updated_at`` and
+an ``If-Modified-Since``-only client would otherwise keep a stale page. Both
+are cached under the current generation, so a warm revalidation costs cache
+reads only.
+"""
+
+import hashlib
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Max, QuerySet
+from django.http import HttpRequest
+
+from .caching import (
+    build_list_cache_key,
+    get_content_changed_at,
+    get_content_generation,
+    get_or_set_list_value,
+)
+from .models import Post
+
+
+def build_etag(*parts: Any) -> str:
+    """Return a strong, quoted entity tag for the current content generation."""
+    scope = ":".join(str(part) for part in (get_content_generation(), *parts))
+    return '"{}"'.format(hashlib.sha256(scope.encode("utf-8")).hexdigest()[:32])
+
+
+def _with_content_change(last_modified: datetime | None) -> datetime | None:
+    """Return ``last_modified`` moved up to the latest content generation change."""
+    if last_modified is None:
+        return None
+    return max(last_modified, get_content_changed_at())
+
+
+def get_post_last_modified(slug: str) -> datetime | None:
+    """Return when the published post at ``slug`` or its related content changed."""
+    return _with_content_change(
+        get_or_set_list_value(
+            build_list_cache_key("modified", "post", slug),
+            lambda: (
+                Post.objects.filter(status="published", slug=slug)
+                .values_list("updated_at", flat=True)
+                .first()
+            ),
+        )
+    )
+
+
+def get_queryset_last_modified(
+    scope: str, queryset_factory: Callable[[], QuerySet]
+) -> datetime | None:
+    """Return when a queryset's newest item or related content changed."""
+    return _with_content_change(
+        get_or_set_list_value(
+            build_list_cache_key("modified", scope),
+            lambda: queryset_factory().aggregate(last_modified=Max("updated_at"))[
+                "last_modified"
+            ],
+        )
+    )
+
+
+def post_detail_etag(request: HttpRequest, slug: str, **kwargs: Any) -> str | None:
+    """Return the entity tag for a post detail page."""
+    last_modified = get_post_last_modified(slug)
+    if last_modified is None:
+        return None
+    return build_etag("post", slug, last_modified.isoformat())
+
+
+def post_detail_last_modified(
+    request: HttpRequest, slug: str, **kwargs: Any
+) -> datetime | None:
+    """Return the ``Last-Modified`` timestamp for a post detail page."""
+    return get_post_last_modified(slug)
@@ -1,9 +1,15 @@
 """RSS feed for QuickScale blog module"""
 
+from typing import Any
+
 from django.contrib.syndication.views import Feed
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse
 from django.urls import reverse
 from django.utils.feedgenerator import Rss201rev2Feed
+from django.views.decorators.http import condition
 
+from .conditional import build_etag, get_queryset_last_modified
 from .models import Post
 
 
@@ -15,6 +21,26 @@ class LatestPostsFeed(Feed):
     link = "/blog/"
     description = "Latest posts from our blog"
 
+    def __call__(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Serve the feed, answering unchanged revalidations with 304"""
+        view = condition(
+            etag_func=lambda request, *args, **kwargs: build_etag(self.cache_scope),
+            last_modified_func=lambda request, *args, **kwargs: self.last_modified(),
+        )(super().__call__)
+        return view(request, *args, **kwargs)
+
+    @property
+    def cache_scope(self) -> str:
+        """Return the key that scopes this feed's validators"""
+        return f"feed:{type(self).__module__}.{type(self).__qualname__}"
+
+    def last_modified(self):  # type: ignore[no-untyped-def]
+        """Return the newest ``updated_at`` among the feed items"""
+        items = self.items()
+        if not isinstance(items, QuerySet):
+            return None
+        return get_queryset_last_modified(self.cache_scope, self.items)
+
     def items(self):  # type: ignore[no-untyped-def]
         """Return the 20 most recent published posts"""
         return Post.objects.filter(status="published").order_by("-published_date")[:20]
@@ -35,6 +61,10 @@ class LatestPostsFeed(Feed):
         """Return post publication date"""
         return item.published_date
 
+    def item_updateddate(self, item: Post):  # type: ignore[no-untyped-def]
+        """Return when the post last changed, used for the Last-Modified header"""
+        return item.updated_at
+
     def item_author_name(self, item: Post) -> str | None:
         """Return post author name"""
         if item.author is None:
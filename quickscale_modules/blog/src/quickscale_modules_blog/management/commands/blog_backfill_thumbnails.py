@@ -0,0 +1,84 @@
+"""Record thumbnail manifests for posts saved before manifests existed."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_blog.models import THUMBNAIL_SIZES, Post
+
+
+class Command(BaseCommand):
+    """Backfill the thumbnail manifest stored on each post"""
+
+    help = (
+        "Record thumbnail variants and dimensions for posts whose manifest is "
+        "missing or describes a different featured image"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--generate-missing",
+            action="store_true",
+            help="Regenerate thumbnails when a size is missing from storage.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-inspect every post, even when its manifest looks current.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Posts loaded and updated per batch (default: 200).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        posts = (
+            Post.objects.exclude(featured_image="")
+            .exclude(featured_image__isnull=True)
+            .only("pk", "featured_image", "thumbnail_manifest")
+            .order_by("pk")
+        )
+
+        total_recorded = 0
+        total_generated = 0
+        pending: list[Post] = []
+        for post in posts.iterator(chunk_size=batch_size):
+            if not options["force"] and post.thumbnail_manifest_is_current():
+                continue
+
+            variants = post.inspect_stored_thumbnails()
+            if options["generate_missing"] and len(variants) < len(THUMBNAIL_SIZES):
+                # Processing persists the manifest itself.
+                post.process_image_derivatives()
+                total_generated += 1
+                continue
+
+            post.thumbnail_manifest = {
+                "source": str(post.featured_image.name),
+                "variants": variants,
+            }
+            pending.append(post)
+            if len(pending) >= batch_size:
+                total_recorded += self._flush(pending)
+        total_recorded += self._flush(pending)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. Manifests recorded: {total_recorded}, "
+                f"posts regenerated: {total_generated}"
+            )
+        )
+
+    def _flush(self, pending: list[Post]) -> int:
+        if not pending:
+            return 0
+        Post.objects.bulk_update(pending, ["thumbnail_manifest"])
+        flushed = len(pending)
+        pending.clear()
+        return flushed
@@ -0,0 +1,98 @@
+"""Verify, and optionally repair, the database-maintained post search index."""
+
+from importlib import import_module
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+
+# The DDL lives in the migration so the index is defined in exactly one place
+search_index = import_module(
+    "quickscale_modules_blog.migrations.0006_post_search_index"
+)
+
+
+def find_missing_search_objects(using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Return the search index objects missing from the ``using`` database."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            expected = [
+                search_index.FTS_TABLE,
+                *(
+                    f"{search_index.FTS_TABLE}_{suffix}"
+                    for suffix in ("ai", "ad", "au")
+                ),
+            ]
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+            )
+        elif connection.vendor == "postgresql":
+            expected = ["search_vector", f"{search_index.POST_TABLE}_search_gin"]
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = %s UNION SELECT indexname FROM pg_indexes "
+                "WHERE tablename = %s",
+                [search_index.POST_TABLE, search_index.POST_TABLE],
+            )
+        else:
+            return []
+        present = {row[0] for row in cursor.fetchall()}
+    return [name for name in expected if name not in present]
+
+
+def rebuild_search_index(using: str = DEFAULT_DB_ALIAS) -> None:
+    """Drop and recreate the search index, reindexing every post."""
+    connection = connections[using]
+    if connection.vendor == "sqlite":
+        statements = search_index.SQLITE_REVERSE + search_index.SQLITE_FORWARD
+    elif connection.vendor == "postgresql":
+        statements = search_index.POSTGRES_REVERSE + search_index.POSTGRES_FORWARD
+    else:
+        return
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+class Command(BaseCommand):
+    """Check the full-text search index that migration 0006 installs"""
+
+    help = (
+        "Check that the post search index and, on SQLite, its sync triggers "
+        "exist. Table rebuilds during migrations drop SQLite triggers."
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Recreate the index and reindex every post if anything is missing.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database to check (default: 'default').",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        using = options["database"]
+        missing = find_missing_search_objects(using)
+        if not missing:
+            self.stdout.write(self.style.SUCCESS("Search index is complete."))
+            return
+        if not options["repair"]:
+            raise CommandError(
+                f"Search index objects missing: {', '.join(missing)}. "
+                "Run with --repair to rebuild the index."
+            )
+
+        try:
+            rebuild_search_index(using)
+        except DatabaseError as exc:
+            raise CommandError(f"Could not rebuild the search index: {exc}") from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt search index (was missing: {', '.join(missing)})"
+            )
+        )
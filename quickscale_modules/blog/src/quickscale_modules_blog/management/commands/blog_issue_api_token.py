@@ -0,0 +1,80 @@
+"""Issue or rotate a database-backed blog API token."""
+
+from datetime import timedelta
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from quickscale_modules_blog.models import BlogApiToken
+
+
+class Command(BaseCommand):
+    """Create a blog API token for a staff user and print its secret once"""
+
+    help = (
+        "Issue a blog API token for a staff user. With --rotate, existing "
+        "active tokens of the same name are revoked."
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument("username", help="Staff user the token acts as.")
+        parser.add_argument(
+            "--name",
+            default="automation",
+            help="Label identifying the client (default: automation).",
+        )
+        parser.add_argument(
+            "--rotate",
+            action="store_true",
+            help="Revoke the user's active tokens with the same name.",
+        )
+        parser.add_argument(
+            "--expires-in-days",
+            type=int,
+            default=None,
+            help="Expire the token after this many days.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user_model = get_user_model()
+        user = user_model.objects.filter(
+            **{user_model.USERNAME_FIELD: options["username"]}
+        ).first()
+        if user is None:
+            raise CommandError(f"User '{options['username']}' does not exist.")
+        if not user.is_staff:
+            raise CommandError("Blog API tokens require a staff user.")
+
+        expires_in_days = options["expires_in_days"]
+        if expires_in_days is not None and expires_in_days < 1:
+            raise CommandError("--expires-in-days must be at least 1.")
+        expires_at = (
+            timezone.now() + timedelta(days=expires_in_days)
+            if expires_in_days
+            else None
+        )
+
+        with transaction.atomic():
+            revoked = 0
+            if options["rotate"]:
+                # Saved one by one so each revoked token leaves the auth cache.
+                for token in BlogApiToken.objects.filter(
+                    user=user, name=options["name"], is_active=True
+                ):
+                    token.is_active = False
+                    token.save(update_fields=["is_active"])
+                    revoked += 1
+            _, raw_token = BlogApiToken.issue(
+                user, options["name"], expires_at=expires_at
+            )
+
+        self.stdout.write(raw_token)
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Done. Issued token '{options['name']}' for {user.get_username()}; "
+                f"revoked {revoked}. Store the secret now, it is not shown again."
+            )
+        )
@@ -0,0 +1,73 @@
+"""Generate featured image thumbnails and responsive derivatives."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_blog.models import Post
+
+
+class Command(BaseCommand):
+    """Process posts whose featured image derivatives are pending"""
+
+    help = (
+        "Generate thumbnails and responsive WebP/AVIF derivatives for posts "
+        "queued by BLOG_IMAGE_DERIVATIVES_MODE = 'deferred'"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Maximum number of posts to process in this run.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Also process posts whose previous attempt failed.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Process every post with a featured image, not only pending ones.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-encode derivatives even when the source hash is unchanged.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        limit = options["limit"]
+        if limit is not None and limit < 1:
+            raise CommandError("--limit must be at least 1.")
+
+        posts = Post.objects.exclude(featured_image="").exclude(
+            featured_image__isnull=True
+        )
+        if not options["all"]:
+            statuses = [Post.IMAGE_DERIVATIVES_PENDING]
+            if options["retry_failed"]:
+                statuses.append(Post.IMAGE_DERIVATIVES_FAILED)
+            posts = posts.filter(image_derivatives_status__in=statuses)
+        posts = posts.only(
+            "pk", "featured_image", "thumbnail_manifest", "image_derivatives_status"
+        ).order_by("pk")
+        if limit is not None:
+            posts = posts[:limit]
+
+        generated = unchanged = failed = 0
+        for post in posts.iterator(chunk_size=100):
+            if post.process_image_derivatives(force=options["force"]):
+                generated += 1
+            elif post.image_derivatives_status == Post.IMAGE_DERIVATIVES_FAILED:
+                failed += 1
+            else:
+                unchanged += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. Generated: {generated}, unchanged: {unchanged}, "
+                f"failed: {failed}"
+            )
+        )
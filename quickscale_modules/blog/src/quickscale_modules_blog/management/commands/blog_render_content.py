@@ -0,0 +1,69 @@
+"""Re-render stored post HTML after Markdown renderer changes."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_blog.models import Post, get_markdown_renderer_version
+
+
+class Command(BaseCommand):
+    """Refresh stored Markdown HTML for posts rendered by an older renderer"""
+
+    help = (
+        "Re-render stored post HTML for posts whose renderer version or content "
+        "hash is out of date"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render every post, even when stored HTML looks current.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Posts loaded and updated per batch (default: 200).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        posts = Post.objects.only(
+            "pk",
+            "content",
+            "content_html",
+            "content_html_version",
+            "content_hash",
+        ).order_by("pk")
+        if not options["force"]:
+            # Content edits re-render on save, so only version drift needs a scan.
+            posts = posts.exclude(content_html_version=get_markdown_renderer_version())
+
+        total_rendered = 0
+        pending: list[Post] = []
+        for post in posts.iterator(chunk_size=batch_size):
+            if post.render_content_html(force=options["force"]):
+                pending.append(post)
+            if len(pending) >= batch_size:
+                total_rendered += self._flush(pending)
+        total_rendered += self._flush(pending)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Total posts re-rendered: {total_rendered}")
+        )
+
+    def _flush(self, pending: list[Post]) -> int:
+        if not pending:
+            return 0
+        Post.objects.bulk_update(
+            pending,
+            ["content_html", "content_html_version", "content_hash"],
+        )
+        flushed = len(pending)
+        pending.clear()
+        return flushed
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quickscale_modules_blog", "0002_blogmediaasset"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_hash",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_html_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
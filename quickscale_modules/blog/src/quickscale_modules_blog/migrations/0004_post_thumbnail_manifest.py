@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quickscale_modules_blog", "0003_post_content_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="thumbnail_manifest",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
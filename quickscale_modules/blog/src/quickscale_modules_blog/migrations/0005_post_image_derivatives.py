@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quickscale_modules_blog", "0004_post_thumbnail_manifest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="image_derivatives_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("pending", "Pending"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                editable=False,
+                max_length=10,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["image_derivatives_status"],
+                name="quickscale__image_d_a115d0_idx",
+            ),
+        ),
+    ]
@@ -1,6 +1,8 @@
 """Blog models for QuickScale blog module"""
 
+import hashlib
 import posixpath
+import secrets
 from collections.abc import Callable
 from importlib import import_module
 from io import BytesIO
@@ -10,15 +12,23 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.core.files.base import ContentFile
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.html import escape
+from django.utils.module_loading import import_string
 from django.utils.text import slugify
 from markdownx.models import MarkdownxField
+from markdownx.utils import markdownify
 from PIL import Image
 
+from .caching import bump_content_generation
+
 storage_build_upload_path: Callable[..., str] | None = None
 storage_build_public_media_url: Callable[..., str] | None = None
+storage_store_deduplicated_upload: Callable[..., Any] | None = None
+storage_deduplicated_uploads_enabled: Callable[..., bool] | None = None
+storage_build_image_variant_url: Callable[..., str] | None = None
 storage_helpers: Any | None
 try:
     storage_helpers = import_module("quickscale_modules_storage.helpers")
@@ -30,6 +40,17 @@ if storage_helpers is not None:
     storage_build_public_media_url = getattr(
         storage_helpers, "build_public_media_url", None
     )
+    storage_store_deduplicated_upload = getattr(
+        storage_helpers, "store_deduplicated_upload", None
+    )
+    storage_deduplicated_uploads_enabled = getattr(
+        storage_helpers, "deduplicated_uploads_enabled", None
+    )
+    storage_build_image_variant_url = getattr(
+        import_module("quickscale_modules_storage.variants"),
+        "build_image_variant_url",
+        None,
+    )
 
 
 def _build_public_media_url(stored_reference: str) -> str:
@@ -87,6 +108,8 @@ def _thumbnail_save_kwargs(image_format: str) -> dict[str, Any]:
     """Return image-save keyword arguments appropriate for the target format."""
     if image_format in {"JPEG", "WEBP"}:
         return {"quality": 85, "optimize": True}
+    if image_format == "AVIF":
+        return {"quality": 70}
     if image_format == "PNG":
         return {"optimize": True}
     return {}
@@ -96,9 +119,142 @@ def _prepare_thumbnail_image(image: Image.Image, image_format: str) -> Image.Ima
     """Normalize image mode for the requested thumbnail format."""
     if image_format == "JPEG" and image.mode not in {"RGB", "L"}:
         return image.convert("RGB")
+    if image_format in {"AVIF", "WEBP"} and image.mode not in {"RGB", "RGBA"}:
+        return image.convert("RGBA")
     return image
 
 
+DEFAULT_MARKDOWN_RENDERER_VERSION = 1
+THUMBNAIL_SIZES: dict[str, tuple[int, int]] = {
+    "small": (300, 200),
+    "medium": (800, 450),
+}
+_THUMBNAIL_STORAGE_ERRORS = (
+    AttributeError,
+    FileNotFoundError,
+    NotImplementedError,
+    OSError,
+    ValueError,
+)
+DEFAULT_IMAGE_DERIVATIVE_WIDTHS = (480, 800, 1200, 1600)
+DEFAULT_IMAGE_DERIVATIVE_FORMATS = ("AVIF", "WEBP")
+IMAGE_DERIVATIVES_MODE_DEFERRED = "deferred"
+IMAGE_DERIVATIVES_MODE_INLINE = "inline"
+_IMAGE_MIME_TYPES = {
+    "AVIF": "image/avif",
+    "GIF": "image/gif",
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+_IMAGE_EXTENSIONS = {
+    "AVIF": ".avif",
+    "GIF": ".gif",
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "WEBP": ".webp",
+}
+
+
+def get_image_derivatives_mode() -> str:
+    """Return how featured image derivatives are generated after a save.
+
+    ``"deferred"`` (default) marks the post pending for ``blog_process_images``,
+    ``"inline"`` generates derivatives during ``save``, and any other value is
+    the dotted path of a callable that receives the post primary key after the
+    transaction commits (for example a task queue's enqueue function).
+    """
+    mode = str(
+        getattr(
+            settings, "BLOG_IMAGE_DERIVATIVES_MODE", IMAGE_DERIVATIVES_MODE_DEFERRED
+        )
+    ).strip()
+    return mode or IMAGE_DERIVATIVES_MODE_DEFERRED
+
+
+def get_image_derivative_widths() -> tuple[int, ...]:
+    """Return the configured responsive widths, ascending and de-duplicated."""
+    widths = getattr(
+        settings, "BLOG_IMAGE_DERIVATIVE_WIDTHS", DEFAULT_IMAGE_DERIVATIVE_WIDTHS
+    )
+    return tuple(sorted({int(width) for width in widths if int(width) > 0}))
+
+
+def get_image_derivative_formats(source_format: str) -> tuple[str, ...]:
+    """Return encodable derivative formats, ending with the source format.
+
+    Formats Pillow cannot encode in this environment (commonly AVIF on older
+    builds) are skipped rather than failing the whole pipeline.
+    """
+    Image.init()
+    configured = getattr(
+        settings, "BLOG_IMAGE_DERIVATIVE_FORMATS", DEFAULT_IMAGE_DERIVATIVE_FORMATS
+    )
+    formats: list[str] = []
+    for image_format in (*configured, source_format):
+        normalized = _save_format_from_name("", str(image_format))
+        if normalized in formats or normalized not in _IMAGE_MIME_TYPES:
+            continue
+        if normalized not in Image.SAVE:
+            continue
+        formats.append(normalized)
+    return tuple(formats)
+
+
+def _fit_within(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """Return ``size`` scaled down (never up) to fit inside ``box``."""
+    width, height = size
+    scale = min(1.0, box[0] / width, box[1] / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _hash_file(file_obj: Any) -> str:
+    """Return the SHA-256 digest of a file object, read in chunks."""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(64 * 1024), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dispatch_image_derivatives(post: "Post") -> None:
+    """Hand a pending post to the configured derivative generator."""
+    mode = get_image_derivatives_mode()
+    if mode == IMAGE_DERIVATIVES_MODE_DEFERRED:
+        return
+    if mode == IMAGE_DERIVATIVES_MODE_INLINE:
+        post.process_image_derivatives()
+        return
+
+    dispatcher = import_string(mode)
+    post_id = post.pk
+    transaction.on_commit(lambda: dispatcher(post_id))
+
+
+def get_markdown_renderer_version() -> int:
+    """Return the active Markdown renderer version for stored post HTML.
+
+    Bump ``BLOG_MARKDOWN_RENDERER_VERSION`` after changing Markdown extensions
+    so ``blog_render_content`` re-renders existing posts.
+    """
+    return int(
+        getattr(
+            settings,
+            "BLOG_MARKDOWN_RENDERER_VERSION",
+            DEFAULT_MARKDOWN_RENDERER_VERSION,
+        )
+    )
+
+
+def render_post_markdown(content: str) -> str:
+    """Render post Markdown to HTML with inline raw HTML escaped."""
+    return markdownify(escape(content))
+
+
+def _hash_post_content(content: str) -> str:
+    """Return the digest used to detect stale stored post HTML."""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+
 def blog_media_upload_to(_: "BlogMediaAsset", filename: str) -> str:
     """Build a stable, collision-resistant upload path for blog media assets."""
     if storage_build_upload_path is not None:
@@ -224,6 +380,81 @@ class BlogMediaAsset(models.Model):
     def __str__(self) -> str:
         return self.original_filename
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Store new uploads content-addressed so identical images share one file."""
+        if (
+            self.file
+            and not self.file._committed
+            and storage_store_deduplicated_upload is not None
+            and storage_deduplicated_uploads_enabled is not None
+            and storage_deduplicated_uploads_enabled(settings)
+        ):
+            stored = storage_store_deduplicated_upload(
+                self.file.storage, self.file.file, self.file.name
+            )
+            self.file.name = stored.name
+            self.file._committed = True
+        super().save(*args, **kwargs)
+
+    def get_variant_url(self, width: int, image_format: str = "webp") -> str:
+        """Return the URL of a resized variant, or the original without storage."""
+        if storage_build_image_variant_url is None:
+            return _build_public_media_url(str(self.file.name))
+        return storage_build_image_variant_url(str(self.file.name), width, image_format)
+
+
+def hash_api_token(raw_token: str) -> str:
+    """Return the SHA-256 hex digest under which an API token is stored."""
+    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+
+
+class BlogApiToken(models.Model):
+    """Database-managed API token for blog automation clients.
+
+    Only the token digest is stored, so tokens can be issued, rotated and
+    revoked without a redeploy and without persisting the secret itself.
+    """
+
+    name = models.CharField(max_length=100, help_text="Label for the client")
+    token_hash = models.CharField(max_length=64, unique=True, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="blog_api_tokens",
+    )
+    is_active = models.BooleanField(default=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Blog API token"
+        verbose_name_plural = "Blog API tokens"
+
+    def __str__(self) -> str:
+        return self.name
+
+    @classmethod
+    def issue(
+        cls, user: Any, name: str, *, expires_at: Any = None
+    ) -> tuple["BlogApiToken", str]:
+        """Create a token for ``user`` and return it with its raw secret."""
+        raw_token = secrets.token_urlsafe(32)
+        token = cls.objects.create(
+            name=name,
+            token_hash=hash_api_token(raw_token),
+            user=user,
+            expires_at=expires_at,
+        )
+        return token, raw_token
+
+    @property
+    def is_usable(self) -> bool:
+        """Return whether the token is active and not expired."""
+        return self.is_active and (
+            self.expires_at is None or self.expires_at > timezone.now()
+        )
+
 
 class Post(models.Model):
     """Blog post model with Markdown support"""
@@ -232,6 +463,14 @@ class Post(models.Model):
         ("draft", "Draft"),
         ("published", "Published"),
     ]
+    IMAGE_DERIVATIVES_PENDING = "pending"
+    IMAGE_DERIVATIVES_READY = "ready"
+    IMAGE_DERIVATIVES_FAILED = "failed"
+    IMAGE_DERIVATIVES_STATUS_CHOICES = [
+        (IMAGE_DERIVATIVES_PENDING, "Pending"),
+        (IMAGE_DERIVATIVES_READY, "Ready"),
+        (IMAGE_DERIVATIVES_FAILED, "Failed"),
+    ]
 
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
@@ -268,6 +507,16 @@ class Post(models.Model):
         related_name="posts",
     )
     tags = models.ManyToManyField(Tag, blank=True, related_name="posts")
+    content_html = models.TextField(blank=True, editable=False)
+    content_html_version = models.PositiveIntegerField(default=0, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    thumbnail_manifest = models.JSONField(default=dict, blank=True, editable=False)
+    image_derivatives_status = models.CharField(
+        max_length=10,
+        choices=IMAGE_DERIVATIVES_STATUS_CHOICES,
+        blank=True,
+        editable=False,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_date = models.DateTimeField(null=True, blank=True)
@@ -278,6 +527,7 @@ class Post(models.Model):
             models.Index(fields=["-published_date"]),
             models.Index(fields=["status"]),
             models.Index(fields=["slug"]),
+            models.Index(fields=["image_derivatives_status"]),
         ]
 
     def __str__(self) -> str:
@@ -285,6 +535,40 @@ class Post(models.Model):
 
     def save(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         """Auto-generate slug and excerpt if not provided"""
+        self._populate_defaults()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            if self.render_content_html() and update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "content_html",
+                    "content_html_version",
+                    "content_hash",
+                }
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "featured_image" in update_fields:
+            if not self.featured_image:
+                self.thumbnail_manifest = {}
+                self.image_derivatives_status = ""
+            elif not self.image_derivatives_are_current():
+                self.image_derivatives_status = self.IMAGE_DERIVATIVES_PENDING
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "thumbnail_manifest",
+                    "image_derivatives_status",
+                }
+
+        super().save(*args, **kwargs)
+
+        # Derivatives are generated outside the request unless configured inline
+        if self.image_derivatives_status == self.IMAGE_DERIVATIVES_PENDING:
+            _dispatch_image_derivatives(self)
+
+    def _populate_defaults(self) -> None:
+        """Fill slug, publish date and excerpt when they were left blank."""
         if not self.slug:
             self.slug = slugify(self.title)
 
@@ -300,16 +584,46 @@ class Post(models.Model):
                 plain_text[:300] + "..." if len(plain_text) > 300 else plain_text
             )
 
-        super().save(*args, **kwargs)
-
-        # Generate thumbnails for featured image
-        if self.featured_image:
-            self._generate_thumbnails()
+    def prepare_for_bulk_create(self) -> None:
+        """Derive every field save() would, for rows inserted by bulk_create()."""
+        self._populate_defaults()
+        self.render_content_html()
+        if not self.featured_image:
+            self.thumbnail_manifest = {}
+            self.image_derivatives_status = ""
+        elif not self.image_derivatives_are_current():
+            self.image_derivatives_status = self.IMAGE_DERIVATIVES_PENDING
 
     def get_absolute_url(self) -> str:
         """Return the URL for this post"""
         return reverse("quickscale_blog:post_detail", kwargs={"slug": self.slug})
 
+    def content_html_is_current(self) -> bool:
+        """Return whether stored HTML matches the content and renderer version."""
+        return (
+            self.content_html_version == get_markdown_renderer_version()
+            and self.content_hash == _hash_post_content(self.content)
+        )
+
+    def render_content_html(self, *, force: bool = False) -> bool:
+        """Refresh stored HTML in memory when stale; return whether it changed."""
+        if not force and self.content_html_is_current():
+            return False
+        self.content_html = render_post_markdown(self.content)
+        self.content_html_version = get_markdown_renderer_version()
+        self.content_hash = _hash_post_content(self.content)
+        return True
+
+    def get_rendered_content(self) -> str:
+        """Return stored post HTML, rendering and persisting it on first read."""
+        if self.render_content_html() and self.pk:
+            Post.objects.filter(pk=self.pk).update(
+                content_html=self.content_html,
+                content_html_version=self.content_html_version,
+                content_hash=self.content_hash,
+            )
+        return self.content_html
+
     def get_featured_image_url(self) -> str:
         """Return the public featured image URL using storage helpers when available."""
         if not self.featured_image:
@@ -327,67 +641,289 @@ class Post(models.Model):
             f"{stem}_{size}{extension}",
         )
 
-    def _generate_thumbnails(self) -> None:
-        """Generate thumbnail versions of featured image"""
-        if not self.featured_image:
-            return
+    def image_derivatives_are_current(self) -> bool:
+        """Return whether derivatives were generated for the current image."""
+        return (
+            self.image_derivatives_status == self.IMAGE_DERIVATIVES_READY
+            and self.thumbnail_manifest_is_current()
+        )
 
-        sizes = {
-            "small": (300, 200),
-            "medium": (800, 450),
-        }
+    def process_image_derivatives(self, *, force: bool = False) -> bool:
+        """Generate thumbnails and responsive derivatives for the featured image.
+
+        Responsive derivative names are keyed by the source content hash, so an
+        identical re-upload reuses existing files, and a source whose hash and
+        derivative configuration are unchanged is skipped without decoding.
+        Returns whether any file was written.
+        """
+        if not self.featured_image:
+            return False
 
         storage = self.featured_image.storage
         source_name = str(self.featured_image.name)
+        previous = self.thumbnail_manifest or {}
+        manifest: dict[str, Any] = {
+            "source": source_name,
+            "variants": {},
+            "srcset": {},
+        }
+        status = self.IMAGE_DERIVATIVES_READY
+        written = False
 
         try:
             with storage.open(source_name, "rb") as source_file:
+                source_hash = _hash_file(source_file)
+                source_file.seek(0)
                 with Image.open(source_file) as image:
                     source_format = _save_format_from_name(source_name, image.format)
-                    for size_name, dimensions in sizes.items():
-                        img_copy = image.copy()
-                        img_copy.thumbnail(dimensions, Image.Resampling.LANCZOS)
-                        prepared = _prepare_thumbnail_image(img_copy, source_format)
-                        thumbnail_name = self._get_thumbnail_name(size_name)
+                    formats = get_image_derivative_formats(source_format)
+                    manifest.update(
+                        source_hash=source_hash,
+                        source_type=_IMAGE_MIME_TYPES.get(source_format, ""),
+                        width=image.width,
+                        height=image.height,
+                        config={
+                            "thumbnails": {
+                                name: list(box) for name, box in THUMBNAIL_SIZES.items()
+                            },
+                            "widths": list(get_image_derivative_widths()),
+                            "formats": list(formats),
+                        },
+                    )
+                    if not force and all(
+                        previous.get(key) == manifest[key]
+                        for key in ("source", "source_hash", "config")
+                    ):
+                        self._store_image_derivatives(previous, status=status)
+                        return False
+
+                    source_changed = previous.get("source_hash") != source_hash
+                    for kind, key, name, size, target_format in self._plan_derivatives(
+                        image.size, source_format, formats, source_hash
+                    ):
+                        entry = {"name": name, "width": size[0], "height": size[1]}
+                        if kind == "thumbnail":
+                            manifest["variants"][key] = entry
+                        else:
+                            manifest["srcset"].setdefault(key, []).append(entry)
+                        if name == source_name:
+                            continue
+
+                        # Thumbnail names follow the source name, which storage
+                        # backends may overwrite; hashed names are immutable.
+                        rewrite = force or (kind == "thumbnail" and source_changed)
+                        if storage.exists(name):
+                            if not rewrite:
+                                continue
+                            storage.delete(name)
+                        prepared = _prepare_thumbnail_image(
+                            image.resize(size, Image.Resampling.LANCZOS),
+                            target_format,
+                        )
                         output = BytesIO()
                         prepared.save(
                             output,
-                            format=source_format,
-                            **_thumbnail_save_kwargs(source_format),
-                        )
-                        output.seek(0)
-                        if storage.exists(thumbnail_name):
-                            storage.delete(thumbnail_name)
-                        storage.save(
-                            thumbnail_name,
-                            ContentFile(output.getvalue()),
+                            format=target_format,
+                            **_thumbnail_save_kwargs(target_format),
                         )
-        except (
-            AttributeError,
-            FileNotFoundError,
-            NotImplementedError,
-            OSError,
-            ValueError,
-        ):
-            return
+                        saved_name = storage.save(name, ContentFile(output.getvalue()))
+                        entry["name"] = str(saved_name or name)
+                        written = True
+        except _THUMBNAIL_STORAGE_ERRORS:
+            status = self.IMAGE_DERIVATIVES_FAILED
+
+        self._store_image_derivatives(manifest, status=status)
+        return written
+
+    def _plan_derivatives(
+        self,
+        source_size: tuple[int, int],
+        source_format: str,
+        formats: tuple[str, ...],
+        source_hash: str,
+    ) -> list[tuple[str, str, str, tuple[int, int], str]]:
+        """Return ``(kind, key, name, size, format)`` for every derivative."""
+        plan = [
+            (
+                "thumbnail",
+                size_name,
+                self._get_thumbnail_name(size_name),
+                _fit_within(source_size, box),
+                source_format,
+            )
+            for size_name, box in THUMBNAIL_SIZES.items()
+        ]
+
+        source_width, source_height = source_size
+        directory = posixpath.dirname(str(self.featured_image.name))
+        widths = [
+            width for width in get_image_derivative_widths() if width < source_width
+        ]
+        for image_format in formats:
+            mime_type = _IMAGE_MIME_TYPES[image_format]
+            for width in widths:
+                name = posixpath.join(
+                    directory,
+                    "derivatives",
+                    f"{source_hash[:16]}-{width}w{_IMAGE_EXTENSIONS[image_format]}",
+                )
+                size = (width, max(1, round(source_height * width / source_width)))
+                plan.append(("srcset", mime_type, name, size, image_format))
+            # The original already serves the full width in its own format.
+            name = str(self.featured_image.name)
+            if image_format != source_format:
+                name = posixpath.join(
+                    directory,
+                    "derivatives",
+                    f"{source_hash[:16]}-{source_width}w"
+                    f"{_IMAGE_EXTENSIONS[image_format]}",
+                )
+            plan.append(("srcset", mime_type, name, source_size, image_format))
+        return plan
+
+    def inspect_stored_thumbnails(self) -> dict[str, dict[str, Any]]:
+        """Return thumbnail variants already present in storage, with dimensions.
+
+        Used to backfill the manifest for posts saved before it existed; this
+        performs one storage lookup per size and reads only image headers.
+        """
+        if not self.featured_image:
+            return {}
+
+        storage = self.featured_image.storage
+        variants: dict[str, dict[str, Any]] = {}
+        for size_name in THUMBNAIL_SIZES:
+            thumbnail_name = self._get_thumbnail_name(size_name)
+            try:
+                if not storage.exists(thumbnail_name):
+                    continue
+                with storage.open(thumbnail_name, "rb") as thumbnail_file:
+                    with Image.open(thumbnail_file) as image:
+                        width, height = image.size
+            except _THUMBNAIL_STORAGE_ERRORS:
+                continue
+            variants[size_name] = {
+                "name": thumbnail_name,
+                "width": width,
+                "height": height,
+            }
+        return variants
+
+    def _store_image_derivatives(
+        self, manifest: dict[str, Any], *, status: str
+    ) -> None:
+        """Persist the derivative manifest without re-running ``save``.
+
+        Unchanged manifests are not written, so reprocessing up-to-date posts
+        leaves the content generation (and every cached page) alone.
+        """
+        changed = (
+            manifest != self.thumbnail_manifest
+            or status != self.image_derivatives_status
+        )
+        self.thumbnail_manifest = manifest
+        self.image_derivatives_status = status
+        if self.pk and changed:
+            Post.objects.filter(pk=self.pk).update(
+                thumbnail_manifest=manifest,
+                image_derivatives_status=status,
+            )
+            # Cached list pages embed thumbnail URLs from the manifest.
+            bump_content_generation()
+
+    def thumbnail_manifest_is_current(self) -> bool:
+        """Return whether the manifest describes the current featured image."""
+        if not self.featured_image:
+            return not self.thumbnail_manifest
+        manifest = self.thumbnail_manifest or {}
+        return manifest.get("source") == str(self.featured_image.name)
+
+    def get_thumbnail_variant(self, size: str = "medium") -> dict[str, Any] | None:
+        """Return the recorded thumbnail variant for a size, if one exists."""
+        if not self.featured_image or not self.thumbnail_manifest_is_current():
+            return None
+        variant = self.thumbnail_manifest.get("variants", {}).get(size)
+        if not isinstance(variant, dict) or not variant.get("name"):
+            return None
+        return variant
 
     def get_thumbnail_url(self, size: str = "medium") -> str:
-        """Get URL for thumbnail of specified size"""
+        """Get URL for thumbnail of specified size without touching storage"""
         if not self.featured_image:
             return ""
 
-        thumbnail_name = self._get_thumbnail_name(size)
-
-        try:
-            if self.featured_image.storage.exists(thumbnail_name):
-                return _build_public_media_url(thumbnail_name)
-        except (
-            AttributeError,
-            FileNotFoundError,
-            NotImplementedError,
-            OSError,
-            ValueError,
-        ):
-            return self.get_featured_image_url()
+        variant = self.get_thumbnail_variant(size)
+        if variant is not None:
+            return _build_public_media_url(str(variant["name"]))
 
         return self.get_featured_image_url()
+
+    def get_image_srcset(self, mime_type: str = "") -> str:
+        """Return a ``srcset`` value for one derivative format.
+
+        Defaults to the original image format, for use on the ``<img>`` tag.
+        """
+        if not self.featured_image or not self.thumbnail_manifest_is_current():
+            return ""
+        manifest = self.thumbnail_manifest
+        entries = manifest.get("srcset", {}).get(
+            mime_type or manifest.get("source_type", ""), []
+        )
+        return ", ".join(
+            f"{_build_public_media_url(str(entry['name']))} {entry['width']}w"
+            for entry in entries
+        )
+
+    def get_image_sources(self) -> list[dict[str, str]]:
+        """Return ``<picture>`` sources for formats other than the original's."""
+        if not self.featured_image or not self.thumbnail_manifest_is_current():
+            return []
+        source_type = self.thumbnail_manifest.get("source_type", "")
+        return [
+            {"type": mime_type, "srcset": self.get_image_srcset(mime_type)}
+            for mime_type in self.thumbnail_manifest.get("srcset", {})
+            if mime_type != source_type
+        ]
+
+
+def bulk_create_posts(
+    posts: list[Post],
+    tags: list[list[Tag]] | None = None,
+    *,
+    batch_size: int | None = None,
+) -> list[Post]:
+    """Insert posts and their tag links with a few bulk statements.
+
+    ``bulk_create()`` skips ``save()`` and model signals, so derived fields are
+    filled first and, once the rows exist, pending image derivatives are
+    dispatched and the content generation is advanced once for the batch.
+    ``tags`` is parallel to ``posts``.
+    """
+    for post in posts:
+        post.prepare_for_bulk_create()
+
+    with transaction.atomic():
+        created = Post.objects.bulk_create(posts, batch_size=batch_size)
+        if created and created[0].pk is None:
+            # Backends without RETURNING: recover ids through the unique slug.
+            ids = dict(
+                Post.objects.filter(
+                    slug__in=[post.slug for post in created]
+                ).values_list("slug", "pk")
+            )
+            for post in created:
+                post.pk = ids[post.slug]
+        through_model = Post.tags.through
+        links = [
+            through_model(post_id=post.pk, tag_id=tag.pk)
+            for post, post_tags in zip(created, tags or [], strict=False)
+            for tag in {tag.pk: tag for tag in post_tags}.values()
+        ]
+        through_model.objects.bulk_create(links, batch_size=batch_size)
+
+    for post in created:
+        if post.image_derivatives_status == Post.IMAGE_DERIVATIVES_PENDING:
+            _dispatch_image_derivatives(post)
+    if created:
+        bump_content_generation()
+    return created
@@ -0,0 +1,161 @@
+"""Keyset pagination for QuickScale blog post lists"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+_CURSOR_AFTER = "n"
+_CURSOR_BEFORE = "p"
+
+
+def keyset_pagination_enabled() -> bool:
+    """Return whether blog list views paginate by cursor instead of offset."""
+    return bool(getattr(settings, "BLOG_KEYSET_PAGINATION", False))
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Position between two posts in ``(-published_date, -id)`` order"""
+
+    published_date: datetime
+    post_id: int
+    before: bool = False
+
+    def encode(self) -> str:
+        """Return the opaque, URL-safe representation of this cursor."""
+        payload = json.dumps(
+            [
+                _CURSOR_BEFORE if self.before else _CURSOR_AFTER,
+                self.published_date.isoformat(),
+                self.post_id,
+            ],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "KeysetCursor":
+        """Parse a cursor produced by :meth:`encode`."""
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            direction, published_date, post_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode("ascii"))
+            )
+            parsed_date = parse_datetime(published_date)
+        except (
+            binascii.Error,
+            TypeError,
+            UnicodeError,
+            ValueError,
+        ) as exc:
+            raise InvalidCursor("Invalid pagination cursor") from exc
+        if (
+            direction not in {_CURSOR_AFTER, _CURSOR_BEFORE}
+            or parsed_date is None
+            or not isinstance(post_id, int)
+        ):
+            raise InvalidCursor("Invalid pagination cursor")
+        return cls(parsed_date, post_id, before=direction == _CURSOR_BEFORE)
+
+
+@dataclass
+class KeysetPage:
+    """One page of posts with opaque cursors for its neighbours"""
+
+    object_list: list[Any]
+    next_cursor: str
+    previous_cursor: str
+
+    @property
+    def has_next(self) -> bool:
+        """Return whether older posts follow this page."""
+        return bool(self.next_cursor)
+
+    @property
+    def has_previous(self) -> bool:
+        """Return whether newer posts precede this page."""
+        return bool(self.previous_cursor)
+
+    @property
+    def has_other_pages(self) -> bool:
+        """Return whether this page has neighbours in either direction."""
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """Paginate published posts newest-first without OFFSET or COUNT(*)
+
+    Pages are keyed on ``(published_date, id)`` so each page is a bounded
+    range read from the ``-published_date`` index, however deep it is.
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        self.queryset = queryset.filter(published_date__isnull=False)
+        self.per_page = per_page
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        """Return the page at an encoded cursor, or the first page."""
+        position = KeysetCursor.decode(cursor) if cursor else None
+        if position is None:
+            rows = list(self._ordered(descending=True)[: self.per_page + 1])
+            return self._build_page(rows, has_previous=False)
+
+        if position.before:
+            rows = list(
+                self._ordered(descending=False).filter(
+                    Q(published_date__gt=position.published_date)
+                    | Q(
+                        published_date=position.published_date,
+                        id__gt=position.post_id,
+                    )
+                )[: self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            rows.reverse()
+            return KeysetPage(
+                object_list=rows,
+                next_cursor=self._cursor(rows[-1]) if rows else "",
+                previous_cursor=(
+                    self._cursor(rows[0], before=True) if has_previous else ""
+                ),
+            )
+
+        rows = list(
+            self._ordered(descending=True).filter(
+                Q(published_date__lt=position.published_date)
+                | Q(published_date=position.published_date, id__lt=position.post_id)
+            )[: self.per_page + 1]
+        )
+        return self._build_page(rows, has_previous=True)
+
+    def _ordered(self, *, descending: bool) -> QuerySet:
+        if descending:
+            return self.queryset.order_by("-published_date", "-id")
+        return self.queryset.order_by("published_date", "id")
+
+    def _build_page(self, rows: list[Any], *, has_previous: bool) -> KeysetPage:
+        has_next = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        return KeysetPage(
+            object_list=rows,
+            next_cursor=self._cursor(rows[-1]) if has_next else "",
+            previous_cursor=(
+                self._cursor(rows[0], before=True) if has_previous and rows else ""
+            ),
+        )
+
+    @staticmethod
+    def _cursor(post: Any, *, before: bool = False) -> str:
+        return KeysetCursor(post.published_date, post.pk, before=before).encode()
@@ -0,0 +1,244 @@
+"""Full-text search over published blog posts
+
+PostgreSQL ranks matches against a stored, GIN-indexed ``tsvector`` column and
+SQLite against an FTS5 table. Both are created by migration 0006 and kept in
+sync by the database itself (a generated column and triggers respectively), so
+every save is indexed without application code. Other databases, or SQLite
+builds without FTS5, fall back to unranked substring matching.
+
+SQLite drops the triggers whenever a migration rebuilds the post table (for
+example an ``AlterField``), so run ``blog_check_search_index`` after such
+migrations; ``--repair`` recreates and rebuilds the index.
+"""
+
+import re
+from dataclasses import dataclass
+
+from django.db import DatabaseError, connections
+from django.db.models import (
+    BooleanField,
+    F,
+    FloatField,
+    Func,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+)
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+from .models import Post
+
+SEARCH_TEXT_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+FTS_TABLE = f"{Post._meta.db_table}_fts"
+DEFAULT_SEARCH_LIMIT = 20
+
+# Private-use code points survive HTML escaping, so snippets can be escaped
+# first and highlighted afterwards.
+_MARK_START = "\ue000"
+_MARK_STOP = "\ue001"
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class _StoredSearchVector(Func):
+    """The migration-managed ``tsvector`` column, which has no model field"""
+
+    template = f'"{Post._meta.db_table}"."{SEARCH_VECTOR_COLUMN}"'
+    output_field = TextField()
+
+
+class _WebSearchQuery(Func):
+    function = "websearch_to_tsquery"
+    template = f"%(function)s('{SEARCH_TEXT_CONFIG}', %(expressions)s)"
+    output_field = TextField()
+
+
+class _TextSearchMatch(Func):
+    """``vector @@ query``"""
+
+    arg_joiner = " @@ "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+class _CoverDensityRank(Func):
+    function = "ts_rank_cd"
+    output_field = FloatField()
+
+
+class _Headline(Func):
+    function = "ts_headline"
+    template = f"%(function)s('{SEARCH_TEXT_CONFIG}', %(expressions)s)"
+    output_field = TextField()
+
+
+@dataclass
+class PostSearchResult:
+    """A matching post with its relevance score and highlighted snippet"""
+
+    post: Post
+    rank: float
+    snippet: SafeString
+
+
+def _highlight(raw_snippet: str) -> SafeString:
+    """Escape a marker-delimited snippet and wrap matches in ``<mark>``."""
+    escaped = str(escape(raw_snippet))
+    return mark_safe(  # noqa: S308 - input is escaped above
+        escaped.replace(_MARK_START, "<mark>").replace(_MARK_STOP, "</mark>")
+    )
+
+
+def _search_terms(query: str) -> list[str]:
+    return _TERM_PATTERN.findall(query or "")
+
+
+class PostSearchBackend:
+    """Portable fallback: unranked substring matching on title and content"""
+
+    def __init__(self, using: str = "default") -> None:
+        self.using = using
+
+    def search(
+        self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[PostSearchResult]:
+        """Return up to ``limit`` published posts matching ``query``."""
+        terms = _search_terms(query)
+        if not terms:
+            return []
+
+        condition = Q()
+        for term in terms:
+            condition &= (
+                Q(title__icontains=term)
+                | Q(excerpt__icontains=term)
+                | Q(content__icontains=term)
+            )
+        posts = (
+            Post.objects.using(self.using)
+            .filter(condition, status="published")
+            .select_related("author", "category")
+            .order_by("-published_date", "-id")[:limit]
+        )
+        term_pattern = re.compile(
+            "|".join(re.escape(term) for term in terms), re.IGNORECASE
+        )
+        return [
+            PostSearchResult(
+                post=post,
+                rank=0.0,
+                snippet=_highlight(
+                    term_pattern.sub(
+                        lambda match: f"{_MARK_START}{match.group(0)}{_MARK_STOP}",
+                        post.excerpt or post.content[:300],
+                    )
+                ),
+            )
+            for post in posts
+        ]
+
+
+class SQLitePostSearchBackend(PostSearchBackend):
+    """BM25-ranked search against the FTS5 shadow table"""
+
+    def search(
+        self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[PostSearchResult]:
+        """Return up to ``limit`` published posts ranked by BM25."""
+        terms = _search_terms(query)
+        if not terms:
+            return []
+
+        # Quote every term so user input never reaches FTS5 query syntax.
+        # Snippets come from the content column, matching ts_headline().
+        match = " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        post_table = Post._meta.db_table
+        sql = (
+            f"SELECT {FTS_TABLE}.rowid, bm25({FTS_TABLE}, 10.0, 5.0, 1.0) AS score, "
+            f"snippet({FTS_TABLE}, 2, %s, %s, '…', 24) "
+            f"FROM {FTS_TABLE} JOIN {post_table} ON {post_table}.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND {post_table}.status = 'published' "
+            "ORDER BY score LIMIT %s"
+        )
+        try:
+            with connections[self.using].cursor() as cursor:
+                cursor.execute(sql, [_MARK_START, _MARK_STOP, match, limit])
+                rows = cursor.fetchall()
+        except DatabaseError:
+            # FTS5 unavailable or the index table was never created.
+            return super().search(query, limit=limit)
+
+        posts = Post.objects.using(self.using).select_related("author", "category")
+        posts_by_id = posts.in_bulk([row[0] for row in rows])
+        return [
+            PostSearchResult(
+                post=posts_by_id[post_id],
+                # bm25() scores are negative; flip so higher means better.
+                rank=-float(score),
+                snippet=_highlight(snippet),
+            )
+            for post_id, score, snippet in rows
+            if post_id in posts_by_id
+        ]
+
+
+class PostgresPostSearchBackend(PostSearchBackend):
+    """``ts_rank_cd``-ranked search against the stored ``tsvector`` column"""
+
+    def search(
+        self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[PostSearchResult]:
+        """Return up to ``limit`` published posts ranked by cover density."""
+        if not _search_terms(query):
+            return []
+
+        return [
+            PostSearchResult(
+                post=post,
+                rank=float(post.search_rank),
+                snippet=_highlight(post.search_snippet),
+            )
+            for post in self.get_queryset(query)[:limit]
+        ]
+
+    def get_queryset(self, query: str) -> QuerySet:
+        """Return matching published posts annotated with rank and snippet."""
+        vector = _StoredSearchVector()
+        tsquery = _WebSearchQuery(Value(query))
+        headline_options = (
+            f"StartSel={_MARK_START}, StopSel={_MARK_STOP}, MaxWords=35, MinWords=15"
+        )
+        return (
+            Post.objects.using(self.using)
+            .filter(_TextSearchMatch(vector, tsquery), status="published")
+            .select_related("author", "category")
+            .annotate(
+                search_rank=_CoverDensityRank(vector, tsquery),
+                search_snippet=_Headline(
+                    F("content"), tsquery, Value(headline_options)
+                ),
+            )
+            .order_by("-search_rank", "-published_date")
+        )
+
+
+def get_post_search_backend(using: str = "default") -> PostSearchBackend:
+    """Return the search backend matching the database vendor."""
+    vendor = connections[using].vendor
+    if vendor == "postgresql":
+        return PostgresPostSearchBackend(using)
+    if vendor == "sqlite":
+        return SQLitePostSearchBackend(using)
+    return PostSearchBackend(using)
+
+
+def search_posts(
+    query: str,
+    *,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    using: str = "default",
+) -> list[PostSearchResult]:
+    """Return ranked, highlighted search results for published posts."""
+    return get_post_search_backend(using).search(query, limit=limit)
@@ -0,0 +1,69 @@
+"""Signal handlers for QuickScale blog module"""
+
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_content_generation
+from .models import BlogApiToken, Category, Post, Tag
+from .tokens import forget_api_token, forget_api_user, get_token_registry
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_list_caches(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Advance the content generation when listed content changes"""
+    bump_content_generation()
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_list_caches_on_tag_change(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    action: str,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Advance the content generation when post tags change"""
+    if action in {"post_add", "post_remove", "post_clear"}:
+        bump_content_generation()
+
+
+@receiver(post_save, sender=BlogApiToken)
+@receiver(post_delete, sender=BlogApiToken)
+def invalidate_api_token(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: BlogApiToken,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Drop the cached resolution of a rotated, revoked or deleted token"""
+    forget_api_token(instance.token_hash)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_api_user(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: Any,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Drop the cached API user so permission changes apply immediately"""
+    forget_api_user(instance.get_username())
+
+
+@receiver(setting_changed)
+def reset_token_registry(
+    setting: str,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Rebuild the token registry when BLOG_API_TOKENS is overridden"""
+    if setting == "BLOG_API_TOKENS":
+        get_token_registry.cache_clear()
@@ -0,0 +1,180 @@
+"""Streaming XML sitemaps for published blog posts
+
+Posts are split into segments of at most 50,000 URLs (the sitemap protocol
+limit) listed by a sitemap index. Segments are ``id`` ranges rather than
+``OFFSET`` pages, and each one streams ``(slug, updated_at)`` rows with
+``iterator()``, so neither memory nor query cost grows with the catalog.
+Segment boundaries, and segments small enough for the cache backend, are
+cached under the blog content generation and are rebuilt only after posts,
+categories or tags change.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import Http404, HttpRequest, StreamingHttpResponse
+from django.urls import reverse
+
+from .caching import build_list_cache_key, get_blog_cache, get_list_cache_timeout
+from .models import Post
+
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_ITERATOR_CHUNK_SIZE = 2_000
+SITEMAP_CONTENT_TYPE = "application/xml; charset=utf-8"
+# Stays under memcached's default 1 MB item limit
+SITEMAP_MAX_CACHED_SEGMENT_BYTES = 900 * 1024
+_SLUG_PLACEHOLDER = "quickscale-sitemap-slug"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def get_sitemap_segment_size() -> int:
+    """Return URLs per sitemap segment, capped at the protocol limit."""
+    size = int(getattr(settings, "BLOG_SITEMAP_SEGMENT_SIZE", SITEMAP_MAX_URLS))
+    return max(1, min(size, SITEMAP_MAX_URLS))
+
+
+def compute_segment_boundaries(queryset: QuerySet, segment_size: int) -> list[int]:
+    """Return the first primary key of every ``segment_size`` rows.
+
+    Only primary keys are streamed, so this is a single index scan however
+    large the table is.
+    """
+    boundaries = []
+    ids = queryset.order_by("pk").values_list("pk", flat=True)
+    for position, pk in enumerate(ids.iterator(chunk_size=SITEMAP_ITERATOR_CHUNK_SIZE)):
+        if position % segment_size == 0:
+            boundaries.append(pk)
+    return boundaries
+
+
+def iter_segment_rows(
+    queryset: QuerySet, boundaries: list[int], segment: int
+) -> Iterator[tuple[str, datetime]]:
+    """Stream ``(slug, updated_at)`` rows belonging to one segment."""
+    rows = queryset.filter(pk__gte=boundaries[segment])
+    if segment + 1 < len(boundaries):
+        rows = rows.filter(pk__lt=boundaries[segment + 1])
+    yield from (
+        rows.order_by("pk")
+        .values_list("slug", "updated_at")
+        .iterator(chunk_size=SITEMAP_ITERATOR_CHUNK_SIZE)
+    )
+
+
+def render_urlset(
+    rows: Iterable[tuple[str, datetime]], location_template: str
+) -> Iterator[str]:
+    """Yield a ``<urlset>`` document in chunks.
+
+    ``location_template`` is an absolute detail URL containing the slug
+    placeholder, so the URL resolver runs once per segment, not per row.
+    """
+    yield f'{_XML_DECLARATION}<urlset xmlns="{_SITEMAP_NAMESPACE}">\n'
+    buffer = []
+    for slug, updated_at in rows:
+        location = escape(location_template.replace(_SLUG_PLACEHOLDER, slug))
+        buffer.append(
+            f"<url><loc>{location}</loc>"
+            f"<lastmod>{updated_at.date().isoformat()}</lastmod></url>\n"
+        )
+        if len(buffer) >= SITEMAP_ITERATOR_CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+    buffer.append("</urlset>\n")
+    yield "".join(buffer)
+
+
+def render_sitemap_index(locations: Iterable[str]) -> str:
+    """Return a ``<sitemapindex>`` document listing segment URLs."""
+    entries = "".join(
+        f"<sitemap><loc>{escape(location)}</loc></sitemap>\n" for location in locations
+    )
+    return (
+        f'{_XML_DECLARATION}<sitemapindex xmlns="{_SITEMAP_NAMESPACE}">\n'
+        f"{entries}</sitemapindex>\n"
+    )
+
+
+def _published_posts() -> QuerySet:
+    return Post.objects.filter(status="published")
+
+
+def get_post_segment_boundaries() -> list[int]:
+    """Return cached segment boundaries for published posts."""
+    timeout = get_list_cache_timeout()
+    key = build_list_cache_key("sitemap", "boundaries", get_sitemap_segment_size())
+    cache = get_blog_cache()
+    boundaries = cache.get(key) if timeout > 0 else None
+    if boundaries is None:
+        boundaries = compute_segment_boundaries(
+            _published_posts(), get_sitemap_segment_size()
+        )
+        if timeout > 0:
+            cache.set(key, boundaries, timeout)
+    return boundaries
+
+
+def _stream_and_cache(chunks: Iterator[str], key: str, timeout: int) -> Iterator[str]:
+    # Segments over the size cap are streamed without being cached
+    rendered: list[str] | None = []
+    size = 0
+    for chunk in chunks:
+        if rendered is not None:
+            size += len(chunk.encode("utf-8"))
+            if size > SITEMAP_MAX_CACHED_SEGMENT_BYTES:
+                rendered = None
+            else:
+                rendered.append(chunk)
+        yield chunk
+    if rendered is not None:
+        get_blog_cache().set(key, "".join(rendered), timeout)
+
+
+def sitemap_index(request: HttpRequest) -> StreamingHttpResponse:
+    """Serve the sitemap index listing every post segment"""
+    segments = max(len(get_post_segment_boundaries()), 1)
+    locations = (
+        request.build_absolute_uri(
+            reverse("quickscale_blog:sitemap_segment", args=[segment])
+        )
+        for segment in range(1, segments + 1)
+    )
+    return StreamingHttpResponse(
+        [render_sitemap_index(locations)], content_type=SITEMAP_CONTENT_TYPE
+    )
+
+
+def sitemap_segment(request: HttpRequest, segment: int) -> StreamingHttpResponse:
+    """Stream one segment of post URLs, serving it from cache when unchanged"""
+    boundaries = get_post_segment_boundaries()
+    if not 1 <= segment <= max(len(boundaries), 1):
+        raise Http404("Sitemap segment does not exist")
+
+    timeout = get_list_cache_timeout()
+    key = build_list_cache_key(
+        "sitemap",
+        "segment",
+        get_sitemap_segment_size(),
+        request.build_absolute_uri("/"),
+        segment,
+    )
+    cached = get_blog_cache().get(key) if timeout > 0 else None
+    if cached is not None:
+        return StreamingHttpResponse([cached], content_type=SITEMAP_CONTENT_TYPE)
+
+    location_template = request.build_absolute_uri(
+        reverse("quickscale_blog:post_detail", args=[_SLUG_PLACEHOLDER])
+    )
+    rows = (
+        iter_segment_rows(_published_posts(), boundaries, segment - 1)
+        if boundaries
+        else iter(())
+    )
+    chunks = render_urlset(rows, location_template)
+    if timeout > 0:
+        chunks = _stream_and_cache(chunks, key, timeout)
+    return StreamingHttpResponse(chunks, content_type=SITEMAP_CONTENT_TYPE)
@@ -0,0 +1,138 @@
+"""Token registry and user cache for blog API authentication
+
+Configured tokens are hashed once per process into a digest-keyed registry, so
+authenticating a request is one SHA-256 and one dictionary lookup. Tokens
+managed in the database (``BlogApiToken``) are looked up by digest and cached
+briefly, as are the users they resolve to. Cached entries are dropped when the
+token or user is saved or deleted (see ``signals``).
+"""
+
+import hashlib
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .caching import get_blog_cache
+from .models import BlogApiToken, hash_api_token
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOG_API_USER_CACHE_TIMEOUT = 60
+_TOKEN_CACHE_PREFIX = "quickscale:blog:api-token"
+_USER_CACHE_PREFIX = "quickscale:blog:api-user"
+_UNKNOWN_TOKEN = ""
+
+
+def get_api_cache_timeout() -> int:
+    """Return how long resolved tokens and users are cached; 0 disables."""
+    return int(
+        getattr(
+            settings,
+            "BLOG_API_USER_CACHE_TIMEOUT",
+            DEFAULT_BLOG_API_USER_CACHE_TIMEOUT,
+        )
+    )
+
+
+def parse_configured_tokens(configured_tokens: Any) -> list[tuple[str, str]]:
+    """Return ``(digest, username)`` pairs from ``BLOG_API_TOKENS`` entries.
+
+    Entries provide either a plain ``token`` or its ``token_sha256`` digest, so
+    settings files need not contain the secret itself.
+    """
+    if not isinstance(configured_tokens, list):
+        logger.warning("BLOG_API_TOKENS must be configured as a list")
+        return []
+
+    valid_tokens: list[tuple[str, str]] = []
+    for entry in configured_tokens:
+        if not isinstance(entry, Mapping):
+            continue
+        username = entry.get("username")
+        if not isinstance(username, str) or not username.strip():
+            continue
+        raw_token = entry.get("token")
+        token_digest = entry.get("token_sha256")
+        if isinstance(raw_token, str) and raw_token.strip():
+            digest = hash_api_token(raw_token.strip())
+        elif isinstance(token_digest, str) and token_digest.strip():
+            digest = token_digest.strip().lower()
+        else:
+            continue
+        valid_tokens.append((digest, username.strip()))
+    return valid_tokens
+
+
+@lru_cache(maxsize=1)
+def get_token_registry() -> dict[str, str]:
+    """Return configured token digests mapped to usernames, built once."""
+    return dict(parse_configured_tokens(getattr(settings, "BLOG_API_TOKENS", [])))
+
+
+def _token_cache_key(digest: str) -> str:
+    return f"{_TOKEN_CACHE_PREFIX}:{digest}"
+
+
+def _user_cache_key(username: str) -> str:
+    digest = hashlib.sha256(username.encode("utf-8")).hexdigest()
+    return f"{_USER_CACHE_PREFIX}:{digest}"
+
+
+def resolve_token_username(raw_token: str) -> str | None:
+    """Return the username a raw API token authenticates as, if any."""
+    digest = hash_api_token(raw_token)
+    username = get_token_registry().get(digest)
+    if username is not None:
+        return username
+
+    timeout = get_api_cache_timeout()
+    cache = get_blog_cache()
+    if timeout > 0:
+        cached = cache.get(_token_cache_key(digest))
+        if cached is not None:
+            return cached or None
+
+    token = (
+        BlogApiToken.objects.select_related("user").filter(token_hash=digest).first()
+    )
+    username = token.user.get_username() if token and token.is_usable else None
+    if timeout > 0:
+        if token is not None and token.expires_at is not None:
+            remaining = (token.expires_at - timezone.now()).total_seconds()
+            timeout = max(1, min(timeout, int(remaining)))
+        cache.set(_token_cache_key(digest), username or _UNKNOWN_TOKEN, timeout)
+    return username
+
+
+def get_api_user(username: str) -> Any | None:
+    """Return the active user named ``username``, cached briefly."""
+    timeout = get_api_cache_timeout()
+    cache = get_blog_cache()
+    key = _user_cache_key(username)
+    if timeout > 0:
+        user = cache.get(key)
+        if user is not None:
+            return user
+
+    user_model = get_user_model()
+    user = user_model.objects.filter(
+        **{user_model.USERNAME_FIELD: username, "is_active": True}
+    ).first()
+    if user is not None and timeout > 0:
+        cache.set(key, user, timeout)
+    return user
+
+
+def forget_api_token(token_hash: str) -> None:
+    """Drop the cached resolution of a database token."""
+    get_blog_cache().delete(_token_cache_key(token_hash))
+
+
+def forget_api_user(username: str) -> None:
+    """Drop the cached user for ``username``."""
+    get_blog_cache().delete(_user_cache_key(username))
@@ -2,7 +2,7 @@
 
 from django.urls import path
 
-from . import views
+from . import sitemaps, views
 from .feeds import LatestPostsFeed
 
 app_name = "quickscale_blog"
@@ -10,11 +10,34 @@ app_name = "quickscale_blog"
 urlpatterns = [
     path("", views.PostListView.as_view(), name="post_list"),
     path("post/<slug:slug>/", views.PostDetailView.as_view(), name="post_detail"),
+    path("search/", views.PostSearchView.as_view(), name="post_search"),
+    path("api/posts/", views.list_posts_api, name="api_list_posts"),
     path("api/media/", views.upload_media_api, name="api_upload_media"),
+    path(
+        "api/media/presign/",
+        views.presign_media_upload_api,
+        name="api_presign_media_upload",
+    ),
+    path(
+        "api/media/finalize/",
+        views.finalize_media_upload_api,
+        name="api_finalize_media_upload",
+    ),
     path("api/publish/", views.publish_post_api, name="api_publish_post"),
+    path(
+        "api/publish/batch/",
+        views.publish_posts_batch_api,
+        name="api_publish_posts_batch",
+    ),
     path(
         "category/<slug:slug>/", views.CategoryListView.as_view(), name="category_list"
     ),
     path("tag/<slug:slug>/", views.TagListView.as_view(), name="tag_list"),
     path("feed/", LatestPostsFeed(), name="feed"),
+    path("sitemap.xml", sitemaps.sitemap_index, name="sitemap_index"),
+    path(
+        "sitemap-<int:segment>.xml",
+        sitemaps.sitemap_segment,
+        name="sitemap_segment",
+    ),
 ]
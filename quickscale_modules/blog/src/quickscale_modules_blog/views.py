@@ -2,26 +2,36 @@
 
 import json
 import logging
-import secrets
 from collections.abc import Callable, Mapping
 from importlib import import_module
 from typing import Any, TypeVar, cast
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import UploadedFile
 from django.db import IntegrityError
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.middleware.csrf import CsrfViewMiddleware
-from django.utils.html import escape
+from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.text import slugify
 from django.views.decorators.csrf import csrf_exempt
-from django.views.generic import DetailView, ListView
-from markdownx.utils import markdownify
+from django.views.decorators.http import condition
+from django.views.generic import DetailView, ListView, TemplateView
 from PIL import Image, UnidentifiedImageError
 
-from .models import BlogMediaAsset, Category, Post, Tag
+from .caching import (
+    GenerationCachedPaginator,
+    build_list_cache_key,
+    get_blog_cache_alias,
+    get_list_cache_timeout,
+    get_or_set_list_value,
+)
+from .conditional import post_detail_etag, post_detail_last_modified
+from .models import BlogMediaAsset, Category, Post, Tag, bulk_create_posts
+from .pagination import InvalidCursor, KeysetPaginator, keyset_pagination_enabled
+from .search import search_posts
+from .tokens import get_api_user, resolve_token_username
 
 storage_build_public_media_url: Callable[..., str] | None = None
 storage_validate_file_upload: Callable[..., Any] | None = None
@@ -39,11 +49,21 @@ if storage_helpers is not None:
         storage_helpers, "validate_file_upload", None
     )
 
+storage_direct_uploads: Any | None
+try:
+    storage_direct_uploads = import_module("quickscale_modules_storage.direct_uploads")
+except ModuleNotFoundError:
+    storage_direct_uploads = None
+
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BLOG_API_ALLOWED_IMAGE_FORMATS = ("PNG", "JPEG", "WEBP", "GIF")
 DEFAULT_BLOG_API_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BLOG_API_MAX_IMAGE_PIXELS = 50_000_000
+DEFAULT_BLOG_API_BATCH_MAX_POSTS = 500
+DEFAULT_BLOG_API_PAGE_SIZE = 20
+MAX_BLOG_API_PAGE_SIZE = 100
 
 ViewFunc = TypeVar("ViewFunc", bound=Callable[..., Any])
 
@@ -113,27 +133,6 @@ class BlogMediaUploadValidationError(Exception):
         self.errors = errors
 
 
-def _get_blog_api_tokens() -> list[tuple[str, str]]:
-    """Return configured token-to-username mappings for machine authentication."""
-    configured_tokens = getattr(settings, "BLOG_API_TOKENS", [])
-    if not isinstance(configured_tokens, list):
-        logger.warning("BLOG_API_TOKENS must be configured as a list")
-        return []
-
-    valid_tokens: list[tuple[str, str]] = []
-    for entry in configured_tokens:
-        if not isinstance(entry, Mapping):
-            continue
-        raw_token = entry.get("token")
-        username = entry.get("username")
-        if not isinstance(raw_token, str) or not raw_token.strip():
-            continue
-        if not isinstance(username, str) or not username.strip():
-            continue
-        valid_tokens.append((raw_token.strip(), username.strip()))
-    return valid_tokens
-
-
 def _get_authorization_token(request: HttpRequest) -> str | None:
     """Extract a Bearer or Token authorization token from the request."""
     header_value = request.META.get("HTTP_AUTHORIZATION", "").strip()
@@ -173,26 +172,20 @@ def authenticate_blog_api_request(
                 status=401,
             )
 
-        user_model = get_user_model()
-        for configured_token, username in _get_blog_api_tokens():
-            if not secrets.compare_digest(token, configured_token):
-                continue
+        username = resolve_token_username(token)
+        if username is None:
+            return None, JsonResponse({"error": "Invalid API token"}, status=401)
 
-            user = user_model.objects.filter(username=username, is_active=True).first()
-            if user is None:
-                logger.warning(
-                    "BLOG_API_TOKENS references missing user '%s'",
-                    username,
-                )
-                return None, JsonResponse({"error": "Invalid API token"}, status=401)
-            if not getattr(user, "is_staff", False):
-                return None, JsonResponse(
-                    {"error": "Staff access required"},
-                    status=403,
-                )
-            return user, None
-
-        return None, JsonResponse({"error": "Invalid API token"}, status=401)
+        user = get_api_user(username)
+        if user is None:
+            logger.warning("API token references missing user '%s'", username)
+            return None, JsonResponse({"error": "Invalid API token"}, status=401)
+        if not getattr(user, "is_staff", False):
+            return None, JsonResponse(
+                {"error": "Staff access required"},
+                status=403,
+            )
+        return user, None
 
     if not request.user.is_authenticated:
         return None, JsonResponse({"error": "Authentication required"}, status=401)
@@ -207,17 +200,19 @@ def authenticate_blog_api_request(
     return request.user, None
 
 
-def _validate_blog_image_upload(uploaded_file: UploadedFile) -> tuple[int, int]:
-    """Validate the uploaded image and return its dimensions."""
+def _get_blog_upload_max_bytes() -> int:
+    """Return the largest accepted blog media upload, in bytes."""
     max_upload_bytes_setting = getattr(
         settings,
         "BLOG_API_UPLOAD_MAX_BYTES",
         DEFAULT_BLOG_API_UPLOAD_MAX_BYTES,
     )
-    max_upload_bytes = int(
-        max_upload_bytes_setting or DEFAULT_BLOG_API_UPLOAD_MAX_BYTES
-    )
-    allowed_formats = {
+    return int(max_upload_bytes_setting or DEFAULT_BLOG_API_UPLOAD_MAX_BYTES)
+
+
+def _get_blog_allowed_image_formats() -> set[str]:
+    """Return the upper-cased Pillow formats accepted for blog media."""
+    return {
         str(image_format).upper()
         for image_format in getattr(
             settings,
@@ -226,27 +221,64 @@ def _validate_blog_image_upload(uploaded_file: UploadedFile) -> tuple[int, int]:
         )
     }
 
+
+def _get_blog_max_image_pixels() -> int:
+    """Return the largest accepted image area, in pixels."""
+    return int(
+        getattr(
+            settings, "BLOG_API_MAX_IMAGE_PIXELS", DEFAULT_BLOG_API_MAX_IMAGE_PIXELS
+        )
+    )
+
+
+def _validate_blog_image_upload(uploaded_file: UploadedFile) -> tuple[int, int]:
+    """Validate the uploaded image and return its dimensions."""
+    max_upload_bytes = _get_blog_upload_max_bytes()
+    allowed_formats = _get_blog_allowed_image_formats()
+
     uploaded_file_size = uploaded_file.size or 0
     if uploaded_file_size > max_upload_bytes:
         raise BlogMediaUploadValidationError(
             {"file": f"File exceeds maximum upload size of {max_upload_bytes} bytes"}
         )
 
+    max_pixels = _get_blog_max_image_pixels()
+    deep_verify = bool(getattr(settings, "BLOG_API_DEEP_VERIFY_IMAGES", False))
+
     if storage_validate_file_upload is not None:
         try:
             validated = storage_validate_file_upload(
                 uploaded_file,
                 max_size_bytes=max_upload_bytes,
                 allowed_image_formats=allowed_formats,
+                max_pixels=max_pixels,
+                deep_verify=deep_verify,
             )
         except ValueError as exc:
             raise BlogMediaUploadValidationError({"file": str(exc)}) from None
         return validated.width, validated.height
 
+    # Read format and size from the header; decode only when deep-verifying.
     try:
         uploaded_file.seek(0)
-        image = Image.open(uploaded_file)
-        image.load()
+        with Image.open(uploaded_file) as image:
+            image_format = (image.format or "").upper()
+            width, height = image.size
+            if width * height > max_pixels:
+                raise BlogMediaUploadValidationError(
+                    {
+                        "file": (
+                            f"Image exceeds maximum of {max_pixels} pixels "
+                            f"({width}x{height})"
+                        )
+                    }
+                )
+            if deep_verify:
+                image.load()
+    except Image.DecompressionBombError as exc:
+        raise BlogMediaUploadValidationError(
+            {"file": "Image dimensions are too large to process safely"}
+        ) from exc
     except (UnidentifiedImageError, OSError) as exc:
         raise BlogMediaUploadValidationError(
             {"file": "Unsupported or invalid image file"}
@@ -254,14 +286,13 @@ def _validate_blog_image_upload(uploaded_file: UploadedFile) -> tuple[int, int]:
     finally:
         uploaded_file.seek(0)
 
-    image_format = (image.format or "").upper()
     if image_format not in allowed_formats:
         allowed_list = ", ".join(sorted(allowed_formats))
         raise BlogMediaUploadValidationError(
             {"file": f"Unsupported image format. Allowed formats: {allowed_list}"}
         )
 
-    return image.width, image.height
+    return width, height
 
 
 def create_blog_media_asset_from_request(
@@ -302,8 +333,158 @@ def create_blog_media_asset_from_request(
     )
 
 
-def create_published_post_from_payload(payload: Mapping[str, Any], author: Any) -> Post:
-    """Create and return a published blog post from validated API payload"""
+def _parse_json_object(request: HttpRequest) -> dict[str, Any] | None:
+    """Return the JSON object in the request body, or None if it is not one."""
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+    except UnicodeDecodeError, json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _clean_media_metadata(payload: Mapping[str, Any]) -> tuple[str, str]:
+    """Validate ``alt`` and ``kind`` of a media payload and return them."""
+    errors: dict[str, str] = {}
+    alt = payload.get("alt", "")
+    if not isinstance(alt, str):
+        errors["alt"] = "Must be a string"
+    elif len(alt.strip()) > 200:
+        errors["alt"] = "Must be 200 characters or fewer"
+
+    kind = payload.get("kind", BlogMediaAsset.Kind.INLINE)
+    if not isinstance(kind, str) or not kind.strip():
+        errors["kind"] = "Must be a non-empty string"
+    elif kind.strip() not in BlogMediaAsset.Kind.values:
+        errors["kind"] = "Must be one of: " + ", ".join(BlogMediaAsset.Kind.values)
+
+    if errors:
+        raise BlogMediaUploadValidationError(errors)
+    return cast(str, alt).strip(), cast(str, kind).strip()
+
+
+def create_presigned_media_upload(
+    payload: Mapping[str, Any], author: Any
+) -> dict[str, Any]:
+    """Issue a presigned direct upload for a blog image described by ``payload``."""
+    direct_uploads = cast(Any, storage_direct_uploads)
+    errors: dict[str, str] = {}
+
+    filename = payload.get("filename")
+    if not isinstance(filename, str) or not filename.strip():
+        errors["filename"] = "Must be a non-empty string"
+    elif len(filename.strip()) > 255:
+        errors["filename"] = "Must be 255 characters or fewer"
+
+    allowed_formats = _get_blog_allowed_image_formats()
+    content_type = payload.get("content_type")
+    if not isinstance(content_type, str) or not content_type.startswith("image/"):
+        errors["content_type"] = "Must be an image content type"
+    elif content_type.removeprefix("image/").upper() not in allowed_formats:
+        allowed_list = ", ".join(sorted(allowed_formats))
+        errors["content_type"] = (
+            f"Unsupported image format. Allowed formats: {allowed_list}"
+        )
+
+    method = payload.get("method", "POST")
+    if (
+        not isinstance(method, str)
+        or method.upper() not in direct_uploads.PRESIGNED_UPLOAD_METHODS
+    ):
+        errors["method"] = "Must be one of: " + ", ".join(
+            direct_uploads.PRESIGNED_UPLOAD_METHODS
+        )
+
+    if errors:
+        raise BlogMediaUploadValidationError(errors)
+
+    presigned = direct_uploads.create_presigned_upload(
+        settings,
+        module_name="blog",
+        asset_kind="uploads",
+        filename=cast(str, filename).strip(),
+        content_type=content_type,
+        max_size_bytes=_get_blog_upload_max_bytes(),
+        method=cast(str, method),
+        claims={
+            "uploaded_by": author.pk,
+            "original_filename": cast(str, filename).strip(),
+        },
+    )
+    return {
+        "key": presigned.key,
+        "method": presigned.method,
+        "url": presigned.url,
+        "fields": presigned.fields,
+        "headers": presigned.headers,
+        "expires_in": presigned.expires_in,
+        "upload_token": presigned.upload_token,
+    }
+
+
+def finalize_direct_media_upload(
+    payload: Mapping[str, Any], author: Any
+) -> tuple[BlogMediaAsset, bool]:
+    """Validate a directly uploaded image and return its ``BlogMediaAsset``.
+
+    The stored object is validated from a ranged header read, so it is never
+    downloaded in full. Objects that fail validation are deleted. Finalizing
+    the same upload twice returns the existing asset.
+    """
+    direct_uploads = cast(Any, storage_direct_uploads)
+    upload_token = payload.get("upload_token")
+    if not isinstance(upload_token, str) or not upload_token.strip():
+        raise BlogMediaUploadValidationError(
+            {"upload_token": "Must be a non-empty string"}
+        )
+    alt, kind = _clean_media_metadata(payload)
+
+    try:
+        ticket = direct_uploads.read_upload_token(
+            upload_token.strip(),
+            max_age=direct_uploads.get_upload_finalize_window(settings),
+        )
+    except ValueError as exc:
+        raise BlogMediaUploadValidationError({"upload_token": str(exc)}) from None
+    if ticket.claims.get("uploaded_by") != author.pk:
+        raise BlogMediaUploadValidationError(
+            {"upload_token": "Upload token was issued to another user"}
+        )
+
+    existing = BlogMediaAsset.objects.filter(file=ticket.key).first()
+    if existing is not None:
+        return existing, False
+
+    storage = BlogMediaAsset._meta.get_field("file").storage
+    try:
+        validated = direct_uploads.validate_uploaded_object(
+            settings,
+            ticket.key,
+            max_size_bytes=ticket.max_size_bytes,
+            allowed_image_formats=_get_blog_allowed_image_formats(),
+            max_pixels=_get_blog_max_image_pixels(),
+            storage=storage,
+        )
+    except ValueError as exc:
+        if storage.exists(ticket.key):
+            storage.delete(ticket.key)
+        raise BlogMediaUploadValidationError({"file": str(exc)}) from None
+
+    asset = BlogMediaAsset.objects.create(
+        file=ticket.key,
+        alt=alt,
+        kind=kind,
+        original_filename=str(ticket.claims.get("original_filename") or ticket.key),
+        width=validated.width,
+        height=validated.height,
+        uploaded_by=author,
+    )
+    return asset, True
+
+
+def _clean_publish_payload(
+    payload: Mapping[str, Any],
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Validate the shape of a publish payload without database lookups."""
     errors: dict[str, str] = {}
 
     title = payload.get("title")
@@ -324,7 +505,6 @@ def create_published_post_from_payload(payload: Mapping[str, Any], author: Any)
     if featured_image_alt is not None and not isinstance(featured_image_alt, str):
         errors["featured_image_alt"] = "Must be a string"
 
-    featured_media_asset = None
     featured_image_id = payload.get("featured_image_id")
     if featured_image_id is not None:
         if isinstance(featured_image_id, str) and featured_image_id.strip().isdigit():
@@ -332,24 +512,17 @@ def create_published_post_from_payload(payload: Mapping[str, Any], author: Any)
 
         if not isinstance(featured_image_id, int):
             errors["featured_image_id"] = "Must be an integer"
-        else:
-            featured_media_asset = BlogMediaAsset.objects.filter(
-                pk=featured_image_id
-            ).first()
-            if featured_media_asset is None:
-                errors["featured_image_id"] = "Media asset not found"
+            featured_image_id = None
     elif featured_image_alt is not None and str(featured_image_alt).strip():
         errors["featured_image_alt"] = "featured_image_alt requires featured_image_id"
 
-    category = None
     category_slug = payload.get("category_slug")
     if category_slug is not None:
         if not isinstance(category_slug, str) or not category_slug.strip():
             errors["category_slug"] = "Must be a non-empty string"
+            category_slug = None
         else:
-            category = Category.objects.filter(slug=category_slug.strip()).first()
-            if category is None:
-                errors["category_slug"] = "Category not found"
+            category_slug = category_slug.strip()
 
     tag_names: list[str] = []
     tags = payload.get("tags")
@@ -368,33 +541,105 @@ def create_published_post_from_payload(payload: Mapping[str, Any], author: Any)
                     break
                 tag_names.append(tag.strip())
 
+    title_text = title.strip() if isinstance(title, str) else ""
+    cleaned = {
+        "title": title_text,
+        "slug": slugify(title_text),
+        "content": content.strip() if isinstance(content, str) else "",
+        "excerpt": excerpt.strip() if isinstance(excerpt, str) else "",
+        "featured_image_id": featured_image_id,
+        "featured_image_alt": (
+            featured_image_alt.strip() if isinstance(featured_image_alt, str) else None
+        ),
+        "category_slug": category_slug,
+        "tag_names": tag_names,
+    }
+    return cleaned, errors
+
+
+def _published_post_fields(
+    cleaned: Mapping[str, Any],
+    author: Any,
+    category: Category | None,
+    featured_media_asset: BlogMediaAsset | None,
+) -> dict[str, Any]:
+    """Return Post field values for a cleaned, resolved publish payload."""
+    featured_image_alt = cleaned["featured_image_alt"]
+    if featured_image_alt is None:
+        featured_image_alt = featured_media_asset.alt if featured_media_asset else ""
+    return {
+        "title": cleaned["title"],
+        "slug": cleaned["slug"],
+        "content": cleaned["content"],
+        "excerpt": cleaned["excerpt"],
+        "featured_image": (
+            featured_media_asset.file.name if featured_media_asset else None
+        ),
+        "featured_image_alt": featured_image_alt,
+        "status": "published",
+        "author": author,
+        "category": category,
+    }
+
+
+def _resolve_tags(tag_names: list[str]) -> dict[str, Tag]:
+    """Return tags keyed by slug, creating missing ones in one bulk insert."""
+    names_by_slug: dict[str, str] = {}
+    for tag_name in tag_names:
+        names_by_slug.setdefault(slugify(tag_name), tag_name)
+    if not names_by_slug:
+        return {}
+
+    tags_by_slug = Tag.objects.in_bulk(list(names_by_slug), field_name="slug")
+    missing = [
+        Tag(name=name, slug=slug)
+        for slug, name in names_by_slug.items()
+        if slug not in tags_by_slug
+    ]
+    if missing:
+        Tag.objects.bulk_create(missing, ignore_conflicts=True)
+        tags_by_slug.update(
+            Tag.objects.in_bulk([tag.slug for tag in missing], field_name="slug")
+        )
+        # A tag whose name exists under a different slug is reused by name.
+        unresolved = {
+            names_by_slug[tag.slug]: tag.slug
+            for tag in missing
+            if tag.slug not in tags_by_slug
+        }
+        for tag in Tag.objects.filter(name__in=list(unresolved)):
+            tags_by_slug[unresolved[tag.name]] = tag
+    return tags_by_slug
+
+
+def create_published_post_from_payload(payload: Mapping[str, Any], author: Any) -> Post:
+    """Create and return a published blog post from validated API payload"""
+    cleaned, errors = _clean_publish_payload(payload)
+
+    featured_media_asset = None
+    if cleaned["featured_image_id"] is not None:
+        featured_media_asset = BlogMediaAsset.objects.filter(
+            pk=cleaned["featured_image_id"]
+        ).first()
+        if featured_media_asset is None:
+            errors["featured_image_id"] = "Media asset not found"
+
+    category = None
+    if cleaned["category_slug"] is not None:
+        category = Category.objects.filter(slug=cleaned["category_slug"]).first()
+        if category is None:
+            errors["category_slug"] = "Category not found"
+
     if errors:
         raise BlogPublishValidationError(errors)
 
-    title_text = str(title).strip()
-    content_text = str(content).strip()
-    generated_slug = slugify(title_text)
-
+    generated_slug = cleaned["slug"]
     if Post.objects.filter(slug=generated_slug).exists():
         raise BlogPublishConflictError("Post already exists for generated slug")
 
     try:
         post = Post.objects.create(
-            title=title_text,
-            slug=generated_slug,
-            content=content_text,
-            excerpt=excerpt.strip() if isinstance(excerpt, str) else "",
-            featured_image=(
-                featured_media_asset.file.name if featured_media_asset else None
-            ),
-            featured_image_alt=(
-                featured_image_alt.strip()
-                if isinstance(featured_image_alt, str)
-                else (featured_media_asset.alt if featured_media_asset else "")
-            ),
-            status="published",
-            author=author,
-            category=category,
+            **_published_post_fields(cleaned, author, category, featured_media_asset)
         )
     except IntegrityError as exc:
         if Post.objects.filter(slug=generated_slug).exists():
@@ -403,20 +648,130 @@ def create_published_post_from_payload(payload: Mapping[str, Any], author: Any)
             ) from exc
         raise
 
-    if tag_names:
-        tag_objects: list[Tag] = []
-        for tag_name in tag_names:
-            tag_slug = slugify(tag_name)
-            tag_obj, _ = Tag.objects.get_or_create(
-                slug=tag_slug,
-                defaults={"name": tag_name},
-            )
-            tag_objects.append(tag_obj)
-        post.tags.add(*tag_objects)
+    if cleaned["tag_names"]:
+        tags_by_slug = _resolve_tags(cleaned["tag_names"])
+        post.tags.add(*{tags_by_slug[slugify(name)] for name in cleaned["tag_names"]})
 
     return post
 
 
+def _bulk_create_accepted(
+    accepted: list[tuple[int, dict[str, Any], dict[str, Any]]],
+    tags_by_slug: Mapping[str, Tag],
+) -> list[Post]:
+    """Insert accepted batch items and their tag links."""
+    return bulk_create_posts(
+        [Post(**fields) for _, _, fields in accepted],
+        [
+            [tags_by_slug[slugify(name)] for name in cleaned["tag_names"]]
+            for _, cleaned, _ in accepted
+        ],
+    )
+
+
+def publish_posts_batch(payloads: list[Any], author: Any) -> list[dict[str, Any]]:
+    """Validate and publish a batch of posts with set-based queries.
+
+    Categories, media assets, tags and existing slugs are each resolved with
+    one query for the whole batch, missing tags are created in one insert, and
+    posts and tag links are inserted in bulk. Items that fail validation or
+    whose slug is taken (already stored, or earlier in the same batch) are
+    reported individually without aborting the rest. Results follow the order
+    of ``payloads``.
+    """
+    results: list[dict[str, Any]] = [{} for _ in payloads]
+    pending: list[tuple[int, dict[str, Any], dict[str, str]]] = []
+    for index, payload in enumerate(payloads):
+        if not isinstance(payload, Mapping):
+            results[index] = {
+                "index": index,
+                "status": 400,
+                "error": "JSON object payload expected",
+            }
+            continue
+        cleaned, errors = _clean_publish_payload(payload)
+        pending.append((index, cleaned, errors))
+
+    asset_ids = {
+        cleaned["featured_image_id"]
+        for _, cleaned, _ in pending
+        if cleaned["featured_image_id"] is not None
+    }
+    category_slugs = {
+        cleaned["category_slug"]
+        for _, cleaned, _ in pending
+        if cleaned["category_slug"] is not None
+    }
+    assets = BlogMediaAsset.objects.in_bulk(list(asset_ids)) if asset_ids else {}
+    categories = (
+        Category.objects.in_bulk(list(category_slugs), field_name="slug")
+        if category_slugs
+        else {}
+    )
+    candidate_slugs = {cleaned["slug"] for _, cleaned, _ in pending if cleaned["slug"]}
+    taken_slugs = set(
+        Post.objects.filter(slug__in=candidate_slugs).values_list("slug", flat=True)
+    )
+
+    accepted: list[tuple[int, dict[str, Any], dict[str, Any]]] = []
+    for index, cleaned, errors in pending:
+        asset_id = cleaned["featured_image_id"]
+        if asset_id is not None and asset_id not in assets:
+            errors["featured_image_id"] = "Media asset not found"
+        category_slug = cleaned["category_slug"]
+        if category_slug is not None and category_slug not in categories:
+            errors["category_slug"] = "Category not found"
+        if errors:
+            results[index] = {"index": index, "status": 400, "errors": errors}
+            continue
+        if cleaned["slug"] in taken_slugs:
+            results[index] = {
+                "index": index,
+                "status": 409,
+                "error": "Post already exists for generated slug",
+            }
+            continue
+        taken_slugs.add(cleaned["slug"])
+        fields = _published_post_fields(
+            cleaned,
+            author,
+            categories.get(category_slug) if category_slug else None,
+            assets.get(asset_id) if asset_id is not None else None,
+        )
+        accepted.append((index, cleaned, fields))
+
+    tags_by_slug = _resolve_tags(
+        [name for _, cleaned, _ in accepted for name in cleaned["tag_names"]]
+    )
+    try:
+        created = _bulk_create_accepted(accepted, tags_by_slug)
+    except IntegrityError:
+        # A concurrent publish claimed one of the slugs; report it and retry.
+        claimed = set(
+            Post.objects.filter(
+                slug__in=[cleaned["slug"] for _, cleaned, _ in accepted]
+            ).values_list("slug", flat=True)
+        )
+        for index, cleaned, _ in accepted:
+            if cleaned["slug"] in claimed:
+                results[index] = {
+                    "index": index,
+                    "status": 409,
+                    "error": "Post already exists for generated slug",
+                }
+        accepted = [item for item in accepted if item[1]["slug"] not in claimed]
+        created = _bulk_create_accepted(accepted, tags_by_slug)
+    for (index, _, _), post in zip(accepted, created, strict=True):
+        results[index] = {
+            "index": index,
+            "status": 201,
+            "id": post.pk,
+            "slug": post.slug,
+            "url": post.get_absolute_url(),
+        }
+    return results
+
+
 @_typed_csrf_exempt
 def upload_media_api(request: HttpRequest) -> JsonResponse:
     """Upload a blog image for later use in Markdown or as a featured image."""
@@ -448,6 +803,81 @@ def upload_media_api(request: HttpRequest) -> JsonResponse:
     )
 
 
+@_typed_csrf_exempt
+def presign_media_upload_api(request: HttpRequest) -> JsonResponse:
+    """Issue a presigned URL for uploading a blog image directly to storage."""
+    if request.method != "POST":
+        return JsonResponse(
+            {"error": "Method not allowed", "allowed_methods": ["POST"]},
+            status=405,
+        )
+
+    author, auth_error = authenticate_blog_api_request(request)
+    if auth_error is not None:
+        return auth_error  # type: ignore[return-value]
+
+    if storage_direct_uploads is None:
+        return JsonResponse(
+            {"error": "Direct uploads require the storage module"}, status=501
+        )
+
+    payload = _parse_json_object(request)
+    if payload is None:
+        return JsonResponse({"error": "Invalid JSON payload"}, status=400)
+
+    try:
+        presigned = create_presigned_media_upload(payload, author)
+    except BlogMediaUploadValidationError as exc:
+        return JsonResponse({"errors": exc.errors}, status=400)
+
+    if not urlparse(presigned["url"]).netloc:
+        presigned["url"] = request.build_absolute_uri(presigned["url"])
+    presigned["finalize_url"] = request.build_absolute_uri(
+        reverse("quickscale_blog:api_finalize_media_upload")
+    )
+    return JsonResponse(presigned, status=201)
+
+
+@_typed_csrf_exempt
+def finalize_media_upload_api(request: HttpRequest) -> JsonResponse:
+    """Register a directly uploaded blog image as a media asset."""
+    if request.method != "POST":
+        return JsonResponse(
+            {"error": "Method not allowed", "allowed_methods": ["POST"]},
+            status=405,
+        )
+
+    author, auth_error = authenticate_blog_api_request(request)
+    if auth_error is not None:
+        return auth_error  # type: ignore[return-value]
+
+    if storage_direct_uploads is None:
+        return JsonResponse(
+            {"error": "Direct uploads require the storage module"}, status=501
+        )
+
+    payload = _parse_json_object(request)
+    if payload is None:
+        return JsonResponse({"error": "Invalid JSON payload"}, status=400)
+
+    try:
+        asset, created = finalize_direct_media_upload(payload, author)
+    except BlogMediaUploadValidationError as exc:
+        return JsonResponse({"errors": exc.errors}, status=400)
+
+    return JsonResponse(
+        {
+            "id": asset.pk,
+            "url": _build_media_response_url(request, asset.file.name),
+            "alt": asset.alt,
+            "kind": asset.kind,
+            "width": asset.width,
+            "height": asset.height,
+        },
+        status=201 if created else 200,
+    )
+
+
 @_typed_csrf_exempt
 def publish_post_api(request: HttpRequest) -> JsonResponse:
     """Create and publish a blog post from JSON payload for authenticated staff users"""
@@ -495,7 +925,192 @@ def publish_post_api(request: HttpRequest) -> JsonResponse:
     )
 
 
-class PostListView(ListView):
+@_typed_csrf_exempt
+def publish_posts_batch_api(request: HttpRequest) -> JsonResponse:
+    """Publish an array of blog posts, reporting failures per item"""
+    if request.method != "POST":
+        return JsonResponse(
+            {"error": "Method not allowed", "allowed_methods": ["POST"]},
+            status=405,
+        )
+
+    author, auth_error = authenticate_blog_api_request(request)
+    if auth_error is not None:
+        return auth_error  # type: ignore[return-value]
+
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+    except UnicodeDecodeError:
+        return JsonResponse({"error": "Invalid JSON payload"}, status=400)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON payload"}, status=400)
+
+    posts = payload.get("posts") if isinstance(payload, dict) else None
+    if not isinstance(posts, list) or not posts:
+        return JsonResponse(
+            {"errors": {"posts": "Must be a non-empty list of post objects"}},
+            status=400,
+        )
+
+    max_posts = int(
+        getattr(settings, "BLOG_API_BATCH_MAX_POSTS", DEFAULT_BLOG_API_BATCH_MAX_POSTS)
+    )
+    if len(posts) > max_posts:
+        return JsonResponse(
+            {"errors": {"posts": f"Must contain at most {max_posts} posts"}},
+            status=400,
+        )
+
+    try:
+        results = publish_posts_batch(posts, author)
+    except IntegrityError:
+        logger.exception("Unexpected integrity error while publishing post batch")
+        return JsonResponse({"error": "Unable to publish posts"}, status=500)
+
+    created = sum(1 for result in results if result["status"] == 201)
+    return JsonResponse(
+        {"created": created, "failed": len(results) - created, "results": results},
+        status=200,
+    )
+
+
+def _serialize_post_summary(post: Post) -> dict[str, Any]:
+    """Return the API representation of a published post in a list."""
+    return {
+        "id": post.pk,
+        "title": post.title,
+        "slug": post.slug,
+        "url": post.get_absolute_url(),
+        "excerpt": post.excerpt,
+        "published_date": (
+            post.published_date.isoformat() if post.published_date else None
+        ),
+        "category": post.category.slug if post.category else None,
+        "tags": [tag.slug for tag in post.tags.all()],
+    }
+
+
+def list_posts_api(request: HttpRequest) -> JsonResponse:
+    """List published posts newest-first using opaque keyset cursors"""
+    if request.method != "GET":
+        return JsonResponse(
+            {"error": "Method not allowed", "allowed_methods": ["GET"]},
+            status=405,
+        )
+
+    _, auth_error = authenticate_blog_api_request(request)
+    if auth_error is not None:
+        return auth_error  # type: ignore[return-value]
+
+    raw_limit = request.GET.get("limit", "").strip()
+    if raw_limit and not raw_limit.isdigit():
+        return JsonResponse({"errors": {"limit": "Must be an integer"}}, status=400)
+    limit = int(raw_limit) if raw_limit else DEFAULT_BLOG_API_PAGE_SIZE
+    if not 1 <= limit <= MAX_BLOG_API_PAGE_SIZE:
+        return JsonResponse(
+            {"errors": {"limit": f"Must be between 1 and {MAX_BLOG_API_PAGE_SIZE}"}},
+            status=400,
+        )
+
+    queryset = (
+        Post.objects.filter(status="published")
+        .select_related("category")
+        .prefetch_related("tags")
+    )
+    try:
+        page = KeysetPaginator(queryset, limit).page(
+            request.GET.get("cursor", "").strip() or None
+        )
+    except InvalidCursor as exc:
+        return JsonResponse({"errors": {"cursor": str(exc)}}, status=400)
+
+    return JsonResponse(
+        {
+            "results": [_serialize_post_summary(post) for post in page.object_list],
+            "next_cursor": page.next_cursor or None,
+            "previous_cursor": page.previous_cursor or None,
+        }
+    )
+
+
+class KeysetPaginationMixin:
+    """Serve list pages by cursor when ``BLOG_KEYSET_PAGINATION`` is enabled
+
+    Requests carrying a legacy ``?page=`` parameter keep offset pagination,
+    so existing links and bookmarks continue to resolve.
+    """
+
+    cursor_kwarg = "cursor"
+
+    def paginate_queryset(self, queryset, page_size):  # type: ignore[no-untyped-def]
+        """Return a keyset page instead of an offset page when enabled"""
+        request = self.request  # type: ignore[attr-defined]
+        page_kwarg = self.page_kwarg  # type: ignore[attr-defined]
+        if not keyset_pagination_enabled() or page_kwarg in request.GET:
+            return super().paginate_queryset(queryset, page_size)  # type: ignore[misc]
+
+        try:
+            page = KeysetPaginator(queryset, page_size).page(
+                request.GET.get(self.cursor_kwarg) or None
+            )
+        except InvalidCursor as exc:
+            raise Http404(str(exc)) from exc
+        self.keyset_page = page
+        return None, page, page.object_list, False
+
+    def get_context_data(self, **kwargs):  # type: ignore[no-untyped-def]
+        """Expose the keyset page for cursor navigation links"""
+        context = super().get_context_data(**kwargs)  # type: ignore[misc]
+        context["keyset_page"] = getattr(self, "keyset_page", None)
+        return context
+
+
+class CachedPostListMixin:
+    """Cache list fragments and page counts under the content generation
+
+    Template fragments use ``{% cache blog_cache_timeout <name> blog_cache_key
+    blog_cache_page using=blog_cache_alias %}``; every Post, Category or Tag
+    change advances the generation, so cached pages never need purging.
+    """
+
+    list_cache_scope = "posts"
+
+    def get_list_cache_scope(self) -> str:
+        """Return the cache scope distinguishing this list from others."""
+        return self.list_cache_scope
+
+    def get_paginator(  # type: ignore[no-untyped-def]
+        self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs
+    ):
+        """Return a paginator whose total count is cached per list scope"""
+        return GenerationCachedPaginator(
+            queryset,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            count_cache_key=build_list_cache_key("count", self.get_list_cache_scope()),
+            **kwargs,
+        )
+
+    def get_context_data(self, **kwargs):  # type: ignore[no-untyped-def]
+        """Expose fragment cache settings to the list template"""
+        context = super().get_context_data(**kwargs)  # type: ignore[misc]
+        context["blog_cache_alias"] = get_blog_cache_alias()
+        context["blog_cache_timeout"] = get_list_cache_timeout()
+        context["blog_cache_key"] = build_list_cache_key(
+            "fragment", self.get_list_cache_scope()
+        )
+        keyset_page = context.get("keyset_page")
+        if keyset_page is not None:
+            cursor = self.request.GET.get("cursor", "")  # type: ignore[attr-defined]
+            context["blog_cache_page"] = f"cursor:{cursor}"
+        else:
+            page_obj = context.get("page_obj")
+            context["blog_cache_page"] = page_obj.number if page_obj is not None else 1
+        return context
+
+
+class PostListView(CachedPostListMixin, KeysetPaginationMixin, ListView):
     """Display paginated list of published blog posts"""
 
     model = Post
@@ -512,8 +1127,12 @@ class PostListView(ListView):
         )
 
 
+@method_decorator(
+    condition(etag_func=post_detail_etag, last_modified_func=post_detail_last_modified),
+    name="dispatch",
+)
 class PostDetailView(DetailView):
-    """Display single blog post"""
+    """Display single blog post, answering unchanged revalidations with 304"""
 
     model = Post
     template_name = "quickscale_modules_blog/blog/post_detail.html"
@@ -528,13 +1147,13 @@ class PostDetailView(DetailView):
         )
 
     def get_context_data(self, **kwargs):  # type: ignore[no-untyped-def]
-        """Add rendered markdown content to context"""
+        """Add stored rendered markdown content to context"""
         context = super().get_context_data(**kwargs)
-        context["rendered_content"] = markdownify(escape(self.object.content))
+        context["rendered_content"] = self.object.get_rendered_content()
         return context
 
 
-class CategoryListView(ListView):
+class CategoryListView(CachedPostListMixin, KeysetPaginationMixin, ListView):
     """Display posts filtered by category"""
 
     model = Post
@@ -542,9 +1161,17 @@ class CategoryListView(ListView):
     context_object_name = "posts"
     paginate_by = 10
 
+    def get_list_cache_scope(self) -> str:
+        """Scope cached pages to the requested category"""
+        return f"category:{self.kwargs['slug']}"
+
     def get_queryset(self):  # type: ignore[no-untyped-def]
         """Return published posts in the specified category"""
-        self.category = Category.objects.get(slug=self.kwargs["slug"])
+        slug = self.kwargs["slug"]
+        self.category = get_or_set_list_value(
+            build_list_cache_key("category", slug),
+            lambda: Category.objects.get(slug=slug),
+        )
         return (
             Post.objects.filter(status="published", category=self.category)
             .select_related("author", "category")
@@ -558,7 +1185,7 @@ class CategoryListView(ListView):
         return context
 
 
-class TagListView(ListView):
+class TagListView(CachedPostListMixin, KeysetPaginationMixin, ListView):
     """Display posts filtered by tag"""
 
     model = Post
@@ -566,9 +1193,17 @@ class TagListView(ListView):
     context_object_name = "posts"
     paginate_by = 10
 
+    def get_list_cache_scope(self) -> str:
+        """Scope cached pages to the requested tag"""
+        return f"tag:{self.kwargs['slug']}"
+
     def get_queryset(self):  # type: ignore[no-untyped-def]
         """Return published posts with the specified tag"""
-        self.tag = Tag.objects.get(slug=self.kwargs["slug"])
+        slug = self.kwargs["slug"]
+        self.tag = get_or_set_list_value(
+            build_list_cache_key("tag", slug),
+            lambda: Tag.objects.get(slug=slug),
+        )
         return (
             Post.objects.filter(status="published", tags=self.tag)
             .select_related("author", "category")
@@ -580,3 +1215,17 @@ class TagListView(ListView):
         context = super().get_context_data(**kwargs)
         context["tag"] = self.tag
         return context
+
+
+class PostSearchView(TemplateView):
+    """Display ranked full-text search results for published posts"""
+
+    template_name = "quickscale_modules_blog/blog/search_results.html"
+
+    def get_context_data(self, **kwargs):  # type: ignore[no-untyped-def]
+        """Add the query and its highlighted results to context"""
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "").strip()
+        context["query"] = query
+        context["results"] = search_posts(query) if query else []
+        return context
@@ -24,6 +24,16 @@ def django_db_setup(django_db_blocker):
         call_command("migrate", "--run-syncdb", verbosity=0)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate cached list pages and generation counters between tests"""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     """Create a test user"""
@@ -75,3 +75,7 @@ MARKDOWNX_MARKDOWN_EXTENSIONS = [
     "markdown.extensions.toc",
 ]
 MARKDOWNX_MEDIA_PATH = "blog/markdownx/"
+
+# Generate image derivatives during save so model tests can assert on them
+BLOG_IMAGE_DERIVATIVES_MODE = "inline"
+BLOG_IMAGE_DERIVATIVE_FORMATS = ["WEBP"]
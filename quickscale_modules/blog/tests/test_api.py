@@ -1,6 +1,7 @@
 """Tests for blog publish API endpoint"""
 
 import json
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,11 +12,17 @@ from django.test import Client
 from django.urls import reverse
 from PIL import Image
 
-from quickscale_modules_blog.models import BlogMediaAsset, Category, Post, Tag
+from quickscale_modules_blog.models import (
+    BlogMediaAsset,
+    Category,
+    Post,
+    Tag,
+    hash_api_token,
+)
+from quickscale_modules_blog.tokens import parse_configured_tokens
 from quickscale_modules_blog.views import (
     _build_media_response_url,
     _get_authorization_token,
-    _get_blog_api_tokens,
     authenticate_blog_api_request,
 )
 
@@ -55,16 +62,18 @@ def staff_user(db):
 class TestPublishPostApi:
     """Tests for publish post API"""
 
-    def test_get_blog_api_tokens_ignores_invalid_entries(self, settings):
-        """Token config helper should keep only valid token/username mappings."""
-        settings.BLOG_API_TOKENS = [
-            {"token": " valid-token ", "username": " author "},
-            {"token": "", "username": "missing-token"},
-            {"token": "missing-user", "username": ""},
-            "invalid-entry",
-        ]
+    def test_parse_configured_tokens_ignores_invalid_entries(self):
+        """Token config parsing should keep only valid token/username mappings."""
+        parsed = parse_configured_tokens(
+            [
+                {"token": " valid-token ", "username": " author "},
+                {"token": "", "username": "missing-token"},
+                {"token": "missing-user", "username": ""},
+                "invalid-entry",
+            ]
+        )
 
-        assert _get_blog_api_tokens() == [("valid-token", "author")]
+        assert parsed == [(hash_api_token("valid-token"), "author")]
 
     def test_get_authorization_token_rejects_malformed_headers(self, rf):
         """Authorization parsing should reject malformed or unsupported headers."""
@@ -596,6 +605,137 @@ class TestPublishPostApi:
         assert Tag.objects.filter(slug="launch", name="Launch").exists()
 
 
+@pytest.mark.django_db
+class TestPublishPostsBatchApi:
+    """Tests for the batch publish API"""
+
+    def _post_batch(self, client, posts):
+        return client.post(
+            reverse("quickscale_blog:api_publish_posts_batch"),
+            data=json.dumps({"posts": posts}),
+            content_type="application/json",
+        )
+
+    def test_batch_reports_per_item_results(self, client, staff_user):
+        """Valid items are created while invalid and conflicting ones are reported"""
+        category = Category.objects.create(name="Archive")
+        Tag.objects.create(name="Legacy")
+        Post.objects.create(title="Existing", author=staff_user, content="Body")
+        client.force_login(staff_user)
+
+        response = self._post_batch(
+            client,
+            [
+                {
+                    "title": "Imported One",
+                    "content": "# Heading\n\nBody one",
+                    "category_slug": category.slug,
+                    "tags": ["Legacy", "Imported"],
+                },
+                {"title": "Imported Two", "content": "Body two", "tags": ["Imported"]},
+                {"title": "", "content": "Missing title"},
+                {"title": "Existing", "content": "Clashes with a stored post"},
+                {"title": "Imported One", "content": "Clashes within the batch"},
+                {"title": "Lost", "content": "Body", "category_slug": "missing"},
+                "not an object",
+            ],
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["created"] == 2
+        assert payload["failed"] == 5
+        assert [result["status"] for result in payload["results"]] == [
+            201,
+            201,
+            400,
+            409,
+            409,
+            400,
+            400,
+        ]
+        assert payload["results"][5]["errors"] == {
+            "category_slug": "Category not found"
+        }
+
+        post = Post.objects.get(slug="imported-one")
+        assert payload["results"][0]["id"] == post.pk
+        assert post.status == "published"
+        assert post.published_date is not None
+        assert post.author == staff_user
+        assert post.category == category
+        assert post.excerpt == " Heading\n\nBody one"
+        assert "Heading</h1>" in post.content_html
+        assert set(post.tags.values_list("slug", flat=True)) == {"legacy", "imported"}
+        assert Tag.objects.filter(slug="imported").count() == 1
+
+    def test_batch_query_count_does_not_grow_with_batch_size(self, client, staff_user):
+        """Lookups and inserts are set-based rather than per item"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        Category.objects.create(name="Bulk")
+        client.force_login(staff_user)
+
+        def batch(prefix, size):
+            return [
+                {
+                    "title": f"{prefix} {index}",
+                    "content": "Body",
+                    "category_slug": "bulk",
+                    "tags": [f"{prefix} tag {index}", "Shared"],
+                }
+                for index in range(size)
+            ]
+
+        self._post_batch(client, batch("Warmup", 1))
+        with CaptureQueriesContext(connection) as small:
+            self._post_batch(client, batch("Small", 2))
+        with CaptureQueriesContext(connection) as large:
+            self._post_batch(client, batch("Large", 25))
+
+        assert Post.objects.filter(title__startswith="Large").count() == 25
+        assert len(large.captured_queries) == len(small.captured_queries)
+
+    def test_batch_posts_are_searchable_and_listed(self, client, staff_user):
+        """Bulk inserts keep the search index and list caches current"""
+        client.force_login(staff_user)
+        client.get(reverse("quickscale_blog:post_list"))
+
+        self._post_batch(client, [{"title": "Bulk Zephyr", "content": "Zephyr body"}])
+
+        from quickscale_modules_blog.search import search_posts
+
+        assert [result.post.slug for result in search_posts("zephyr")] == [
+            "bulk-zephyr"
+        ]
+        assert (
+            "Bulk Zephyr"
+            in client.get(reverse("quickscale_blog:post_list")).content.decode()
+        )
+
+    def test_batch_rejects_missing_and_oversized_batches(
+        self, client, staff_user, settings
+    ):
+        """The posts array is required and bounded"""
+        settings.BLOG_API_BATCH_MAX_POSTS = 1
+        client.force_login(staff_user)
+
+        assert self._post_batch(client, []).status_code == 400
+        oversized = self._post_batch(
+            client,
+            [{"title": "A", "content": "Body"}, {"title": "B", "content": "Body"}],
+        )
+
+        assert oversized.status_code == 400
+        assert oversized.json()["errors"] == {"posts": "Must contain at most 1 posts"}
+        assert not Post.objects.exists()
+
+    def test_batch_requires_authentication(self, client):
+        """Anonymous callers are rejected"""
+        assert self._post_batch(client, [{"title": "A"}]).status_code == 401
+
+
 @pytest.mark.django_db
 class TestUploadMediaApi:
     """Tests for blog media upload API."""
@@ -731,7 +871,7 @@ class TestUploadMediaApi:
         assert payload["kind"] == BlogMediaAsset.Kind.INLINE
         assert payload["width"] == 1600
         assert payload["height"] == 900
-        assert payload["url"].startswith("http://testserver/media/blog/uploads/")
+        assert payload["url"].startswith("http://testserver/media/shared/images/")
         assert BlogMediaAsset.objects.filter(pk=payload["id"]).exists()
 
     def test_upload_media_api_uses_public_base_url_when_configured(
@@ -880,6 +1020,67 @@ class TestUploadMediaApi:
             "file": "Unsupported or invalid image file"
         }
 
+    @pytest.mark.parametrize("use_storage_helper", [True, False])
+    def test_upload_media_api_rejects_images_over_pixel_limit(
+        self,
+        client,
+        staff_user,
+        settings,
+        use_storage_helper,
+    ):
+        """Test oversized images are rejected from the header, before decoding."""
+        settings.BLOG_API_MAX_IMAGE_PIXELS = 1_000
+        client.force_login(staff_user)
+        upload = make_uploaded_test_image(size=(40, 30))
+        helper_patch = (
+            nullcontext()
+            if use_storage_helper
+            else patch(
+                "quickscale_modules_blog.views.storage_validate_file_upload", None
+            )
+        )
+
+        with helper_patch, patch.object(Image.Image, "load") as load:
+            response = client.post(
+                reverse("quickscale_blog:api_upload_media"),
+                data={"file": upload},
+            )
+
+        assert response.status_code == 400
+        assert "maximum of 1000 pixels (40x30)" in response.json()["errors"]["file"]
+        load.assert_not_called()
+
+    def test_upload_media_api_fallback_deep_verify_rejects_truncated_images(
+        self,
+        client,
+        staff_user,
+        settings,
+    ):
+        """Test deep verification decodes the image when the setting is enabled."""
+        import os
+        from io import BytesIO
+
+        settings.BLOG_API_DEEP_VERIFY_IMAGES = True
+        client.force_login(staff_user)
+        image_bytes = BytesIO()
+        Image.frombytes("L", (128, 128), os.urandom(128 * 128)).save(
+            image_bytes, format="PNG"
+        )
+        truncated = SimpleUploadedFile(
+            "cut.png", image_bytes.getvalue()[:-2048], content_type="image/png"
+        )
+
+        with patch("quickscale_modules_blog.views.storage_validate_file_upload", None):
+            response = client.post(
+                reverse("quickscale_blog:api_upload_media"),
+                data={"file": truncated},
+            )
+
+        assert response.status_code == 400
+        assert response.json()["errors"] == {
+            "file": "Unsupported or invalid image file"
+        }
+
     def test_upload_media_api_token_auth_bypasses_csrf(
         self,
         settings,
@@ -900,3 +1101,179 @@ class TestUploadMediaApi:
         )
 
         assert response.status_code == 201
+
+
+@pytest.mark.django_db
+class TestDirectMediaUploadApi:
+    """Tests for presigned direct uploads and their finalization."""
+
+    @pytest.fixture(autouse=True)
+    def local_storage(self, settings, tmp_path):
+        """Store direct uploads under a temporary local media root."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.QUICKSCALE_STORAGE_BACKEND = "local"
+        return tmp_path
+
+    def _presign(self, client, **payload):
+        body = {"filename": "diagram.png", "content_type": "image/png", **payload}
+        return client.post(
+            reverse("quickscale_blog:api_presign_media_upload"),
+            data=json.dumps(body),
+            content_type="application/json",
+        )
+
+    def _finalize(self, client, upload_token, **payload):
+        return client.post(
+            reverse("quickscale_blog:api_finalize_media_upload"),
+            data=json.dumps({"upload_token": upload_token, **payload}),
+            content_type="application/json",
+        )
+
+    def test_presign_upload_and_finalize_creates_asset(
+        self, client, staff_user, local_storage
+    ):
+        """A presigned PUT followed by finalize registers the stored image."""
+        client.force_login(staff_user)
+
+        presign_response = self._presign(client, method="PUT")
+        assert presign_response.status_code == 201
+        presigned = presign_response.json()
+        assert presigned["key"].startswith("blog/uploads/")
+        assert presigned["url"].startswith("http://testserver/storage/uploads/")
+        assert presigned["headers"] == {"Content-Type": "image/png"}
+
+        upload_response = Client().put(
+            presigned["url"],
+            data=make_uploaded_test_image(size=(640, 360)).read(),
+            content_type="image/png",
+        )
+        assert upload_response.status_code == 204
+
+        finalize_response = self._finalize(
+            client, presigned["upload_token"], alt="Diagram", kind="featured"
+        )
+
+        assert finalize_response.status_code == 201
+        payload = finalize_response.json()
+        assert (payload["width"], payload["height"]) == (640, 360)
+        assert payload["url"].endswith(presigned["key"])
+        asset = BlogMediaAsset.objects.get(pk=payload["id"])
+        assert asset.file.name == presigned["key"]
+        assert asset.original_filename == "diagram.png"
+        assert asset.kind == BlogMediaAsset.Kind.FEATURED
+        assert asset.uploaded_by == staff_user
+
+    def test_presign_post_and_finalize_uses_only_returned_fields(
+        self, client, staff_user, local_storage
+    ):
+        """A client following the default presigned POST as given succeeds."""
+        client.force_login(staff_user)
+        presigned = self._presign(client).json()
+        assert presigned["method"] == "POST"
+
+        upload_response = Client().post(
+            presigned["url"],
+            data={
+                **presigned["fields"],
+                "file": SimpleUploadedFile(
+                    "diagram.png",
+                    make_uploaded_test_image().read(),
+                    content_type="image/png",
+                ),
+            },
+        )
+        assert upload_response.status_code == 204
+
+        finalize_response = self._finalize(client, presigned["upload_token"])
+
+        assert finalize_response.status_code == 201
+        assert BlogMediaAsset.objects.get().file.name == presigned["key"]
+
+    def test_finalize_is_idempotent(self, client, staff_user):
+        """Finalizing the same upload twice returns the existing asset."""
+        client.force_login(staff_user)
+        presigned = self._presign(client, method="PUT").json()
+        Client().put(
+            presigned["url"],
+            data=make_uploaded_test_image().read(),
+            content_type="image/png",
+        )
+
+        first = self._finalize(client, presigned["upload_token"])
+        second = self._finalize(client, presigned["upload_token"])
+
+        assert first.status_code == 201
+        assert second.status_code == 200
+        assert second.json()["id"] == first.json()["id"]
+        assert BlogMediaAsset.objects.count() == 1
+
+    def test_finalize_rejects_and_deletes_invalid_object(
+        self, client, staff_user, local_storage
+    ):
+        """Objects that are not valid images are removed and reported."""
+        client.force_login(staff_user)
+        presigned = self._presign(client, method="PUT").json()
+        Client().put(presigned["url"], data=b"not an image", content_type="image/png")
+
+        response = self._finalize(client, presigned["upload_token"])
+
+        assert response.status_code == 400
+        assert response.json()["errors"] == {
+            "file": "Unsupported or invalid image file"
+        }
+        assert not (local_storage / presigned["key"]).exists()
+        assert not BlogMediaAsset.objects.exists()
+
+    def test_finalize_requires_uploaded_object(self, client, staff_user):
+        """Finalizing before the upload completes reports the missing object."""
+        client.force_login(staff_user)
+        presigned = self._presign(client).json()
+
+        response = self._finalize(client, presigned["upload_token"])
+
+        assert response.status_code == 400
+        assert response.json()["errors"] == {"file": "Uploaded object was not found"}
+
+    def test_finalize_rejects_token_issued_to_another_user(self, client, staff_user):
+        """Upload tokens are bound to the user that requested them."""
+        other_staff = get_user_model().objects.create_user(
+            username="other-staff", password="pass12345", is_staff=True
+        )
+        client.force_login(staff_user)
+        presigned = self._presign(client).json()
+
+        client.force_login(other_staff)
+        response = self._finalize(client, presigned["upload_token"])
+
+        assert response.status_code == 400
+        assert "upload_token" in response.json()["errors"]
+
+    def test_presign_validates_payload(self, client, staff_user):
+        """Unsupported content types and methods are rejected."""
+        client.force_login(staff_user)
+
+        response = self._presign(
+            client, filename="", content_type="image/tiff", method="PATCH"
+        )
+
+        assert response.status_code == 400
+        assert set(response.json()["errors"]) == {"filename", "content_type", "method"}
+
+    def test_presign_requires_staff(self, client, user):
+        """Non-staff users cannot request presigned uploads."""
+        client.force_login(user)
+
+        response = self._presign(client)
+
+        assert response.status_code == 403
+
+    def test_presign_without_storage_module_is_not_implemented(
+        self, client, staff_user
+    ):
+        """Direct uploads report clearly when the storage module is missing."""
+        client.force_login(staff_user)
+
+        with patch("quickscale_modules_blog.views.storage_direct_uploads", None):
+            response = self._presign(client)
+
+        assert response.status_code == 501
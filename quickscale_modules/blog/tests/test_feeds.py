@@ -43,3 +43,40 @@ class TestLatestPostsFeed:
         assert response.status_code == 200
         assert "Authorless Post" in response.content.decode()
         assert "Unknown author" not in response.content.decode()
+
+    def test_unchanged_feed_revalidates_with_304(
+        self, client, author_user, django_assert_num_queries
+    ):
+        """Matching validators short-circuit before the feed is rebuilt"""
+        Post.objects.create(
+            title="Polled Post", author=author_user, content="Body", status="published"
+        )
+        url = reverse("quickscale_blog:feed")
+        first = client.get(url)
+
+        with django_assert_num_queries(0):
+            etag_hit = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        date_hit = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        assert etag_hit.status_code == 304
+        assert etag_hit.content == b""
+        assert date_hit.status_code == 304
+
+    def test_feed_validators_change_with_content(self, client, author_user):
+        """Publishing or editing a post invalidates earlier validators"""
+        post = Post.objects.create(
+            title="Changing Post",
+            author=author_user,
+            content="Body",
+            status="published",
+        )
+        url = reverse("quickscale_blog:feed")
+        etag = client.get(url)["ETag"]
+
+        post.title = "Changed Post"
+        post.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert "Changed Post" in response.content.decode()
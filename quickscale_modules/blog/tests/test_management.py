@@ -0,0 +1,230 @@
+"""Tests for blog module management commands"""
+
+from io import BytesIO, StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from PIL import Image
+
+from quickscale_modules_blog.caching import get_content_generation
+from quickscale_modules_blog.models import (
+    BlogApiToken,
+    Post,
+    get_markdown_renderer_version,
+    hash_api_token,
+)
+from quickscale_modules_blog.search import search_posts
+
+
+@pytest.mark.django_db
+class TestBlogRenderContent:
+    """Tests for the blog_render_content management command"""
+
+    def test_rerenders_posts_from_older_renderer_versions(self, author_user):
+        """Posts stored by an older renderer are re-rendered in batches"""
+        posts = [
+            Post.objects.create(
+                title=f"Post {index}", author=author_user, content=f"*{index}*"
+            )
+            for index in range(3)
+        ]
+        Post.objects.update(content_html="stale", content_html_version=0)
+
+        call_command("blog_render_content", "--batch-size=2", verbosity=0)
+
+        for post in posts:
+            post.refresh_from_db()
+            assert post.content_html_version == get_markdown_renderer_version()
+            assert post.content_html.startswith("<p><em>")
+
+    def test_skips_current_posts_unless_forced(self, author_user):
+        """Current posts are left alone unless --force is passed"""
+        post = Post.objects.create(title="Current", author=author_user, content="x")
+        Post.objects.filter(pk=post.pk).update(content_html="kept")
+
+        call_command("blog_render_content", verbosity=0)
+        post.refresh_from_db()
+        assert post.content_html == "kept"
+
+        call_command("blog_render_content", "--force", verbosity=0)
+        post.refresh_from_db()
+        assert post.content_html == "<p>x</p>"
+
+    def test_rejects_invalid_batch_size(self):
+        """Batch size must be positive"""
+        with pytest.raises(CommandError, match="batch-size"):
+            call_command("blog_render_content", "--batch-size=0", verbosity=0)
+
+
+def _jpeg_upload(name: str) -> SimpleUploadedFile:
+    buffer = BytesIO()
+    Image.new("RGB", (1200, 800), color="red").save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestBlogBackfillThumbnails:
+    """Tests for the blog_backfill_thumbnails management command"""
+
+    def test_records_manifest_from_existing_variants(
+        self, author_user, tmp_path, settings
+    ):
+        """Existing thumbnails are recorded with their dimensions"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        post = Post.objects.create(
+            title="Legacy", author=author_user, featured_image=_jpeg_upload("a.jpg")
+        )
+        Post.objects.filter(pk=post.pk).update(thumbnail_manifest={})
+
+        call_command("blog_backfill_thumbnails", verbosity=0)
+
+        post.refresh_from_db()
+        assert post.thumbnail_manifest["source"] == post.featured_image.name
+        assert post.thumbnail_manifest["variants"]["small"] == {
+            "name": post._get_thumbnail_name("small"),
+            "width": 300,
+            "height": 200,
+        }
+
+    def test_generate_missing_rebuilds_absent_variants(
+        self, author_user, tmp_path, settings
+    ):
+        """--generate-missing recreates thumbnails that are not in storage"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        post = Post.objects.create(
+            title="Legacy", author=author_user, featured_image=_jpeg_upload("b.jpg")
+        )
+        storage = post.featured_image.storage
+        storage.delete(post._get_thumbnail_name("medium"))
+        Post.objects.filter(pk=post.pk).update(thumbnail_manifest={})
+
+        call_command("blog_backfill_thumbnails", "--generate-missing", verbosity=0)
+
+        post.refresh_from_db()
+        assert storage.exists(post._get_thumbnail_name("medium"))
+        assert set(post.thumbnail_manifest["variants"]) == {"small", "medium"}
+
+
+@pytest.mark.django_db
+class TestBlogProcessImages:
+    """Tests for the blog_process_images management command"""
+
+    def test_processes_pending_posts(self, author_user, tmp_path, settings):
+        """Deferred posts get thumbnails and srcset data from the command"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVES_MODE = "deferred"
+        post = Post.objects.create(
+            title="Deferred", author=author_user, featured_image=_jpeg_upload("p.jpg")
+        )
+
+        call_command("blog_process_images", verbosity=0)
+
+        post.refresh_from_db()
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_READY
+        assert post.featured_image.storage.exists(post._get_thumbnail_name("small"))
+        assert post.get_image_sources()
+
+    def test_skips_failed_posts_unless_retrying(self, author_user, tmp_path, settings):
+        """Failed posts are only retried with --retry-failed"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVES_MODE = "deferred"
+        post = Post.objects.create(
+            title="Failed", author=author_user, featured_image=_jpeg_upload("f.jpg")
+        )
+        Post.objects.filter(pk=post.pk).update(
+            image_derivatives_status=Post.IMAGE_DERIVATIVES_FAILED
+        )
+
+        call_command("blog_process_images", verbosity=0)
+        post.refresh_from_db()
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_FAILED
+
+        call_command("blog_process_images", "--retry-failed", verbosity=0)
+        post.refresh_from_db()
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_READY
+
+    def test_reprocessing_current_posts_keeps_content_generation(
+        self, author_user, tmp_path, settings
+    ):
+        """Up-to-date posts are not rewritten and do not invalidate caches"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        Post.objects.create(
+            title="Current", author=author_user, featured_image=_jpeg_upload("c.jpg")
+        )
+        generation = get_content_generation()
+
+        call_command("blog_process_images", "--all", verbosity=0)
+
+        assert get_content_generation() == generation
+
+
+@pytest.mark.django_db
+class TestBlogIssueApiToken:
+    """Tests for the blog_issue_api_token management command"""
+
+    @pytest.fixture
+    def robot(self, db):
+        return get_user_model().objects.create_user(
+            username="robot", password="robotpass123", is_staff=True
+        )
+
+    def test_rotation_revokes_previous_token(self, robot):
+        """Rotating revokes the previous token with the same name"""
+        first, _ = BlogApiToken.issue(robot, "deploy")
+        stdout = StringIO()
+
+        call_command(
+            "blog_issue_api_token",
+            "robot",
+            "--name=deploy",
+            "--rotate",
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        raw_token = stdout.getvalue().strip()
+        first.refresh_from_db()
+        assert not first.is_active
+        assert BlogApiToken.objects.get(is_active=True).token_hash == hash_api_token(
+            raw_token
+        )
+
+    def test_rejects_non_staff_users(self, user):
+        """Tokens are only issued for staff users"""
+        with pytest.raises(CommandError, match="staff"):
+            call_command("blog_issue_api_token", user.username)
+
+
+@pytest.mark.django_db
+class TestBlogCheckSearchIndex:
+    """Tests for the blog_check_search_index management command"""
+
+    def test_reports_complete_index(self):
+        out = StringIO()
+
+        call_command("blog_check_search_index", stdout=out)
+
+        assert "Search index is complete" in out.getvalue()
+
+    def test_detects_and_repairs_dropped_triggers(self, author_user):
+        post = Post.objects.create(
+            title="Indexed", author=author_user, content="Before", status="published"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER quickscale_modules_blog_post_fts_au")
+        post.content = "Rewritten after a table rebuild"
+        post.save()
+
+        with pytest.raises(CommandError, match="quickscale_modules_blog_post_fts_au"):
+            call_command("blog_check_search_index")
+        assert search_posts("rewritten") == []
+
+        call_command("blog_check_search_index", "--repair", stdout=StringIO())
+
+        assert [result.post for result in search_posts("rewritten")] == [post]
+        call_command("blog_check_search_index", stdout=StringIO())
@@ -19,6 +19,7 @@ from quickscale_modules_blog.models import (
     Category,
     Post,
     Tag,
+    get_markdown_renderer_version,
 )
 
 User = get_user_model()
@@ -390,6 +391,83 @@ class TestPost:
 
         assert post.get_thumbnail_url("large") == post.featured_image.url
 
+    def test_thumbnail_manifest_records_variants_and_dimensions(
+        self, author_user, tmp_path, settings
+    ):
+        """Generated thumbnails are recorded in the persisted manifest."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 800), color="green").save(buffer, format="JPEG")
+        post = Post.objects.create(
+            title="Manifest Post",
+            author=author_user,
+            content="Content",
+            featured_image=SimpleUploadedFile(
+                "manifest.jpg", buffer.getvalue(), content_type="image/jpeg"
+            ),
+        )
+
+        post.refresh_from_db()
+        manifest = post.thumbnail_manifest
+        assert manifest["source"] == post.featured_image.name
+        assert manifest["variants"]["small"]["width"] == 300
+        assert manifest["variants"]["small"]["height"] == 200
+        assert manifest["variants"]["medium"]["width"] == 675
+        assert manifest["variants"]["medium"]["height"] == 450
+        assert post.get_thumbnail_variant("medium")["name"].endswith(
+            "thumbnails/manifest_medium.jpg"
+        )
+
+    def test_get_thumbnail_url_does_not_touch_storage(
+        self, author_user, tmp_path, settings, monkeypatch
+    ):
+        """Thumbnail URLs resolve from the manifest without storage lookups."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 800), color="green").save(buffer, format="JPEG")
+        post = Post.objects.create(
+            title="No Lookup Post",
+            author=author_user,
+            content="Content",
+            featured_image=SimpleUploadedFile(
+                "lookup.jpg", buffer.getvalue(), content_type="image/jpeg"
+            ),
+        )
+        post = Post.objects.get(pk=post.pk)
+        storage = post.featured_image.storage
+
+        def fail(*args, **kwargs):
+            raise AssertionError("storage should not be queried")
+
+        monkeypatch.setattr(storage, "exists", fail)
+        monkeypatch.setattr(storage, "open", fail)
+
+        assert "thumbnails/lookup_small" in post.get_thumbnail_url("small")
+        assert post.get_thumbnail_url("large") == post.get_featured_image_url()
+
+    def test_get_thumbnail_url_ignores_manifest_for_other_source(
+        self, author_user, tmp_path, settings
+    ):
+        """A manifest recorded for a previous image falls back to the original."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 800), color="green").save(buffer, format="JPEG")
+        post = Post.objects.create(
+            title="Stale Manifest Post",
+            author=author_user,
+            content="Content",
+            featured_image=SimpleUploadedFile(
+                "stale.jpg", buffer.getvalue(), content_type="image/jpeg"
+            ),
+        )
+        post.thumbnail_manifest = {
+            "source": "blog/images/other.jpg",
+            "variants": {"medium": {"name": "x.jpg", "width": 1, "height": 1}},
+        }
+
+        assert not post.thumbnail_manifest_is_current()
+        assert post.get_thumbnail_url("medium") == post.get_featured_image_url()
+
     def test_get_featured_image_url_uses_public_base_url(
         self,
         author_user,
@@ -451,7 +529,7 @@ class TestPost:
             raise NotImplementedError
 
         monkeypatch.setattr(post.featured_image.storage, "open", _raise_not_implemented)
-        post._generate_thumbnails()
+        post.process_image_derivatives(force=True)
 
     def test_generate_thumbnails_with_storage_open_without_filesystem_path(
         self,
@@ -506,7 +584,7 @@ class TestPost:
         monkeypatch.setattr(post.featured_image.storage, "save", _save)
         monkeypatch.setattr(post.featured_image.storage, "exists", _exists)
         monkeypatch.setattr(post.featured_image.storage, "delete", _delete)
-        post._generate_thumbnails()
+        post.process_image_derivatives(force=True)
 
         thumbnail_name = post._get_thumbnail_name("medium")
         assert post.featured_image.storage.exists(thumbnail_name)
@@ -587,4 +665,267 @@ class TestBlogMediaAsset:
         assert asset.width == 640
         assert asset.height == 360
         assert asset.uploaded_by == author_user
+        assert asset.file.name.startswith("shared/images/")
+
+    def test_identical_uploads_share_one_stored_file(self, tmp_path, settings):
+        """Uploading the same bytes twice stores one content-addressed file."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        image_bytes = BytesIO()
+        Image.new("RGB", (32, 32), color="purple").save(image_bytes, format="PNG")
+
+        first = BlogMediaAsset.objects.create(
+            file=SimpleUploadedFile("first.png", image_bytes.getvalue()),
+            original_filename="first.png",
+        )
+        second = BlogMediaAsset.objects.create(
+            file=SimpleUploadedFile("second.png", image_bytes.getvalue()),
+            original_filename="second.png",
+        )
+
+        assert first.file.name == second.file.name
+        assert len(list(tmp_path.rglob("*.png"))) == 1
+        assert second.file.read() == image_bytes.getvalue()
+
+    def test_variant_url_points_at_storage_variant_endpoint(self, tmp_path, settings):
+        """Media assets expose resized variants through the storage endpoint."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        image_bytes = BytesIO()
+        Image.new("RGB", (32, 32), color="purple").save(image_bytes, format="PNG")
+        asset = BlogMediaAsset.objects.create(
+            file=SimpleUploadedFile("asset.png", image_bytes.getvalue()),
+            original_filename="asset.png",
+        )
+
+        assert asset.get_variant_url(800, "avif") == (
+            f"/storage/variants/800/avif/{asset.file.name}"
+        )
+        with patch(
+            "quickscale_modules_blog.models.storage_build_image_variant_url", None
+        ):
+            assert asset.get_variant_url(800).endswith(f"/media/{asset.file.name}")
+
+    def test_deduplication_can_be_disabled(self, tmp_path, settings):
+        """Disabling deduplication falls back to dated per-module upload paths."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.QUICKSCALE_STORAGE_DEDUPLICATE_UPLOADS = False
+        image_bytes = BytesIO()
+        Image.new("RGB", (32, 32), color="purple").save(image_bytes, format="PNG")
+
+        asset = BlogMediaAsset.objects.create(
+            file=SimpleUploadedFile("asset.png", image_bytes.getvalue()),
+            original_filename="asset.png",
+        )
+
         assert asset.file.name.startswith("blog/uploads/")
+
+
+@pytest.mark.django_db
+class TestPostRenderedContent:
+    """Tests for stored Markdown HTML on Post"""
+
+    def test_save_stores_rendered_html_with_version_and_hash(self, author_user):
+        """Saving a post renders Markdown once and stores the result"""
+        post = Post.objects.create(
+            title="Rendered",
+            author=author_user,
+            content="# Heading\n\n<b>raw</b>",
+        )
+        post.refresh_from_db()
+
+        assert "<h1" in post.content_html
+        assert "&lt;b&gt;raw&lt;/b&gt;" in post.content_html
+        assert post.content_html_version == get_markdown_renderer_version()
+        assert len(post.content_hash) == 64
+        assert post.content_html_is_current()
+
+    def test_save_skips_rendering_when_content_is_unchanged(self, author_user):
+        """Re-saving without content changes does not re-render Markdown"""
+        post = Post.objects.create(title="Stable", author=author_user, content="Body")
+
+        with patch(
+            "quickscale_modules_blog.models.render_post_markdown"
+        ) as mocked_render:
+            post.title = "Stable renamed"
+            post.save()
+
+        mocked_render.assert_not_called()
+
+    def test_save_with_update_fields_persists_rendered_html(self, author_user):
+        """Partial saves that touch content also persist the rendered HTML"""
+        post = Post.objects.create(title="Partial", author=author_user, content="Old")
+
+        post.content = "**New**"
+        post.save(update_fields=["content"])
+        post.refresh_from_db()
+
+        assert "<strong>New</strong>" in post.content_html
+
+    def test_get_rendered_content_renders_stale_rows_lazily(self, author_user):
+        """Rows without current HTML are rendered and persisted on first read"""
+        post = Post.objects.create(title="Legacy", author=author_user, content="*Hi*")
+        Post.objects.filter(pk=post.pk).update(
+            content_html="", content_html_version=0, content_hash=""
+        )
+        post.refresh_from_db()
+
+        assert "<em>Hi</em>" in post.get_rendered_content()
+        post.refresh_from_db()
+        assert post.content_html_version == get_markdown_renderer_version()
+        assert "<em>Hi</em>" in post.content_html
+
+    def test_renderer_version_bump_marks_html_stale(self, author_user, settings):
+        """Changing the renderer version invalidates stored HTML"""
+        post = Post.objects.create(title="Versioned", author=author_user, content="x")
+
+        settings.BLOG_MARKDOWN_RENDERER_VERSION = get_markdown_renderer_version() + 1
+
+        assert not post.content_html_is_current()
+
+
+dispatched_post_ids: list[int] = []
+
+
+def record_dispatched_post(post_id: int) -> None:
+    """Stand-in task queue entry point for BLOG_IMAGE_DERIVATIVES_MODE."""
+    dispatched_post_ids.append(post_id)
+
+
+def _jpeg_upload(name: str, size: tuple[int, int] = (1200, 800)) -> SimpleUploadedFile:
+    buffer = BytesIO()
+    Image.new("RGB", size, color="teal").save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestPostImageDerivatives:
+    """Tests for the featured image derivative pipeline"""
+
+    def test_deferred_mode_marks_post_pending_without_processing(
+        self, author_user, tmp_path, settings
+    ):
+        """Deferred saves leave image work to the background command"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVES_MODE = "deferred"
+
+        post = Post.objects.create(
+            title="Deferred", author=author_user, featured_image=_jpeg_upload("d.jpg")
+        )
+        post.refresh_from_db()
+
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_PENDING
+        assert not (tmp_path / "blog" / "images" / "thumbnails").exists()
+        assert post.get_thumbnail_url("medium") == post.get_featured_image_url()
+
+    def test_callable_mode_dispatches_after_commit(
+        self, author_user, tmp_path, settings, django_capture_on_commit_callbacks
+    ):
+        """A dotted-path mode hands the post id to a task queue after commit"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVES_MODE = (
+            "tests.test_models.record_dispatched_post"
+        )
+        dispatched_post_ids.clear()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            post = Post.objects.create(
+                title="Queued",
+                author=author_user,
+                featured_image=_jpeg_upload("q.jpg"),
+            )
+
+        assert dispatched_post_ids == [post.pk]
+
+    def test_unchanged_image_is_not_rescheduled_on_save(
+        self, author_user, tmp_path, settings
+    ):
+        """Saving a post whose image is already processed does no image work"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        post = Post.objects.create(
+            title="Ready", author=author_user, featured_image=_jpeg_upload("r.jpg")
+        )
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_READY
+
+        with patch.object(Post, "process_image_derivatives") as process:
+            post.title = "Ready again"
+            post.save()
+
+        process.assert_not_called()
+
+    def test_unchanged_source_hash_skips_encoding(
+        self, author_user, tmp_path, settings, monkeypatch
+    ):
+        """Reprocessing an unchanged source writes nothing"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        post = Post.objects.create(
+            title="Hashed", author=author_user, featured_image=_jpeg_upload("h.jpg")
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("storage should not be written")
+
+        monkeypatch.setattr(post.featured_image.storage, "save", fail)
+
+        assert post.process_image_derivatives() is False
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_READY
+
+    def test_srcset_lists_widths_below_source_plus_original(
+        self, author_user, tmp_path, settings
+    ):
+        """srcset data covers configured widths and the full-size image"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVE_WIDTHS = [480, 800, 1600]
+        post = Post.objects.create(
+            title="Responsive",
+            author=author_user,
+            featured_image=_jpeg_upload("resp.jpg"),
+        )
+        storage = post.featured_image.storage
+
+        jpeg_entries = post.thumbnail_manifest["srcset"]["image/jpeg"]
+        webp_entries = post.thumbnail_manifest["srcset"]["image/webp"]
+        assert [entry["width"] for entry in jpeg_entries] == [480, 800, 1200]
+        assert [entry["width"] for entry in webp_entries] == [480, 800, 1200]
+        assert webp_entries[0]["height"] == 320
+        assert jpeg_entries[-1]["name"] == post.featured_image.name
+        assert all(storage.exists(entry["name"]) for entry in webp_entries)
+
+        srcset = post.get_image_srcset()
+        assert srcset.endswith(f"{post.get_featured_image_url()} 1200w")
+        assert " 480w, " in srcset
+        sources = post.get_image_sources()
+        assert [source["type"] for source in sources] == ["image/webp"]
+        assert ".webp 800w" in sources[0]["srcset"]
+
+    def test_identical_uploads_share_derivatives(self, author_user, tmp_path, settings):
+        """Derivative names are keyed by content, so duplicates reuse files"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        first = Post.objects.create(
+            title="First", author=author_user, featured_image=_jpeg_upload("same.jpg")
+        )
+        second = Post.objects.create(
+            title="Second", author=author_user, featured_image=_jpeg_upload("same.jpg")
+        )
+
+        assert first.featured_image.name != second.featured_image.name
+        assert (
+            first.thumbnail_manifest["srcset"]["image/webp"]
+            == second.thumbnail_manifest["srcset"]["image/webp"]
+        )
+
+    def test_unreadable_source_marks_failure(
+        self, author_user, tmp_path, settings, monkeypatch
+    ):
+        """Storage errors are recorded instead of raised"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        post = Post.objects.create(
+            title="Broken", author=author_user, featured_image=_jpeg_upload("b.jpg")
+        )
+
+        def _raise_os_error(*_args, **_kwargs):
+            raise OSError("unavailable")
+
+        monkeypatch.setattr(post.featured_image.storage, "open", _raise_os_error)
+        post.process_image_derivatives(force=True)
+        post.refresh_from_db()
+
+        assert post.image_derivatives_status == Post.IMAGE_DERIVATIVES_FAILED
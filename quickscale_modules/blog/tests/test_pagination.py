@@ -0,0 +1,208 @@
+"""Tests for blog keyset pagination"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+
+from quickscale_modules_blog.models import Post
+from quickscale_modules_blog.pagination import (
+    InvalidCursor,
+    KeysetCursor,
+    KeysetPaginator,
+)
+
+
+@pytest.fixture
+def published_posts(author_user):
+    """Create five published posts, two sharing a publish timestamp"""
+    now = timezone.now()
+    dates = [now, now - timedelta(hours=1), now - timedelta(hours=1)]
+    dates += [now - timedelta(hours=2), now - timedelta(hours=3)]
+    posts = []
+    for index, published_date in enumerate(dates):
+        posts.append(
+            Post.objects.create(
+                title=f"Post {index}",
+                author=author_user,
+                content="Body",
+                status="published",
+                published_date=published_date,
+            )
+        )
+    return posts
+
+
+def _expected_order(posts):
+    return sorted(posts, key=lambda post: (post.published_date, post.pk), reverse=True)
+
+
+class TestKeysetCursor:
+    """Tests for opaque cursor encoding"""
+
+    def test_round_trip(self):
+        """Encoded cursors decode back to the same position"""
+        cursor = KeysetCursor(timezone.now(), 42, before=True)
+
+        assert KeysetCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("value", ["not-base64!", "W10", "WyJ4IiwiYSIsMV0"])
+    def test_rejects_malformed_cursors(self, value):
+        """Garbage and structurally invalid cursors raise InvalidCursor"""
+        with pytest.raises(InvalidCursor):
+            KeysetCursor.decode(value)
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    """Tests for KeysetPaginator"""
+
+    def test_walks_forward_and_back_without_gaps(self, published_posts):
+        """Next and previous cursors cover every post exactly once"""
+        paginator = KeysetPaginator(Post.objects.all(), per_page=2)
+        expected = _expected_order(published_posts)
+
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        back = paginator.page(third.previous_cursor)
+
+        assert first.object_list == expected[:2]
+        assert second.object_list == expected[2:4]
+        assert third.object_list == expected[4:]
+        assert not first.has_previous
+        assert not third.has_next
+        assert back.object_list == second.object_list
+        assert paginator.page(back.previous_cursor).object_list == expected[:2]
+
+    def test_deep_page_does_not_count_rows(
+        self, published_posts, django_assert_num_queries
+    ):
+        """A cursor page is a single bounded query"""
+        paginator = KeysetPaginator(Post.objects.all(), per_page=2)
+        cursor = paginator.page().next_cursor
+
+        with django_assert_num_queries(1) as captured:
+            paginator.page(cursor)
+
+        sql = captured.captured_queries[0]["sql"].upper()
+        assert "COUNT(" not in sql
+        assert "OFFSET" not in sql
+
+
+@pytest.mark.django_db
+class TestKeysetListViews:
+    """Tests for cursor pagination in blog list views"""
+
+    def test_list_view_uses_cursor_links_when_enabled(
+        self, client, settings, author_user
+    ):
+        """Enabled keyset pagination renders opaque cursor links"""
+        settings.BLOG_KEYSET_PAGINATION = True
+        for index in range(11):
+            Post.objects.create(
+                title=f"Linked {index}",
+                author=author_user,
+                content="Body",
+                status="published",
+            )
+
+        response = client.get(reverse("quickscale_blog:post_list"))
+        html = response.content.decode()
+
+        keyset_page = response.context["keyset_page"]
+        assert f'href="?cursor={keyset_page.next_cursor}"' in html
+        assert "?page=" not in html
+        assert "Page 1 of" not in html
+
+    def test_next_cursor_serves_older_posts(self, client, settings, author_user):
+        """Following the next cursor shows the following page"""
+        settings.BLOG_KEYSET_PAGINATION = True
+        now = timezone.now()
+        for index in range(12):
+            Post.objects.create(
+                title=f"Keyset {index:02d}",
+                author=author_user,
+                content="Body",
+                status="published",
+                published_date=now - timedelta(minutes=index),
+            )
+        url = reverse("quickscale_blog:post_list")
+        next_cursor = client.get(url).context["keyset_page"].next_cursor
+
+        html = client.get(url, {"cursor": next_cursor}).content.decode()
+
+        assert "Keyset 10" in html
+        assert "Keyset 11" in html
+        assert "Keyset 00" not in html
+
+    def test_legacy_page_links_fall_back_to_offset(self, client, settings, author_user):
+        """?page= keeps offset pagination even with keyset enabled"""
+        settings.BLOG_KEYSET_PAGINATION = True
+        for index in range(12):
+            Post.objects.create(
+                title=f"Legacy {index}",
+                author=author_user,
+                content="Body",
+                status="published",
+            )
+
+        response = client.get(reverse("quickscale_blog:post_list"), {"page": 2})
+
+        assert response.status_code == 200
+        assert response.context["keyset_page"] is None
+        assert response.context["page_obj"].number == 2
+        assert "Page 2 of 2" in response.content.decode()
+
+    def test_invalid_cursor_returns_404(self, client, settings, published_posts):
+        """Tampered cursors are treated like an unknown page"""
+        settings.BLOG_KEYSET_PAGINATION = True
+
+        response = client.get(reverse("quickscale_blog:post_list"), {"cursor": "x"})
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestListPostsApi:
+    """Tests for the cursor-paginated post list API"""
+
+    @pytest.fixture
+    def staff_client(self, client, db):
+        staff = get_user_model().objects.create_user(
+            username="lister", password="pass12345", is_staff=True
+        )
+        client.force_login(staff)
+        return client
+
+    def test_pages_through_posts_with_cursors(self, staff_client, published_posts):
+        """API results follow next_cursor until exhausted"""
+        url = reverse("quickscale_blog:api_list_posts")
+        expected = [post.slug for post in _expected_order(published_posts)]
+
+        slugs = []
+        params = {"limit": 2}
+        while True:
+            payload = staff_client.get(url, params).json()
+            slugs.extend(item["slug"] for item in payload["results"])
+            if payload["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": payload["next_cursor"]}
+
+        assert slugs == expected
+
+    def test_rejects_invalid_cursor_and_limit(self, staff_client):
+        """Malformed parameters return field errors"""
+        url = reverse("quickscale_blog:api_list_posts")
+
+        assert staff_client.get(url, {"cursor": "x"}).status_code == 400
+        assert staff_client.get(url, {"limit": "0"}).status_code == 400
+        assert staff_client.get(url, {"limit": "many"}).status_code == 400
+
+    def test_requires_authentication(self, client):
+        """Anonymous callers are rejected like other blog API endpoints"""
+        response = client.get(reverse("quickscale_blog:api_list_posts"))
+
+        assert response.status_code == 401
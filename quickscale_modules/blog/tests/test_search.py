@@ -0,0 +1,149 @@
+"""Tests for blog full-text search"""
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from quickscale_modules_blog.models import Post
+from quickscale_modules_blog.search import (
+    PostgresPostSearchBackend,
+    PostSearchBackend,
+    SQLitePostSearchBackend,
+    get_post_search_backend,
+    search_posts,
+)
+
+
+def _publish(author, title, content, **kwargs):
+    return Post.objects.create(
+        title=title,
+        author=author,
+        content=content,
+        status=kwargs.pop("status", "published"),
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestSQLitePostSearch:
+    """Tests for the FTS5-backed search backend"""
+
+    def test_uses_fts5_backend_on_sqlite(self):
+        """SQLite databases get the FTS5 backend"""
+        assert isinstance(get_post_search_backend(), SQLitePostSearchBackend)
+
+    def test_ranks_title_matches_above_body_matches(self, author_user):
+        """Title hits are weighted above content-only hits"""
+        body_hit = _publish(author_user, "Deploy notes", "We moved to kubernetes.")
+        title_hit = _publish(author_user, "Kubernetes in practice", "Cluster notes.")
+
+        results = search_posts("kubernetes")
+
+        assert [result.post for result in results] == [title_hit, body_hit]
+        assert results[0].rank > results[1].rank
+
+    def test_snippets_highlight_terms_and_escape_html(self, author_user):
+        """Snippets wrap matches in <mark> and never pass raw HTML through"""
+        _publish(
+            author_user,
+            "Escaping",
+            "Beware <script>alert(1)</script> when rendering observability data.",
+        )
+
+        (result,) = search_posts("observability")
+
+        assert "<mark>observability</mark>" in result.snippet
+        assert "<script>" not in result.snippet
+        assert "&lt;script&gt;" in result.snippet
+
+    def test_index_follows_saves_and_deletes(self, author_user):
+        """Edits and deletions are reflected without a manual reindex"""
+        post = _publish(author_user, "Changing", "Original wording about caching.")
+        assert search_posts("caching")
+
+        post.content = "Rewritten wording about sharding."
+        post.excerpt = "Rewritten."
+        post.save()
+        assert not search_posts("caching")
+        assert [result.post for result in search_posts("sharding")] == [post]
+
+        post.delete()
+        assert not search_posts("sharding")
+
+    def test_excludes_drafts_and_tolerates_query_syntax(self, author_user):
+        """Drafts never match and FTS operators in input are treated as text"""
+        _publish(author_user, "Secret draft", "unreleased roadmap", status="draft")
+        published = _publish(author_user, "Roadmap", "Public roadmap AND plans")
+
+        assert [result.post for result in search_posts("roadmap")] == [published]
+        assert search_posts('"roadmap*') == search_posts("roadmap")
+        assert search_posts("   ") == []
+
+
+@pytest.mark.django_db
+class TestFallbackPostSearch:
+    """Tests for the portable substring fallback"""
+
+    def test_matches_all_terms_and_highlights(self, author_user):
+        """Every term must match and matches are highlighted"""
+        both = _publish(author_user, "Python tips", "Profiling python services")
+        _publish(author_user, "Go tips", "Profiling go services")
+
+        results = PostSearchBackend().search("python profiling")
+
+        assert [result.post for result in results] == [both]
+        assert "<mark>python</mark>" in results[0].snippet
+
+
+@pytest.mark.django_db
+class TestPostgresPostSearch:
+    """Tests for the tsvector-backed search backend"""
+
+    def test_filters_on_the_indexed_vector_with_bound_parameters(self):
+        """The match is a WHERE expression on the stored column, never raw input"""
+        query = "planner'); DROP TABLE x; --"
+
+        sql, params = (
+            PostgresPostSearchBackend().get_queryset(query).query.sql_with_params()
+        )
+
+        assert (
+            '("quickscale_modules_blog_post"."search_vector" @@ '
+            "websearch_to_tsquery('english', %s))"
+        ) in sql
+        assert 'ts_rank_cd("quickscale_modules_blog_post"."search_vector"' in sql
+        assert "DROP TABLE" not in sql
+        assert params.count(query) == 3
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Requires PostgreSQL")
+    def test_matches_stemmed_terms_and_highlights(self, author_user):
+        """Stemmed matches are ranked and highlighted by PostgreSQL"""
+        post = _publish(author_user, "Planning", "The planner chooses indexes.")
+
+        (result,) = search_posts("planners")
+
+        assert result.post == post
+        assert "<mark>planner</mark>" in result.snippet
+
+
+@pytest.mark.django_db
+class TestPostSearchView:
+    """Tests for PostSearchView"""
+
+    def test_renders_ranked_results(self, client, author_user):
+        """The search page lists matches with highlighted snippets"""
+        _publish(author_user, "Tracing", "Distributed tracing primer")
+
+        response = client.get(reverse("quickscale_blog:post_search"), {"q": "tracing"})
+
+        html = response.content.decode()
+        assert response.status_code == 200
+        assert "<mark>tracing</mark>" in html
+        assert reverse("quickscale_blog:post_detail", args=["tracing"]) in html
+
+    def test_empty_query_renders_form_only(self, client):
+        """No query means no search is run"""
+        response = client.get(reverse("quickscale_blog:post_search"))
+
+        assert response.status_code == 200
+        assert response.context["results"] == []
@@ -0,0 +1,88 @@
+"""Tests for blog sitemaps"""
+
+import pytest
+from django.urls import reverse
+
+from quickscale_modules_blog.models import Post
+from quickscale_modules_blog.sitemaps import compute_segment_boundaries
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def _publish(author, count, prefix="Mapped"):
+    return [
+        Post.objects.create(
+            title=f"{prefix} {index}",
+            author=author,
+            content="Body",
+            status="published",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestPostSitemaps:
+    """Tests for the segmented post sitemap"""
+
+    def test_index_splits_posts_into_segments(self, client, settings, author_user):
+        """Each segment lists at most BLOG_SITEMAP_SEGMENT_SIZE posts"""
+        settings.BLOG_SITEMAP_SEGMENT_SIZE = 2
+        posts = _publish(author_user, 5)
+        Post.objects.create(title="Hidden", author=author_user, content="x")
+
+        index = _content(client.get(reverse("quickscale_blog:sitemap_index")))
+        segments = [
+            _content(
+                client.get(reverse("quickscale_blog:sitemap_segment", args=[number]))
+            )
+            for number in (1, 2, 3)
+        ]
+
+        assert index.count("<sitemap>") == 3
+        assert "http://testserver/blog/sitemap-3.xml" in index
+        assert [segment.count("<url>") for segment in segments] == [2, 2, 1]
+        assert f"<loc>http://testserver/blog/post/{posts[0].slug}/</loc>" in segments[0]
+        assert "hidden" not in "".join(segments)
+        assert (
+            client.get(reverse("quickscale_blog:sitemap_segment", args=[4])).status_code
+            == 404
+        )
+
+    def test_segments_are_cached_until_content_changes(
+        self, client, author_user, django_assert_num_queries
+    ):
+        """A warm segment is served without queries and refreshed after edits"""
+        post = _publish(author_user, 1)[0]
+        url = reverse("quickscale_blog:sitemap_segment", args=[1])
+        _content(client.get(url))
+
+        with django_assert_num_queries(0):
+            cached = _content(client.get(url))
+
+        post.slug = "renamed-post"
+        post.save()
+
+        assert "mapped-0" in cached
+        assert "renamed-post" in _content(client.get(url))
+
+    def test_empty_blog_serves_a_valid_empty_segment(self, client):
+        """Without posts the index still points at one empty urlset"""
+        index = _content(client.get(reverse("quickscale_blog:sitemap_index")))
+        segment = _content(
+            client.get(reverse("quickscale_blog:sitemap_segment", args=[1]))
+        )
+
+        assert index.count("<sitemap>") == 1
+        assert "<url>" not in segment
+        assert segment.rstrip().endswith("</urlset>")
+
+    def test_boundaries_are_primary_key_ranges(self, author_user):
+        """Boundaries are the first id of every segment"""
+        posts = _publish(author_user, 5)
+
+        boundaries = compute_segment_boundaries(Post.objects.all(), 2)
+
+        assert boundaries == [posts[0].pk, posts[2].pk, posts[4].pk]
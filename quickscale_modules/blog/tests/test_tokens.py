@@ -0,0 +1,102 @@
+"""Tests for blog API token resolution"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from quickscale_modules_blog.models import BlogApiToken, hash_api_token
+from quickscale_modules_blog.tokens import get_token_registry
+from quickscale_modules_blog.views import authenticate_blog_api_request
+
+
+@pytest.fixture
+def staff_user(db):
+    """Create a staff user for token authentication"""
+    return get_user_model().objects.create_user(
+        username="robot", password="robotpass123", is_staff=True
+    )
+
+
+def _authenticate(rf, token):
+    return authenticate_blog_api_request(
+        rf.get("/blog/api", HTTP_AUTHORIZATION=f"Bearer {token}")
+    )
+
+
+@pytest.mark.django_db
+class TestConfiguredTokens:
+    """Tests for the settings-backed token registry"""
+
+    def test_registry_is_built_once_and_rebuilt_on_override(self, settings):
+        """The registry is reused until BLOG_API_TOKENS changes"""
+        settings.BLOG_API_TOKENS = [{"token": "first", "username": "robot"}]
+        registry = get_token_registry()
+
+        assert get_token_registry() is registry
+        settings.BLOG_API_TOKENS = [{"token": "second", "username": "robot"}]
+        assert get_token_registry() == {hash_api_token("second"): "robot"}
+
+    def test_hashed_token_entries_authenticate(self, rf, settings, staff_user):
+        """Settings may hold the token digest instead of the secret"""
+        settings.BLOG_API_TOKENS = [
+            {"token_sha256": hash_api_token("digest-only"), "username": "robot"}
+        ]
+
+        user, response = _authenticate(rf, "digest-only")
+
+        assert response is None
+        assert user == staff_user
+
+    def test_resolved_user_is_cached_until_saved(
+        self, rf, settings, staff_user, django_assert_num_queries
+    ):
+        """Repeat requests skip the user query; saving the user applies at once"""
+        settings.BLOG_API_TOKENS = [{"token": "hot-token", "username": "robot"}]
+        _authenticate(rf, "hot-token")
+
+        with django_assert_num_queries(0):
+            user, _ = _authenticate(rf, "hot-token")
+        assert user == staff_user
+
+        staff_user.is_staff = False
+        staff_user.save()
+        _, response = _authenticate(rf, "hot-token")
+
+        assert response is not None
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestDatabaseTokens:
+    """Tests for BlogApiToken-backed authentication"""
+
+    def test_issued_token_authenticates_and_revocation_is_immediate(
+        self, rf, staff_user, django_assert_num_queries
+    ):
+        """Active tokens resolve from cache and stop working once revoked"""
+        token, raw_token = BlogApiToken.issue(staff_user, "ci")
+
+        user, response = _authenticate(rf, raw_token)
+        assert response is None
+        assert user == staff_user
+        assert token.token_hash == hash_api_token(raw_token)
+        with django_assert_num_queries(0):
+            _authenticate(rf, raw_token)
+
+        token.is_active = False
+        token.save()
+        _, response = _authenticate(rf, raw_token)
+
+        assert response is not None
+        assert response.status_code == 401
+
+    def test_expired_and_unknown_tokens_are_rejected(self, rf, staff_user):
+        """Expired and never-issued tokens return 401"""
+        _, raw_token = BlogApiToken.issue(
+            staff_user, "old", expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert _authenticate(rf, raw_token)[1].status_code == 401
+        assert _authenticate(rf, "never-issued")[1].status_code == 401
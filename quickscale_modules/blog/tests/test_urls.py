@@ -35,3 +35,10 @@ class TestBlogUrls:
         """Test RSS feed URL resolves correctly"""
         url = reverse("quickscale_blog:feed")
         assert url == "/blog/feed/"
+
+    def test_sitemap_urls(self):
+        """Test sitemap index and segment URLs resolve correctly"""
+        assert reverse("quickscale_blog:sitemap_index") == "/blog/sitemap.xml"
+        assert reverse("quickscale_blog:sitemap_segment", args=[2]) == (
+            "/blog/sitemap-2.xml"
+        )
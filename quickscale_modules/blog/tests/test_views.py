@@ -1,8 +1,12 @@
 """Tests for blog views"""
 
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
+from django.utils import timezone
 from PIL import Image
 from quickscale_modules_blog.models import Category, Post, Tag
 
@@ -60,6 +64,63 @@ class TestPostDetailView:
         response = client.get(reverse("quickscale_blog:post_detail", args=[post.slug]))
         assert response.status_code == 404
 
+    def test_post_detail_revalidates_with_304(
+        self, client, author_user, django_assert_num_queries
+    ):
+        """Unchanged posts answer conditional requests without rendering"""
+        post = Post.objects.create(
+            title="Cached Post", author=author_user, content="Body", status="published"
+        )
+        url = reverse("quickscale_blog:post_detail", args=[post.slug])
+        first = client.get(url)
+
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        by_date = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        assert response.status_code == 304
+        assert response.templates == []
+        assert by_date.status_code == 304
+
+    def test_post_detail_etag_changes_when_tags_change(self, client, author_user):
+        """Related content changes invalidate the entity tag"""
+        post = Post.objects.create(
+            title="Tagged Post", author=author_user, content="Body", status="published"
+        )
+        url = reverse("quickscale_blog:post_detail", args=[post.slug])
+        etag = client.get(url)["ETag"]
+
+        post.tags.add(Tag.objects.create(name="Fresh"))
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert "Fresh" in response.content.decode()
+
+    def test_post_detail_last_modified_advances_when_tags_change(
+        self, client, author_user
+    ):
+        """Related content changes invalidate If-Modified-Since-only requests"""
+        post = Post.objects.create(
+            title="Dated Post", author=author_user, content="Body", status="published"
+        )
+        url = reverse("quickscale_blog:post_detail", args=[post.slug])
+        first = client.get(url)
+
+        later = timezone.now() + timedelta(minutes=5)
+        with patch("quickscale_modules_blog.caching.timezone.now", return_value=later):
+            post.tags.add(Tag.objects.create(name="Fresh"))
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        assert response.status_code == 200
+        assert "Fresh" in response.content.decode()
+        assert response["Last-Modified"] != first["Last-Modified"]
+        assert (
+            client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code
+            == 304
+        )
+
     def test_post_detail_styling_hooks_present_when_rendered(self, client, author_user):
         """Test post detail includes markdown wrapper and module stylesheet"""
         post = Post.objects.create(
@@ -92,6 +153,28 @@ class TestPostDetailView:
         assert "<script>alert('xss')</script>" not in html
         assert "&lt;script&gt;alert(&#x27;xss&#x27;)&lt;/script&gt;" in html
 
+    def test_post_detail_serves_stored_html_without_rendering(
+        self, client, author_user
+    ):
+        """Test post detail serves stored HTML instead of rendering per request"""
+        post = Post.objects.create(
+            title="Stored Post",
+            author=author_user,
+            content="# Stored heading",
+            status="published",
+        )
+
+        with patch(
+            "quickscale_modules_blog.models.render_post_markdown"
+        ) as mocked_render:
+            response = client.get(
+                reverse("quickscale_blog:post_detail", args=[post.slug])
+            )
+
+        assert response.status_code == 200
+        assert "Stored heading</h1>" in response.content.decode()
+        mocked_render.assert_not_called()
+
     def test_post_detail_renders_markdown_image_links(self, client, author_user):
         """Test markdown image syntax renders inline images from uploaded URLs."""
         post = Post.objects.create(
@@ -146,6 +229,42 @@ class TestPostDetailView:
         assert "Featured diagram" in html
         assert post.get_featured_image_url() in html
 
+    def test_post_detail_renders_responsive_picture_sources(
+        self,
+        client,
+        author_user,
+        tmp_path,
+        settings,
+    ):
+        """Post detail exposes derivative srcset data through <picture>"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.BLOG_IMAGE_DERIVATIVE_WIDTHS = [480]
+
+        image = Image.new("RGB", (800, 450), color="purple")
+        image_path = tmp_path / "responsive.png"
+        image.save(str(image_path), format="PNG")
+        with open(image_path, "rb") as image_handle:
+            uploaded_file = SimpleUploadedFile(
+                "responsive.png",
+                image_handle.read(),
+                content_type="image/png",
+            )
+
+        post = Post.objects.create(
+            title="Responsive Image Post",
+            author=author_user,
+            content="Body",
+            status="published",
+            featured_image=uploaded_file,
+        )
+
+        response = client.get(reverse("quickscale_blog:post_detail", args=[post.slug]))
+
+        html = response.content.decode()
+        assert '<source type="image/webp"' in html
+        assert f'srcset="{post.get_image_srcset()}"' in html
+        assert f"{post.get_featured_image_url()} 800w" in html
+
     def test_post_detail_uses_helper_backed_featured_image_url(
         self,
         client,
@@ -288,3 +407,91 @@ class TestAuthorlessPostRendering:
             response = client.get(url)
             assert response.status_code == 200
             assert "Unknown author" not in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestListPageCaching:
+    """Tests for generation-versioned list caching"""
+
+    def test_repeat_anonymous_list_request_skips_database(
+        self, client, author_user, django_assert_num_queries
+    ):
+        """A warm post list page is served from cache without queries"""
+        Post.objects.create(
+            title="Cached Post", author=author_user, content="x", status="published"
+        )
+        url = reverse("quickscale_blog:post_list")
+        client.get(url)
+
+        with django_assert_num_queries(0):
+            response = client.get(url)
+
+        assert "Cached Post" in response.content.decode()
+
+    def test_repeat_category_and_tag_requests_skip_database(
+        self, client, author_user, django_assert_num_queries
+    ):
+        """Category and tag lookups and counts are cached per slug"""
+        category = Category.objects.create(name="Cached Category")
+        tag = Tag.objects.create(name="Cached Tag")
+        post = Post.objects.create(
+            title="Scoped Post",
+            author=author_user,
+            content="x",
+            status="published",
+            category=category,
+        )
+        post.tags.add(tag)
+        urls = [
+            reverse("quickscale_blog:category_list", args=[category.slug]),
+            reverse("quickscale_blog:tag_list", args=[tag.slug]),
+        ]
+        for url in urls:
+            client.get(url)
+
+        with django_assert_num_queries(0):
+            responses = [client.get(url) for url in urls]
+
+        assert all("Scoped Post" in r.content.decode() for r in responses)
+
+    def test_post_save_invalidates_cached_pages(self, client, author_user):
+        """Saving a post advances the generation so lists re-render"""
+        post = Post.objects.create(
+            title="Original Title", author=author_user, content="x", status="published"
+        )
+        url = reverse("quickscale_blog:post_list")
+        client.get(url)
+
+        post.title = "Updated Title"
+        post.save()
+        html = client.get(url).content.decode()
+
+        assert "Updated Title" in html
+        assert "Original Title" not in html
+
+    def test_tag_assignment_invalidates_tag_page(self, client, author_user):
+        """Changing post tags re-renders the affected tag list"""
+        tag = Tag.objects.create(name="Late Tag")
+        post = Post.objects.create(
+            title="Late Post", author=author_user, content="x", status="published"
+        )
+        url = reverse("quickscale_blog:tag_list", args=[tag.slug])
+        assert "Late Post" not in client.get(url).content.decode()
+
+        post.tags.add(tag)
+
+        assert "Late Post" in client.get(url).content.decode()
+
+    def test_zero_timeout_disables_list_caching(self, client, author_user, settings):
+        """BLOG_LIST_CACHE_TIMEOUT = 0 renders every request from the database"""
+        settings.BLOG_LIST_CACHE_TIMEOUT = 0
+        Post.objects.create(
+            title="Uncached", author=author_user, content="x", status="published"
+        )
+        url = reverse("quickscale_blog:post_list")
+        client.get(url)
+
+        Post.objects.update(title="Bulk Renamed")
+        html = client.get(url).content.decode()
+
+        assert "Bulk Renamed" in html
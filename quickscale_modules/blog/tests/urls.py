@@ -1,5 +1,7 @@
 """URL configuration for blog module tests"""
 
+from importlib.util import find_spec
+
 from django.contrib import admin
 from django.urls import include, path
 
@@ -7,3 +9,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("blog/", include("quickscale_modules_blog.urls")),
 ]
+
+# Local stand-in for presigned bucket uploads, when the storage module is present
+if find_spec("quickscale_modules_storage") is not None:
+    urlpatterns.append(path("storage/", include("quickscale_modules_storage.urls")))
@@ -2,7 +2,18 @@
 
 from django.contrib import admin
 
-from .models import Company, Contact, ContactNote, Deal, DealNote, Stage, Tag
+from .models import (
+    BulkAction,
+    BulkActionChange,
+    Company,
+    Contact,
+    ContactNote,
+    Deal,
+    DealNote,
+    ImportJob,
+    Stage,
+    Tag,
+)
 
 
 @admin.register(Tag)
@@ -160,3 +171,53 @@ class DealNoteAdmin(admin.ModelAdmin):
         return obj.text[:50] + "..." if len(obj.text) > 50 else obj.text
 
     short_text.short_description = "Text"  # type: ignore
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    """Admin configuration for ImportJob model"""
+
+    list_display = [
+        "entity",
+        "source_name",
+        "status",
+        "rows_processed",
+        "created_count",
+        "updated_count",
+        "error_count",
+        "created_at",
+    ]
+    list_filter = ["entity", "status", "created_at"]
+    search_fields = ["source_name"]
+    readonly_fields = [
+        field.name for field in ImportJob._meta.fields if field.name != "id"
+    ]
+
+
+class BulkActionChangeInline(admin.TabularInline):
+    """Inline admin for the change log of a bulk action"""
+
+    model = BulkActionChange
+    extra = 0
+    can_delete = False
+    readonly_fields = ["from_stage", "from_probability", "deal_ids", "created_at"]
+
+
+@admin.register(BulkAction)
+class BulkActionAdmin(admin.ModelAdmin):
+    """Admin configuration for BulkAction model"""
+
+    list_display = [
+        "action",
+        "stage",
+        "status",
+        "matched_count",
+        "updated_count",
+        "requested_by",
+        "created_at",
+    ]
+    list_filter = ["action", "status", "created_at"]
+    readonly_fields = [
+        field.name for field in BulkAction._meta.fields if field.name != "id"
+    ]
+    inlines = [BulkActionChangeInline]
@@ -0,0 +1,249 @@
+"""Pipeline analytics for CRM deals, aggregated in the database
+
+`get_pipeline_analytics` computes stage conversion, a probability-weighted
+forecast by month, win rate by owner and average deal age per stage for a
+filtered deal queryset. Each metric is one ``GROUP BY`` query, plus one query
+for the stage list, so no deal rows are loaded into Python.
+
+Results are cached per filter combination under a generation number that
+`invalidate_pipeline_analytics` advances whenever deals, their tags, stages,
+contacts or companies change (see ``signals`` and the bulk write helpers in
+``stats``). User changes do not advance it, so a renamed owner keeps their old
+username in cached results for up to ``CRM_ANALYTICS_CACHE_TIMEOUT`` seconds.
+
+Deals do not record their stage history, so conversion is derived from the
+current stage: a deal counts as having reached every open stage up to the one
+it is in, and a won deal as having reached them all. Lost deals only count as
+having reached the first stage. Each stage's conversion rate is the share of
+deals that reached the previous open stage and went on to reach it.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import BaseCache, caches
+from django.db.models import (
+    Avg,
+    Count,
+    DecimalField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Q,
+    QuerySet,
+    Sum,
+    Value,
+)
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import Stage
+
+WON_STAGE_NAME = "Closed-Won"
+LOST_STAGE_NAME = "Closed-Lost"
+
+DEFAULT_CRM_CACHE_ALIAS = "default"
+DEFAULT_CRM_ANALYTICS_CACHE_TIMEOUT = 5 * 60
+_GENERATION_KEY = "quickscale:crm:analytics:generation"
+
+ZERO = Decimal("0")
+CENTS = Decimal("0.01")
+
+
+def get_crm_cache() -> BaseCache:
+    """Return the cache backend used for CRM analytics"""
+    return caches[str(getattr(settings, "CRM_CACHE_ALIAS", DEFAULT_CRM_CACHE_ALIAS))]
+
+
+def get_analytics_cache_timeout() -> int:
+    """Return the analytics cache timeout in seconds; 0 disables caching"""
+    return int(
+        getattr(
+            settings,
+            "CRM_ANALYTICS_CACHE_TIMEOUT",
+            DEFAULT_CRM_ANALYTICS_CACHE_TIMEOUT,
+        )
+    )
+
+
+def get_analytics_generation() -> int:
+    """Return the current analytics generation
+
+    A missing counter (cold or evicted cache) is seeded from the clock so it
+    never repeats a generation that earlier entries were stored under.
+    """
+    cache = get_crm_cache()
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, time.time_ns() // 1000, timeout=None)
+        generation = cache.get(_GENERATION_KEY, 0)
+    return int(generation)
+
+
+def invalidate_pipeline_analytics() -> None:
+    """Invalidate every cached analytics result"""
+    cache = get_crm_cache()
+    try:
+        cache.incr(_GENERATION_KEY)
+    except ValueError:
+        get_analytics_generation()
+        cache.incr(_GENERATION_KEY)
+
+
+def get_cached_analytics(
+    filters: dict[str, Any], loader: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Return the analytics cached for ``filters``, computing them on a miss"""
+    timeout = get_analytics_cache_timeout()
+    if timeout <= 0:
+        return loader()
+
+    scope = json.dumps(filters, sort_keys=True)
+    digest = hashlib.sha256(scope.encode()).hexdigest()[:32]
+    key = f"quickscale:crm:analytics:{get_analytics_generation()}:{digest}"
+    cache = get_crm_cache()
+    result = cache.get(key)
+    if result is None:
+        result = loader()
+        cache.set(key, result, timeout)
+    return result
+
+
+def _money(value: Decimal | None) -> str:
+    return str((value or ZERO).quantize(CENTS))
+
+
+def _rate(part: int, whole: int) -> float | None:
+    return round(part / whole, 4) if whole else None
+
+
+def _days(age: timedelta | None) -> float | None:
+    return round(age.total_seconds() / 86400, 1) if age is not None else None
+
+
+def _stage_metrics(deals: QuerySet, now: Any) -> list[dict[str, Any]]:
+    """Return per-stage counts, value, age and conversion in pipeline order"""
+    age = ExpressionWrapper(Value(now) - F("created_at"), output_field=DurationField())
+    figures = {
+        row["stage_id"]: row
+        for row in deals.values("stage_id").annotate(
+            deal_count=Count("id"),
+            deal_value=Sum("amount"),
+            average_age=Avg(age),
+        )
+    }
+    stages = list(Stage.objects.order_by("order", "pk"))
+    lost_count = sum(
+        figures.get(stage.pk, {}).get("deal_count", 0)
+        for stage in stages
+        if stage.name == LOST_STAGE_NAME
+    )
+
+    # Deals at or beyond each open stage, counted from the end of the pipeline
+    open_stages = [stage for stage in stages if stage.name != LOST_STAGE_NAME]
+    reached_by_stage: dict[int, int] = {}
+    reached = 0
+    for stage in reversed(open_stages):
+        reached += figures.get(stage.pk, {}).get("deal_count", 0)
+        reached_by_stage[stage.pk] = reached
+    if open_stages:
+        reached_by_stage[open_stages[0].pk] += lost_count
+
+    metrics = []
+    previous = 0
+    for stage in stages:
+        row = figures.get(stage.pk, {})
+        stage_reached = reached_by_stage.get(stage.pk)
+        metrics.append(
+            {
+                "stage_id": stage.pk,
+                "name": stage.name,
+                "order": stage.order,
+                "deal_count": row.get("deal_count", 0),
+                "deal_value": _money(row.get("deal_value")),
+                "average_age_days": _days(row.get("average_age")),
+                "reached": stage_reached,
+                "conversion_rate": (
+                    None if stage_reached is None else _rate(stage_reached, previous)
+                ),
+            }
+        )
+        if stage_reached is not None:
+            previous = stage_reached
+    return metrics
+
+
+def _forecast(deals: QuerySet) -> list[dict[str, Any]]:
+    """Return open deal value and probability-weighted value by close month"""
+    weighted = ExpressionWrapper(
+        F("amount") * F("probability"),
+        output_field=DecimalField(max_digits=15, decimal_places=2),
+    )
+    rows = (
+        deals.exclude(stage__name__in=[WON_STAGE_NAME, LOST_STAGE_NAME])
+        .filter(expected_close_date__isnull=False)
+        .annotate(month=TruncMonth("expected_close_date"))
+        .values("month")
+        .annotate(
+            deal_count=Count("id"),
+            total=Sum("amount"),
+            weighted=Sum(weighted),
+        )
+        .order_by("month")
+    )
+    return [
+        {
+            "month": row["month"].strftime("%Y-%m"),
+            "deal_count": row["deal_count"],
+            "amount": _money(row["total"]),
+            "weighted_amount": _money((row["weighted"] or ZERO) / 100),
+        }
+        for row in rows
+    ]
+
+
+def _win_rates(deals: QuerySet) -> list[dict[str, Any]]:
+    """Return won and lost counts and the win rate of each deal owner"""
+    won = Q(stage__name=WON_STAGE_NAME)
+    lost = Q(stage__name=LOST_STAGE_NAME)
+    owner_name = f"owner__{get_user_model().USERNAME_FIELD}"
+    rows = (
+        deals.filter(won | lost)
+        .values("owner_id", owner_name)
+        .annotate(
+            won=Count("id", filter=won),
+            lost=Count("id", filter=lost),
+            won_value=Sum("amount", filter=won),
+        )
+        .order_by(owner_name)
+    )
+    return [
+        {
+            "owner_id": row["owner_id"],
+            "owner": row[owner_name],
+            "won": row["won"],
+            "lost": row["lost"],
+            "won_value": _money(row["won_value"]),
+            "win_rate": _rate(row["won"], row["won"] + row["lost"]),
+        }
+        for row in rows
+    ]
+
+
+def get_pipeline_analytics(deals: QuerySet) -> dict[str, Any]:
+    """Return pipeline metrics for ``deals``, computed in four queries"""
+    now = timezone.now()
+    deals = deals.select_related(None).prefetch_related(None).order_by()
+    return {
+        "generated_at": now.isoformat(),
+        "stages": _stage_metrics(deals, now),
+        "forecast": _forecast(deals),
+        "owners": _win_rates(deals),
+    }
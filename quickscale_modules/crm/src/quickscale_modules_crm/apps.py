@@ -10,3 +10,7 @@ class QuickscaleCrmConfig(AppConfig):
     name = "quickscale_modules_crm"
     label = "quickscale_modules_crm"
     verbose_name = "QuickScale CRM"
+
+    def ready(self) -> None:
+        """Import signal handlers when app is ready"""
+        import quickscale_modules_crm.signals  # noqa: F401
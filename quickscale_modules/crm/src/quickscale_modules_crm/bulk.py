@@ -0,0 +1,253 @@
+"""Chunked, logged bulk stage changes for CRM deals
+
+`start_bulk_action` records a ``BulkAction`` for deals selected by ID list or
+by deal list filters. Selections up to ``CRM_BULK_ASYNC_THRESHOLD`` deals run
+immediately; larger ones stay queued for `run_queued_bulk_actions` (the
+``crm_run_bulk_actions`` command), so the request returns a job handle at
+once instead of holding locks for the whole selection.
+
+`run_bulk_action` updates ``CRM_BULK_CHUNK_SIZE`` deals at a time, each chunk
+in its own short transaction with a bounded ``IN`` list. Every chunk writes
+``BulkActionChange`` rows listing the deals it updated, grouped by their
+previous stage and probability, which is enough to audit or revert the action.
+Filter selections are walked in primary key order and evaluated as the action
+runs.
+
+Each chunk also refreshes the action's ``updated_at``. An action still running
+with no progress for ``CRM_BULK_STALE_TIMEOUT`` seconds is assumed to belong to
+a worker that died. `fail_stale_bulk_actions` marks it failed, and
+`run_queued_bulk_actions` runs that check first. A worker whose action was
+failed this way stops after its current chunk.
+"""
+
+import logging
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .filters import DealFilterSet
+from .models import BulkAction, BulkActionChange, Deal, Stage
+from .stats import move_deals_to_stage
+
+DEFAULT_CRM_BULK_CHUNK_SIZE = 500
+DEFAULT_CRM_BULK_ASYNC_THRESHOLD = 1000
+DEFAULT_CRM_BULK_STALE_TIMEOUT = 60 * 60
+STALE_MESSAGE = "The worker stopped before the action finished"
+
+logger = logging.getLogger(__name__)
+
+# Fields each action sets besides the stage
+ACTION_FIELDS: dict[str, dict[str, Any]] = {
+    BulkAction.ACTION_UPDATE_STAGE: {},
+    BulkAction.ACTION_MARK_WON: {"probability": 100},
+    BulkAction.ACTION_MARK_LOST: {"probability": 0},
+}
+
+
+def get_bulk_chunk_size() -> int:
+    """Return how many deals are updated per transaction"""
+    return max(
+        1, int(getattr(settings, "CRM_BULK_CHUNK_SIZE", DEFAULT_CRM_BULK_CHUNK_SIZE))
+    )
+
+
+def get_bulk_async_threshold() -> int:
+    """Return the largest selection that is updated within the request"""
+    return int(
+        getattr(settings, "CRM_BULK_ASYNC_THRESHOLD", DEFAULT_CRM_BULK_ASYNC_THRESHOLD)
+    )
+
+
+def get_bulk_stale_timeout() -> int:
+    """Return the seconds after which a running action is considered orphaned"""
+    return int(
+        getattr(settings, "CRM_BULK_STALE_TIMEOUT", DEFAULT_CRM_BULK_STALE_TIMEOUT)
+    )
+
+
+def filter_deals(filters: dict[str, Any]) -> QuerySet:
+    """Return the deals the deal list would return for ``filters``"""
+    return DealFilterSet(data=filters, queryset=Deal.objects.all()).qs
+
+
+def start_bulk_action(
+    action: str,
+    stage: Stage,
+    *,
+    deal_ids: list[int] | None = None,
+    filters: dict[str, Any] | None = None,
+    requested_by: Any = None,
+) -> BulkAction:
+    """Record a bulk action and run it now, or leave it queued if it is large"""
+    if (deal_ids is None) == (filters is None):
+        raise ValueError("Select deals with either deal_ids or filters")
+
+    bulk_action = BulkAction(
+        action=action,
+        stage=stage,
+        filters=filters,
+        requested_by=requested_by,
+    )
+    if deal_ids is not None:
+        bulk_action.deal_ids = sorted(set(deal_ids))
+        bulk_action.matched_count = len(bulk_action.deal_ids)
+    else:
+        bulk_action.matched_count = filter_deals(filters or {}).count()
+    bulk_action.save()
+
+    if bulk_action.matched_count <= get_bulk_async_threshold():
+        run_bulk_action(bulk_action)
+    return bulk_action
+
+
+def _id_chunks(bulk_action: BulkAction, chunk_size: int) -> Iterator[list[int]]:
+    """Yield the selected deal IDs a chunk at a time"""
+    if bulk_action.deal_ids is not None:
+        ids = bulk_action.deal_ids
+        for start in range(0, len(ids), chunk_size):
+            yield ids[start : start + chunk_size]
+        return
+
+    deals = filter_deals(bulk_action.filters or {}).order_by("pk")
+    last_id = 0
+    while chunk := list(
+        deals.filter(pk__gt=last_id).values_list("pk", flat=True)[:chunk_size]
+    ):
+        yield chunk
+        last_id = chunk[-1]
+
+
+def _apply_chunk(bulk_action: BulkAction, deal_ids: list[int]) -> int:
+    """Update one chunk of deals and log their previous values"""
+    stage = bulk_action.stage
+    assert stage is not None
+    with transaction.atomic():
+        previous: dict[tuple[int, int], list[int]] = {}
+        for deal_id, stage_id, probability in (
+            Deal.objects.select_for_update()
+            .filter(id__in=deal_ids)
+            .order_by("pk")
+            .values_list("id", "stage_id", "probability")
+        ):
+            previous.setdefault((stage_id, probability), []).append(deal_id)
+
+        updated = move_deals_to_stage(
+            deal_ids, stage, **ACTION_FIELDS[bulk_action.action]
+        )
+        BulkActionChange.objects.bulk_create(
+            [
+                BulkActionChange(
+                    bulk_action=bulk_action,
+                    from_stage_id=stage_id,
+                    from_probability=probability,
+                    deal_ids=ids,
+                )
+                for (stage_id, probability), ids in previous.items()
+            ]
+        )
+    return updated
+
+
+def _save_progress(bulk_action: BulkAction) -> bool:
+    """Save the updated count; return False if the action is no longer running"""
+    bulk_action.updated_at = timezone.now()
+    progress = {
+        "updated_count": bulk_action.updated_count,
+        "updated_at": bulk_action.updated_at,
+    }
+    actions = BulkAction.objects.filter(pk=bulk_action.pk)
+    if actions.filter(status=BulkAction.STATUS_RUNNING).update(**progress):
+        return True
+    # Failed as stale meanwhile: keep the count accurate, but leave the status
+    actions.update(updated_count=bulk_action.updated_count)
+    bulk_action.refresh_from_db(fields=["status", "message", "finished_at"])
+    return False
+
+
+def _finish(bulk_action: BulkAction, status: str, message: str = "") -> None:
+    bulk_action.status = status
+    bulk_action.message = message
+    bulk_action.finished_at = timezone.now()
+    bulk_action.save(update_fields=["status", "message", "finished_at", "updated_at"])
+
+
+def run_bulk_action(
+    bulk_action: BulkAction, *, chunk_size: int | None = None
+) -> BulkAction:
+    """Apply ``bulk_action`` chunk by chunk, saving progress after each chunk
+
+    Chunks that completed stay applied if a later one fails; the action is
+    then marked failed with the error in ``message`` and the error re-raised.
+    If the action was failed as stale while a chunk ran, it stops there and
+    keeps that status.
+    """
+    chunk_size = chunk_size or get_bulk_chunk_size()
+    bulk_action.status = BulkAction.STATUS_RUNNING
+    bulk_action.started_at = bulk_action.started_at or timezone.now()
+    bulk_action.save(update_fields=["status", "started_at", "updated_at"])
+
+    if bulk_action.stage is None:
+        _finish(bulk_action, BulkAction.STATUS_FAILED, "The target stage was deleted")
+        return bulk_action
+
+    try:
+        for deal_ids in _id_chunks(bulk_action, chunk_size):
+            bulk_action.updated_count += _apply_chunk(bulk_action, deal_ids)
+            if not _save_progress(bulk_action):
+                return bulk_action
+    except Exception as exc:
+        _finish(bulk_action, BulkAction.STATUS_FAILED, str(exc))
+        raise
+    _finish(bulk_action, BulkAction.STATUS_COMPLETED)
+    return bulk_action
+
+
+def fail_stale_bulk_actions() -> int:
+    """Mark running actions without progress for the stale timeout as failed
+
+    Progress is measured from ``updated_at``, so long actions that keep
+    completing chunks are never failed. Chunks they applied stay applied, as
+    for any failed action. Returns how many actions were failed.
+    """
+    now = timezone.now()
+    return BulkAction.objects.filter(
+        status=BulkAction.STATUS_RUNNING,
+        updated_at__lt=now - timedelta(seconds=get_bulk_stale_timeout()),
+    ).update(status=BulkAction.STATUS_FAILED, message=STALE_MESSAGE, finished_at=now)
+
+
+def run_queued_bulk_actions(limit: int | None = None) -> int:
+    """Run queued bulk actions oldest first and return how many were run
+
+    Orphaned running actions are failed first. Each queued action is claimed
+    with a conditional update, so concurrent workers never run the same action
+    twice. A failed action is logged and does not stop the rest.
+    """
+    stale_count = fail_stale_bulk_actions()
+    if stale_count:
+        logger.warning("Failed %d stale CRM bulk action(s)", stale_count)
+
+    queued = BulkAction.objects.filter(status=BulkAction.STATUS_QUEUED).order_by(
+        "created_at", "pk"
+    )
+    run_count = 0
+    for pk in queued.values_list("pk", flat=True)[:limit]:
+        now = timezone.now()
+        claimed = BulkAction.objects.filter(
+            pk=pk, status=BulkAction.STATUS_QUEUED
+        ).update(status=BulkAction.STATUS_RUNNING, started_at=now, updated_at=now)
+        if not claimed:
+            continue
+        bulk_action = BulkAction.objects.select_related("stage").get(pk=pk)
+        try:
+            run_bulk_action(bulk_action)
+        except Exception:
+            # The error is also recorded on the action by run_bulk_action
+            logger.exception("CRM bulk action %s failed", pk)
+        run_count += 1
+    return run_count
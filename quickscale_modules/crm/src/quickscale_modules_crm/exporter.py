@@ -0,0 +1,194 @@
+"""Streaming CSV and NDJSON export of CRM contacts and deals
+
+`stream_export` turns a filtered queryset into an iterator of encoded output
+for ``StreamingHttpResponse``. Rows are read as ``values_list()`` projections
+with ``iterator(chunk_size=CRM_EXPORT_CHUNK_SIZE)`` (a server-side cursor on
+PostgreSQL), and the tags of each chunk are fetched in one extra query, so
+memory use stays constant however many rows are exported and output starts
+with the first chunk rather than after the last.
+
+Column names match the bulk import format (see ``importer``), so an export
+can be edited and imported again. CSV text cells that a spreadsheet would run
+as a formula (starting with ``=``, ``+``, ``-``, ``@``, tab or carriage return)
+are prefixed with ``'``, which the importer strips again.
+"""
+
+import csv
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+
+from .models import Contact, Deal, ImportJob
+
+DEFAULT_CRM_EXPORT_CHUNK_SIZE = 2000
+# Leading characters that make spreadsheet applications evaluate a cell
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+CONTENT_TYPES = {
+    ImportJob.FORMAT_CSV: "text/csv; charset=utf-8",
+    ImportJob.FORMAT_NDJSON: "application/x-ndjson",
+}
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """Columns of one exported entity, as ``(column, values() lookup)`` pairs"""
+
+    name: str
+    columns: tuple[tuple[str, str], ...]
+    tags_through: Any
+    tags_field: str
+
+    @property
+    def headers(self) -> list[str]:
+        """Return the column names, ending with ``tags``"""
+        return [column for column, _lookup in self.columns] + ["tags"]
+
+
+def contact_export_spec() -> ExportSpec:
+    """Return the export columns for contacts"""
+    return ExportSpec(
+        name="contacts",
+        columns=(
+            ("id", "id"),
+            ("first_name", "first_name"),
+            ("last_name", "last_name"),
+            ("email", "email"),
+            ("phone", "phone"),
+            ("title", "title"),
+            ("status", "status"),
+            ("company", "company__name"),
+            ("last_contacted_at", "last_contacted_at"),
+            ("created_at", "created_at"),
+            ("updated_at", "updated_at"),
+        ),
+        tags_through=Contact.tags.through,
+        tags_field="contact_id",
+    )
+
+
+def deal_export_spec() -> ExportSpec:
+    """Return the export columns for deals"""
+    username_field = get_user_model().USERNAME_FIELD
+    return ExportSpec(
+        name="deals",
+        columns=(
+            ("id", "id"),
+            ("title", "title"),
+            ("contact_email", "contact__email"),
+            ("company", "contact__company__name"),
+            ("stage", "stage__name"),
+            ("amount", "amount"),
+            ("expected_close_date", "expected_close_date"),
+            ("probability", "probability"),
+            ("owner", f"owner__{username_field}"),
+            ("created_at", "created_at"),
+            ("updated_at", "updated_at"),
+        ),
+        tags_through=Deal.tags.through,
+        tags_field="deal_id",
+    )
+
+
+def get_export_chunk_size() -> int:
+    """Return how many rows are read from the database at a time"""
+    return max(
+        1,
+        int(getattr(settings, "CRM_EXPORT_CHUNK_SIZE", DEFAULT_CRM_EXPORT_CHUNK_SIZE)),
+    )
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def escape_csv_formula(value: str) -> str:
+    """Prefix text a spreadsheet would evaluate as a formula with ``'``"""
+    return f"'{value}" if value.startswith(CSV_FORMULA_PREFIXES) else value
+
+
+def _csv_cell(value: Any) -> Any:
+    # Only text is escaped, so negative numbers stay numbers
+    return escape_csv_formula(value) if isinstance(value, str) else _cell(value)
+
+
+def _export_chunks(
+    queryset: QuerySet,
+    spec: ExportSpec,
+    chunk_size: int,
+    cell: Callable[[Any], Any] = _cell,
+) -> Iterator[list[list[Any]]]:
+    """Yield rows a chunk at a time as lists of cells, tag names last"""
+    lookups = [lookup for _column, lookup in spec.columns]
+    rows = (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .values_list(*lookups)
+        .iterator(chunk_size=chunk_size)
+    )
+    while chunk := list(islice(rows, chunk_size)):
+        tags: dict[int, list[str]] = {}
+        for object_id, name in (
+            spec.tags_through.objects.filter(
+                **{f"{spec.tags_field}__in": [row[0] for row in chunk]}
+            )
+            .order_by("tag__name")
+            .values_list(spec.tags_field, "tag__name")
+        ):
+            tags.setdefault(object_id, []).append(name)
+        yield [[cell(value) for value in row] + [tags.get(row[0], [])] for row in chunk]
+
+
+class _LineBuffer:
+    """File-like object that hands back what ``csv.writer`` writes"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_export(
+    queryset: QuerySet,
+    spec: ExportSpec,
+    file_format: str,
+    chunk_size: int | None = None,
+) -> Iterator[bytes]:
+    """Yield ``queryset`` as encoded CSV or NDJSON, the header line first
+
+    Each chunk of rows is encoded into one piece of output so the response is
+    written in a few large blocks rather than one small write per row.
+    """
+    chunk_size = chunk_size or get_export_chunk_size()
+    headers = spec.headers
+
+    if file_format == ImportJob.FORMAT_NDJSON:
+        for chunk in _export_chunks(queryset, spec, chunk_size):
+            yield "".join(
+                json.dumps(dict(zip(headers, row, strict=True))) + "\n" for row in chunk
+            ).encode()
+        return
+
+    writer = csv.writer(_LineBuffer())
+    # Byte order mark so spreadsheet applications detect UTF-8
+    yield ("\ufeff" + writer.writerow(headers)).encode()
+    for chunk in _export_chunks(queryset, spec, chunk_size, _csv_cell):
+        yield "".join(
+            writer.writerow([*row[:-1], escape_csv_formula(";".join(row[-1]))])
+            for row in chunk
+        ).encode()
+
+
+def export_filename(spec: ExportSpec, file_format: str) -> str:
+    """Return the download file name for an export"""
+    return f"{spec.name}.{file_format}"
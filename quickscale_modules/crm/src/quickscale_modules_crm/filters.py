@@ -0,0 +1,13 @@
+"""django-filter FilterSets for CRM API endpoints"""
+
+from django_filters import rest_framework as filters
+
+from .models import Deal
+
+
+class DealFilterSet(filters.FilterSet):
+    """Filters for the deal list, also used to select deals for bulk actions"""
+
+    class Meta:
+        model = Deal
+        fields = ["stage", "owner", "tags", "contact__company"]
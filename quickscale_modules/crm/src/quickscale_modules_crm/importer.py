@@ -0,0 +1,354 @@
+"""Streaming bulk import of CRM companies, contacts and deals
+
+`run_import` reads CSV or NDJSON from a binary file object one row at a time,
+validates rows in chunks of ``CRM_IMPORT_CHUNK_SIZE`` and writes each chunk in
+its own transaction with a fixed number of queries: companies, tags, stages
+and existing rows are looked up with ``__in`` queries and rows are written
+with ``bulk_create``/``bulk_update``. Memory use is bounded by the chunk size,
+not the file size.
+
+Companies are matched on their exact name and contacts on email, ignoring
+case, so re-importing a file updates rows instead of duplicating them; only
+the columns present in a row are written. Deals are always created. Contacts that
+name an unknown company create it, and unknown tags are created on the fly.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import IO, Any
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+from rest_framework import serializers
+
+from .exporter import CSV_FORMULA_PREFIXES
+from .models import Company, Contact, Deal, ImportJob, Stage, Tag
+from .serializers import (
+    CompanyImportRowSerializer,
+    ContactImportRowSerializer,
+    DealImportRowSerializer,
+)
+from .stats import adjust_totals, record_created_deals
+
+DEFAULT_CRM_IMPORT_CHUNK_SIZE = 1000
+
+# (row number, validated data) pairs and {row, errors} error records
+Rows = list[tuple[int, dict[str, Any]]]
+RowErrors = list[dict[str, Any]]
+
+
+class ImportFormatError(ValueError):
+    """Raised when an import file cannot be read in its declared format"""
+
+
+def get_import_chunk_size() -> int:
+    """Return how many rows are validated and written per transaction"""
+    return max(
+        1,
+        int(getattr(settings, "CRM_IMPORT_CHUNK_SIZE", DEFAULT_CRM_IMPORT_CHUNK_SIZE)),
+    )
+
+
+def read_rows(stream: IO[bytes], file_format: str) -> Iterator[tuple[int, Any]]:
+    """Yield ``(row_number, row)`` pairs from a UTF-8 CSV or NDJSON stream
+
+    Empty CSV cells are dropped so they count as "not provided", and the
+    ``'`` the exporter puts before formula-like text is removed. NDJSON lines
+    that are not valid JSON are yielded as ``None`` and rejected as row errors.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if file_format == ImportJob.FORMAT_CSV:
+            reader = csv.DictReader(text)
+            for row in reader:
+                yield (
+                    reader.line_num,
+                    {
+                        key: _unescape_csv_formula(value)
+                        for key, value in row.items()
+                        if key is not None and value not in (None, "")
+                    },
+                )
+        elif file_format == ImportJob.FORMAT_NDJSON:
+            for number, line in enumerate(text, start=1):
+                if line.strip():
+                    yield number, _parse_json_line(line)
+        else:
+            raise ImportFormatError(f"Unsupported import format: {file_format}")
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise ImportFormatError(f"Could not read {file_format} input: {exc}") from exc
+    finally:
+        # Leave the caller's stream open
+        text.detach()
+
+
+def _unescape_csv_formula(value: str) -> str:
+    if value.startswith("'") and value[1:].startswith(CSV_FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def _parse_json_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _validate(
+    chunk: list[tuple[int, Any]], serializer_class: type[serializers.Serializer]
+) -> tuple[Rows, RowErrors]:
+    """Split a chunk into validated rows and row errors"""
+    valid: Rows = []
+    errors: RowErrors = []
+    for number, row in chunk:
+        if not isinstance(row, dict):
+            errors.append({"row": number, "errors": ["Expected a JSON object"]})
+            continue
+        serializer = serializer_class(data=row)
+        if serializer.is_valid():
+            valid.append((number, dict(serializer.validated_data)))
+        else:
+            errors.append({"row": number, "errors": serializer.errors})
+    return valid, errors
+
+
+def _first_by(queryset: models.QuerySet, key: str) -> dict[Any, Any]:
+    """Return the first object of ``queryset`` for each value of ``key``"""
+    objects: dict[Any, Any] = {}
+    for obj in queryset:
+        objects.setdefault(getattr(obj, key), obj)
+    return objects
+
+
+def _merge_by(rows: Rows, key: Callable[[dict[str, Any]], Any]) -> dict[Any, Any]:
+    """Collapse rows sharing a key; later rows override earlier columns"""
+    merged: dict[Any, dict[str, Any]] = {}
+    for _number, data in rows:
+        merged[key(data)] = {**merged.get(key(data), {}), **data}
+    return merged
+
+
+def _resolve_companies(names: set[str]) -> dict[str, Company]:
+    """Return companies by name, creating the ones that do not exist"""
+    companies = _first_by(Company.objects.filter(name__in=names).order_by("pk"), "name")
+    new = [Company(name=name) for name in sorted(names - companies.keys())]
+    Company.objects.bulk_create(new)
+    adjust_totals(company_count=len(new))
+    companies.update((company.name, company) for company in new)
+    return companies
+
+
+def _resolve_tags(names: set[str]) -> dict[str, Tag]:
+    """Return tags by name, creating the ones that do not exist"""
+    tags = {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+    missing = names - tags.keys()
+    if missing:
+        # A concurrent import may create the same tags; reread them afterwards.
+        Tag.objects.bulk_create(
+            [Tag(name=name) for name in missing], ignore_conflicts=True
+        )
+        tags.update((tag.name, tag) for tag in Tag.objects.filter(name__in=missing))
+    return tags
+
+
+def _link_tags(
+    relation: Any, field: str, links: list[tuple[models.Model, list[str]]]
+) -> None:
+    """Add tags to objects, keeping tags they already have"""
+    if not links:
+        return
+    tags = _resolve_tags({name for _obj, names in links for name in names})
+    through = relation.through
+    through.objects.bulk_create(
+        [
+            through(**{field: obj.pk, "tag_id": tags[name].pk})
+            for obj, names in links
+            for name in set(names)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def _upsert(
+    model: type[models.Model],
+    existing: dict[Any, models.Model],
+    merged: dict[Any, dict[str, Any]],
+) -> tuple[list[models.Model], list[models.Model]]:
+    """Build new objects and update existing ones from merged row data"""
+    now = timezone.now()
+    created, updated = [], []
+    update_fields: set[str] = set()
+    for key, fields in merged.items():
+        obj = existing.get(key)
+        if obj is None:
+            created.append(model(**fields))
+            continue
+        for field, value in fields.items():
+            setattr(obj, field, value)
+        obj.updated_at = now  # type: ignore[attr-defined]
+        update_fields.update(fields)
+        updated.append(obj)
+    model.objects.bulk_create(created)  # type: ignore[attr-defined]
+    if updated:
+        model.objects.bulk_update(  # type: ignore[attr-defined]
+            updated, sorted(update_fields | {"updated_at"})
+        )
+    return created, updated
+
+
+def _import_companies(rows: Rows) -> tuple[int, int, RowErrors]:
+    merged = _merge_by(rows, lambda data: data["name"])
+    existing = _first_by(Company.objects.filter(name__in=merged).order_by("pk"), "name")
+    created, updated = _upsert(Company, existing, merged)
+    adjust_totals(company_count=len(created))
+    return len(created), len(updated), []
+
+
+def _import_contacts(rows: Rows) -> tuple[int, int, RowErrors]:
+    merged = _merge_by(rows, lambda data: data["email"].lower())
+    companies = _resolve_companies({data["company"] for data in merged.values()})
+    tag_names = {key: data.pop("tags", []) for key, data in merged.items()}
+    for data in merged.values():
+        data["company"] = companies[data["company"]]
+
+    existing = _first_by(
+        Contact.objects.annotate(email_key=Lower("email"))
+        .filter(email_key__in=merged)
+        .order_by("pk"),
+        "email_key",
+    )
+    created, updated = _upsert(Contact, existing, merged)
+    adjust_totals(contact_count=len(created))
+
+    contacts = {contact.email.lower(): contact for contact in [*updated, *created]}
+    _link_tags(
+        Contact.tags,
+        "contact_id",
+        [(contacts[key], names) for key, names in tag_names.items() if names],
+    )
+    return len(created), len(updated), []
+
+
+def _import_deals(rows: Rows) -> tuple[int, int, RowErrors]:
+    contacts = _first_by(
+        Contact.objects.annotate(email_key=Lower("email"))
+        .filter(email_key__in={data["contact_email"].lower() for _n, data in rows})
+        .order_by("pk"),
+        "email_key",
+    )
+    stages = _first_by(
+        Stage.objects.filter(name__in={data["stage"] for _n, data in rows}).order_by(
+            "order", "pk"
+        ),
+        "name",
+    )
+
+    deals, links, errors = [], [], []
+    for number, data in rows:
+        row_errors = {}
+        contact = contacts.get(data.pop("contact_email").lower())
+        stage = stages.get(data.pop("stage"))
+        if contact is None:
+            row_errors["contact_email"] = ["No contact has this email."]
+        if stage is None:
+            row_errors["stage"] = ["No stage has this name."]
+        if row_errors:
+            errors.append({"row": number, "errors": row_errors})
+            continue
+        tags = data.pop("tags", [])
+        deal = Deal(contact=contact, stage=stage, **data)
+        deals.append(deal)
+        if tags:
+            links.append((deal, tags))
+
+    Deal.objects.bulk_create(deals)
+    record_created_deals(deals)
+    _link_tags(Deal.tags, "deal_id", links)
+    return len(deals), 0, errors
+
+
+_IMPORTERS: dict[str, tuple[type[serializers.Serializer], Callable[..., Any]]] = {
+    ImportJob.ENTITY_COMPANIES: (CompanyImportRowSerializer, _import_companies),
+    ImportJob.ENTITY_CONTACTS: (ContactImportRowSerializer, _import_contacts),
+    ImportJob.ENTITY_DEALS: (DealImportRowSerializer, _import_deals),
+}
+_PROGRESS_FIELDS = [
+    "status",
+    "rows_processed",
+    "created_count",
+    "updated_count",
+    "error_count",
+    "errors",
+    "message",
+    "started_at",
+    "finished_at",
+]
+
+
+def _record_errors(job: ImportJob, errors: RowErrors) -> None:
+    job.error_count += len(errors)
+    room = ImportJob.MAX_STORED_ERRORS - len(job.errors)
+    if room > 0:
+        job.errors.extend(errors[:room])
+
+
+def run_import(
+    job: ImportJob,
+    stream: IO[bytes],
+    *,
+    chunk_size: int | None = None,
+    on_progress: Callable[[ImportJob], None] | None = None,
+) -> ImportJob:
+    """Import ``stream`` into ``job.entity``, saving progress on ``job``
+
+    Each chunk is committed on its own: if the input turns out to be
+    unreadable part way, earlier chunks stay imported and the job is marked
+    failed with the reason in ``message``. Unexpected errors also mark the
+    job failed before propagating.
+    """
+    serializer_class, import_chunk = _IMPORTERS[job.entity]
+    chunk_size = chunk_size or get_import_chunk_size()
+
+    job.status = ImportJob.STATUS_RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=_PROGRESS_FIELDS)
+    try:
+        for chunk in _chunks(read_rows(stream, job.file_format), chunk_size):
+            rows, errors = _validate(chunk, serializer_class)
+            with transaction.atomic():
+                created, updated, write_errors = import_chunk(rows)
+            job.rows_processed += len(chunk)
+            job.created_count += created
+            job.updated_count += updated
+            _record_errors(
+                job, sorted(errors + write_errors, key=lambda error: error["row"])
+            )
+            job.save(update_fields=_PROGRESS_FIELDS)
+            if on_progress is not None:
+                on_progress(job)
+    except ImportFormatError as exc:
+        job.status = ImportJob.STATUS_FAILED
+        job.message = str(exc)
+    except Exception as exc:
+        job.status = ImportJob.STATUS_FAILED
+        job.message = f"Import stopped by an unexpected error: {exc}"
+        job.finished_at = timezone.now()
+        job.save(update_fields=_PROGRESS_FIELDS)
+        raise
+    else:
+        job.status = ImportJob.STATUS_COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=_PROGRESS_FIELDS)
+    return job
@@ -0,0 +1,102 @@
+"""Bulk import CRM companies, contacts or deals from a CSV or NDJSON file."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_crm.importer import run_import
+from quickscale_modules_crm.models import ImportJob
+
+
+class Command(BaseCommand):
+    """Stream a CSV or NDJSON file into the CRM in chunks"""
+
+    help = (
+        "Import companies, contacts or deals from a CSV or NDJSON file. "
+        "Contacts are matched on email and companies on name, so existing "
+        "rows are updated instead of duplicated."
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "entity",
+            choices=[choice for choice, _label in ImportJob.ENTITY_CHOICES],
+            help="What the file contains.",
+        )
+        parser.add_argument("path", help="File to import, or - for stdin.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=[choice for choice, _label in ImportJob.FORMAT_CHOICES],
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Rows per transaction. Defaults to CRM_IMPORT_CHUNK_SIZE.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options["path"]
+        file_format = options["file_format"] or _format_for(path)
+        if file_format is None:
+            raise CommandError("Cannot infer the format; pass --format.")
+
+        job = ImportJob.objects.create(
+            entity=options["entity"],
+            file_format=file_format,
+            source_name="stdin" if path == "-" else Path(path).name[:255],
+        )
+        verbosity = options["verbosity"]
+
+        def report(progress: ImportJob) -> None:
+            if verbosity >= 2:
+                self.stdout.write(
+                    f"{progress.rows_processed} rows processed, "
+                    f"{progress.error_count} errors"
+                )
+
+        try:
+            if path == "-":
+                run_import(
+                    job,
+                    sys.stdin.buffer,
+                    chunk_size=options["chunk_size"],
+                    on_progress=report,
+                )
+            else:
+                with open(path, "rb") as stream:
+                    run_import(
+                        job,
+                        stream,
+                        chunk_size=options["chunk_size"],
+                        on_progress=report,
+                    )
+        except OSError as exc:
+            job.status = ImportJob.STATUS_FAILED
+            job.message = str(exc)
+            job.save(update_fields=["status", "message"])
+            raise CommandError(str(exc)) from exc
+
+        for error in job.errors[:20]:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        if job.status == ImportJob.STATUS_FAILED:
+            raise CommandError(f"Import {job.pk} failed: {job.message}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. Import {job.pk}: {job.rows_processed} rows, "
+                f"{job.created_count} created, {job.updated_count} updated, "
+                f"{job.error_count} errors ({job.rows_per_second or 0} rows/s)."
+            )
+        )
+
+
+def _format_for(path: str) -> str | None:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return ImportJob.FORMAT_CSV
+    if suffix in (".ndjson", ".jsonl"):
+        return ImportJob.FORMAT_NDJSON
+    return None
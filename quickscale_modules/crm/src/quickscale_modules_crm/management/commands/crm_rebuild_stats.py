@@ -0,0 +1,39 @@
+"""Rebuild the CRM dashboard statistics rollup from source tables."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_crm.stats import find_stats_drift, rebuild_stats
+
+
+class Command(BaseCommand):
+    """Recompute CRMStats rows from contacts, companies and deals"""
+
+    help = (
+        "Rebuild the CRM dashboard statistics rollup from scratch, or report "
+        "rows that drifted from the source tables with --check"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drifted rows; exit with an error if any are found.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["check"]:
+            drifted = find_stats_drift()
+            if drifted:
+                raise CommandError("CRM statistics drifted for: " + ", ".join(drifted))
+            self.stdout.write(self.style.SUCCESS("CRM statistics are up to date."))
+            return
+
+        totals = rebuild_stats()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done. Rebuilt CRM statistics: {totals.contact_count} contacts, "
+                f"{totals.company_count} companies, {totals.deal_count} deals."
+            )
+        )
@@ -0,0 +1,26 @@
+"""Run CRM bulk deal actions that were queued because of their size."""
+
+from django.core.management.base import BaseCommand
+
+from quickscale_modules_crm.bulk import run_queued_bulk_actions
+
+
+class Command(BaseCommand):
+    """Run queued bulk stage changes, oldest first"""
+
+    help = (
+        "Run queued CRM bulk actions (bulk stage updates, mark won, mark lost). "
+        "Deals are updated in chunks of CRM_BULK_CHUNK_SIZE, each in its own "
+        "transaction."
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Maximum number of bulk actions to run in this run.",
+        )
+
+    def handle(self, *args, **options) -> None:  # type: ignore[no-untyped-def]
+        run_count = run_queued_bulk_actions(limit=options["limit"])
+        self.stdout.write(self.style.SUCCESS(f"Ran {run_count} bulk action(s)"))
@@ -0,0 +1,85 @@
+"""Add the CRMStats dashboard rollup and fill it from existing data"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_stats(apps, _schema_editor):
+    """Compute the rollup rows from the current contacts, companies and deals"""
+    CRMStats = apps.get_model("quickscale_modules_crm", "CRMStats")
+    Company = apps.get_model("quickscale_modules_crm", "Company")
+    Contact = apps.get_model("quickscale_modules_crm", "Contact")
+    Deal = apps.get_model("quickscale_modules_crm", "Deal")
+    Stage = apps.get_model("quickscale_modules_crm", "Stage")
+
+    deals = Deal.objects.aggregate(deal_count=Count("id"), deal_value=Sum("amount"))
+    rows = [
+        CRMStats(
+            key="totals",
+            contact_count=Contact.objects.count(),
+            company_count=Company.objects.count(),
+            deal_count=deals["deal_count"],
+            deal_value=deals["deal_value"] or 0,
+        )
+    ]
+    for stage in Stage.objects.annotate(
+        deal_count=Count("deals"), deal_value=Sum("deals__amount")
+    ):
+        rows.append(
+            CRMStats(
+                key=f"stage:{stage.pk}",
+                stage=stage,
+                deal_count=stage.deal_count,
+                deal_value=stage.deal_value or 0,
+            )
+        )
+    CRMStats.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+    """Add the CRMStats dashboard rollup"""
+
+    dependencies = [
+        ("quickscale_modules_crm", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CRMStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=32, unique=True)),
+                ("contact_count", models.IntegerField(default=0)),
+                ("company_count", models.IntegerField(default=0)),
+                ("deal_count", models.IntegerField(default=0)),
+                (
+                    "deal_value",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "stage",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats",
+                        to="quickscale_modules_crm.stage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "CRM statistics",
+                "verbose_name_plural": "CRM statistics",
+            },
+        ),
+        migrations.RunPython(build_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+"""Create trigram indexes for CRM contact and company search.
+
+PostgreSQL gets ``pg_trgm`` GIN indexes on the searched name and email
+columns, which serve both the ``ILIKE`` substring and the ``<%`` fuzzy match
+predicates used by ``CRMSearchFilter``. Other databases are left unchanged
+and search with plain substring matching.
+"""
+
+from django.db import migrations
+
+CONTACT_TABLE = "quickscale_modules_crm_contact"
+COMPANY_TABLE = "quickscale_modules_crm_company"
+
+TRIGRAM_INDEXES = [
+    (CONTACT_TABLE, "first_name"),
+    (CONTACT_TABLE, "last_name"),
+    (CONTACT_TABLE, "email"),
+    (COMPANY_TABLE, "name"),
+    (COMPANY_TABLE, "industry"),
+]
+
+POSTGRES_FORWARD = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"CREATE INDEX IF NOT EXISTS {table}_{column}_trgm "
+    f"ON {table} USING GIN ({column} gin_trgm_ops)"
+    for table, column in TRIGRAM_INDEXES
+]
+POSTGRES_REVERSE = [
+    f"DROP INDEX IF EXISTS {table}_{column}_trgm" for table, column in TRIGRAM_INDEXES
+]
+
+
+def _run(schema_editor, statements):  # type: ignore[no-untyped-def]
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_indexes(apps, schema_editor):  # type: ignore[no-untyped-def]
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_search_indexes(apps, schema_editor):  # type: ignore[no-untyped-def]
+    # The pg_trgm extension is left installed; other apps may rely on it.
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_REVERSE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quickscale_modules_crm", "0002_crmstats"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
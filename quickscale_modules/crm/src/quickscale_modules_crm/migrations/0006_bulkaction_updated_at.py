@@ -0,0 +1,25 @@
+"""Record when a BulkAction last made progress"""
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Record when a BulkAction last made progress"""
+
+    dependencies = [
+        ("quickscale_modules_crm", "0005_bulkaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bulkaction",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Last progress, saved after every chunk",
+            ),
+            preserve_default=False,
+        ),
+    ]
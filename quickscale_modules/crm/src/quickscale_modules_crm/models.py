@@ -9,10 +9,15 @@ This module provides 7 core models for CRM functionality:
 - Deal: Sales opportunity with pipeline tracking
 - ContactNote: Notes on contacts
 - DealNote: Notes on deals
+
+``CRMStats`` is a derived rollup of those models kept for the dashboard,
+``ImportJob`` records the progress of bulk imports, and ``BulkAction`` with
+``BulkActionChange`` records bulk deal updates and what they changed.
 """
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Tag(models.Model):
@@ -203,3 +208,218 @@ class DealNote(models.Model):
 
     def __str__(self) -> str:
         return f"Note on {self.deal} by {self.created_by}"
+
+
+class CRMStats(models.Model):
+    """Rollup of dashboard statistics, maintained incrementally
+
+    The ``totals`` row holds module-wide totals; every other row holds the
+    deal count and value of one stage. Rows are adjusted by the signal
+    handlers in ``signals`` and rebuilt by the ``crm_rebuild_stats`` command.
+    """
+
+    TOTALS_KEY = "totals"
+
+    key = models.CharField(max_length=32, unique=True)
+    stage = models.OneToOneField(
+        Stage,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="stats",
+    )
+    contact_count = models.IntegerField(default=0)
+    company_count = models.IntegerField(default=0)
+    deal_count = models.IntegerField(default=0)
+    deal_value = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        app_label = "quickscale_modules_crm"
+        verbose_name = "CRM statistics"
+        verbose_name_plural = "CRM statistics"
+
+    def __str__(self) -> str:
+        return f"Statistics for {self.stage or 'all stages'}"
+
+    @staticmethod
+    def key_for_stage(stage_id: int) -> str:
+        """Return the rollup key of a stage row"""
+        return f"stage:{stage_id}"
+
+
+class ImportJob(models.Model):
+    """Progress and outcome of one bulk import of contacts, companies or deals
+
+    Counters are saved after every chunk, so a running import can be polled.
+    Row errors are kept up to ``MAX_STORED_ERRORS``; ``error_count`` counts all.
+    """
+
+    ENTITY_COMPANIES = "companies"
+    ENTITY_CONTACTS = "contacts"
+    ENTITY_DEALS = "deals"
+    ENTITY_CHOICES = [
+        (ENTITY_COMPANIES, "Companies"),
+        (ENTITY_CONTACTS, "Contacts"),
+        (ENTITY_DEALS, "Deals"),
+    ]
+
+    FORMAT_CSV = "csv"
+    FORMAT_NDJSON = "ndjson"
+    FORMAT_CHOICES = [
+        (FORMAT_CSV, "CSV"),
+        (FORMAT_NDJSON, "NDJSON"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    MAX_STORED_ERRORS = 1000
+
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    file_format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    source_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="crm_import_jobs",
+    )
+    rows_processed = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Rejected rows as {row, errors} objects",
+    )
+    message = models.TextField(blank=True, help_text="Why the import failed")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "quickscale_modules_crm"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"Import of {self.entity} ({self.status})"
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the import throughput so far, or None before it starts"""
+        if self.started_at is None:
+            return None
+        elapsed = (
+            (self.finished_at or timezone.now()) - self.started_at
+        ).total_seconds()
+        if elapsed <= 0:
+            return None
+        return round(self.rows_processed / elapsed, 1)
+
+
+class BulkAction(models.Model):
+    """A bulk stage change applied to deals selected by ID or by filter
+
+    Large selections are queued and run by the ``crm_run_bulk_actions``
+    command. Deals are updated in chunks, each in its own short transaction,
+    and every chunk logs the deals it updated in ``BulkActionChange`` rows.
+    """
+
+    ACTION_UPDATE_STAGE = "update_stage"
+    ACTION_MARK_WON = "mark_won"
+    ACTION_MARK_LOST = "mark_lost"
+    ACTION_CHOICES = [
+        (ACTION_UPDATE_STAGE, "Update stage"),
+        (ACTION_MARK_WON, "Mark won"),
+        (ACTION_MARK_LOST, "Mark lost"),
+    ]
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    stage = models.ForeignKey(
+        Stage,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="bulk_actions",
+    )
+    deal_ids = models.JSONField(
+        null=True, blank=True, help_text="Selected deal IDs, if selected by ID"
+    )
+    filters = models.JSONField(
+        null=True, blank=True, help_text="Deal list filters, if selected by filter"
+    )
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="crm_bulk_actions",
+    )
+    matched_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    message = models.TextField(blank=True, help_text="Why the action failed")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(
+        auto_now=True, help_text="Last progress, saved after every chunk"
+    )
+
+    class Meta:
+        app_label = "quickscale_modules_crm"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.get_action_display()} ({self.status})"
+
+
+class BulkActionChange(models.Model):
+    """Deals one chunk of a bulk action updated, with their previous values"""
+
+    bulk_action = models.ForeignKey(
+        BulkAction,
+        on_delete=models.CASCADE,
+        related_name="changes",
+    )
+    from_stage = models.ForeignKey(
+        Stage,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    from_probability = models.IntegerField(null=True)
+    deal_ids = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "quickscale_modules_crm"
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{len(self.deal_ids)} deals from {self.from_stage}"
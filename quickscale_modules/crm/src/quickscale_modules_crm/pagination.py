@@ -0,0 +1,204 @@
+"""Cursor pagination for CRM API list endpoints
+
+Pages are keyed on every column of the active ordering plus the primary key,
+so each page is a bounded range read however deep it is and rows never repeat
+or go missing between pages when values tie. The ordering comes from the
+view's ``OrderingFilter`` and cursors carry the values of the row they stop
+at, so clients can page through any allowed ``?ordering=``.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.db.models import F, Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+
+DEFAULT_CRM_PAGE_SIZE = 25
+DEFAULT_CRM_CONTACTS_PER_PAGE = 50
+DEFAULT_CRM_DEALS_PER_PAGE = 25
+DEFAULT_CRM_MAX_PAGE_SIZE = 100
+_PRIMARY_KEY_FIELDS = {"pk", "id"}
+
+
+def get_max_page_size() -> int:
+    """Return the largest page size clients may request"""
+    return max(
+        1, int(getattr(settings, "CRM_MAX_PAGE_SIZE", DEFAULT_CRM_MAX_PAGE_SIZE))
+    )
+
+
+def _position_value(value: Any) -> Any:
+    """Return a JSON-safe value that lookups parse back to ``value``"""
+    if isinstance(value, (datetime, date, time)):
+        # Full precision: DjangoJSONEncoder would truncate microseconds
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class CRMCursorPagination(CursorPagination):
+    """Keyset pagination over the view ordering with a primary key tie-breaker
+
+    ``NULL`` sorts before every value in both directions' keyset comparisons,
+    and the ``ORDER BY`` pins it there, so nullable columns such as
+    ``last_contacted_at`` page consistently on every database.
+    """
+
+    ordering = "-created_at"
+    page_size_query_param = "page_size"
+    page_size_setting = "CRM_PAGE_SIZE"
+    default_page_size = DEFAULT_CRM_PAGE_SIZE
+
+    def get_page_size(self, request: Request) -> int:
+        """Return the requested page size, capped at ``CRM_MAX_PAGE_SIZE``"""
+        max_page_size = get_max_page_size()
+        raw_page_size = request.query_params.get(self.page_size_query_param)
+        if raw_page_size:
+            try:
+                page_size = int(raw_page_size)
+            except ValueError:
+                page_size = 0
+            if page_size > 0:
+                return min(page_size, max_page_size)
+
+        page_size = int(
+            getattr(settings, self.page_size_setting, self.default_page_size)
+        )
+        return max(1, min(page_size, max_page_size))
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> tuple[str, ...]:
+        """Return the view ordering made unique with a primary key tie-breaker"""
+        ordering = list(super().get_ordering(request, queryset, view))
+        if not any(field.lstrip("-") in _PRIMARY_KEY_FIELDS for field in ordering):
+            ordering.append("-pk" if ordering[-1].startswith("-") else "pk")
+        return tuple(ordering)
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list[Model]:
+        """Return one page of ``queryset`` starting after the request cursor"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        ordering = (
+            tuple(_flip(field) for field in self.ordering) if reverse else self.ordering
+        )
+        queryset = queryset.order_by(*_order_by(ordering))
+        position = None
+        if self.cursor is not None and self.cursor.position is not None:
+            position = self._load_position(self.cursor.position)
+            queryset = queryset.filter(_after(ordering, position))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        self._position = position
+        return self.page
+
+    def get_next_link(self) -> str | None:
+        """Return the URL of the page after this one"""
+        if not self.has_next:
+            return None
+        position = self._get_positions(self.page[-1]) if self.page else self._position
+        return self._link(position, reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        """Return the URL of the page before this one"""
+        if not self.has_previous:
+            return None
+        position = self._get_positions(self.page[0]) if self.page else self._position
+        return self._link(position, reverse=True)
+
+    def _link(self, position: list[Any] | None, *, reverse: bool) -> str:
+        encoded = json.dumps(position, separators=(",", ":"))
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=encoded))
+
+    def _get_positions(self, instance: Model) -> list[Any]:
+        """Return the ordering values of ``instance``"""
+        return [
+            _position_value(getattr(instance, field.lstrip("-")))
+            for field in self.ordering
+        ]
+
+    def _load_position(self, encoded: str) -> list[Any]:
+        """Decode a cursor position, which must match the current ordering"""
+        try:
+            position = json.loads(encoded)
+        except ValueError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+
+class ContactCursorPagination(CRMCursorPagination):
+    """Cursor pagination sized by ``CRM_CONTACTS_PER_PAGE``"""
+
+    page_size_setting = "CRM_CONTACTS_PER_PAGE"
+    default_page_size = DEFAULT_CRM_CONTACTS_PER_PAGE
+
+
+class DealCursorPagination(CRMCursorPagination):
+    """Cursor pagination sized by ``CRM_DEALS_PER_PAGE``"""
+
+    page_size_setting = "CRM_DEALS_PER_PAGE"
+    default_page_size = DEFAULT_CRM_DEALS_PER_PAGE
+
+
+def _flip(field: str) -> str:
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def _order_by(ordering: tuple[str, ...]) -> list[Any]:
+    """Return ``order_by()`` expressions that sort ``NULL`` lowest"""
+    expressions = []
+    for field in ordering:
+        if field.startswith("-"):
+            expressions.append(F(field[1:]).desc(nulls_last=True))
+        else:
+            expressions.append(F(field).asc(nulls_first=True))
+    return expressions
+
+
+def _after(ordering: tuple[str, ...], position: list[Any]) -> Q:
+    """Return a filter for rows strictly after ``position`` in ``ordering``
+
+    ``(a, b, pk) > (x, y, z)`` expands to ``a > x OR (a = x AND b > y) OR
+    (a = x AND b = y AND pk > z)``, with ``NULL`` the lowest value.
+    """
+    condition = Q(pk__in=[])
+    equal_so_far = Q()
+    for field, value in zip(ordering, position, strict=True):
+        name = field.lstrip("-")
+        descending = field.startswith("-")
+        if value is None:
+            beyond = Q(pk__in=[]) if descending else Q(**{f"{name}__isnull": False})
+            equal = Q(**{f"{name}__isnull": True})
+        else:
+            if descending:
+                beyond = Q(**{f"{name}__lt": value}) | Q(**{f"{name}__isnull": True})
+            else:
+                beyond = Q(**{f"{name}__gt": value})
+            equal = Q(**{name: value})
+        condition |= equal_so_far & beyond
+        equal_so_far &= equal
+    return condition
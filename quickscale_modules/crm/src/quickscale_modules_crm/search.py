@@ -0,0 +1,172 @@
+"""Ranked, typo-tolerant search for CRM API list endpoints
+
+`CRMSearchFilter` is a drop-in replacement for DRF's ``SearchFilter`` that reads
+the same ``?search=`` parameter and ``search_fields``. On PostgreSQL it matches
+with ``pg_trgm``: each term must be a substring of, or trigram-similar to
+(``<%``), one of the fields, so "jonh" finds "John". Both predicates are served
+by the GIN trigram indexes created in migration 0003. Other databases keep
+``SearchFilter``'s substring matching.
+
+Every search annotates a ``search_rank``: summed trigram word similarity on
+PostgreSQL, and exact > prefix > substring matches elsewhere. Use
+`SearchRankOrderingFilter` in place of ``OrderingFilter`` to return the most
+relevant rows first unless the client asks for an explicit ``?ordering=``.
+"""
+
+import operator
+from functools import reduce
+from typing import Any
+
+from django.db import connections
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    FloatField,
+    Func,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.request import Request
+
+SEARCH_RANK = "search_rank"
+# search_fields prefixes understood by SearchFilter; ranked search ignores them
+_LOOKUP_PREFIXES = "^=@$"
+
+
+class _WordSimilar(Func):
+    """``term <% field``: the term is trigram-similar to a word in the field"""
+
+    arg_joiner = " <%% "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+class _ILike(Func):
+    """``field ILIKE pattern``, which trigram GIN indexes can serve"""
+
+    arg_joiner = " ILIKE "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+class _WordSimilarity(Func):
+    function = "WORD_SIMILARITY"
+    output_field = FloatField()
+
+
+def _field_path(search_field: str) -> str:
+    return str(search_field).lstrip(_LOOKUP_PREFIXES)
+
+
+def _greatest(expressions: list[Any]) -> Any:
+    return expressions[0] if len(expressions) == 1 else Greatest(*expressions)
+
+
+class CRMSearchFilter(SearchFilter):
+    """Search filter with relevance ranking and, on PostgreSQL, fuzzy matching"""
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> QuerySet:
+        """Return rows matching every search term, annotated with a rank"""
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        fields = [_field_path(field) for field in search_fields]
+        # Multi-valued relations would duplicate rows, so they filter but do
+        # not contribute to the rank.
+        ranked_fields = [
+            field for field in fields if not self.must_call_distinct(queryset, [field])
+        ] or fields[:1]
+
+        if connections[queryset.db].vendor == "postgresql":
+            queryset = self._filter_trigram(queryset, fields, search_terms)
+            rank = [
+                _greatest(
+                    [
+                        _WordSimilarity(Value(term), Coalesce(F(field), Value("")))
+                        for field in ranked_fields
+                    ]
+                )
+                for term in search_terms
+            ]
+        else:
+            queryset = super().filter_queryset(request, queryset, view)
+            rank = [
+                _greatest([self._match_score(field, term) for field in ranked_fields])
+                for term in search_terms
+            ]
+        return queryset.annotate(**{SEARCH_RANK: reduce(operator.add, rank)})
+
+    def _filter_trigram(
+        self, queryset: QuerySet, fields: list[str], terms: list[str]
+    ) -> QuerySet:
+        """Keep rows where each term is in, or similar to, one of ``fields``"""
+        ops = connections[queryset.db].ops
+        conditions = []
+        for term in terms:
+            pattern = f"%{ops.prep_for_like_query(term)}%"
+            conditions.append(
+                reduce(
+                    operator.or_,
+                    (
+                        Q(_ILike(F(field), Value(pattern)))
+                        | Q(_WordSimilar(Value(term), F(field)))
+                        for field in fields
+                    ),
+                )
+            )
+        matches = queryset.filter(reduce(operator.and_, conditions))
+        if self.must_call_distinct(queryset, fields):
+            return queryset.filter(Exists(matches.filter(pk=OuterRef("pk"))))
+        return matches
+
+    @staticmethod
+    def _match_score(field: str, term: str) -> Case:
+        return Case(
+            When(**{f"{field}__iexact": term}, then=Value(3.0)),
+            When(**{f"{field}__istartswith": term}, then=Value(2.0)),
+            When(**{f"{field}__icontains": term}, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+
+def is_ranked_search(request: Request, view: Any) -> bool:
+    """Return whether ``view`` annotates a search rank for this request"""
+    for backend in getattr(view, "filter_backends", []):
+        if issubclass(backend, CRMSearchFilter):
+            search = backend()
+            return bool(
+                search.get_search_fields(view, request)
+                and search.get_search_terms(request)
+            )
+    return False
+
+
+class SearchRankOrderingFilter(OrderingFilter):
+    """``OrderingFilter`` that puts the best search matches first by default
+
+    An explicit ``?ordering=`` always wins; otherwise searches are ordered by
+    ``-search_rank`` and then the view's default ordering. Cursor pagination
+    reads this ordering too, so relevance-ordered results page correctly.
+    """
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> list[str] | tuple[str, ...] | None:
+        """Return the requested ordering, or relevance first for searches"""
+        if not request.query_params.get(self.ordering_param) and is_ranked_search(
+            request, view
+        ):
+            return [f"-{SEARCH_RANK}", *(self.get_default_ordering(view) or ())]
+        return super().get_ordering(request, queryset, view)
@@ -1,8 +1,35 @@
 """DRF serializers for CRM module models"""
 
+from typing import Any
+
 from rest_framework import serializers
 
-from .models import Company, Contact, ContactNote, Deal, DealNote, Stage, Tag
+from .filters import DealFilterSet
+from .models import (
+    BulkAction,
+    BulkActionChange,
+    Company,
+    Contact,
+    ContactNote,
+    Deal,
+    DealNote,
+    ImportJob,
+    Stage,
+    Tag,
+)
+
+
+def _annotated_count(obj: object, annotation: str, relation: str) -> int:
+    """Return a count annotated by the viewset, counting only as a fallback
+
+    The CRM viewsets annotate ``Count()`` values onto their querysets so lists
+    serialize without a query per row. Instances that were not loaded through
+    them (e.g. freshly created ones) fall back to counting the relation.
+    """
+    count = getattr(obj, annotation, None)
+    if count is None:
+        count = getattr(obj, relation).count()
+    return int(count)
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -34,7 +61,7 @@ class CompanySerializer(serializers.ModelSerializer):
 
     def get_contact_count(self, obj: Company) -> int:
         """Return the number of contacts for this company"""
-        return obj.contacts.count()  # type: ignore
+        return _annotated_count(obj, "contact_count", "contacts")
 
 
 class ContactNoteSerializer(serializers.ModelSerializer):
@@ -93,7 +120,7 @@ class ContactListSerializer(serializers.ModelSerializer):
 
     def get_tag_names(self, obj: Contact) -> list[str]:
         """Return list of tag names"""
-        return list(obj.tags.values_list("name", flat=True))
+        return [tag.name for tag in obj.tags.all()]
 
 
 class ContactDetailSerializer(serializers.ModelSerializer):
@@ -141,7 +168,7 @@ class ContactDetailSerializer(serializers.ModelSerializer):
 
     def get_deal_count(self, obj: Contact) -> int:
         """Return the number of deals for this contact"""
-        return obj.deals.count()  # type: ignore
+        return _annotated_count(obj, "deal_count", "deals")
 
 
 class StageSerializer(serializers.ModelSerializer):
@@ -156,7 +183,7 @@ class StageSerializer(serializers.ModelSerializer):
 
     def get_deal_count(self, obj: Stage) -> int:
         """Return the number of deals in this stage"""
-        return obj.deals.count()  # type: ignore
+        return _annotated_count(obj, "deal_count", "deals")
 
 
 class DealNoteSerializer(serializers.ModelSerializer):
@@ -218,7 +245,7 @@ class DealListSerializer(serializers.ModelSerializer):
 
     def get_tag_names(self, obj: Deal) -> list[str]:
         """Return list of tag names"""
-        return list(obj.tags.values_list("name", flat=True))
+        return [tag.name for tag in obj.tags.all()]
 
 
 class DealDetailSerializer(serializers.ModelSerializer):
@@ -268,20 +295,175 @@ class DealDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class BulkUpdateStageSerializer(serializers.Serializer):
-    """Serializer for bulk stage update action"""
+class DealSelectionSerializer(serializers.Serializer):
+    """Deals chosen for a bulk action, by ``deal_ids`` or by deal list ``filter``"""
 
     deal_ids = serializers.ListField(
         child=serializers.IntegerField(),
         min_length=1,
+        required=False,
     )
+    filter = serializers.DictField(required=False)
+
+    def validate_filter(self, value: dict[str, Any]) -> dict[str, Any]:
+        """Accept only the filters the deal list endpoint accepts"""
+        if not value:
+            raise serializers.ValidationError("Provide at least one filter.")
+        filterset = DealFilterSet(data=value, queryset=Deal.objects.all())
+        unknown = sorted(set(value) - set(filterset.filters))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown filters: {', '.join(unknown)}")
+        if not filterset.is_valid():
+            raise serializers.ValidationError(filterset.errors)
+        return value
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Require exactly one way of selecting deals"""
+        if ("deal_ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError(
+                "Provide either deal_ids or filter, not both."
+            )
+        return attrs
+
+
+class BulkUpdateStageSerializer(DealSelectionSerializer):
+    """Serializer for bulk stage update action"""
+
     stage_id = serializers.PrimaryKeyRelatedField(queryset=Stage.objects.all())
 
 
-class BulkMarkSerializer(serializers.Serializer):
+class BulkMarkSerializer(DealSelectionSerializer):
     """Serializer for bulk mark as won/lost action"""
 
-    deal_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        min_length=1,
+
+class BulkActionSerializer(serializers.ModelSerializer):
+    """Serializer for BulkAction progress records"""
+
+    stage_name = serializers.CharField(
+        source="stage.name", read_only=True, allow_null=True
     )
+
+    class Meta:
+        model = BulkAction
+        fields = [
+            "id",
+            "action",
+            "stage",
+            "stage_name",
+            "filters",
+            "status",
+            "matched_count",
+            "updated_count",
+            "message",
+            "started_at",
+            "finished_at",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class BulkActionChangeSerializer(serializers.ModelSerializer):
+    """Serializer for the change log of a bulk action"""
+
+    class Meta:
+        model = BulkActionChange
+        fields = ["id", "from_stage", "from_probability", "deal_ids", "created_at"]
+        read_only_fields = fields
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """Serializer for ImportJob progress records"""
+
+    rows_per_second = serializers.FloatField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "entity",
+            "file_format",
+            "source_name",
+            "status",
+            "rows_processed",
+            "created_count",
+            "updated_count",
+            "error_count",
+            "errors",
+            "message",
+            "rows_per_second",
+            "started_at",
+            "finished_at",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+class ImportUploadSerializer(serializers.Serializer):
+    """Serializer for starting an import from an uploaded file"""
+
+    entity = serializers.ChoiceField(choices=ImportJob.ENTITY_CHOICES)
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=ImportJob.FORMAT_CHOICES,
+        required=False,
+        help_text="Defaults to the file extension (.csv, .ndjson or .jsonl)",
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Infer the file format from the file name when it is not given"""
+        if "file_format" not in attrs:
+            name = attrs["file"].name.lower()
+            if name.endswith(".csv"):
+                attrs["file_format"] = ImportJob.FORMAT_CSV
+            elif name.endswith((".ndjson", ".jsonl")):
+                attrs["file_format"] = ImportJob.FORMAT_NDJSON
+            else:
+                raise serializers.ValidationError(
+                    {"file_format": "Cannot infer the format from the file name"}
+                )
+        return attrs
+
+
+class NameListField(serializers.ListField):
+    """List of names, also accepted as one ``;``-separated string (CSV cells)"""
+
+    child = serializers.CharField(max_length=50)
+
+    def to_internal_value(self, data: Any) -> list[str]:
+        if isinstance(data, str):
+            data = [name.strip() for name in data.split(";") if name.strip()]
+        return super().to_internal_value(data)
+
+
+class CompanyImportRowSerializer(serializers.Serializer):
+    """One imported company row, matched to existing companies by name"""
+
+    name = serializers.CharField(max_length=200)
+    industry = serializers.CharField(max_length=100, required=False)
+    website = serializers.URLField(required=False)
+
+
+class ContactImportRowSerializer(serializers.Serializer):
+    """One imported contact row, matched to existing contacts by email"""
+
+    first_name = serializers.CharField(max_length=100)
+    last_name = serializers.CharField(max_length=100)
+    email = serializers.EmailField()
+    phone = serializers.CharField(max_length=20, required=False)
+    title = serializers.CharField(max_length=100, required=False)
+    status = serializers.ChoiceField(choices=Contact.STATUS_CHOICES, required=False)
+    company = serializers.CharField(max_length=200, help_text="Company name")
+    tags = NameListField(required=False)
+
+
+class DealImportRowSerializer(serializers.Serializer):
+    """One imported deal row; contacts and stages are referenced by key"""
+
+    title = serializers.CharField(max_length=200)
+    contact_email = serializers.EmailField()
+    stage = serializers.CharField(max_length=100, help_text="Stage name")
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    expected_close_date = serializers.DateField(required=False)
+    probability = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    tags = NameListField(required=False)
@@ -0,0 +1,111 @@
+"""Signal handlers for QuickScale CRM module"""
+
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .analytics import invalidate_pipeline_analytics
+from .models import Company, Contact, CRMStats, Deal, Stage, Tag
+from .stats import adjust_totals, record_deal_change
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+def count_contacts(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    created: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Keep the rollup contact count in step with contacts"""
+    if kwargs["signal"] is post_delete:
+        adjust_totals(contact_count=-1)
+    elif created:
+        adjust_totals(contact_count=1)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def count_companies(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    created: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Keep the rollup company count in step with companies"""
+    if kwargs["signal"] is post_delete:
+        adjust_totals(company_count=-1)
+    elif created:
+        adjust_totals(company_count=1)
+
+
+@receiver(pre_save, sender=Deal)
+def remember_previous_deal_figures(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: Deal,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Record the stored stage and amount of a deal about to be updated"""
+    previous = None
+    if not instance._state.adding and instance.pk is not None:
+        previous = (
+            Deal.objects.filter(pk=instance.pk)
+            .values_list("stage_id", "amount")
+            .first()
+        )
+    instance._stats_previous = previous  # type: ignore[attr-defined]
+
+
+@receiver(post_save, sender=Deal)
+def record_saved_deal(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: Deal,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Apply a created or updated deal to the rollup"""
+    previous = getattr(instance, "_stats_previous", None)
+    record_deal_change(previous, (instance.stage_id, instance.amount))
+
+
+@receiver(post_delete, sender=Deal)
+def record_deleted_deal(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: Deal,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Remove a deleted deal from the rollup"""
+    record_deal_change((instance.stage_id, instance.amount), None)
+
+
+@receiver(post_save, sender=Stage)
+def create_stage_stats(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    instance: Stage,
+    created: bool,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Give new stages an empty rollup row so the dashboard lists them"""
+    if created:
+        CRMStats.objects.get_or_create(
+            key=CRMStats.key_for_stage(instance.pk), defaults={"stage": instance}
+        )
+
+
+@receiver(post_save, sender=Deal)
+@receiver(post_delete, sender=Deal)
+@receiver(post_save, sender=Stage)
+@receiver(post_delete, sender=Stage)
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Deal.tags.through)
+def invalidate_analytics(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    **kwargs: Any,
+) -> None:
+    """Drop cached pipeline analytics once the change is committed"""
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+    transaction.on_commit(invalidate_pipeline_analytics)
@@ -0,0 +1,199 @@
+"""Incrementally maintained CRM dashboard statistics
+
+Totals and per-stage deal figures live in ``CRMStats`` rows so the dashboard
+reads them in one query instead of counting and summing whole tables. The
+signal handlers in ``signals`` adjust the rows with ``F()`` expressions as
+contacts, companies and deals change, and `move_deals_to_stage` and
+`record_created_deals` do the same for bulk writes, which bypass model
+signals; they also invalidate the cached pipeline analytics. A row that is
+missing is recomputed from the source tables rather than adjusted, and
+`rebuild_stats` recomputes every row (see the ``crm_rebuild_stats`` command).
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from .analytics import invalidate_pipeline_analytics
+from .models import Company, Contact, CRMStats, Deal, Stage
+
+ZERO = Decimal("0")
+
+
+def _deal_figures(deals: Any) -> dict[str, Any]:
+    figures = deals.aggregate(deal_count=Count("id"), deal_value=Sum("amount"))
+    return {
+        "deal_count": figures["deal_count"],
+        "deal_value": figures["deal_value"] or ZERO,
+    }
+
+
+def _compute_row(stage_id: int | None) -> dict[str, Any]:
+    """Return the up-to-date values of one rollup row"""
+    if stage_id is not None:
+        return {
+            "stage_id": stage_id,
+            **_deal_figures(Deal.objects.filter(stage_id=stage_id)),
+        }
+    return {
+        "stage_id": None,
+        "contact_count": Contact.objects.count(),
+        "company_count": Company.objects.count(),
+        **_deal_figures(Deal.objects.all()),
+    }
+
+
+def compute_stats() -> dict[str, dict[str, Any]]:
+    """Return every rollup row, keyed by ``CRMStats.key``, from source tables"""
+    rows = {CRMStats.TOTALS_KEY: _compute_row(None)}
+    stages = Stage.objects.annotate(
+        deal_count=Count("deals"), deal_value=Sum("deals__amount")
+    )
+    for stage in stages:
+        rows[CRMStats.key_for_stage(stage.pk)] = {
+            "stage_id": stage.pk,
+            "deal_count": stage.deal_count,
+            "deal_value": stage.deal_value or ZERO,
+        }
+    return rows
+
+
+def find_stats_drift() -> list[str]:
+    """Return the keys of rollup rows that differ from the source tables"""
+    expected = compute_stats()
+    stored = {row.key: row for row in CRMStats.objects.all()}
+    drifted = []
+    for key in sorted(expected.keys() | stored.keys()):
+        row = stored.get(key)
+        values = expected.get(key)
+        if row is None or values is None:
+            drifted.append(key)
+        elif any(getattr(row, field) != value for field, value in values.items()):
+            drifted.append(key)
+    return drifted
+
+
+@transaction.atomic
+def rebuild_stats() -> CRMStats:
+    """Recompute every rollup row from scratch and return the totals row"""
+    # Hold the existing rows so concurrent adjustments wait for the rebuild.
+    list(CRMStats.objects.select_for_update())
+    expected = compute_stats()
+    for key, values in expected.items():
+        CRMStats.objects.update_or_create(key=key, defaults=values)
+    CRMStats.objects.exclude(key__in=expected).delete()
+    return CRMStats.objects.get(key=CRMStats.TOTALS_KEY)
+
+
+def adjust_stats(key: str, stage_id: int | None = None, **deltas: Any) -> None:
+    """Add ``deltas`` to one rollup row, recomputing the row if it is missing"""
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    updated = CRMStats.objects.filter(key=key).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+    if not updated:
+        CRMStats.objects.update_or_create(key=key, defaults=_compute_row(stage_id))
+
+
+def adjust_totals(**deltas: Any) -> None:
+    """Add ``deltas`` to the module-wide totals"""
+    adjust_stats(CRMStats.TOTALS_KEY, **deltas)
+
+
+def adjust_stage(stage_id: int, **deltas: Any) -> None:
+    """Add ``deltas`` to the figures of one stage"""
+    adjust_stats(CRMStats.key_for_stage(stage_id), stage_id, **deltas)
+
+
+def record_deal_change(
+    previous: tuple[int, Decimal | None] | None,
+    current: tuple[int, Decimal | None] | None,
+) -> None:
+    """Apply a deal moving from ``previous`` to ``current`` ``(stage_id, amount)``
+
+    ``None`` stands for a deal that did not exist before or no longer exists.
+    """
+    old_stage, old_amount = previous if previous else (None, None)
+    new_stage, new_amount = current if current else (None, None)
+    old_amount = old_amount or ZERO
+    new_amount = new_amount or ZERO
+
+    adjust_totals(
+        deal_count=(current is not None) - (previous is not None),
+        deal_value=new_amount - old_amount,
+    )
+    if old_stage is not None and old_stage == new_stage:
+        adjust_stage(new_stage, deal_value=new_amount - old_amount)
+        return
+    if old_stage is not None:
+        adjust_stage(old_stage, deal_count=-1, deal_value=-old_amount)
+    if new_stage is not None:
+        adjust_stage(new_stage, deal_count=1, deal_value=new_amount)
+
+
+def record_created_deals(deals: list[Deal]) -> None:
+    """Add deals written with ``bulk_create``, which skips model signals"""
+    by_stage: dict[int, list[Decimal]] = {}
+    for deal in deals:
+        by_stage.setdefault(deal.stage_id, []).append(deal.amount or ZERO)
+    for stage_id, amounts in by_stage.items():
+        adjust_stage(stage_id, deal_count=len(amounts), deal_value=sum(amounts, ZERO))
+    adjust_totals(
+        deal_count=len(deals),
+        deal_value=sum((deal.amount or ZERO for deal in deals), ZERO),
+    )
+    transaction.on_commit(invalidate_pipeline_analytics)
+
+
+def move_deals_to_stage(deal_ids: list[int], stage: Stage, **fields: Any) -> int:
+    """Move deals to ``stage`` with one ``UPDATE`` and keep the rollup in step
+
+    Returns the number of deals updated, like ``QuerySet.update()``.
+    """
+    with transaction.atomic():
+        locked_ids = list(
+            Deal.objects.select_for_update()
+            .filter(id__in=deal_ids)
+            .values_list("id", flat=True)
+        )
+        deals = Deal.objects.filter(id__in=locked_ids)
+        moved = list(
+            deals.exclude(stage=stage)
+            .order_by()
+            .values("stage_id")
+            .annotate(deal_count=Count("id"), deal_value=Sum("amount"))
+        )
+        updated = deals.update(stage=stage, **fields)
+
+        for row in moved:
+            adjust_stage(
+                row["stage_id"],
+                deal_count=-row["deal_count"],
+                deal_value=-(row["deal_value"] or ZERO),
+            )
+        adjust_stage(
+            stage.pk,
+            deal_count=sum(row["deal_count"] for row in moved),
+            deal_value=sum((row["deal_value"] or ZERO for row in moved), ZERO),
+        )
+        transaction.on_commit(invalidate_pipeline_analytics)
+    return updated
+
+
+def get_dashboard_stats() -> tuple[CRMStats, list[CRMStats]]:
+    """Return the totals row and the per-stage rows in pipeline order"""
+    rows = list(
+        CRMStats.objects.select_related("stage").order_by(
+            F("stage__order").asc(nulls_first=True), "stage__name"
+        )
+    )
+    totals = next((row for row in rows if row.stage_id is None), None)
+    if totals is None:
+        # Never built (or wiped): rebuild once instead of showing zeros.
+        rebuild_stats()
+        return get_dashboard_stats()
+    return totals, [row for row in rows if row.stage_id is not None]
@@ -4,12 +4,14 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    BulkActionViewSet,
     CompanyViewSet,
     ContactNoteViewSet,
     ContactViewSet,
     CRMDashboardView,
     DealNoteViewSet,
     DealViewSet,
+    ImportJobViewSet,
     StageViewSet,
     TagViewSet,
 )
@@ -24,6 +26,8 @@ router.register(r"stages", StageViewSet, basename="stage")
 router.register(r"deals", DealViewSet, basename="deal")
 router.register(r"contact-notes", ContactNoteViewSet, basename="contact-note")
 router.register(r"deal-notes", DealNoteViewSet, basename="deal-note")
+router.register(r"import-jobs", ImportJobViewSet, basename="import-job")
+router.register(r"bulk-actions", BulkActionViewSet, basename="bulk-action")
 
 urlpatterns = [
     path("", CRMDashboardView.as_view(), name="dashboard"),
@@ -2,17 +2,54 @@
 
 from typing import Any
 
-from django.db.models import Count, Sum
+from django.db.models import Count, Prefetch, QuerySet
+from django.http import StreamingHttpResponse
 from django.views.generic import TemplateView
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import status, viewsets
+from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
-from .models import Company, Contact, ContactNote, Deal, DealNote, Stage, Tag
+from .analytics import (
+    LOST_STAGE_NAME,
+    WON_STAGE_NAME,
+    get_cached_analytics,
+    get_pipeline_analytics,
+)
+from .bulk import start_bulk_action
+from .exporter import (
+    CONTENT_TYPES,
+    ExportSpec,
+    contact_export_spec,
+    deal_export_spec,
+    export_filename,
+    stream_export,
+)
+from .filters import DealFilterSet
+from .importer import run_import
+from .models import (
+    BulkAction,
+    Company,
+    Contact,
+    ContactNote,
+    Deal,
+    DealNote,
+    ImportJob,
+    Stage,
+    Tag,
+)
+from .pagination import (
+    ContactCursorPagination,
+    CRMCursorPagination,
+    DealCursorPagination,
+)
+from .search import CRMSearchFilter, SearchRankOrderingFilter
 from .serializers import (
+    BulkActionChangeSerializer,
+    BulkActionSerializer,
     BulkMarkSerializer,
     BulkUpdateStageSerializer,
     CompanySerializer,
@@ -22,9 +59,12 @@ from .serializers import (
     DealDetailSerializer,
     DealListSerializer,
     DealNoteSerializer,
+    ImportJobSerializer,
+    ImportUploadSerializer,
     StageSerializer,
     TagSerializer,
 )
+from .stats import get_dashboard_stats
 
 
 class CRMDashboardView(TemplateView):
@@ -35,23 +75,16 @@ class CRMDashboardView(TemplateView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
-        # Summary statistics
-        context["total_contacts"] = Contact.objects.count()
-        context["total_companies"] = Company.objects.count()
-        context["total_deals"] = Deal.objects.count()
-
-        # Deal statistics
-        context["deals_by_stage"] = (
-            Stage.objects.annotate(deal_count=Count("deals"))
-            .values("name", "deal_count")
-            .order_by("order")
-        )
-
-        # Total deal value
-        deal_totals = Deal.objects.aggregate(
-            total_value=Sum("amount"),
-        )
-        context["total_deal_value"] = deal_totals["total_value"] or 0
+        # Summary statistics, read from the incrementally maintained rollup
+        totals, stage_stats = get_dashboard_stats()
+        context["total_contacts"] = totals.contact_count
+        context["total_companies"] = totals.company_count
+        context["total_deals"] = totals.deal_count
+        context["deals_by_stage"] = [
+            {"name": row.stage.name, "deal_count": row.deal_count}
+            for row in stage_stats
+        ]
+        context["total_deal_value"] = totals.deal_value
 
         # Recent contacts
         context["recent_contacts"] = Contact.objects.select_related("company").order_by(
@@ -66,11 +99,47 @@ class CRMDashboardView(TemplateView):
         return context
 
 
+def _companies_with_contact_count() -> QuerySet:
+    """Return companies annotated with the ``contact_count`` serializers read"""
+    return Company.objects.annotate(contact_count=Count("contacts"))
+
+
+def _stages_with_deal_count() -> QuerySet:
+    """Return stages annotated with the ``deal_count`` serializers read"""
+    return Stage.objects.annotate(deal_count=Count("deals"))
+
+
+# Query parameters that never change which rows a list or aggregate covers
+_NON_FILTER_PARAMS = {"ordering", "cursor", "page_size", "format", "file_format"}
+
+
+def _export_response(
+    viewset: viewsets.GenericViewSet, request: Request, spec: ExportSpec
+) -> Response | StreamingHttpResponse:
+    """Stream the viewset's filtered, searched and ordered rows as a file"""
+    file_format = request.query_params.get("file_format", ImportJob.FORMAT_CSV)
+    if file_format not in CONTENT_TYPES:
+        return Response(
+            {"file_format": ["Must be one of: " + ", ".join(CONTENT_TYPES)]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    queryset = viewset.filter_queryset(viewset.get_queryset())
+    response = StreamingHttpResponse(
+        stream_export(queryset, spec, file_format),
+        content_type=CONTENT_TYPES[file_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_filename(spec, file_format)}"'
+    )
+    return response
+
+
 class TagViewSet(viewsets.ModelViewSet):
     """ViewSet for Tag model"""
 
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
+    pagination_class = CRMCursorPagination
     filter_backends = [SearchFilter, OrderingFilter]
     search_fields = ["name"]
     ordering_fields = ["name", "created_at"]
@@ -80,9 +149,10 @@ class TagViewSet(viewsets.ModelViewSet):
 class CompanyViewSet(viewsets.ModelViewSet):
     """ViewSet for Company model"""
 
-    queryset = Company.objects.all()
+    queryset = _companies_with_contact_count()
     serializer_class = CompanySerializer
-    filter_backends = [SearchFilter, DjangoFilterBackend, OrderingFilter]
+    pagination_class = CRMCursorPagination
+    filter_backends = [CRMSearchFilter, DjangoFilterBackend, SearchRankOrderingFilter]
     search_fields = ["name", "industry"]
     filterset_fields = ["industry"]
     ordering_fields = ["name", "created_at"]
@@ -93,12 +163,32 @@ class ContactViewSet(viewsets.ModelViewSet):
     """ViewSet for Contact model with nested notes"""
 
     queryset = Contact.objects.select_related("company").prefetch_related("tags")
-    filter_backends = [SearchFilter, DjangoFilterBackend, OrderingFilter]
+    pagination_class = ContactCursorPagination
+    filter_backends = [CRMSearchFilter, DjangoFilterBackend, SearchRankOrderingFilter]
     search_fields = ["first_name", "last_name", "email", "company__name"]
     filterset_fields = ["status", "company", "tags"]
     ordering_fields = ["last_name", "first_name", "created_at", "last_contacted_at"]
     ordering = ["last_name", "first_name"]
 
+    def get_queryset(self) -> QuerySet:
+        """Load the counts and nested rows the detail serializer reads"""
+        queryset = super().get_queryset()
+        if self.action in ("list", "notes", "export"):
+            return queryset
+        # Prefetching skips relations already loaded by select_related(), so
+        # the company is prefetched instead to carry its contact_count.
+        return (
+            queryset.select_related(None)
+            # distinct: tag filters join a second multi-valued relation
+            .annotate(deal_count=Count("deals", distinct=True))
+            .prefetch_related(
+                Prefetch("company", queryset=_companies_with_contact_count()),
+                Prefetch(
+                    "notes", queryset=ContactNote.objects.select_related("created_by")
+                ),
+            )
+        )
+
     def get_serializer_class(self):
         """Use different serializers for list vs detail views"""
         if self.action == "list":
@@ -111,7 +201,7 @@ class ContactViewSet(viewsets.ModelViewSet):
         contact = self.get_object()
 
         if request.method == "GET":
-            notes = contact.notes.all()
+            notes = contact.notes.select_related("created_by")
             serializer = ContactNoteSerializer(notes, many=True)
             return Response(serializer.data)
 
@@ -124,12 +214,18 @@ class ContactViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["get"])  # type: ignore
+    def export(self, request: Request) -> Response | StreamingHttpResponse:
+        """Stream contacts matching the list filters as CSV or NDJSON"""
+        return _export_response(self, request, contact_export_spec())
+
 
 class StageViewSet(viewsets.ModelViewSet):
     """ViewSet for Stage model"""
 
-    queryset = Stage.objects.all()
+    queryset = _stages_with_deal_count()
     serializer_class = StageSerializer
+    pagination_class = CRMCursorPagination
     filter_backends = [OrderingFilter]
     ordering_fields = ["order", "name"]
     ordering = ["order"]
@@ -141,12 +237,32 @@ class DealViewSet(viewsets.ModelViewSet):
     queryset = Deal.objects.select_related(
         "contact", "contact__company", "stage", "owner"
     ).prefetch_related("tags")
+    pagination_class = DealCursorPagination
     filter_backends = [SearchFilter, DjangoFilterBackend, OrderingFilter]
     search_fields = ["title", "contact__first_name", "contact__last_name"]
-    filterset_fields = ["stage", "owner", "tags", "contact__company"]
+    filterset_class = DealFilterSet
     ordering_fields = ["title", "amount", "created_at", "expected_close_date"]
     ordering = ["-created_at"]
 
+    def get_queryset(self) -> QuerySet:
+        """Load the counts and nested rows the detail serializer reads"""
+        queryset = super().get_queryset()
+        if self.action in ("list", "notes", "export", "analytics"):
+            return queryset
+        # Prefetching skips relations already loaded by select_related(), so
+        # the stage is prefetched instead to carry its deal_count.
+        return (
+            queryset.select_related(None)
+            .select_related("contact__company", "owner")
+            .prefetch_related(
+                "contact__tags",
+                Prefetch("stage", queryset=_stages_with_deal_count()),
+                Prefetch(
+                    "notes", queryset=DealNote.objects.select_related("created_by")
+                ),
+            )
+        )
+
     def get_serializer_class(self):
         """Use different serializers for list vs detail views"""
         if self.action == "list":
@@ -159,7 +275,7 @@ class DealViewSet(viewsets.ModelViewSet):
         deal = self.get_object()
 
         if request.method == "GET":
-            notes = deal.notes.all()
+            notes = deal.notes.select_related("created_by")
             serializer = DealNoteSerializer(notes, many=True)
             return Response(serializer.data)
 
@@ -172,6 +288,49 @@ class DealViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["get"])  # type: ignore
+    def export(self, request: Request) -> Response | StreamingHttpResponse:
+        """Stream deals matching the list filters as CSV or NDJSON"""
+        return _export_response(self, request, deal_export_spec())
+
+    @action(detail=False, methods=["get"])  # type: ignore
+    def analytics(self, request: Request) -> Response:
+        """Return pipeline metrics for deals matching the list filters"""
+        deals = self.filter_queryset(self.get_queryset())
+        filters = {
+            key: ",".join(sorted(request.query_params.getlist(key)))
+            for key in request.query_params
+            if key not in _NON_FILTER_PARAMS
+        }
+        return Response(
+            get_cached_analytics(filters, lambda: get_pipeline_analytics(deals))
+        )
+
+    def _run_bulk_action(
+        self, request: Request, action_name: str, stage: Stage, selection: dict
+    ) -> Response:
+        """Run a bulk action now, or return its job handle if it was queued"""
+        job = start_bulk_action(
+            action_name,
+            stage,
+            deal_ids=selection.get("deal_ids"),
+            filters=selection.get("filter"),
+            requested_by=request.user if request.user.is_authenticated else None,
+        )
+        if job.status == BulkAction.STATUS_QUEUED:
+            url = reverse(
+                "quickscale_crm:bulk-action-detail", args=[job.pk], request=request
+            )
+            return Response(
+                {**BulkActionSerializer(job).data, "url": url},
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Location": url},
+            )
+        return Response(
+            {"updated": job.updated_count, "stage": stage.name, "bulk_action": job.pk},
+            status=status.HTTP_200_OK,
+        )
+
     @action(  # type: ignore
         detail=False,
         methods=["post"],
@@ -179,18 +338,13 @@ class DealViewSet(viewsets.ModelViewSet):
         url_name="bulk-update-stage",
     )
     def bulk_update_stage(self, request: Request) -> Response:
-        """Bulk update stage for multiple deals"""
+        """Bulk update stage for deals selected by ID or by filter"""
         serializer = BulkUpdateStageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        deal_ids = serializer.validated_data["deal_ids"]
         stage = serializer.validated_data["stage_id"]
-
-        updated = Deal.objects.filter(id__in=deal_ids).update(stage=stage)
-
-        return Response(
-            {"updated": updated, "stage": stage.name},
-            status=status.HTTP_200_OK,
+        return self._run_bulk_action(
+            request, BulkAction.ACTION_UPDATE_STAGE, stage, serializer.validated_data
         )
 
     @action(  # type: ignore
@@ -200,27 +354,21 @@ class DealViewSet(viewsets.ModelViewSet):
         url_name="mark-won",
     )
     def mark_won(self, request: Request) -> Response:
-        """Mark multiple deals as won (Closed-Won stage)"""
+        """Mark deals selected by ID or by filter as won (Closed-Won stage)"""
         serializer = BulkMarkSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        deal_ids = serializer.validated_data["deal_ids"]
-
-        # Find the Closed-Won stage
-        try:
-            won_stage = Stage.objects.get(name="Closed-Won")
-        except Stage.DoesNotExist:
+        won_stage = Stage.objects.filter(name=WON_STAGE_NAME).first()
+        if won_stage is None:
             return Response(
                 {"error": "Closed-Won stage not found"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated = Deal.objects.filter(id__in=deal_ids).update(
-            stage=won_stage, probability=100
+        return self._run_bulk_action(
+            request, BulkAction.ACTION_MARK_WON, won_stage, serializer.validated_data
         )
 
-        return Response({"updated": updated}, status=status.HTTP_200_OK)
-
     @action(  # type: ignore
         detail=False,
         methods=["post"],
@@ -228,33 +376,28 @@ class DealViewSet(viewsets.ModelViewSet):
         url_name="mark-lost",
     )
     def mark_lost(self, request: Request) -> Response:
-        """Mark multiple deals as lost (Closed-Lost stage)"""
+        """Mark deals selected by ID or by filter as lost (Closed-Lost stage)"""
         serializer = BulkMarkSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        deal_ids = serializer.validated_data["deal_ids"]
-
-        # Find the Closed-Lost stage
-        try:
-            lost_stage = Stage.objects.get(name="Closed-Lost")
-        except Stage.DoesNotExist:
+        lost_stage = Stage.objects.filter(name=LOST_STAGE_NAME).first()
+        if lost_stage is None:
             return Response(
                 {"error": "Closed-Lost stage not found"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated = Deal.objects.filter(id__in=deal_ids).update(
-            stage=lost_stage, probability=0
+        return self._run_bulk_action(
+            request, BulkAction.ACTION_MARK_LOST, lost_stage, serializer.validated_data
         )
 
-        return Response({"updated": updated}, status=status.HTTP_200_OK)
-
 
 class ContactNoteViewSet(viewsets.ModelViewSet):
     """Standalone ViewSet for ContactNote model"""
 
     queryset = ContactNote.objects.select_related("contact", "created_by")
     serializer_class = ContactNoteSerializer
+    pagination_class = CRMCursorPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["contact"]
     ordering_fields = ["created_at"]
@@ -266,7 +409,71 @@ class DealNoteViewSet(viewsets.ModelViewSet):
 
     queryset = DealNote.objects.select_related("deal", "created_by")
     serializer_class = DealNoteSerializer
+    pagination_class = CRMCursorPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["deal"]
     ordering_fields = ["created_at"]
     ordering = ["-created_at"]
+
+
+class ImportJobViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """Start bulk imports from uploaded files and report their progress
+
+    ``POST`` a multipart ``file`` with the ``entity`` to import; the response
+    is the finished job. Use the ``crm_import`` management command for files
+    too large to import within one request.
+    """
+
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+    pagination_class = CRMCursorPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["entity", "status"]
+    ordering_fields = ["created_at"]
+    ordering = ["-created_at"]
+
+    def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Import an uploaded CSV or NDJSON file"""
+        upload = ImportUploadSerializer(data=request.data)
+        upload.is_valid(raise_exception=True)
+        uploaded_file = upload.validated_data["file"]
+
+        job = ImportJob.objects.create(
+            entity=upload.validated_data["entity"],
+            file_format=upload.validated_data["file_format"],
+            source_name=uploaded_file.name[:255],
+            created_by=request.user if request.user.is_authenticated else None,
+        )
+        run_import(job, uploaded_file)
+
+        serializer = self.get_serializer(job)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class BulkActionViewSet(viewsets.ReadOnlyModelViewSet):
+    """Report the progress and change log of bulk deal actions
+
+    Bulk actions are started from the deal ``bulk-update-stage``, ``mark-won``
+    and ``mark-lost`` endpoints. Queued actions are run by the
+    ``crm_run_bulk_actions`` management command.
+    """
+
+    queryset = BulkAction.objects.select_related("stage")
+    serializer_class = BulkActionSerializer
+    pagination_class = CRMCursorPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["action", "status"]
+    ordering_fields = ["created_at"]
+    ordering = ["-created_at"]
+
+    @action(detail=True, methods=["get"])  # type: ignore
+    def changes(self, request: Request, pk: int | None = None) -> Response:
+        """List the deals the action updated, with their previous values"""
+        bulk_action = self.get_object()
+        serializer = BulkActionChangeSerializer(bulk_action.changes.all(), many=True)
+        return Response(serializer.data)
@@ -0,0 +1,215 @@
+"""Tests for the CRM pipeline analytics endpoint"""
+
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from quickscale_modules_crm.analytics import get_cached_analytics
+from quickscale_modules_crm.models import Company, Deal, Stage
+
+ANALYTICS = reverse("quickscale_crm:deal-analytics")
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def pipeline(contact, user):
+    """Create deals across the default pipeline for two owners"""
+    other = get_user_model().objects.create_user(username="other", password="x")
+    stages = {stage.name: stage for stage in Stage.objects.all()}
+
+    def deal(title, stage, amount, owner=user, **fields):
+        return Deal.objects.create(
+            title=title,
+            contact=contact,
+            stage=stages[stage],
+            amount=amount,
+            owner=owner,
+            **fields,
+        )
+
+    deal(
+        "P1", "Prospecting", 100, probability=10, expected_close_date=date(2026, 11, 15)
+    )
+    deal("N1", "Negotiation", 200, expected_close_date=date(2026, 11, 20))
+    deal("N2", "Negotiation", 300, expected_close_date=date(2026, 12, 1))
+    deal("W1", "Closed-Won", 400, expected_close_date=date(2026, 10, 1))
+    deal("W2", "Closed-Won", 500, owner=other)
+    deal("L1", "Closed-Lost", 50)
+    Deal.objects.filter(stage__name="Negotiation").update(
+        created_at=timezone.now() - timedelta(days=10)
+    )
+    return {"user": user, "other": other}
+
+
+def _by(rows, key):
+    return {row[key]: row for row in rows}
+
+
+@pytest.mark.django_db
+class TestPipelineAnalytics:
+    """Tests for pipeline metrics"""
+
+    def test_stage_conversion_and_age(self, authenticated_client, pipeline):
+        """Test stage counts, conversion rates and average ages"""
+        stages = _by(authenticated_client.get(ANALYTICS).data["stages"], "name")
+
+        assert [stages[name]["reached"] for name in stages] == [6, 4, 2, None]
+        assert stages["Prospecting"]["conversion_rate"] is None
+        assert stages["Negotiation"]["conversion_rate"] == 0.6667
+        assert stages["Closed-Won"]["conversion_rate"] == 0.5
+        assert stages["Negotiation"]["deal_count"] == 2
+        assert stages["Negotiation"]["deal_value"] == "500.00"
+        assert stages["Negotiation"]["average_age_days"] == 10.0
+        assert stages["Prospecting"]["average_age_days"] == 0.0
+
+    def test_weighted_forecast_by_month(self, authenticated_client, pipeline):
+        """Test open deals are forecast by close month, weighted by probability"""
+        forecast = authenticated_client.get(ANALYTICS).data["forecast"]
+
+        assert forecast == [
+            {
+                "month": "2026-11",
+                "deal_count": 2,
+                "amount": "300.00",
+                "weighted_amount": "110.00",
+            },
+            {
+                "month": "2026-12",
+                "deal_count": 1,
+                "amount": "300.00",
+                "weighted_amount": "150.00",
+            },
+        ]
+
+    def test_win_rate_by_owner(self, authenticated_client, pipeline):
+        """Test win rates count only closed deals"""
+        owners = _by(authenticated_client.get(ANALYTICS).data["owners"], "owner")
+
+        assert owners["testuser"]["won"] == 1
+        assert owners["testuser"]["lost"] == 1
+        assert owners["testuser"]["win_rate"] == 0.5
+        assert owners["testuser"]["won_value"] == "400.00"
+        assert owners["other"]["win_rate"] == 1.0
+
+    def test_honours_list_filters(self, authenticated_client, pipeline):
+        """Test the deal list filters narrow every metric"""
+        data = authenticated_client.get(ANALYTICS, {"owner": pipeline["other"].pk}).data
+
+        assert sum(stage["deal_count"] for stage in data["stages"]) == 1
+        assert data["forecast"] == []
+        assert [row["owner"] for row in data["owners"]] == ["other"]
+
+    def test_runs_four_queries(
+        self, authenticated_client, pipeline, django_assert_num_queries
+    ):
+        """Test metrics are aggregated in SQL and then served from the cache"""
+        with django_assert_num_queries(4):
+            authenticated_client.get(ANALYTICS)
+        with django_assert_num_queries(0):
+            authenticated_client.get(ANALYTICS)
+
+
+@pytest.mark.django_db
+class TestAnalyticsCache:
+    """Tests for analytics caching and invalidation"""
+
+    def _won(self, client):
+        stages = _by(client.get(ANALYTICS).data["stages"], "name")
+        return stages["Closed-Won"]["deal_count"]
+
+    def test_deal_changes_invalidate(
+        self, authenticated_client, pipeline, django_capture_on_commit_callbacks
+    ):
+        """Test saving a deal invalidates cached results"""
+        assert self._won(authenticated_client) == 2
+        deal = Deal.objects.get(title="N1")
+        deal.stage = Stage.objects.get(name="Closed-Won")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            deal.save()
+
+        assert self._won(authenticated_client) == 3
+
+    def test_bulk_actions_invalidate(
+        self, authenticated_client, pipeline, django_capture_on_commit_callbacks
+    ):
+        """Test bulk stage changes, which skip signals, invalidate too"""
+        assert self._won(authenticated_client) == 2
+        deal_ids = list(
+            Deal.objects.filter(stage__name="Negotiation").values_list("id", flat=True)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.post(
+                reverse("quickscale_crm:deal-mark-won"),
+                {"deal_ids": deal_ids},
+                format="json",
+            )
+
+        assert self._won(authenticated_client) == 4
+
+    def test_contact_changes_invalidate(
+        self,
+        authenticated_client,
+        pipeline,
+        contact,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test moving a contact to another company invalidates company filters"""
+        query = {"contact__company": contact.company_id}
+        assert len(authenticated_client.get(ANALYTICS, query).data["owners"]) == 2
+        contact.company = Company.objects.create(name="Elsewhere")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            contact.save()
+
+        assert authenticated_client.get(ANALYTICS, query).data["owners"] == []
+
+    def test_deal_tag_changes_invalidate(
+        self, authenticated_client, pipeline, tag, django_capture_on_commit_callbacks
+    ):
+        """Test tagging a deal invalidates tag filters"""
+        assert (
+            authenticated_client.get(ANALYTICS, {"tags": tag.pk}).data["owners"] == []
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Deal.objects.get(title="W1").tags.add(tag)
+
+        owners = authenticated_client.get(ANALYTICS, {"tags": tag.pk}).data["owners"]
+        assert [row["owner"] for row in owners] == ["testuser"]
+
+    def test_filters_with_separators_get_distinct_entries(self):
+        """Test filter values containing key separators do not share an entry"""
+        first = get_cached_analytics({"owner": "1&stage=2"}, lambda: {"result": 1})
+        second = get_cached_analytics(
+            {"owner": "1", "stage": "2"}, lambda: {"result": 2}
+        )
+
+        assert (first, second) == ({"result": 1}, {"result": 2})
+
+    def test_uncommitted_changes_keep_cache(self, authenticated_client, pipeline):
+        """Test invalidation waits for the transaction to commit"""
+        assert self._won(authenticated_client) == 2
+        Deal.objects.filter(title="N1").delete()
+
+        assert self._won(authenticated_client) == 2
+
+    def test_can_be_disabled(self, authenticated_client, pipeline, settings):
+        """Test a zero timeout computes results on every request"""
+        settings.CRM_ANALYTICS_CACHE_TIMEOUT = 0
+        assert self._won(authenticated_client) == 2
+
+        Deal.objects.filter(title="W1").delete()
+
+        assert self._won(authenticated_client) == 1
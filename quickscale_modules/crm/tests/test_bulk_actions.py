@@ -0,0 +1,343 @@
+"""Tests for chunked, logged CRM bulk deal actions"""
+
+import io
+import logging
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from quickscale_modules_crm import bulk
+from quickscale_modules_crm.bulk import STALE_MESSAGE, run_bulk_action
+from quickscale_modules_crm.models import BulkAction, Deal, Stage
+from quickscale_modules_crm.stats import find_stats_drift
+
+BULK_UPDATE_STAGE = reverse("quickscale_crm:deal-bulk-update-stage")
+MARK_WON = reverse("quickscale_crm:deal-mark-won")
+MARK_LOST = reverse("quickscale_crm:deal-mark-lost")
+
+
+@pytest.fixture
+def deals(contact, user):
+    """Create five deals, three of them in Prospecting"""
+    stages = {stage.name: stage for stage in Stage.objects.all()}
+    created = []
+    for index, stage in enumerate(
+        ["Prospecting", "Prospecting", "Prospecting", "Negotiation", "Negotiation"]
+    ):
+        created.append(
+            Deal.objects.create(
+                title=f"Deal {index}",
+                contact=contact,
+                stage=stages[stage],
+                amount=100,
+                probability=50,
+                owner=user,
+            )
+        )
+    return created
+
+
+def _ids(deals):
+    return [deal.pk for deal in deals]
+
+
+def _running_actions(deals, stage, *, started, progressed):
+    """Create running actions started and last saved the given seconds ago"""
+    now = timezone.now()
+    actions = []
+    for age in progressed:
+        action = BulkAction.objects.create(
+            action=BulkAction.ACTION_UPDATE_STAGE,
+            stage=stage,
+            deal_ids=_ids(deals),
+            status=BulkAction.STATUS_RUNNING,
+            started_at=now - timedelta(seconds=started),
+        )
+        # updated_at is auto_now, so it can only be backdated with update()
+        BulkAction.objects.filter(pk=action.pk).update(
+            updated_at=now - timedelta(seconds=age)
+        )
+        actions.append(action)
+    return actions
+
+
+@pytest.mark.django_db
+class TestBulkActionSelection:
+    """Tests for selecting deals by ID or by filter"""
+
+    def test_by_ids_records_action(self, authenticated_client, deals, user):
+        """Test an ID selection runs inline and is recorded"""
+        response = authenticated_client.post(
+            MARK_WON, {"deal_ids": _ids(deals[:2])}, format="json"
+        )
+
+        assert response.status_code == 200
+        assert response.data["updated"] == 2
+        bulk_action = BulkAction.objects.get(pk=response.data["bulk_action"])
+        assert bulk_action.action == BulkAction.ACTION_MARK_WON
+        assert bulk_action.status == BulkAction.STATUS_COMPLETED
+        assert bulk_action.requested_by == user
+        assert (bulk_action.matched_count, bulk_action.updated_count) == (2, 2)
+        assert set(
+            Deal.objects.filter(stage__name="Closed-Won").values_list(
+                "probability", flat=True
+            )
+        ) == {100}
+
+    def test_by_filter(self, authenticated_client, deals):
+        """Test a filter selects the deals the deal list would return"""
+        prospecting = deals[0].stage
+
+        response = authenticated_client.post(
+            MARK_LOST, {"filter": {"stage": prospecting.pk}}, format="json"
+        )
+
+        assert response.data["updated"] == 3
+        assert Deal.objects.filter(stage__name="Closed-Lost").count() == 3
+        assert Deal.objects.filter(stage__name="Negotiation").count() == 2
+        bulk_action = BulkAction.objects.get()
+        assert bulk_action.deal_ids is None
+        assert bulk_action.filters == {"stage": prospecting.pk}
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {},
+            {"filter": {}},
+            {"filter": {"title": "x"}},
+            {"filter": {"stage": "not-a-stage"}},
+            {"deal_ids": [1], "filter": {"stage": 1}},
+        ],
+    )
+    def test_rejects_invalid_selection(self, authenticated_client, deals, payload):
+        """Test selections must be either deal IDs or known, valid filters"""
+        response = authenticated_client.post(MARK_WON, payload, format="json")
+
+        assert response.status_code == 400
+        assert not BulkAction.objects.exists()
+        assert not Deal.objects.filter(stage__name="Closed-Won").exists()
+
+
+@pytest.mark.django_db
+class TestBulkActionChunks:
+    """Tests for chunked application and the change log"""
+
+    def test_change_log_records_previous_values(
+        self, authenticated_client, deals, closed_won_stage, settings
+    ):
+        """Test each chunk logs its deals grouped by previous stage/probability"""
+        settings.CRM_BULK_CHUNK_SIZE = 2
+
+        authenticated_client.post(
+            BULK_UPDATE_STAGE,
+            {"deal_ids": _ids(deals[:3]), "stage_id": closed_won_stage.pk},
+            format="json",
+        )
+
+        changes = list(BulkAction.objects.get().changes.all())
+        assert [change.deal_ids for change in changes] == [
+            [deals[0].pk, deals[1].pk],
+            [deals[2].pk],
+        ]
+        assert {change.from_stage for change in changes} == {deals[0].stage}
+        assert {change.from_probability for change in changes} == {50}
+
+    def test_filter_selection_walks_in_chunks(self, deals, closed_lost_stage, settings):
+        """Test filter selections are keyset-paginated, one transaction per chunk"""
+        settings.CRM_BULK_CHUNK_SIZE = 2
+        bulk_action = BulkAction.objects.create(
+            action=BulkAction.ACTION_UPDATE_STAGE,
+            stage=closed_lost_stage,
+            filters={"owner": deals[0].owner_id},
+        )
+
+        run_bulk_action(bulk_action)
+
+        assert bulk_action.updated_count == 5
+        assert bulk_action.changes.count() == 4
+        assert sorted(
+            deal_id
+            for change in bulk_action.changes.all()
+            for deal_id in change.deal_ids
+        ) == sorted(_ids(deals))
+
+    def test_keeps_dashboard_stats_exact(
+        self, authenticated_client, deals, closed_won_stage, settings
+    ):
+        """Test chunked updates keep the stats rollup in step"""
+        settings.CRM_BULK_CHUNK_SIZE = 2
+
+        authenticated_client.post(
+            BULK_UPDATE_STAGE,
+            {"filter": {"owner": deals[0].owner_id}, "stage_id": closed_won_stage.pk},
+            format="json",
+        )
+
+        assert find_stats_drift() == []
+
+    def test_records_deleted_target_stage(self, deals, closed_won_stage):
+        """Test an action whose stage was deleted fails without updating deals"""
+        bulk_action = BulkAction.objects.create(
+            action=BulkAction.ACTION_UPDATE_STAGE,
+            stage=closed_won_stage,
+            deal_ids=_ids(deals),
+        )
+        closed_won_stage.delete()
+        bulk_action.refresh_from_db()
+
+        run_bulk_action(bulk_action)
+
+        assert bulk_action.status == BulkAction.STATUS_FAILED
+        assert bulk_action.updated_count == 0
+
+
+@pytest.mark.django_db
+class TestQueuedBulkActions:
+    """Tests for large selections that run outside the request"""
+
+    def test_large_selection_is_queued(self, authenticated_client, deals, settings):
+        """Test selections above the threshold return a job handle"""
+        settings.CRM_BULK_ASYNC_THRESHOLD = 4
+
+        response = authenticated_client.post(
+            MARK_WON, {"deal_ids": _ids(deals)}, format="json"
+        )
+
+        assert response.status_code == 202
+        assert response.data["status"] == BulkAction.STATUS_QUEUED
+        assert response.data["matched_count"] == 5
+        assert response["Location"] == response.data["url"]
+        assert not Deal.objects.filter(stage__name="Closed-Won").exists()
+
+        detail = authenticated_client.get(response.data["url"])
+        assert detail.data["id"] == response.data["id"]
+
+    def test_command_runs_queued_actions(self, authenticated_client, deals, settings):
+        """Test the command runs queued actions and exposes their change log"""
+        settings.CRM_BULK_ASYNC_THRESHOLD = 1
+        queued = authenticated_client.post(
+            MARK_WON, {"deal_ids": _ids(deals)}, format="json"
+        ).data
+        out = io.StringIO()
+
+        call_command("crm_run_bulk_actions", stdout=out)
+
+        assert "Ran 1 bulk action(s)" in out.getvalue()
+        bulk_action = BulkAction.objects.get(pk=queued["id"])
+        assert bulk_action.status == BulkAction.STATUS_COMPLETED
+        assert bulk_action.updated_count == 5
+        assert Deal.objects.filter(stage__name="Closed-Won").count() == 5
+
+        changes = authenticated_client.get(
+            reverse("quickscale_crm:bulk-action-changes", args=[queued["id"]])
+        ).data
+        assert sum(len(change["deal_ids"]) for change in changes) == 5
+
+    def test_command_skips_finished_actions(self, deals, closed_won_stage):
+        """Test only queued actions are claimed"""
+        BulkAction.objects.create(
+            action=BulkAction.ACTION_UPDATE_STAGE,
+            stage=closed_won_stage,
+            deal_ids=_ids(deals),
+            status=BulkAction.STATUS_COMPLETED,
+        )
+        out = io.StringIO()
+
+        call_command("crm_run_bulk_actions", stdout=out)
+
+        assert "Ran 0 bulk action(s)" in out.getvalue()
+        assert not Deal.objects.filter(stage=closed_won_stage).exists()
+
+    def test_command_fails_stale_running_actions(
+        self, deals, closed_won_stage, settings
+    ):
+        """Test actions orphaned by a dead worker are failed, recent ones kept"""
+        settings.CRM_BULK_STALE_TIMEOUT = 60
+        stale, running = _running_actions(
+            deals, closed_won_stage, started=120, progressed=(120, 10)
+        )
+
+        call_command("crm_run_bulk_actions", stdout=io.StringIO())
+
+        stale.refresh_from_db()
+        running.refresh_from_db()
+        assert stale.status == BulkAction.STATUS_FAILED
+        assert stale.message == STALE_MESSAGE
+        assert stale.finished_at is not None
+        assert running.status == BulkAction.STATUS_RUNNING
+
+    def test_long_running_action_with_progress_is_kept(
+        self, deals, closed_won_stage, settings
+    ):
+        """Test staleness is measured from the last chunk, not the start"""
+        settings.CRM_BULK_STALE_TIMEOUT = 60
+        (long_running,) = _running_actions(
+            deals, closed_won_stage, started=3 * 60 * 60, progressed=(5,)
+        )
+
+        call_command("crm_run_bulk_actions", stdout=io.StringIO())
+
+        long_running.refresh_from_db()
+        assert long_running.status == BulkAction.STATUS_RUNNING
+        assert long_running.finished_at is None
+
+    def test_action_failed_while_running_stops(self, deals, closed_won_stage):
+        """Test a worker stops once its action has been failed as stale"""
+        bulk_action = BulkAction.objects.create(
+            action=BulkAction.ACTION_UPDATE_STAGE,
+            stage=closed_won_stage,
+            deal_ids=_ids(deals),
+        )
+        real_apply_chunk = bulk._apply_chunk
+
+        def apply_then_fail(action, deal_ids):
+            BulkAction.objects.filter(pk=action.pk).update(
+                status=BulkAction.STATUS_FAILED, message=STALE_MESSAGE
+            )
+            return real_apply_chunk(action, deal_ids)
+
+        with patch.object(bulk, "_apply_chunk", side_effect=apply_then_fail):
+            run_bulk_action(bulk_action, chunk_size=2)
+
+        bulk_action.refresh_from_db()
+        assert (bulk_action.status, bulk_action.message) == (
+            BulkAction.STATUS_FAILED,
+            STALE_MESSAGE,
+        )
+        assert bulk_action.updated_count == 2
+        assert Deal.objects.filter(stage=closed_won_stage).count() == 2
+
+    def test_command_logs_failures_and_continues(self, deals, closed_won_stage, caplog):
+        """Test a failing action is logged with its traceback"""
+        failing, passing = (
+            BulkAction.objects.create(
+                action=BulkAction.ACTION_UPDATE_STAGE,
+                stage=closed_won_stage,
+                deal_ids=ids,
+            )
+            for ids in (_ids(deals[:1]), _ids(deals[1:]))
+        )
+        apply_chunk = "quickscale_modules_crm.bulk._apply_chunk"
+        out = io.StringIO()
+
+        with (
+            patch(apply_chunk, side_effect=[RuntimeError("deadlock"), 4]),
+            caplog.at_level(logging.ERROR, logger="quickscale_modules_crm.bulk"),
+        ):
+            call_command("crm_run_bulk_actions", stdout=out)
+
+        assert "Ran 2 bulk action(s)" in out.getvalue()
+        (record,) = caplog.records
+        assert f"CRM bulk action {failing.pk} failed" in record.getMessage()
+        assert record.exc_info is not None
+        failing.refresh_from_db()
+        passing.refresh_from_db()
+        assert (failing.status, failing.message) == (
+            BulkAction.STATUS_FAILED,
+            "deadlock",
+        )
+        assert passing.status == BulkAction.STATUS_COMPLETED
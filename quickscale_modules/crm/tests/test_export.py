@@ -0,0 +1,169 @@
+"""Tests for streaming CRM exports"""
+
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+
+from quickscale_modules_crm.importer import run_import
+from quickscale_modules_crm.models import Contact, Deal, ImportJob, Tag
+
+CONTACT_EXPORT = reverse("quickscale_crm:contact-export")
+DEAL_EXPORT = reverse("quickscale_crm:deal-export")
+
+
+def _content(response):
+    assert response.streaming
+    return b"".join(response.streaming_content).decode("utf-8-sig")
+
+
+def _csv_rows(response):
+    return list(csv.DictReader(io.StringIO(_content(response))))
+
+
+@pytest.fixture
+def contacts(company, tag):
+    """Create contacts with tags, one of them inactive"""
+    created = [
+        Contact.objects.create(
+            first_name=first,
+            last_name=last,
+            email=f"{first.lower()}@example.com",
+            status=status,
+            company=company,
+        )
+        for first, last, status in [
+            ("Ann", "Lee", "new"),
+            ("Bob", "Stone", "inactive"),
+            ("Cy", "Young", "new"),
+        ]
+    ]
+    created[0].tags.add(tag)
+    return created
+
+
+@pytest.mark.django_db
+class TestContactExport:
+    """Tests for the contact export endpoint"""
+
+    def test_exports_csv(self, authenticated_client, contacts):
+        """Test contacts stream as CSV with company and tag names"""
+        response = authenticated_client.get(CONTACT_EXPORT)
+
+        assert response["Content-Type"].startswith("text/csv")
+        assert 'filename="contacts.csv"' in response["Content-Disposition"]
+        rows = _csv_rows(response)
+        assert [row["last_name"] for row in rows] == ["Lee", "Stone", "Young"]
+        assert rows[0]["company"] == "Acme Corp"
+        assert rows[0]["tags"] == "VIP"
+        assert rows[1]["tags"] == ""
+
+    def test_honours_filters_search_and_ordering(self, authenticated_client, contacts):
+        """Test the export matches what the list endpoint would return"""
+        response = authenticated_client.get(
+            CONTACT_EXPORT, {"status": "new", "ordering": "-last_name"}
+        )
+        assert [row["last_name"] for row in _csv_rows(response)] == ["Young", "Lee"]
+
+        response = authenticated_client.get(CONTACT_EXPORT, {"search": "stone"})
+        assert [row["last_name"] for row in _csv_rows(response)] == ["Stone"]
+
+    def test_exports_ndjson(self, authenticated_client, contacts):
+        """Test NDJSON export writes one object per line"""
+        response = authenticated_client.get(
+            CONTACT_EXPORT, {"file_format": "ndjson", "search": "ann"}
+        )
+
+        lines = _content(response).splitlines()
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [json.loads(line)["email"] for line in lines] == ["ann@example.com"]
+        assert json.loads(lines[0])["tags"] == ["VIP"]
+
+    def test_tags_are_loaded_per_chunk(
+        self, authenticated_client, contacts, settings, django_assert_num_queries
+    ):
+        """Test one row query plus one tag query per chunk, not per row"""
+        settings.CRM_EXPORT_CHUNK_SIZE = 2
+
+        with django_assert_num_queries(3):
+            rows = _csv_rows(authenticated_client.get(CONTACT_EXPORT))
+
+        assert len(rows) == 3
+
+    def test_export_can_be_imported_again(self, authenticated_client, contacts):
+        """Test CSV exports use the import column names"""
+        content = _content(authenticated_client.get(CONTACT_EXPORT))
+        job = ImportJob.objects.create(
+            entity=ImportJob.ENTITY_CONTACTS, file_format=ImportJob.FORMAT_CSV
+        )
+
+        run_import(job, io.BytesIO(content.encode("utf-8-sig")))
+
+        assert (job.updated_count, job.created_count, job.error_count) == (3, 0, 0)
+
+    def test_csv_neutralises_formulas_and_round_trips(
+        self, authenticated_client, company
+    ):
+        """Test formula-like text is quoted in CSV but not in NDJSON or on import"""
+        contact = Contact.objects.create(
+            first_name='=HYPERLINK("http://evil")',
+            last_name="-2+3",
+            email="formula@example.com",
+            phone="+1 555 0100",
+            company=company,
+        )
+        contact.tags.add(Tag.objects.create(name="@risk"))
+
+        (row,) = _csv_rows(authenticated_client.get(CONTACT_EXPORT))
+        (line,) = _content(
+            authenticated_client.get(CONTACT_EXPORT, {"file_format": "ndjson"})
+        ).splitlines()
+
+        assert row["first_name"] == '\'=HYPERLINK("http://evil")'
+        assert row["last_name"] == "'-2+3"
+        assert row["phone"] == "'+1 555 0100"
+        assert row["tags"] == "'@risk"
+        assert row["email"] == "formula@example.com"
+        assert json.loads(line)["first_name"] == '=HYPERLINK("http://evil")'
+
+        content = _content(authenticated_client.get(CONTACT_EXPORT))
+        Contact.objects.filter(pk=contact.pk).update(first_name="Changed")
+        job = ImportJob.objects.create(
+            entity=ImportJob.ENTITY_CONTACTS, file_format=ImportJob.FORMAT_CSV
+        )
+        run_import(job, io.BytesIO(content.encode("utf-8-sig")))
+
+        contact.refresh_from_db()
+        assert contact.first_name == '=HYPERLINK("http://evil")'
+        assert contact.phone == "+1 555 0100"
+
+    def test_rejects_unknown_format(self, authenticated_client):
+        """Test unsupported formats are a validation error"""
+        response = authenticated_client.get(CONTACT_EXPORT, {"file_format": "xlsx"})
+
+        assert response.status_code == 400
+        assert "file_format" in response.data
+
+
+@pytest.mark.django_db
+class TestDealExport:
+    """Tests for the deal export endpoint"""
+
+    def test_exports_filtered_deals(
+        self, authenticated_client, deal, contact, closed_won_stage
+    ):
+        """Test deals stream with their contact, stage and owner"""
+        Deal.objects.create(
+            title="Won deal", contact=contact, stage=closed_won_stage, amount=10
+        )
+
+        response = authenticated_client.get(DEAL_EXPORT, {"stage": deal.stage_id})
+
+        rows = _csv_rows(response)
+        assert [row["title"] for row in rows] == [deal.title]
+        assert rows[0]["contact_email"] == contact.email
+        assert rows[0]["stage"] == deal.stage.name
+        assert rows[0]["amount"] == "50000.00"
+        assert rows[0]["owner"] == deal.owner.username
@@ -0,0 +1,247 @@
+"""Tests for CRM bulk imports"""
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quickscale_modules_crm.importer import run_import
+from quickscale_modules_crm.models import Company, Contact, Deal, ImportJob
+from quickscale_modules_crm.stats import find_stats_drift
+
+IMPORT_JOBS = reverse("quickscale_crm:import-job-list")
+
+CONTACTS_CSV = """first_name,last_name,email,company,tags,status
+Ann,Lee,ann@example.com,Globex,vip;newsletter,contacted
+Bob,Stone,bob@example.com,Acme Corp,,
+Ann,Lee-Smith,ANN@example.com,Globex,,
+"""
+
+
+def _import(entity, content, file_format=ImportJob.FORMAT_CSV, **kwargs):
+    job = ImportJob.objects.create(entity=entity, file_format=file_format)
+    return run_import(job, io.BytesIO(content.encode()), **kwargs)
+
+
+def _ndjson(*rows):
+    return "".join(
+        (row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows
+    )
+
+
+@pytest.mark.django_db
+class TestContactImport:
+    """Tests for importing contacts"""
+
+    def test_creates_contacts_companies_and_tags(self, company):
+        """Test contacts are created with companies and tags resolved by name"""
+        job = _import(ImportJob.ENTITY_CONTACTS, CONTACTS_CSV)
+
+        assert job.status == ImportJob.STATUS_COMPLETED
+        assert (job.rows_processed, job.created_count, job.error_count) == (3, 2, 0)
+        ann = Contact.objects.get(email__iexact="ann@example.com")
+        assert ann.last_name == "Lee-Smith"
+        assert ann.status == "contacted"
+        assert ann.company.name == "Globex"
+        assert sorted(ann.tags.values_list("name", flat=True)) == [
+            "newsletter",
+            "vip",
+        ]
+        assert Contact.objects.get(email="bob@example.com").company == company
+        assert Company.objects.filter(name="Acme Corp").count() == 1
+        assert find_stats_drift() == []
+
+    def test_existing_contacts_are_updated(self, contact, tag):
+        """Test re-imported emails update only the columns provided"""
+        contact.tags.add(tag)
+
+        job = _import(
+            ImportJob.ENTITY_CONTACTS,
+            "first_name,last_name,email,company,phone\n"
+            "Johnny,Doe,JOHN.DOE@example.com,Acme Corp,\n",
+        )
+
+        assert (job.created_count, job.updated_count) == (0, 1)
+        contact.refresh_from_db()
+        assert contact.first_name == "Johnny"
+        assert contact.phone == "+1234567890"
+        assert list(contact.tags.all()) == [tag]
+        assert Contact.objects.count() == 1
+
+    def test_invalid_rows_are_reported(self):
+        """Test invalid rows are skipped and recorded with their row number"""
+        job = _import(
+            ImportJob.ENTITY_CONTACTS,
+            "first_name,last_name,email,company,status\n"
+            "Ann,Lee,not-an-email,Globex,\n"
+            "Bob,Stone,bob@example.com,Globex,unknown\n"
+            "Cy,Young,cy@example.com,Globex,\n",
+        )
+
+        assert job.status == ImportJob.STATUS_COMPLETED
+        assert (job.created_count, job.error_count) == (1, 2)
+        assert [error["row"] for error in job.errors] == [2, 3]
+        assert "email" in job.errors[0]["errors"]
+        assert "status" in job.errors[1]["errors"]
+
+    def test_chunks_give_the_same_result(self):
+        """Test small chunks dedupe across chunk boundaries and save progress"""
+        progress = []
+
+        job = _import(
+            ImportJob.ENTITY_CONTACTS,
+            CONTACTS_CSV,
+            chunk_size=1,
+            on_progress=lambda job: progress.append(job.rows_processed),
+        )
+
+        assert progress == [1, 2, 3]
+        assert (job.created_count, job.updated_count) == (2, 1)
+        assert Contact.objects.count() == 2
+
+    def test_queries_per_chunk_are_constant(self):
+        """Test a chunk costs the same number of queries whatever its size"""
+
+        def queries_for(rows):
+            content = "first_name,last_name,email,company,tags\n" + "".join(
+                f"Pat,{index},pat{rows}-{index}@example.com,Co {index % 3},a;b\n"
+                for index in range(rows)
+            )
+            with CaptureQueriesContext(connection) as queries:
+                _import(ImportJob.ENTITY_CONTACTS, content)
+            return len(queries)
+
+        queries_for(3)  # creates the shared companies and tags
+        assert queries_for(5) == queries_for(40)
+
+    def test_unreadable_input_fails_the_job(self):
+        """Test undecodable input marks the job failed"""
+        job = ImportJob.objects.create(
+            entity=ImportJob.ENTITY_CONTACTS, file_format=ImportJob.FORMAT_CSV
+        )
+
+        run_import(job, io.BytesIO(b"first_name\n\xff\xfe\n"))
+
+        assert job.status == ImportJob.STATUS_FAILED
+        assert "Could not read csv input" in job.message
+        assert job.finished_at is not None
+
+
+@pytest.mark.django_db
+class TestCompanyAndDealImport:
+    """Tests for importing companies and deals"""
+
+    def test_companies_are_matched_on_name(self, company):
+        """Test companies are upserted by name from NDJSON"""
+        job = _import(
+            ImportJob.ENTITY_COMPANIES,
+            _ndjson(
+                {"name": "Acme Corp", "industry": "Retail"},
+                "{not json",
+                {"name": "Initech", "website": "https://initech.example.com"},
+            ),
+            file_format=ImportJob.FORMAT_NDJSON,
+        )
+
+        assert (job.created_count, job.updated_count, job.error_count) == (1, 1, 1)
+        assert job.errors[0]["row"] == 2
+        company.refresh_from_db()
+        assert company.industry == "Retail"
+        assert company.website == "https://acme.example.com"
+        assert find_stats_drift() == []
+
+    def test_deals_resolve_contacts_and_stages(self, contact, stage):
+        """Test deals are created against contacts by email and stages by name"""
+        job = _import(
+            ImportJob.ENTITY_DEALS,
+            _ndjson(
+                {
+                    "title": "Renewal",
+                    "contact_email": "John.Doe@example.com",
+                    "stage": "Negotiation",
+                    "amount": "1200.50",
+                    "tags": ["renewal"],
+                },
+                {"title": "Lost", "contact_email": "nobody@example.com", "stage": "X"},
+            ),
+            file_format=ImportJob.FORMAT_NDJSON,
+        )
+
+        assert (job.created_count, job.error_count) == (1, 1)
+        assert set(job.errors[0]["errors"]) == {"contact_email", "stage"}
+        deal = Deal.objects.get(title="Renewal")
+        assert deal.contact == contact
+        assert deal.stage.name == "Negotiation"
+        assert deal.amount == Decimal("1200.50")
+        assert list(deal.tags.values_list("name", flat=True)) == ["renewal"]
+        assert find_stats_drift() == []
+
+
+@pytest.mark.django_db
+class TestImportAPI:
+    """Tests for the import job endpoints"""
+
+    def test_upload_imports_file(self, authenticated_client, user):
+        """Test uploading a file runs the import and returns the job"""
+        upload = SimpleUploadedFile("contacts.csv", CONTACTS_CSV.encode())
+
+        response = authenticated_client.post(
+            IMPORT_JOBS, {"entity": "contacts", "file": upload}, format="multipart"
+        )
+
+        assert response.status_code == 201
+        assert response.data["status"] == ImportJob.STATUS_COMPLETED
+        assert response.data["file_format"] == ImportJob.FORMAT_CSV
+        assert response.data["created_count"] == 2
+        assert response.data["rows_per_second"] is not None
+        assert ImportJob.objects.get().created_by == user
+
+        detail = authenticated_client.get(
+            reverse("quickscale_crm:import-job-detail", args=[response.data["id"]])
+        )
+        assert detail.data["source_name"] == "contacts.csv"
+
+    def test_unknown_extension_needs_format(self, authenticated_client):
+        """Test uploads without a recognisable extension must name the format"""
+        upload = SimpleUploadedFile("contacts.txt", CONTACTS_CSV.encode())
+
+        response = authenticated_client.post(
+            IMPORT_JOBS, {"entity": "contacts", "file": upload}, format="multipart"
+        )
+
+        assert response.status_code == 400
+        assert "file_format" in response.data
+        assert not ImportJob.objects.exists()
+
+
+@pytest.mark.django_db
+class TestImportCommand:
+    """Tests for the crm_import management command"""
+
+    def test_imports_file(self, tmp_path):
+        """Test the command imports a file and reports the job"""
+        path = tmp_path / "contacts.csv"
+        path.write_text(CONTACTS_CSV)
+        out = io.StringIO()
+
+        call_command("crm_import", "contacts", str(path), stdout=out)
+
+        assert "3 rows, 2 created, 0 updated, 0 errors" in out.getvalue()
+        assert ImportJob.objects.get().source_name == "contacts.csv"
+
+    def test_failed_import_raises(self, tmp_path):
+        """Test unreadable files make the command fail"""
+        path = tmp_path / "contacts.data"
+        path.write_bytes(b"first_name\n\xff\n")
+
+        with pytest.raises(CommandError, match="failed"):
+            call_command("crm_import", "contacts", str(path), "--format", "csv")
+
+        assert ImportJob.objects.get().status == ImportJob.STATUS_FAILED
@@ -0,0 +1,187 @@
+"""Tests for CRM API cursor pagination"""
+
+import base64
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from quickscale_modules_crm.models import Company, Contact
+
+
+def _walk(client, url, params=None, direction="next"):
+    """Follow ``direction`` links from ``url`` and return the pages seen"""
+    pages = []
+    response = client.get(url, params or {})
+    while True:
+        assert response.status_code == 200
+        pages.append(response.data["results"])
+        link = response.data[direction]
+        if link is None:
+            return pages
+        response = client.get(link)
+
+
+def _rows(pages):
+    return [row for page in pages for row in page]
+
+
+@pytest.fixture
+def companies(db):
+    """Create companies whose names and creation times tie"""
+    created_at = timezone.now()
+    names = ["Beta", "Alpha", "Beta", "Gamma", "Alpha", "Beta", "Delta"]
+    rows = [Company.objects.create(name=name) for name in names]
+    Company.objects.update(created_at=created_at)
+    return rows
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    """Tests for CRMCursorPagination"""
+
+    def test_list_is_paginated_with_cursor_links(
+        self, authenticated_client, companies, settings
+    ):
+        """Test list responses are bounded pages with next/previous links"""
+        settings.CRM_PAGE_SIZE = 3
+
+        response = authenticated_client.get(reverse("quickscale_crm:company-list"))
+
+        assert set(response.data) == {"next", "previous", "results"}
+        assert len(response.data["results"]) == 3
+        assert response.data["previous"] is None
+        assert "cursor=" in response.data["next"]
+
+    def test_pages_cover_every_row_once_despite_ties(
+        self, authenticated_client, companies, settings
+    ):
+        """Test tied sort values neither repeat nor skip rows across pages"""
+        settings.CRM_PAGE_SIZE = 2
+
+        pages = _walk(authenticated_client, reverse("quickscale_crm:company-list"))
+        rows = _rows(pages)
+
+        assert len(pages) == 4
+        assert [row["name"] for row in rows] == sorted(c.name for c in companies)
+        assert sorted(row["id"] for row in rows) == sorted(c.id for c in companies)
+
+    def test_pagination_follows_ordering_filter(
+        self, authenticated_client, companies, settings
+    ):
+        """Test ?ordering= is honoured and kept across pages"""
+        settings.CRM_PAGE_SIZE = 2
+
+        rows = _rows(
+            _walk(
+                authenticated_client,
+                reverse("quickscale_crm:company-list"),
+                {"ordering": "-name"},
+            )
+        )
+
+        assert [row["name"] for row in rows] == sorted(
+            (c.name for c in companies), reverse=True
+        )
+        assert len({row["id"] for row in rows}) == len(companies)
+
+    def test_previous_links_walk_back_to_first_page(
+        self, authenticated_client, companies, settings
+    ):
+        """Test paging backwards returns the same rows in the same order"""
+        settings.CRM_PAGE_SIZE = 2
+        url = reverse("quickscale_crm:company-list")
+        forward = _walk(authenticated_client, url)
+        last_page = authenticated_client.get(url)
+        while last_page.data["next"]:
+            last_page = authenticated_client.get(last_page.data["next"])
+
+        backward = _walk(
+            authenticated_client, last_page.data["previous"], direction="previous"
+        )
+
+        assert backward[-1] == forward[0]
+        assert _rows(reversed(backward)) == _rows(forward[:-1])
+
+    @pytest.mark.parametrize("ordering", ["last_contacted_at", "-last_contacted_at"])
+    def test_nullable_ordering_pages_consistently(
+        self, authenticated_client, company, settings, ordering
+    ):
+        """Test NULL values in the ordering column page without gaps"""
+        settings.CRM_CONTACTS_PER_PAGE = 2
+        now = timezone.now()
+        for index in range(7):
+            Contact.objects.create(
+                first_name="Pat",
+                last_name=f"Lee {index}",
+                email=f"pat.{index}@example.com",
+                company=company,
+                last_contacted_at=None if index % 2 else now - timedelta(days=index),
+            )
+
+        rows = _rows(
+            _walk(
+                authenticated_client,
+                reverse("quickscale_crm:contact-list"),
+                {"ordering": ordering},
+            )
+        )
+
+        assert len({row["id"] for row in rows}) == 7
+        nulls = [row["last_contacted_at"] is None for row in rows]
+        if ordering.startswith("-"):
+            assert nulls == sorted(nulls)
+        else:
+            assert nulls == sorted(nulls, reverse=True)
+
+    def test_page_size_is_capped_by_max_page_size(
+        self, authenticated_client, companies, settings
+    ):
+        """Test clients cannot request more rows than CRM_MAX_PAGE_SIZE"""
+        settings.CRM_MAX_PAGE_SIZE = 4
+
+        response = authenticated_client.get(
+            reverse("quickscale_crm:company-list"), {"page_size": 1000}
+        )
+
+        assert len(response.data["results"]) == 4
+
+    def test_client_can_request_smaller_pages(self, authenticated_client, companies):
+        """Test ?page_size= selects the page size up to the maximum"""
+        response = authenticated_client.get(
+            reverse("quickscale_crm:company-list"), {"page_size": 2}
+        )
+
+        assert len(response.data["results"]) == 2
+
+    def test_contacts_use_contacts_per_page(
+        self, authenticated_client, company, settings
+    ):
+        """Test contact lists are sized by CRM_CONTACTS_PER_PAGE"""
+        settings.CRM_CONTACTS_PER_PAGE = 3
+        for index in range(5):
+            Contact.objects.create(
+                first_name="Sam",
+                last_name=f"Ray {index}",
+                email=f"sam.{index}@example.com",
+                company=company,
+            )
+
+        response = authenticated_client.get(reverse("quickscale_crm:contact-list"))
+
+        assert len(response.data["results"]) == 3
+
+    @pytest.mark.parametrize("position", ["not-json", "[1]", '{"a":1}'])
+    def test_invalid_cursor_is_not_found(
+        self, authenticated_client, companies, position
+    ):
+        """Test cursors that do not match the ordering are rejected"""
+        cursor = base64.b64encode(urlencode({"p": position}).encode()).decode()
+
+        response = authenticated_client.get(
+            reverse("quickscale_crm:company-list"), {"cursor": cursor}
+        )
+
+        assert response.status_code == 404
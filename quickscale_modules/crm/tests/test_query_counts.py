@@ -0,0 +1,173 @@
+"""Query-count regression tests for CRM API endpoints
+
+Each endpoint is requested twice, before and after more rows are added; the
+number of queries must not change, so serializers never query per row.
+"""
+
+from decimal import Decimal
+from itertools import count
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quickscale_modules_crm.models import (
+    Company,
+    Contact,
+    ContactNote,
+    Deal,
+    DealNote,
+    Stage,
+    Tag,
+)
+
+_sequence = count()
+
+
+def _add_rows(user, contact, deal, rows):
+    """Add ``rows`` related objects of every CRM model"""
+    for _ in range(rows):
+        number = next(_sequence)
+        tags = [
+            Tag.objects.create(name=f"tag-{number}-a"),
+            Tag.objects.create(name=f"tag-{number}-b"),
+        ]
+        company = Company.objects.create(name=f"Company {number}")
+        stage = Stage.objects.create(name=f"Stage {number}", order=10 + number)
+        other_contact = Contact.objects.create(
+            first_name="Jane",
+            last_name=f"Roe {number}",
+            email=f"jane.{number}@example.com",
+            company=company,
+        )
+        other_contact.tags.set(tags)
+        other_deal = Deal.objects.create(
+            title=f"Deal {number}",
+            contact=other_contact,
+            amount=Decimal("1000.00"),
+            stage=stage,
+            owner=user,
+        )
+        other_deal.tags.set(tags)
+        ContactNote.objects.create(contact=contact, created_by=user, text="Call")
+        DealNote.objects.create(deal=deal, created_by=user, text="Email")
+        Deal.objects.create(
+            title=f"Follow-up {number}",
+            contact=contact,
+            stage=deal.stage,
+            owner=user,
+        )
+
+
+def _count_queries(client, url):
+    """Return the number of queries a GET of ``url`` runs"""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+LIST_ENDPOINTS = [
+    "quickscale_crm:tag-list",
+    "quickscale_crm:company-list",
+    "quickscale_crm:contact-list",
+    "quickscale_crm:stage-list",
+    "quickscale_crm:deal-list",
+    "quickscale_crm:contact-note-list",
+    "quickscale_crm:deal-note-list",
+]
+
+
+@pytest.mark.django_db
+class TestQueryCounts:
+    """Endpoints run a constant number of queries however many rows exist"""
+
+    @pytest.fixture
+    def populated(self, user, contact, deal, tag):
+        """Attach tags to the base fixtures and add a first batch of rows"""
+        contact.tags.add(tag)
+        deal.tags.add(tag)
+        _add_rows(user, contact, deal, 2)
+        return user, contact, deal
+
+    @pytest.mark.parametrize("url_name", LIST_ENDPOINTS)
+    def test_list_endpoint_is_constant(self, authenticated_client, populated, url_name):
+        """Test list endpoints do not query per row"""
+        url = reverse(url_name)
+        baseline = _count_queries(authenticated_client, url)
+
+        _add_rows(*populated, 10)
+
+        assert _count_queries(authenticated_client, url) == baseline
+
+    @pytest.mark.parametrize("url_name", ["contact-notes", "deal-notes"])
+    def test_notes_action_is_constant(self, authenticated_client, populated, url_name):
+        """Test nested note listings do not query per note"""
+        user, contact, deal = populated
+        obj = contact if url_name == "contact-notes" else deal
+        url = reverse(f"quickscale_crm:{url_name}", args=[obj.id])
+        baseline = _count_queries(authenticated_client, url)
+
+        _add_rows(*populated, 10)
+
+        assert _count_queries(authenticated_client, url) == baseline
+
+    @pytest.mark.parametrize("url_name", ["contact-detail", "deal-detail"])
+    def test_detail_endpoint_is_constant(
+        self, authenticated_client, populated, url_name
+    ):
+        """Test detail views load nested notes and counts in bulk"""
+        user, contact, deal = populated
+        obj = contact if url_name == "contact-detail" else deal
+        url = reverse(f"quickscale_crm:{url_name}", args=[obj.id])
+        baseline = _count_queries(authenticated_client, url)
+
+        _add_rows(*populated, 10)
+
+        assert _count_queries(authenticated_client, url) == baseline
+
+    def test_company_list_is_single_query(
+        self, authenticated_client, populated, django_assert_num_queries
+    ):
+        """Test company contact counts come from the list query itself"""
+        with django_assert_num_queries(1):
+            authenticated_client.get(reverse("quickscale_crm:company-list"))
+
+    def test_annotated_counts_match_relations(self, authenticated_client, populated):
+        """Test annotated counts report the same values as counting"""
+        user, contact, deal = populated
+
+        companies = authenticated_client.get(
+            reverse("quickscale_crm:company-list")
+        ).data["results"]
+        stages = authenticated_client.get(reverse("quickscale_crm:stage-list")).data[
+            "results"
+        ]
+        detail = authenticated_client.get(
+            reverse("quickscale_crm:contact-detail", args=[contact.id])
+        ).data
+
+        assert {row["id"]: row["contact_count"] for row in companies} == {
+            company.id: company.contacts.count() for company in Company.objects.all()
+        }
+        assert {row["id"]: row["deal_count"] for row in stages} == {
+            stage.id: stage.deals.count() for stage in Stage.objects.all()
+        }
+        assert detail["deal_count"] == contact.deals.count() == 3
+        assert detail["company"]["contact_count"] == 1
+
+    def test_tag_filter_does_not_inflate_deal_count(
+        self, authenticated_client, populated, tag
+    ):
+        """Test filtering by a multi-valued relation keeps counts exact"""
+        user, contact, deal = populated
+        second_tag = Tag.objects.create(name="Partner")
+        contact.tags.add(second_tag)
+
+        response = authenticated_client.get(
+            reverse("quickscale_crm:contact-detail", args=[contact.id]),
+            {"tags": [tag.id, second_tag.id]},
+        )
+
+        assert response.data["deal_count"] == contact.deals.count()
@@ -0,0 +1,171 @@
+"""Tests for ranked CRM search"""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.request import Request
+
+from quickscale_modules_crm.models import Company, Contact
+from quickscale_modules_crm.search import SEARCH_RANK, CRMSearchFilter
+from quickscale_modules_crm.views import ContactViewSet
+
+CONTACT_LIST = reverse("quickscale_crm:contact-list")
+COMPANY_LIST = reverse("quickscale_crm:company-list")
+
+
+def _names(response):
+    return [row["last_name"] for row in response.data["results"]]
+
+
+@pytest.fixture
+def contacts(db):
+    """Create contacts matching "ann" exactly, as a prefix and as a substring"""
+    company = Company.objects.create(name="Globex")
+    return [
+        Contact.objects.create(
+            first_name=first, last_name=last, email=email, company=company
+        )
+        for first, last, email in [
+            ("Joanne", "Substring", "joanne@example.com"),
+            ("Annabel", "Prefix", "annabel@example.com"),
+            ("Ann", "Exact", "ann@example.com"),
+            ("Bob", "Unrelated", "bob@example.com"),
+        ]
+    ]
+
+
+@pytest.mark.django_db
+class TestContactSearch:
+    """Tests for relevance-ranked contact search"""
+
+    def test_best_matches_come_first(self, authenticated_client, contacts):
+        """Test exact matches rank above prefix and substring matches"""
+        response = authenticated_client.get(CONTACT_LIST, {"search": "ann"})
+
+        assert _names(response) == ["Exact", "Prefix", "Substring"]
+
+    def test_explicit_ordering_wins(self, authenticated_client, contacts):
+        """Test ?ordering= replaces relevance ordering"""
+        response = authenticated_client.get(
+            CONTACT_LIST, {"search": "ann", "ordering": "-first_name"}
+        )
+
+        assert _names(response) == ["Substring", "Prefix", "Exact"]
+
+    def test_every_term_must_match(self, authenticated_client, contacts):
+        """Test multiple terms narrow results like SearchFilter"""
+        response = authenticated_client.get(CONTACT_LIST, {"search": "ann exact"})
+
+        assert _names(response) == ["Exact"]
+
+    def test_searches_company_name(self, authenticated_client, contact, contacts):
+        """Test related company names are still searched"""
+        response = authenticated_client.get(CONTACT_LIST, {"search": "acme"})
+
+        assert _names(response) == ["Doe"]
+
+    def test_ranked_results_paginate(self, authenticated_client, contacts):
+        """Test cursor pagination walks relevance order without repeats"""
+        seen = []
+        response = authenticated_client.get(
+            CONTACT_LIST, {"search": "ann", "page_size": 1}
+        )
+        while True:
+            seen.extend(_names(response))
+            if not response.data["next"]:
+                break
+            response = authenticated_client.get(response.data["next"])
+
+        assert seen == ["Exact", "Prefix", "Substring"]
+
+    def test_unsearched_list_keeps_default_ordering(
+        self, authenticated_client, contacts
+    ):
+        """Test lists without ?search= use the view ordering"""
+        response = authenticated_client.get(CONTACT_LIST, {"page_size": 10})
+
+        assert _names(response) == sorted(_names(response))
+
+
+@pytest.mark.django_db
+class TestCompanySearch:
+    """Tests for relevance-ranked company search"""
+
+    def test_name_match_outranks_industry_substring(self, authenticated_client):
+        """Test a company named after the term ranks above partial matches"""
+        Company.objects.create(name="Retail Partners", industry="Retail")
+        Company.objects.create(name="Shop", industry="Online retailing")
+
+        response = authenticated_client.get(COMPANY_LIST, {"search": "retail"})
+
+        assert [row["name"] for row in response.data["results"]] == [
+            "Retail Partners",
+            "Shop",
+        ]
+
+
+@pytest.mark.django_db
+class TestCRMSearchFilter:
+    """Tests for the filter backend outside of HTTP"""
+
+    def test_annotates_rank(self, rf, contacts):
+        """Test filtered rows carry the search rank annotation"""
+        request = Request(rf.get("/", {"search": "ann"}))
+        queryset = CRMSearchFilter().filter_queryset(
+            request, Contact.objects.all(), ContactViewSet()
+        )
+
+        ranks = {row.last_name: getattr(row, SEARCH_RANK) for row in queryset}
+        assert ranks["Exact"] > ranks["Prefix"] > ranks["Substring"]
+        assert "Unrelated" not in ranks
+
+    def test_no_terms_leaves_queryset_unchanged(self, rf):
+        """Test the backend is a no-op without ?search="""
+        queryset = Contact.objects.all()
+
+        assert (
+            CRMSearchFilter().filter_queryset(
+                Request(rf.get("/")), queryset, ContactViewSet()
+            )
+            is queryset
+        )
+
+
+@pytest.mark.django_db
+class TestTrigramSearch:
+    """Tests for the pg_trgm matching used on PostgreSQL"""
+
+    def _trigram_sql(self, rf, search):
+        request = Request(rf.get("/", {"search": search}))
+        with patch.object(connection, "vendor", "postgresql"):
+            queryset = CRMSearchFilter().filter_queryset(
+                request, Contact.objects.all(), ContactViewSet()
+            )
+        return queryset.query.sql_with_params()
+
+    def test_compiles_word_similarity_with_escaped_operator(self, rf):
+        """Test each term is bound once per predicate and ``<%`` is escaped"""
+        sql, params = self._trigram_sql(rf, "jonh 50%")
+
+        # psycopg turns "%%" back into the "<%" operator when executing
+        assert '(%s <%% "quickscale_modules_crm_contact"."first_name")' in sql
+        assert '("quickscale_modules_crm_contact"."last_name" ILIKE %s)' in sql
+        assert "WORD_SIMILARITY(%s" in sql
+        assert "jonh" in params
+        assert "%jonh%" in params
+        assert "%50\\%%" in params
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Requires PostgreSQL with pg_trgm"
+    )
+    def test_misspelled_name_finds_contact(self, authenticated_client, contacts):
+        """Test a transposed name still matches through trigram similarity"""
+        Contact.objects.create(
+            first_name="John", last_name="Typo", email="john@example.com"
+        )
+
+        response = authenticated_client.get(CONTACT_LIST, {"search": "jonh"})
+
+        assert _names(response)[0] == "Typo"
@@ -0,0 +1,228 @@
+"""Tests for the CRM dashboard statistics rollup"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory
+from django.urls import reverse
+
+from quickscale_modules_crm.models import (
+    Company,
+    Contact,
+    CRMStats,
+    Deal,
+    Stage,
+)
+from quickscale_modules_crm.stats import find_stats_drift
+from quickscale_modules_crm.views import CRMDashboardView
+
+
+def _totals():
+    return CRMStats.objects.get(key=CRMStats.TOTALS_KEY)
+
+
+def _stage_row(stage):
+    return CRMStats.objects.get(stage=stage)
+
+
+@pytest.mark.django_db
+class TestStatsSignals:
+    """Tests for incremental rollup maintenance"""
+
+    def test_migration_builds_rows_for_default_stages(self):
+        """Test the rollup starts with totals and one row per stage"""
+        assert _totals().deal_count == 0
+        assert CRMStats.objects.filter(stage__isnull=False).count() == (
+            Stage.objects.count()
+        )
+        assert find_stats_drift() == []
+
+    def test_creates_are_counted(self, deal):
+        """Test new contacts, companies and deals update the rollup"""
+        totals = _totals()
+
+        assert totals.contact_count == 1
+        assert totals.company_count == 1
+        assert totals.deal_count == 1
+        assert totals.deal_value == Decimal("50000.00")
+        assert _stage_row(deal.stage).deal_count == 1
+        assert find_stats_drift() == []
+
+    def test_deal_update_moves_figures_between_stages(self, deal, closed_won_stage):
+        """Test changing a deal's stage and amount adjusts both stages"""
+        deal.stage = closed_won_stage
+        deal.amount = Decimal("60000.00")
+        deal.save()
+
+        assert _totals().deal_value == Decimal("60000.00")
+        assert _stage_row(closed_won_stage).deal_count == 1
+        assert _stage_row(closed_won_stage).deal_value == Decimal("60000.00")
+        assert find_stats_drift() == []
+
+    def test_cascading_deletes_are_subtracted(self, deal, contact, company):
+        """Test deleting a company removes its contacts and deals"""
+        Contact.objects.create(
+            first_name="Jane",
+            last_name="Roe",
+            email="jane@example.com",
+            company=company,
+        )
+
+        company.delete()
+
+        totals = _totals()
+        assert totals.company_count == 0
+        assert totals.contact_count == 0
+        assert totals.deal_count == 0
+        assert totals.deal_value == 0
+        assert find_stats_drift() == []
+
+    def test_new_stage_gets_an_empty_row(self):
+        """Test stages created after migration are listed on the dashboard"""
+        stage = Stage.objects.create(name="Discovery", order=0)
+
+        assert _stage_row(stage).deal_count == 0
+
+    def test_missing_row_is_recomputed(self, deal):
+        """Test adjusting a deleted row rebuilds it from source tables"""
+        CRMStats.objects.filter(stage=deal.stage).delete()
+
+        Deal.objects.create(
+            title="Second", contact=deal.contact, stage=deal.stage, amount=10
+        )
+
+        assert _stage_row(deal.stage).deal_count == 2
+        assert find_stats_drift() == []
+
+
+@pytest.mark.django_db
+class TestBulkActionStats:
+    """Tests for rollup maintenance by bulk deal actions"""
+
+    @pytest.fixture
+    def deals(self, deal, contact, stage):
+        """Create deals spread over two stages"""
+        other_stage = Stage.objects.create(name="Qualified", order=2)
+        second = Deal.objects.create(
+            title="Second", contact=contact, stage=other_stage, amount=Decimal("10")
+        )
+        return [deal, second]
+
+    @pytest.mark.parametrize(
+        ("url_name", "stage_name"),
+        [
+            ("quickscale_crm:deal-mark-won", "Closed-Won"),
+            ("quickscale_crm:deal-mark-lost", "Closed-Lost"),
+        ],
+    )
+    def test_mark_actions_move_figures(
+        self, authenticated_client, deals, url_name, stage_name
+    ):
+        """Test mark-won and mark-lost move deals between stage rows"""
+        response = authenticated_client.post(
+            reverse(url_name), {"deal_ids": [d.id for d in deals]}, format="json"
+        )
+
+        assert response.data["updated"] == 2
+        target = Stage.objects.get(name=stage_name)
+        assert _stage_row(target).deal_count == 2
+        assert _stage_row(target).deal_value == Decimal("50010.00")
+        assert _stage_row(deals[0].stage).deal_count == 0
+        assert find_stats_drift() == []
+
+    def test_bulk_update_stage_ignores_deals_already_there(
+        self, authenticated_client, deals
+    ):
+        """Test deals already in the target stage are not counted twice"""
+        target = deals[1].stage
+
+        response = authenticated_client.post(
+            reverse("quickscale_crm:deal-bulk-update-stage"),
+            {"deal_ids": [d.id for d in deals], "stage_id": target.id},
+            format="json",
+        )
+
+        assert response.data["updated"] == 2
+        assert _stage_row(target).deal_count == 2
+        assert _totals().deal_count == 2
+        assert find_stats_drift() == []
+
+
+@pytest.mark.django_db
+class TestRebuildCommand:
+    """Tests for the crm_rebuild_stats management command"""
+
+    def test_rebuild_repairs_drifted_rows(self, deal):
+        """Test the command recomputes every row from scratch"""
+        CRMStats.objects.update(deal_count=99, contact_count=42)
+
+        call_command("crm_rebuild_stats", verbosity=0)
+
+        assert find_stats_drift() == []
+        assert _totals().contact_count == 1
+
+    def test_check_reports_drift_without_writing(self, deal):
+        """Test --check fails on drift and leaves rows untouched"""
+        CRMStats.objects.filter(key=CRMStats.TOTALS_KEY).update(deal_count=99)
+
+        with pytest.raises(CommandError, match="totals"):
+            call_command("crm_rebuild_stats", "--check", verbosity=0)
+
+        assert _totals().deal_count == 99
+
+    def test_check_passes_when_current(self, deal):
+        """Test --check succeeds for an up-to-date rollup"""
+        call_command("crm_rebuild_stats", "--check", verbosity=0)
+
+
+@pytest.mark.django_db
+class TestDashboardStats:
+    """Tests for dashboard rendering from the rollup"""
+
+    def _context(self):
+        view = CRMDashboardView()
+        view.setup(RequestFactory().get("/"))
+        context = view.get_context_data()
+        list(context["recent_contacts"])
+        list(context["recent_deals"])
+        return context
+
+    def test_dashboard_reads_rollup(self, deal):
+        """Test dashboard figures come from the rollup"""
+        context = self._context()
+
+        assert context["total_contacts"] == 1
+        assert context["total_companies"] == 1
+        assert context["total_deals"] == 1
+        assert context["total_deal_value"] == Decimal("50000.00")
+        assert {"name": deal.stage.name, "deal_count": 1} in context["deals_by_stage"]
+        assert [row["name"] for row in context["deals_by_stage"]] == list(
+            Stage.objects.values_list("name", flat=True)
+        )
+
+    def test_dashboard_runs_constant_queries(
+        self, deal, contact, django_assert_num_queries
+    ):
+        """Test the dashboard costs three queries however large the CRM is"""
+        for index in range(20):
+            company = Company.objects.create(name=f"Company {index}")
+            Contact.objects.create(
+                first_name="Pat",
+                last_name=str(index),
+                email=f"pat{index}@example.com",
+                company=company,
+            )
+            Deal.objects.create(
+                title=f"Deal {index}", contact=contact, stage=deal.stage
+            )
+
+        with django_assert_num_queries(3):
+            self._context()
+
+    def test_missing_totals_are_rebuilt(self, deal):
+        """Test a wiped rollup is rebuilt instead of showing zeros"""
+        CRMStats.objects.all().delete()
+
+        assert self._context()["total_deals"] == 1
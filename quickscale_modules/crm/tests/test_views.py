@@ -13,7 +13,7 @@ class TestTagViewSet:
         """Test listing tags"""
         response = authenticated_client.get(reverse("quickscale_crm:tag-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
     def test_create_tag(self, authenticated_client):
         """Test creating a tag"""
@@ -39,7 +39,7 @@ class TestCompanyViewSet:
         """Test listing companies"""
         response = authenticated_client.get(reverse("quickscale_crm:company-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
     def test_create_company(self, authenticated_client):
         """Test creating a company"""
@@ -60,7 +60,7 @@ class TestCompanyViewSet:
             f"{reverse('quickscale_crm:company-list')}?search=Acme"
         )
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
 
 @pytest.mark.django_db
@@ -71,7 +71,7 @@ class TestContactViewSet:
         """Test listing contacts"""
         response = authenticated_client.get(reverse("quickscale_crm:contact-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
     def test_create_contact(self, authenticated_client, company):
         """Test creating a contact"""
@@ -128,7 +128,7 @@ class TestStageViewSet:
         """Test listing stages"""
         response = authenticated_client.get(reverse("quickscale_crm:stage-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
     def test_create_stage(self, authenticated_client):
         """Test creating a stage"""
@@ -146,7 +146,7 @@ class TestDealViewSet:
         """Test listing deals"""
         response = authenticated_client.get(reverse("quickscale_crm:deal-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
 
     def test_create_deal(self, authenticated_client, contact, stage):
         """Test creating a deal"""
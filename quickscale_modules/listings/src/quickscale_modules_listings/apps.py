@@ -12,6 +12,7 @@ class QuickscaleListingsConfig(AppConfig):
     verbose_name = "QuickScale Listings"
 
     def ready(self) -> None:
-        """Import signal handlers when app is ready"""
-        # No signals needed for listings module yet
-        pass
+        """Connect signal handlers once every listing model is registered"""
+        from .signals import connect_listing_signals
+
+        connect_listing_signals()
@@ -0,0 +1,46 @@
+"""Generation-versioned caching for QuickScale listings sitemaps"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+DEFAULT_LISTINGS_CACHE_ALIAS = "default"
+DEFAULT_SITEMAP_CACHE_TIMEOUT = 60 * 60
+_GENERATION_KEY = "quickscale:listings:sitemap:generation"
+
+
+def get_listings_cache() -> BaseCache:
+    """Return the cache backend named by ``LISTINGS_CACHE_ALIAS``"""
+    return caches[
+        str(getattr(settings, "LISTINGS_CACHE_ALIAS", DEFAULT_LISTINGS_CACHE_ALIAS))
+    ]
+
+
+def get_sitemap_cache_timeout() -> int:
+    """Return the sitemap cache timeout in seconds; 0 disables caching"""
+    return int(
+        getattr(
+            settings, "LISTINGS_SITEMAP_CACHE_TIMEOUT", DEFAULT_SITEMAP_CACHE_TIMEOUT
+        )
+    )
+
+
+def get_sitemap_generation() -> int:
+    """Return the current sitemap generation, seeding it from the clock"""
+    cache = get_listings_cache()
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, time.time_ns() // 1000, timeout=None)
+        generation = cache.get(_GENERATION_KEY, 0)
+    return int(generation)
+
+
+def bump_sitemap_generation() -> None:
+    """Invalidate every cached sitemap entry"""
+    cache = get_listings_cache()
+    try:
+        cache.incr(_GENERATION_KEY)
+    except ValueError:
+        get_sitemap_generation()
+        cache.incr(_GENERATION_KEY)
@@ -1,10 +1,37 @@
 """Listing models for QuickScale listings module"""
 
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+from django.conf import settings
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 
+storage_store_deduplicated_upload: Callable[..., Any] | None = None
+storage_deduplicated_uploads_enabled: Callable[..., bool] | None = None
+storage_build_image_variant_url: Callable[..., str] | None = None
+storage_helpers: Any | None
+try:
+    storage_helpers = import_module("quickscale_modules_storage.helpers")
+except ModuleNotFoundError:
+    storage_helpers = None
+
+if storage_helpers is not None:
+    storage_store_deduplicated_upload = getattr(
+        storage_helpers, "store_deduplicated_upload", None
+    )
+    storage_deduplicated_uploads_enabled = getattr(
+        storage_helpers, "deduplicated_uploads_enabled", None
+    )
+    storage_build_image_variant_url = getattr(
+        import_module("quickscale_modules_storage.variants"),
+        "build_image_variant_url",
+        None,
+    )
+
 
 class AbstractListing(models.Model):
     """Abstract base model for marketplace listings"""
@@ -79,8 +106,38 @@ class AbstractListing(models.Model):
         if self.status == "published" and not self.published_date:
             self.published_date = timezone.now()
 
+        self._store_featured_image_deduplicated()
         super().save(*args, **kwargs)
 
+    def _store_featured_image_deduplicated(self) -> None:
+        """Store a new featured image content-addressed, sharing identical files"""
+        image = self.featured_image
+        if (
+            not image
+            or image._committed
+            or storage_store_deduplicated_upload is None
+            or storage_deduplicated_uploads_enabled is None
+            or not storage_deduplicated_uploads_enabled(settings)
+        ):
+            return
+        stored = storage_store_deduplicated_upload(
+            image.storage, image.file, image.name
+        )
+        image.name = stored.name
+        image._committed = True
+
+    def get_featured_image_variant_url(
+        self, width: int, image_format: str = "webp"
+    ) -> str:
+        """Return a resized featured image URL, or the original without storage"""
+        if not self.featured_image:
+            return ""
+        if storage_build_image_variant_url is None:
+            return self.featured_image.url
+        return storage_build_image_variant_url(
+            str(self.featured_image.name), width, image_format
+        )
+
     def get_absolute_url(self) -> str:
         """Return the URL for this listing"""
         return reverse("quickscale_listings:listing_detail", kwargs={"slug": self.slug})
@@ -0,0 +1,35 @@
+"""Signal handlers for QuickScale listings module"""
+
+from typing import Any
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .caching import bump_sitemap_generation
+from .models import AbstractListing
+
+
+def invalidate_sitemaps(
+    sender: Any,  # noqa: ARG001  # Required by Django signal API
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Advance the sitemap generation when a listing changes"""
+    bump_sitemap_generation()
+
+
+def connect_listing_signals() -> None:
+    """Connect sitemap invalidation to every concrete listing model"""
+    for model in apps.get_models():
+        if not issubclass(model, AbstractListing):
+            continue
+        label = model._meta.label_lower
+        post_save.connect(
+            invalidate_sitemaps,
+            sender=model,
+            dispatch_uid=f"quickscale_listings_sitemaps_save_{label}",
+        )
+        post_delete.connect(
+            invalidate_sitemaps,
+            sender=model,
+            dispatch_uid=f"quickscale_listings_sitemaps_delete_{label}",
+        )
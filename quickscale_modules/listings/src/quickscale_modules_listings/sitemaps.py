@@ -0,0 +1,213 @@
+"""Streaming XML sitemaps for published listings
+
+Listings are split into segments of at most 50,000 URLs (the sitemap protocol
+limit) listed by a sitemap index. Segments are primary-key ranges rather than
+``OFFSET`` pages, and each one streams ``(slug, updated_at)`` rows with
+``iterator()``. Segment boundaries, and segments small enough for the cache
+backend, are cached under a sitemap generation that advances whenever a
+listing is saved or deleted.
+
+Like the list and detail views, the sitemap views default to ``Listing`` and
+can be subclassed for a concrete listing model::
+
+    class PropertySitemapIndexView(ListingSitemapIndexView):
+        model = PropertyListing
+        segment_url_name = "property_sitemap_segment"
+
+    class PropertySitemapSegmentView(ListingSitemapSegmentView):
+        model = PropertyListing
+        detail_url_name = "property_detail"
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import BaseCache
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpRequest, StreamingHttpResponse
+from django.urls import reverse
+from django.views import View
+
+from .caching import (
+    get_listings_cache,
+    get_sitemap_cache_timeout,
+    get_sitemap_generation,
+)
+from .models import Listing
+
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_ITERATOR_CHUNK_SIZE = 2_000
+SITEMAP_CONTENT_TYPE = "application/xml; charset=utf-8"
+# Stays under memcached's default 1 MB item limit
+SITEMAP_MAX_CACHED_SEGMENT_BYTES = 900 * 1024
+_SLUG_PLACEHOLDER = "quickscale-sitemap-slug"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def get_sitemap_segment_size() -> int:
+    """Return URLs per sitemap segment, capped at the protocol limit"""
+    size = int(getattr(settings, "LISTINGS_SITEMAP_SEGMENT_SIZE", SITEMAP_MAX_URLS))
+    return max(1, min(size, SITEMAP_MAX_URLS))
+
+
+def compute_segment_boundaries(queryset: QuerySet, segment_size: int) -> list[Any]:
+    """Return the first primary key of every ``segment_size`` rows"""
+    boundaries = []
+    ids = queryset.order_by("pk").values_list("pk", flat=True)
+    for position, pk in enumerate(ids.iterator(chunk_size=SITEMAP_ITERATOR_CHUNK_SIZE)):
+        if position % segment_size == 0:
+            boundaries.append(pk)
+    return boundaries
+
+
+def iter_segment_rows(
+    queryset: QuerySet, boundaries: list[Any], segment: int
+) -> Iterator[tuple[str, datetime]]:
+    """Stream ``(slug, updated_at)`` rows belonging to one segment"""
+    rows = queryset.filter(pk__gte=boundaries[segment])
+    if segment + 1 < len(boundaries):
+        rows = rows.filter(pk__lt=boundaries[segment + 1])
+    yield from (
+        rows.order_by("pk")
+        .values_list("slug", "updated_at")
+        .iterator(chunk_size=SITEMAP_ITERATOR_CHUNK_SIZE)
+    )
+
+
+def render_urlset(
+    rows: Iterable[tuple[str, datetime]], location_template: str
+) -> Iterator[str]:
+    """Yield a ``<urlset>`` document in chunks
+
+    ``location_template`` is an absolute detail URL containing the slug
+    placeholder, so the URL resolver runs once per segment, not per row.
+    """
+    yield f'{_XML_DECLARATION}<urlset xmlns="{_SITEMAP_NAMESPACE}">\n'
+    buffer = []
+    for slug, updated_at in rows:
+        location = escape(location_template.replace(_SLUG_PLACEHOLDER, slug))
+        buffer.append(
+            f"<url><loc>{location}</loc>"
+            f"<lastmod>{updated_at.date().isoformat()}</lastmod></url>\n"
+        )
+        if len(buffer) >= SITEMAP_ITERATOR_CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+    buffer.append("</urlset>\n")
+    yield "".join(buffer)
+
+
+def render_sitemap_index(locations: Iterable[str]) -> str:
+    """Return a ``<sitemapindex>`` document listing segment URLs"""
+    entries = "".join(
+        f"<sitemap><loc>{escape(location)}</loc></sitemap>\n" for location in locations
+    )
+    return (
+        f'{_XML_DECLARATION}<sitemapindex xmlns="{_SITEMAP_NAMESPACE}">\n'
+        f"{entries}</sitemapindex>\n"
+    )
+
+
+class ListingSitemapMixin:
+    """Shared queryset and caching for listing sitemap views"""
+
+    model: type[Model] = Listing
+    detail_url_name = "quickscale_listings:listing_detail"
+    segment_url_name = "quickscale_listings:sitemap_segment"
+
+    def get_queryset(self) -> QuerySet:
+        """Return published listings"""
+        return self.model._default_manager.filter(status="published")
+
+    def build_cache_key(self, *parts: Any) -> str:
+        """Return a cache key scoped to this model and the current generation"""
+        scope = ":".join(str(part) for part in parts)
+        return (
+            f"quickscale:listings:sitemap:{get_sitemap_generation()}:"
+            f"{self.model._meta.label_lower}:{scope}"
+        )
+
+    def get_segment_boundaries(self) -> list[Any]:
+        """Return cached segment boundaries for published listings"""
+        timeout = get_sitemap_cache_timeout()
+        segment_size = get_sitemap_segment_size()
+        key = self.build_cache_key("boundaries", segment_size)
+        cache = get_listings_cache()
+        boundaries = cache.get(key) if timeout > 0 else None
+        if boundaries is None:
+            boundaries = compute_segment_boundaries(self.get_queryset(), segment_size)
+            if timeout > 0:
+                cache.set(key, boundaries, timeout)
+        return boundaries
+
+
+class ListingSitemapIndexView(ListingSitemapMixin, View):
+    """Serve the sitemap index listing every listing segment"""
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        """Return the sitemap index document"""
+        segments = max(len(self.get_segment_boundaries()), 1)
+        locations = (
+            request.build_absolute_uri(reverse(self.segment_url_name, args=[segment]))
+            for segment in range(1, segments + 1)
+        )
+        return StreamingHttpResponse(
+            [render_sitemap_index(locations)], content_type=SITEMAP_CONTENT_TYPE
+        )
+
+
+class ListingSitemapSegmentView(ListingSitemapMixin, View):
+    """Stream one segment of listing URLs, served from cache when unchanged"""
+
+    def get(self, request: HttpRequest, segment: int) -> StreamingHttpResponse:
+        """Return the ``<urlset>`` document for ``segment`` (1-based)"""
+        boundaries = self.get_segment_boundaries()
+        if not 1 <= segment <= max(len(boundaries), 1):
+            raise Http404("Sitemap segment does not exist")
+
+        timeout = get_sitemap_cache_timeout()
+        key = self.build_cache_key(
+            "segment",
+            get_sitemap_segment_size(),
+            request.build_absolute_uri("/"),
+            segment,
+        )
+        cache = get_listings_cache()
+        cached = cache.get(key) if timeout > 0 else None
+        if cached is not None:
+            return StreamingHttpResponse([cached], content_type=SITEMAP_CONTENT_TYPE)
+
+        location_template = request.build_absolute_uri(
+            reverse(self.detail_url_name, kwargs={"slug": _SLUG_PLACEHOLDER})
+        )
+        rows: Iterable[tuple[str, datetime]] = (
+            iter_segment_rows(self.get_queryset(), boundaries, segment - 1)
+            if boundaries
+            else ()
+        )
+        chunks = render_urlset(rows, location_template)
+        if timeout > 0:
+            chunks = self._stream_and_cache(chunks, cache, key, timeout)
+        return StreamingHttpResponse(chunks, content_type=SITEMAP_CONTENT_TYPE)
+
+    @staticmethod
+    def _stream_and_cache(
+        chunks: Iterator[str], cache: BaseCache, key: str, timeout: int
+    ) -> Iterator[str]:
+        # Segments over the size cap are streamed without being cached
+        rendered: list[str] | None = []
+        size = 0
+        for chunk in chunks:
+            if rendered is not None:
+                size += len(chunk.encode("utf-8"))
+                if size > SITEMAP_MAX_CACHED_SEGMENT_BYTES:
+                    rendered = None
+                else:
+                    rendered.append(chunk)
+            yield chunk
+        if rendered is not None:
+            cache.set(key, "".join(rendered), timeout)
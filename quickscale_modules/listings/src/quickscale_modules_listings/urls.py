@@ -2,7 +2,7 @@
 
 from django.urls import path
 
-from . import views
+from . import sitemaps, views
 
 app_name = "quickscale_listings"
 
@@ -29,5 +29,15 @@ urlpatterns = [
     # These patterns use the base views - override with concrete model views in your project
     path("", views.ListingListView.as_view(), name="listing_list"),
     path("api/publish/", views.publish_listing_api, name="api_publish_listing"),
+    path(
+        "sitemap.xml",
+        sitemaps.ListingSitemapIndexView.as_view(),
+        name="sitemap_index",
+    ),
+    path(
+        "sitemap-<int:segment>.xml",
+        sitemaps.ListingSitemapSegmentView.as_view(),
+        name="sitemap_segment",
+    ),
     path("<slug:slug>/", views.ListingDetailView.as_view(), name="listing_detail"),
 ]
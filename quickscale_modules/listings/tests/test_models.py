@@ -1,9 +1,12 @@
 """Tests for listing models"""
 
 from decimal import Decimal
+from io import BytesIO
 
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
+from PIL import Image
 
 from tests.models import ConcreteListing
 
@@ -192,3 +195,54 @@ class TestListingModel:
         )
         listing.refresh_from_db()
         assert listing.description == long_text
+
+
+def _png_upload(name):
+    image_bytes = BytesIO()
+    Image.new("RGB", (24, 24), color="teal").save(image_bytes, format="PNG")
+    return SimpleUploadedFile(name, image_bytes.getvalue(), content_type="image/png")
+
+
+@pytest.mark.django_db
+class TestFeaturedImageDeduplication:
+    """Tests for content-addressed featured image storage"""
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, tmp_path, settings):
+        pytest.importorskip("quickscale_modules_storage.helpers")
+        settings.MEDIA_ROOT = str(tmp_path)
+        return tmp_path
+
+    def test_identical_images_share_one_file(self, media_root):
+        """Test listings with the same image bytes reference one stored file"""
+        first = ConcreteListing.objects.create(
+            title="First", featured_image=_png_upload("front.png")
+        )
+        second = ConcreteListing.objects.create(
+            title="Second", featured_image=_png_upload("copy.png")
+        )
+
+        assert first.featured_image.name == second.featured_image.name
+        assert first.featured_image.name.startswith("shared/images/")
+        assert len(list(media_root.rglob("*.png"))) == 1
+
+    def test_deduplication_can_be_disabled(self, settings):
+        """Test disabling deduplication keeps the field's upload_to path"""
+        settings.QUICKSCALE_STORAGE_DEDUPLICATE_UPLOADS = False
+
+        listing = ConcreteListing.objects.create(
+            title="Plain", featured_image=_png_upload("front.png")
+        )
+
+        assert listing.featured_image.name.startswith("listings/images/")
+
+    def test_featured_image_variant_url_points_at_variant_endpoint(self):
+        """Test variant URLs resolve through the storage variant endpoint"""
+        listing = ConcreteListing.objects.create(
+            title="Variant", featured_image=_png_upload("front.png")
+        )
+
+        url = listing.get_featured_image_variant_url(480)
+
+        assert url == f"/storage/variants/480/webp/{listing.featured_image.name}"
+        assert ConcreteListing(title="Empty").get_featured_image_variant_url(480) == ""
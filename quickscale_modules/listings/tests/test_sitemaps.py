@@ -0,0 +1,119 @@
+"""Tests for listing sitemaps"""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quickscale_modules_listings.caching import get_sitemap_generation
+from quickscale_modules_listings.sitemaps import compute_segment_boundaries
+from tests.models import ConcreteListing
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestListingSitemaps:
+    """Tests for the segmented listing sitemap views"""
+
+    def test_index_splits_listings_into_segments(
+        self, client, settings, listing_factory, draft_listing
+    ):
+        """Each segment lists at most LISTINGS_SITEMAP_SEGMENT_SIZE listings"""
+        settings.LISTINGS_SITEMAP_SEGMENT_SIZE = 2
+        listings = [
+            listing_factory(title=f"Mapped {index}", status="published")
+            for index in range(3)
+        ]
+
+        index = _content(client.get(reverse("concrete_listing_sitemap_index")))
+        first = _content(
+            client.get(reverse("concrete_listing_sitemap_segment", args=[1]))
+        )
+        second = _content(
+            client.get(reverse("concrete_listing_sitemap_segment", args=[2]))
+        )
+
+        assert index.count("<sitemap>") == 2
+        assert "http://testserver/concrete/sitemap-2.xml" in index
+        assert first.count("<url>") == 2
+        assert second.count("<url>") == 1
+        assert f"http://testserver/concrete/{listings[0].slug}/" in first
+        assert draft_listing.slug not in first + second
+        response = client.get(reverse("concrete_listing_sitemap_segment", args=[3]))
+        assert response.status_code == 404
+
+    def test_segments_are_cached_until_a_listing_changes(
+        self, client, published_listing, django_assert_num_queries
+    ):
+        """Warm segments skip the database and refresh after saves"""
+        url = reverse("concrete_listing_sitemap_segment", args=[1])
+        _content(client.get(url))
+
+        with django_assert_num_queries(0):
+            cached = _content(client.get(url))
+
+        published_listing.slug = "renamed-listing"
+        published_listing.save()
+
+        assert "published-listing" in cached
+        assert "renamed-listing" in _content(client.get(url))
+
+    def test_boundaries_are_primary_key_ranges(self, listing_factory):
+        """Boundaries are the first primary key of every segment"""
+        listings = [listing_factory(title=f"Range {index}") for index in range(3)]
+
+        boundaries = compute_segment_boundaries(ConcreteListing.objects.all(), 2)
+
+        assert boundaries == [listings[0].pk, listings[2].pk]
+
+    def test_only_listing_models_advance_the_generation(self, listing_factory):
+        """Receivers are connected per listing model, not to every save"""
+        generation = get_sitemap_generation()
+
+        get_user_model().objects.create_user(username="mapper", password="x")
+        assert get_sitemap_generation() == generation
+
+        listing_factory(title="Bumps")
+        assert get_sitemap_generation() > generation
+
+    def test_cache_alias_is_configurable(self, client, settings, published_listing):
+        """LISTINGS_CACHE_ALIAS selects the cache holding sitemap entries"""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "listings-default",
+            },
+            "sitemaps": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "listings-sitemaps",
+            },
+        }
+        settings.LISTINGS_CACHE_ALIAS = "sitemaps"
+
+        _content(client.get(reverse("concrete_listing_sitemap_segment", args=[1])))
+
+        assert caches["sitemaps"].get("quickscale:listings:sitemap:generation")
+        assert caches["default"].get("quickscale:listings:sitemap:generation") is None
+
+    def test_large_segments_are_streamed_without_caching(self, client, listing_factory):
+        """Segments over the cache size cap are re-read instead of cached"""
+        for index in range(3):
+            listing_factory(title=f"Large {index}", status="published")
+        url = reverse("concrete_listing_sitemap_segment", args=[1])
+
+        with patch(
+            "quickscale_modules_listings.sitemaps.SITEMAP_MAX_CACHED_SEGMENT_BYTES", 100
+        ):
+            _content(client.get(url))
+        with CaptureQueriesContext(connection) as queries:
+            refreshed = _content(client.get(url))
+
+        assert refreshed.count("<url>") == 3
+        assert len(queries) > 0
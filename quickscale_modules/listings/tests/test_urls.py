@@ -23,6 +23,13 @@ class TestListingUrls:
         url = reverse("quickscale_listings:api_publish_listing")
         assert url == "/listings/api/publish/"
 
+    def test_sitemap_urls(self):
+        """Test sitemap index and segment URLs resolve correctly"""
+        assert reverse("quickscale_listings:sitemap_index") == "/listings/sitemap.xml"
+        assert reverse("quickscale_listings:sitemap_segment", args=[2]) == (
+            "/listings/sitemap-2.xml"
+        )
+
     def test_listing_list_view_name(self):
         """Test listing list URL resolves to correct view name"""
         resolver = resolve("/listings/")
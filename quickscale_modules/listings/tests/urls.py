@@ -1,12 +1,29 @@
 """URL configuration for listings module tests"""
 
+from importlib.util import find_spec
+
 from django.urls import include, path
 
-from tests.views import ConcreteListingListView, ConcreteListingDetailView
+from tests.views import (
+    ConcreteListingDetailView,
+    ConcreteListingListView,
+    ConcreteListingSitemapIndexView,
+    ConcreteListingSitemapSegmentView,
+)
 
 urlpatterns = [
     path("listings/", include("quickscale_modules_listings.urls")),
     # Custom URLs for concrete model testing
+    path(
+        "concrete/sitemap.xml",
+        ConcreteListingSitemapIndexView.as_view(),
+        name="concrete_listing_sitemap_index",
+    ),
+    path(
+        "concrete/sitemap-<int:segment>.xml",
+        ConcreteListingSitemapSegmentView.as_view(),
+        name="concrete_listing_sitemap_segment",
+    ),
     path("concrete/", ConcreteListingListView.as_view(), name="concrete_listing_list"),
     path(
         "concrete/<slug:slug>/",
@@ -14,3 +31,7 @@ urlpatterns = [
         name="concrete_listing_detail",
     ),
 ]
+
+# Image variant endpoint, when the storage module is present
+if find_spec("quickscale_modules_storage") is not None:
+    urlpatterns.append(path("storage/", include("quickscale_modules_storage.urls")))
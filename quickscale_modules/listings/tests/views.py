@@ -1,5 +1,9 @@
 """Views for testing the listings module"""
 
+from quickscale_modules_listings.sitemaps import (
+    ListingSitemapIndexView,
+    ListingSitemapSegmentView,
+)
 from quickscale_modules_listings.views import ListingDetailView, ListingListView
 from tests.models import ConcreteListing
 
@@ -14,3 +18,17 @@ class ConcreteListingDetailView(ListingDetailView):
     """Concrete detail view for testing"""
 
     model = ConcreteListing
+
+
+class ConcreteListingSitemapIndexView(ListingSitemapIndexView):
+    """Concrete sitemap index view for testing"""
+
+    model = ConcreteListing
+    segment_url_name = "concrete_listing_sitemap_segment"
+
+
+class ConcreteListingSitemapSegmentView(ListingSitemapSegmentView):
+    """Concrete sitemap segment view for testing"""
+
+    model = ConcreteListing
+    detail_url_name = "concrete_listing_detail"
@@ -0,0 +1,33 @@
+"""Dispatch notification deliveries that are still waiting in the queue."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_notifications.services import (
+    NotificationError,
+    dispatch_queued_notifications,
+)
+
+
+class Command(BaseCommand):
+    """Management command for re-dispatching deferred deliveries."""
+
+    help = (
+        "Dispatch messages with queued deliveries, including deliveries deferred "
+        "by provider rate limiting"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Maximum number of messages to dispatch in this run.",
+        )
+
+    def handle(self, *args, **options) -> None:  # type: ignore[no-untyped-def]
+        try:
+            dispatched_count = dispatch_queued_notifications(limit=options["limit"])
+        except NotificationError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(f"Dispatched {dispatched_count} queued message(s)")
+        )
@@ -0,0 +1,95 @@
+"""Prune notification history according to the configured retention windows."""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quickscale_modules_notifications.services import (
+    NotificationError,
+    NotificationRetentionPolicy,
+    prune_notification_history,
+)
+
+
+class Command(BaseCommand):
+    """Management command for notification history retention."""
+
+    help = (
+        "Delete or compact old delivery events and strip rendered bodies from "
+        "sent notification messages"
+    )
+
+    def add_arguments(self, parser) -> None:  # type: ignore[no-untyped-def]
+        parser.add_argument(
+            "--event-retention-days",
+            type=int,
+            help=(
+                "Prune delivery events received more than this many days ago. "
+                "0 keeps events forever. Defaults to "
+                "QUICKSCALE_NOTIFICATIONS_EVENT_RETENTION_DAYS."
+            ),
+        )
+        parser.add_argument(
+            "--message-retention-days",
+            type=int,
+            help=(
+                "Strip rendered bodies from sent messages created more than this "
+                "many days ago. 0 keeps bodies forever. Defaults to "
+                "QUICKSCALE_NOTIFICATIONS_MESSAGE_RETENTION_DAYS."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help=(
+                "Rows modified per transaction. Defaults to "
+                "QUICKSCALE_NOTIFICATIONS_PRUNE_CHUNK_SIZE."
+            ),
+        )
+        parser.add_argument(
+            "--compact-events",
+            action="store_true",
+            help="Clear event payloads instead of deleting event rows.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help=(
+                "Write affected rows to gzip-compressed NDJSON files in this "
+                "directory before modifying them."
+            ),
+        )
+
+    def handle(self, *args, **options) -> None:  # type: ignore[no-untyped-def]
+        defaults = NotificationRetentionPolicy.from_settings()
+        policy = NotificationRetentionPolicy(
+            event_retention_days=_option_or_default(
+                options["event_retention_days"], defaults.event_retention_days
+            ),
+            message_retention_days=_option_or_default(
+                options["message_retention_days"], defaults.message_retention_days
+            ),
+            chunk_size=_option_or_default(options["chunk_size"], defaults.chunk_size),
+        )
+        archive_dir = Path(options["archive_dir"]) if options["archive_dir"] else None
+
+        try:
+            result = prune_notification_history(
+                policy=policy,
+                archive_dir=archive_dir,
+                compact_events=options["compact_events"],
+            )
+        except NotificationError as exc:
+            raise CommandError(str(exc)) from exc
+
+        event_action = "Compacted" if options["compact_events"] else "Deleted"
+        self.stdout.write(f"{event_action} {result.events_pruned} delivery event(s)")
+        self.stdout.write(
+            f"Stripped rendered bodies from {result.messages_compacted} message(s)"
+        )
+        for archive_path in result.archive_paths:
+            self.stdout.write(f"Archive: {archive_path}")
+        self.stdout.write(self.style.SUCCESS("Notification history prune complete"))
+
+
+def _option_or_default(value: int | None, default: int) -> int:
+    return default if value is None else value
@@ -0,0 +1,34 @@
+"""Index webhook delivery lookups on a normalized recipient column."""
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quickscale_modules_notifications", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationdelivery",
+            name="recipient_normalized",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower("recipient_email"),
+                output_field=models.CharField(max_length=255),
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notificationdelivery",
+            name="provider_message_id",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="notificationdelivery",
+            index=models.Index(
+                fields=["provider_message_id", "recipient_normalized"],
+                name="quickscale__provide_1e33b3_idx",
+            ),
+        ),
+    ]
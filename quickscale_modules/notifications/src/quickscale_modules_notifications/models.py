@@ -1,6 +1,7 @@
 """Data models for the QuickScale notifications module."""
 
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class NotificationSettings(models.Model):
@@ -108,7 +109,12 @@ class NotificationDelivery(models.Model):
         on_delete=models.CASCADE,
     )
     recipient_email = models.EmailField(max_length=255)
-    provider_message_id = models.CharField(max_length=255, blank=True, db_index=True)
+    recipient_normalized = models.GeneratedField(
+        expression=Lower("recipient_email"),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
+    provider_message_id = models.CharField(max_length=255, blank=True)
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -133,6 +139,9 @@ class NotificationDelivery(models.Model):
                 name="quickscale_notifications_unique_message_recipient",
             )
         ]
+        indexes = [
+            models.Index(fields=["provider_message_id", "recipient_normalized"]),
+        ]
         verbose_name = "Notification delivery"
         verbose_name_plural = "Notification deliveries"
 
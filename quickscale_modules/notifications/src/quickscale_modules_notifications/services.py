@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+import gzip
 import hashlib
 import hmac
 import json
 import os
 import time
 from email.utils import formataddr
-from typing import Any, Protocol, cast
+from pathlib import Path
+from typing import IO, Any, Protocol, cast
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.mail import EmailMultiAlternatives
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import validate_email
 from django.db import transaction
+from django.db.models import Q, QuerySet
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
@@ -56,6 +62,17 @@ _EVENT_STATUS_MAP = {
     "complained": NotificationDelivery.STATUS_COMPLAINED,
     "email.complained": NotificationDelivery.STATUS_COMPLAINED,
 }
+_DEFAULT_EVENT_RETENTION_DAYS = 90
+_DEFAULT_MESSAGE_RETENTION_DAYS = 30
+_DEFAULT_PRUNE_CHUNK_SIZE = 1000
+_DEFAULT_RATE_LIMIT_PER_SECOND = 2.0
+_DEFAULT_RATE_LIMIT_BURST = 2
+_RATE_LIMIT_CACHE_PREFIX = "quickscale:notifications:rate-limit"
+_PROVIDER_THROTTLED_STATUS_CODE = 429
+_DISPATCHABLE_DELIVERY_STATUSES = (
+    NotificationDelivery.STATUS_QUEUED,
+    NotificationDelivery.STATUS_FAILED,
+)
 
 
 class NotificationError(Exception):
@@ -286,6 +303,151 @@ _TEMPLATE_REGISTRY = {
 }
 
 
+@dataclass(frozen=True)
+class NotificationRetentionPolicy:
+    """Retention windows applied by notification history pruning."""
+
+    event_retention_days: int
+    message_retention_days: int
+    chunk_size: int
+
+    @classmethod
+    def from_settings(cls) -> NotificationRetentionPolicy:
+        """Create a retention policy from Django settings defaults."""
+        return cls(
+            event_retention_days=int(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_EVENT_RETENTION_DAYS",
+                    _DEFAULT_EVENT_RETENTION_DAYS,
+                )
+            ),
+            message_retention_days=int(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_MESSAGE_RETENTION_DAYS",
+                    _DEFAULT_MESSAGE_RETENTION_DAYS,
+                )
+            ),
+            chunk_size=int(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_PRUNE_CHUNK_SIZE",
+                    _DEFAULT_PRUNE_CHUNK_SIZE,
+                )
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class NotificationPruneResult:
+    """Row counts and archive files produced by a history prune run."""
+
+    events_pruned: int
+    messages_compacted: int
+    archive_paths: tuple[Path, ...]
+
+
+@dataclass(frozen=True)
+class NotificationRateLimitPolicy:
+    """Outbound provider throughput limits applied during live dispatch."""
+
+    rate_per_second: float
+    burst: int
+    cache_alias: str
+
+    @classmethod
+    def from_settings(cls) -> NotificationRateLimitPolicy:
+        """Create a rate-limit policy from Django settings defaults."""
+        return cls(
+            rate_per_second=float(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_RATE_LIMIT_PER_SECOND",
+                    _DEFAULT_RATE_LIMIT_PER_SECOND,
+                )
+            ),
+            burst=int(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_RATE_LIMIT_BURST",
+                    _DEFAULT_RATE_LIMIT_BURST,
+                )
+            ),
+            cache_alias=str(
+                getattr(
+                    settings,
+                    "QUICKSCALE_NOTIFICATIONS_RATE_LIMIT_CACHE_ALIAS",
+                    "default",
+                )
+            ),
+        )
+
+    def enabled(self) -> bool:
+        """Return whether outbound sends should be throttled at all."""
+        return self.rate_per_second > 0 and self.burst > 0
+
+
+class ProviderRateLimiter:
+    """Token bucket shared across workers through the Django cache.
+
+    Bucket state is stored under one cache key per provider so every worker
+    process draws from the same budget. Updates are serialized with a short
+    ``cache.add`` lock, which is atomic on the shared cache backends Django
+    ships with.
+    """
+
+    def __init__(
+        self,
+        provider_name: str,
+        *,
+        policy: NotificationRateLimitPolicy,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.provider_name = provider_name
+        self.policy = policy
+        self._cache = caches[policy.cache_alias]
+        self._clock = clock
+        self._state_key = f"{_RATE_LIMIT_CACHE_PREFIX}:{provider_name}"
+        self._lock_key = f"{self._state_key}:lock"
+
+    def reserve(self) -> float:
+        """Take one token, or return the seconds to wait before one is available."""
+        retry_interval = 1 / self.policy.rate_per_second
+        if not self._cache.add(self._lock_key, 1, timeout=1):
+            return min(retry_interval, 0.05)
+        try:
+            now = self._clock()
+            tokens = self._available_tokens(now)
+            if tokens >= 1:
+                self._store(tokens - 1, now)
+                return 0.0
+            self._store(tokens, now)
+            return (1 - tokens) * retry_interval
+        finally:
+            self._cache.delete(self._lock_key)
+
+    def drain(self) -> None:
+        """Empty the bucket after the provider reports throttling."""
+        self._store(0.0, self._clock())
+
+    def _available_tokens(self, now: float) -> float:
+        state = self._cache.get(self._state_key)
+        if state is None:
+            return float(self.policy.burst)
+        tokens, updated_at = state
+        refilled = tokens + max(now - updated_at, 0.0) * self.policy.rate_per_second
+        return min(float(self.policy.burst), refilled)
+
+    def _store(self, tokens: float, now: float) -> None:
+        refill_seconds = self.policy.burst / self.policy.rate_per_second
+        self._cache.set(
+            self._state_key,
+            (tokens, now),
+            timeout=max(int(refill_seconds) + 1, 1),
+        )
+
+
 def ensure_default_settings() -> NotificationSettings:
     """Ensure the read-only settings snapshot row exists and matches settings."""
     snapshot = NotificationSettingsSnapshot.from_settings()
@@ -462,15 +624,38 @@ def dispatch_notification_message(
     message_id: int,
     *,
     mailer: DeliveryMailer | None = None,
+    rate_limiter: ProviderRateLimiter | None = None,
 ) -> NotificationMessage:
-    """Dispatch queued recipient deliveries for a logical notification message."""
+    """Dispatch queued recipient deliveries for a logical notification message.
+
+    Live provider sends draw from the shared per-provider rate limiter. Send
+    slots are reserved without waiting before the message and delivery rows
+    are locked, so a throttled provider never holds those locks or the calling
+    worker. Deliveries left without a slot, or that the provider answers with
+    HTTP 429, stay queued for a later dispatch run instead of being marked
+    failed.
+    """
+    settings_snapshot = load_settings_snapshot()
+    _ensure_notifications_enabled(settings_snapshot)
+    configuration_issues = _validate_dispatch_settings(settings_snapshot)
+
+    resolved_rate_limiter = None
+    send_slots: int | None = None
+    if not configuration_issues:
+        resolved_rate_limiter = rate_limiter or _build_rate_limiter(settings_snapshot)
+    if resolved_rate_limiter is not None:
+        send_slots = _reserve_send_slots(
+            resolved_rate_limiter,
+            NotificationDelivery.objects.filter(
+                message_id=message_id,
+                status__in=_DISPATCHABLE_DELIVERY_STATUSES,
+            ).count(),
+        )
+
     with transaction.atomic():
         message = NotificationMessage.objects.select_for_update().get(pk=message_id)
         deliveries = list(message.deliveries.select_for_update().order_by("pk"))
-        settings_snapshot = load_settings_snapshot()
-        _ensure_notifications_enabled(settings_snapshot)
 
-        configuration_issues = _validate_dispatch_settings(settings_snapshot)
         if configuration_issues:
             error_message = "; ".join(configuration_issues)
             for delivery in deliveries:
@@ -482,11 +667,12 @@ def dispatch_notification_message(
 
         resolved_mailer = mailer or _send_email_message
         for delivery in deliveries:
-            if delivery.status not in {
-                NotificationDelivery.STATUS_QUEUED,
-                NotificationDelivery.STATUS_FAILED,
-            }:
+            if delivery.status not in _DISPATCHABLE_DELIVERY_STATUSES:
                 continue
+            if send_slots is not None:
+                if send_slots <= 0:
+                    break
+                send_slots -= 1
             try:
                 provider_message_id = _dispatch_single_delivery(
                     message=message,
@@ -494,9 +680,11 @@ def dispatch_notification_message(
                     settings_snapshot=settings_snapshot,
                     mailer=resolved_mailer,
                 )
-            except (
-                Exception
-            ) as exc:  # pragma: no cover - exception type intentionally broad
+            except Exception as exc:
+                if _is_provider_throttled(exc):
+                    if resolved_rate_limiter is not None:
+                        resolved_rate_limiter.drain()
+                    break
                 _mark_delivery_failed(delivery, str(exc))
                 continue
             _mark_delivery_sent(
@@ -508,6 +696,29 @@ def dispatch_notification_message(
         return message
 
 
+def dispatch_queued_notifications(
+    *,
+    limit: int | None = None,
+    mailer: DeliveryMailer | None = None,
+) -> int:
+    """Dispatch messages that still have queued deliveries, oldest first."""
+    message_ids = (
+        NotificationMessage.objects.filter(
+            deliveries__status=NotificationDelivery.STATUS_QUEUED
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+    if limit is not None:
+        message_ids = message_ids[:limit]
+    dispatched_count = 0
+    for message_id in list(message_ids):
+        dispatch_notification_message(message_id, mailer=mailer)
+        dispatched_count += 1
+    return dispatched_count
+
+
 def build_webhook_signature_headers(
     body: bytes,
     *,
@@ -571,7 +782,7 @@ def ingest_webhook_event(
         NotificationDelivery.objects.select_related("message")
         .filter(
             provider_message_id=provider_message_id,
-            recipient_email__iexact=recipient_email,
+            recipient_normalized=recipient_email,
         )
         .order_by("-pk")
         .first()
@@ -634,6 +845,120 @@ def ingest_webhook_event(
         )
 
 
+def prune_notification_history(
+    *,
+    policy: NotificationRetentionPolicy | None = None,
+    archive_dir: Path | None = None,
+    compact_events: bool = False,
+    now: datetime | None = None,
+) -> NotificationPruneResult:
+    """Prune old delivery events and strip rendered bodies from sent messages.
+
+    Rows are processed in primary-key chunks of ``policy.chunk_size``, each in
+    its own short transaction. When ``archive_dir`` is set, every affected row
+    is appended to a gzip-compressed NDJSON file before it is modified. A
+    retention of ``0`` days keeps that history forever.
+    """
+    resolved_policy = policy or NotificationRetentionPolicy.from_settings()
+    if resolved_policy.chunk_size < 1:
+        raise NotificationConfigurationError("Prune chunk size must be at least 1.")
+    resolved_now = now or timezone.now()
+    stamp = resolved_now.strftime("%Y%m%dT%H%M%SZ")
+    archive_paths: list[Path] = []
+
+    events_pruned = 0
+    if resolved_policy.event_retention_days > 0:
+        events = NotificationDeliveryEvent.objects.filter(
+            received_at__lt=resolved_now
+            - timedelta(days=resolved_policy.event_retention_days)
+        )
+        if compact_events:
+            events = events.exclude(payload_json={})
+        events_pruned = _prune_in_chunks(
+            events,
+            chunk_size=resolved_policy.chunk_size,
+            archive_path=(
+                archive_dir / f"notification-events-{stamp}.ndjson.gz"
+                if archive_dir is not None
+                else None
+            ),
+            archive_paths=archive_paths,
+            apply_chunk=(
+                (lambda chunk: chunk.update(payload_json={}))
+                if compact_events
+                else (lambda chunk: chunk.delete()[0])
+            ),
+        )
+
+    messages_compacted = 0
+    if resolved_policy.message_retention_days > 0:
+        messages = NotificationMessage.objects.filter(
+            status=NotificationMessage.STATUS_SENT,
+            created_at__lt=resolved_now
+            - timedelta(days=resolved_policy.message_retention_days),
+        ).filter(
+            Q(rendered_text__gt="") | Q(rendered_html__gt="") | ~Q(context_json={})
+        )
+        messages_compacted = _prune_in_chunks(
+            messages,
+            chunk_size=resolved_policy.chunk_size,
+            archive_path=(
+                archive_dir / f"notification-messages-{stamp}.ndjson.gz"
+                if archive_dir is not None
+                else None
+            ),
+            archive_paths=archive_paths,
+            apply_chunk=lambda chunk: chunk.update(
+                rendered_text="",
+                rendered_html="",
+                context_json={},
+            ),
+        )
+
+    return NotificationPruneResult(
+        events_pruned=events_pruned,
+        messages_compacted=messages_compacted,
+        archive_paths=tuple(archive_paths),
+    )
+
+
+def _prune_in_chunks(
+    queryset: QuerySet[Any],
+    *,
+    chunk_size: int,
+    archive_path: Path | None,
+    archive_paths: list[Path],
+    apply_chunk: Callable[[QuerySet[Any]], int],
+) -> int:
+    processed = 0
+    archive_file: IO[str] | None = None
+    with ExitStack() as archive_stack:
+        while True:
+            with transaction.atomic():
+                chunk_ids = list(
+                    queryset.order_by("pk").values_list("pk", flat=True)[:chunk_size]
+                )
+                if not chunk_ids:
+                    break
+                chunk = queryset.model.objects.filter(pk__in=chunk_ids)
+                if archive_path is not None:
+                    if archive_file is None:
+                        archive_path.parent.mkdir(parents=True, exist_ok=True)
+                        archive_file = archive_stack.enter_context(
+                            gzip.open(archive_path, "at", encoding="utf-8")
+                        )
+                        archive_paths.append(archive_path)
+                    for row in chunk.order_by("pk").values():
+                        archive_file.write(
+                            json.dumps(row, cls=DjangoJSONEncoder, sort_keys=True)
+                            + "\n"
+                        )
+                    archive_file.flush()
+                apply_chunk(chunk)
+                processed += len(chunk_ids)
+    return processed
+
+
 def _dispatch_single_delivery(
     *,
     message: NotificationMessage,
@@ -658,6 +983,29 @@ def _dispatch_single_delivery(
     return _extract_provider_message_id(email_message)
 
 
+def _build_rate_limiter(
+    settings_snapshot: NotificationSettingsSnapshot,
+) -> ProviderRateLimiter | None:
+    if not settings_snapshot.live_delivery_enabled():
+        return None
+    policy = NotificationRateLimitPolicy.from_settings()
+    if not policy.enabled():
+        return None
+    return ProviderRateLimiter(settings_snapshot.provider_name, policy=policy)
+
+
+def _reserve_send_slots(rate_limiter: ProviderRateLimiter, wanted: int) -> int:
+    """Take up to ``wanted`` send slots without waiting and return how many."""
+    granted = 0
+    while granted < wanted and rate_limiter.reserve() <= 0:
+        granted += 1
+    return granted
+
+
+def _is_provider_throttled(exc: Exception) -> bool:
+    return getattr(exc, "status_code", None) == _PROVIDER_THROTTLED_STATUS_CODE
+
+
 def _send_email_message(message: EmailMultiAlternatives) -> str:
     message.send(fail_silently=False)
     return _extract_provider_message_id(message)
@@ -0,0 +1,164 @@
+"""Tests for notifications module management commands."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import gzip
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from quickscale_modules_notifications.models import (
+    NotificationDeliveryEvent,
+    NotificationMessage,
+)
+
+
+def _create_event(delivery, *, key: str, age_days: int) -> NotificationDeliveryEvent:
+    event = NotificationDeliveryEvent.objects.create(
+        delivery=delivery,
+        provider_event_id=key,
+        idempotency_key=key,
+        event_type="email.delivered",
+        provider_message_id=delivery.provider_message_id,
+        status_after=delivery.status,
+        payload_json={"id": key, "type": "email.delivered"},
+    )
+    NotificationDeliveryEvent.objects.filter(pk=event.pk).update(
+        received_at=timezone.now() - timedelta(days=age_days)
+    )
+    return event
+
+
+def _age_message(message: NotificationMessage, *, age_days: int) -> None:
+    NotificationMessage.objects.filter(pk=message.pk).update(
+        created_at=timezone.now() - timedelta(days=age_days)
+    )
+
+
+@pytest.mark.django_db
+def test_notifications_prune_deletes_old_events_in_chunks(delivery_for_webhook) -> None:
+    old_events = [
+        _create_event(delivery_for_webhook, key=f"evt-old-{index}", age_days=120)
+        for index in range(5)
+    ]
+    recent_event = _create_event(delivery_for_webhook, key="evt-recent", age_days=1)
+    stdout = StringIO()
+
+    call_command(
+        "notifications_prune",
+        "--event-retention-days=90",
+        "--message-retention-days=0",
+        "--chunk-size=2",
+        stdout=stdout,
+    )
+
+    remaining_ids = set(NotificationDeliveryEvent.objects.values_list("pk", flat=True))
+    assert remaining_ids == {recent_event.pk}
+    assert not remaining_ids.intersection(event.pk for event in old_events)
+    assert "Deleted 5 delivery event(s)" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_notifications_prune_compacts_event_payloads(delivery_for_webhook) -> None:
+    old_event = _create_event(delivery_for_webhook, key="evt-old", age_days=120)
+
+    call_command(
+        "notifications_prune",
+        "--event-retention-days=90",
+        "--message-retention-days=0",
+        "--compact-events",
+        stdout=StringIO(),
+    )
+
+    old_event.refresh_from_db()
+    assert old_event.payload_json == {}
+    assert old_event.event_type == "email.delivered"
+
+
+@pytest.mark.django_db
+def test_notifications_prune_strips_only_old_sent_message_bodies(
+    delivery_for_webhook,
+    queued_message,
+) -> None:
+    sent_message = delivery_for_webhook.message
+    _age_message(sent_message, age_days=60)
+    _age_message(queued_message, age_days=60)
+
+    call_command(
+        "notifications_prune",
+        "--event-retention-days=0",
+        "--message-retention-days=30",
+        stdout=StringIO(),
+    )
+
+    sent_message.refresh_from_db()
+    queued_message.refresh_from_db()
+    assert sent_message.rendered_text == ""
+    assert sent_message.rendered_html == ""
+    assert sent_message.context_json == {}
+    assert sent_message.subject == "Webhook message"
+    assert queued_message.rendered_text == "Plain text body"
+
+
+@pytest.mark.django_db
+def test_notifications_prune_strips_html_only_message_bodies(
+    delivery_for_webhook,
+) -> None:
+    html_only_message = delivery_for_webhook.message
+    NotificationMessage.objects.filter(pk=html_only_message.pk).update(
+        rendered_text="", context_json={}
+    )
+    _age_message(html_only_message, age_days=60)
+    stdout = StringIO()
+
+    call_command(
+        "notifications_prune",
+        "--event-retention-days=0",
+        "--message-retention-days=30",
+        stdout=stdout,
+    )
+
+    html_only_message.refresh_from_db()
+    assert html_only_message.rendered_html == ""
+    assert "Stripped rendered bodies from 1 message(s)" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_notifications_prune_archives_rows_before_modifying_them(
+    delivery_for_webhook,
+    tmp_path,
+) -> None:
+    old_event = _create_event(delivery_for_webhook, key="evt-archived", age_days=120)
+    _age_message(delivery_for_webhook.message, age_days=60)
+    stdout = StringIO()
+
+    call_command(
+        "notifications_prune",
+        "--event-retention-days=90",
+        "--message-retention-days=30",
+        f"--archive-dir={tmp_path}",
+        stdout=stdout,
+    )
+
+    archives = {path.name.split("-")[1]: path for path in tmp_path.iterdir()}
+    with gzip.open(archives["events"], "rt", encoding="utf-8") as archive_file:
+        archived_events = [json.loads(line) for line in archive_file]
+    with gzip.open(archives["messages"], "rt", encoding="utf-8") as archive_file:
+        archived_messages = [json.loads(line) for line in archive_file]
+
+    assert [row["id"] for row in archived_events] == [old_event.pk]
+    assert archived_events[0]["payload_json"]["id"] == "evt-archived"
+    assert archived_messages[0]["rendered_text"] == "Plain text body"
+    assert not NotificationDeliveryEvent.objects.filter(pk=old_event.pk).exists()
+    assert "Archive:" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_notifications_prune_rejects_invalid_chunk_size() -> None:
+    with pytest.raises(CommandError, match="chunk size"):
+        call_command("notifications_prune", "--chunk-size=0", stdout=StringIO())
@@ -7,6 +7,7 @@ import os
 import time
 
 import pytest
+from django.db import connection
 from django.test import override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -26,10 +27,13 @@ from quickscale_modules_notifications.models import (
 )
 from quickscale_modules_notifications.services import (
     NotificationDisabledError,
+    NotificationRateLimitPolicy,
     NotificationTemplateError,
     NotificationWebhookSignatureError,
+    ProviderRateLimiter,
     build_webhook_signature_headers,
     dispatch_notification_message,
+    dispatch_queued_notifications,
     ensure_default_settings,
     ingest_webhook_event,
     render_notification,
@@ -540,3 +544,200 @@ def test_webhook_ingestion_is_replay_safe_and_updates_delivery_status(
         NotificationDeliveryEvent.objects.filter(delivery=delivery_for_webhook).count()
         == 1
     )
+
+
+@pytest.mark.django_db
+def test_webhook_ingestion_matches_recipient_case_insensitively(
+    delivery_for_webhook,
+) -> None:
+    NotificationDelivery.objects.filter(pk=delivery_for_webhook.pk).update(
+        recipient_email="Ops@Example.com"
+    )
+    payload = {
+        "id": "evt-mixed-case",
+        "type": "email.delivered",
+        "provider_message_id": delivery_for_webhook.provider_message_id,
+        "recipient": "OPS@example.COM",
+    }
+    body = json.dumps(payload).encode("utf-8")
+    headers = build_webhook_signature_headers(
+        body,
+        secret=os.environ["QUICKSCALE_NOTIFICATIONS_WEBHOOK_SECRET"],
+        timestamp=int(time.time()),
+    )
+
+    result = ingest_webhook_event(
+        body=body,
+        payload=payload,
+        signature=headers["X-QuickScale-Notifications-Signature"],
+        timestamp=headers["X-QuickScale-Notifications-Timestamp"],
+    )
+
+    assert result.delivery_id == delivery_for_webhook.pk
+    assert result.status == NotificationDelivery.STATUS_DELIVERED
+
+
+@pytest.mark.django_db
+def test_webhook_delivery_lookup_uses_composite_index(delivery_for_webhook) -> None:
+    query_plan = (
+        NotificationDelivery.objects.filter(
+            provider_message_id=delivery_for_webhook.provider_message_id,
+            recipient_normalized=delivery_for_webhook.recipient_email,
+        )
+        .order_by("-pk")
+        .explain()
+    )
+    index_names = {
+        index.name for index in NotificationDelivery._meta.indexes if index.name
+    }
+
+    assert any(index_name in query_plan for index_name in index_names)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ProviderThrottledError(Exception):
+    status_code = 429
+
+
+def _rate_limit_policy() -> NotificationRateLimitPolicy:
+    return NotificationRateLimitPolicy(
+        rate_per_second=1.0,
+        burst=2,
+        cache_alias="default",
+    )
+
+
+def test_provider_rate_limiter_shares_bucket_across_instances() -> None:
+    clock = _FakeClock()
+    policy = _rate_limit_policy()
+    first_worker = ProviderRateLimiter("shared-bucket", policy=policy, clock=clock)
+    second_worker = ProviderRateLimiter("shared-bucket", policy=policy, clock=clock)
+    other_provider = ProviderRateLimiter("other-bucket", policy=policy, clock=clock)
+
+    assert first_worker.reserve() == 0.0
+    assert second_worker.reserve() == 0.0
+    assert first_worker.reserve() == pytest.approx(1.0)
+    assert other_provider.reserve() == 0.0
+
+    clock.now += 1.0
+    assert second_worker.reserve() == 0.0
+
+
+class _RecordingRateLimiter(ProviderRateLimiter):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.savepoints_at_reserve: list[int] = []
+
+    def reserve(self) -> float:
+        self.savepoints_at_reserve.append(len(connection.savepoint_ids))
+        return super().reserve()
+
+
+@pytest.mark.django_db
+def test_dispatch_reserves_send_slots_before_locking_rows(queued_message) -> None:
+    clock = _FakeClock()
+    limiter = _RecordingRateLimiter(
+        "unlocked-bucket", policy=_rate_limit_policy(), clock=clock
+    )
+    outer_savepoints = len(connection.savepoint_ids)
+
+    dispatch_notification_message(
+        queued_message.pk,
+        mailer=lambda message: f"provider::{message.to[0]}",
+        rate_limiter=limiter,
+    )
+    queued_message.refresh_from_db()
+
+    assert queued_message.status == NotificationMessage.STATUS_SENT
+    assert limiter.savepoints_at_reserve == [outer_savepoints, outer_savepoints]
+
+
+@pytest.mark.django_db
+def test_dispatch_defers_deliveries_when_rate_limit_budget_is_exhausted(
+    queued_message,
+) -> None:
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter(
+        "deferred-bucket",
+        policy=_rate_limit_policy(),
+        clock=clock,
+    )
+    sent_to: list[str] = []
+
+    def fake_mailer(message) -> str:
+        sent_to.append(message.to[0])
+        return f"provider::{message.to[0]}"
+
+    limiter.reserve()
+    dispatch_notification_message(
+        queued_message.pk,
+        mailer=fake_mailer,
+        rate_limiter=limiter,
+    )
+    queued_message.refresh_from_db()
+
+    assert sent_to == ["alpha@example.com"]
+    assert queued_message.status == NotificationMessage.STATUS_PARTIAL
+    deferred = queued_message.deliveries.get(recipient_email="beta@example.com")
+    assert deferred.status == NotificationDelivery.STATUS_QUEUED
+
+    clock.now += 1.0
+    dispatch_notification_message(
+        queued_message.pk,
+        mailer=fake_mailer,
+        rate_limiter=limiter,
+    )
+    queued_message.refresh_from_db()
+
+    assert sent_to == ["alpha@example.com", "beta@example.com"]
+    assert queued_message.status == NotificationMessage.STATUS_SENT
+
+
+@pytest.mark.django_db
+def test_dispatch_keeps_provider_throttled_deliveries_queued(queued_message) -> None:
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter(
+        "throttled-bucket",
+        policy=_rate_limit_policy(),
+        clock=clock,
+    )
+    attempted: list[str] = []
+
+    def throttled_mailer(message) -> str:
+        attempted.append(message.to[0])
+        raise _ProviderThrottledError("Too many requests")
+
+    dispatch_notification_message(
+        queued_message.pk,
+        mailer=throttled_mailer,
+        rate_limiter=limiter,
+    )
+    queued_message.refresh_from_db()
+
+    assert attempted == ["alpha@example.com"]
+    assert queued_message.status == NotificationMessage.STATUS_QUEUED
+    assert set(queued_message.deliveries.values_list("status", flat=True)) == {
+        NotificationDelivery.STATUS_QUEUED
+    }
+    assert limiter.reserve() > 0
+
+
+@pytest.mark.django_db
+def test_dispatch_queued_notifications_sends_remaining_deliveries(
+    queued_message,
+) -> None:
+    dispatched_count = dispatch_queued_notifications(
+        mailer=lambda message: f"provider::{message.to[0]}"
+    )
+    queued_message.refresh_from_db()
+
+    assert dispatched_count == 1
+    assert queued_message.status == NotificationMessage.STATUS_SENT
+    assert dispatch_queued_notifications() == 0
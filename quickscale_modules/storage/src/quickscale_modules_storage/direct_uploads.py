@@ -0,0 +1,348 @@
+"""Direct-to-bucket uploads with presigned URLs.
+
+Clients upload media straight to the configured bucket instead of streaming it
+through a Django worker. The server issues a presigned POST or PUT scoped to a
+single `build_upload_path()` key and a signed upload token naming that key.
+Once the upload completes, the token is exchanged for a header-only validation
+of the stored object: one ranged read returns the image header and, from its
+``Content-Range``, the total object size.
+
+With the local backend the presigned URL points at the `direct_upload` view in
+this module, which accepts the same POST and PUT requests a bucket would. That
+keeps the flow usable in development and testable without a cloud account.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, Mapping
+
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import Storage, default_storage
+from django.urls import NoReverseMatch, reverse
+from PIL import Image
+
+from .helpers import (
+    DEFAULT_MAX_IMAGE_PIXELS,
+    StorageBackendSelection,
+    ValidatedUpload,
+    _read_setting,
+    build_upload_path,
+    inspect_image_header,
+    select_storage_backend,
+)
+
+DEFAULT_PRESIGNED_UPLOAD_EXPIRY = 15 * 60
+DEFAULT_UPLOAD_FINALIZE_WINDOW = 24 * 60 * 60
+# Enough for the header of PNG, GIF, WebP and typical JPEG files
+DEFAULT_HEADER_READ_BYTES = 64 * 1024
+PRESIGNED_UPLOAD_METHODS = ("POST", "PUT")
+_UPLOAD_TOKEN_SALT = "quickscale_modules_storage.direct_upload"
+
+
+@dataclass(frozen=True)
+class PresignedUpload:
+    """Instructions a client follows to upload one object directly."""
+
+    key: str
+    method: str
+    url: str
+    expires_in: int
+    upload_token: str
+    fields: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class UploadTicket:
+    """Claims carried by a verified upload token."""
+
+    key: str
+    content_type: str
+    max_size_bytes: int
+    claims: dict[str, Any]
+
+
+def get_presigned_upload_expiry(settings_obj: Any | Mapping[str, Any]) -> int:
+    """Return how long presigned upload URLs stay valid, in seconds."""
+    return int(
+        _read_setting(
+            settings_obj,
+            "QUICKSCALE_STORAGE_PRESIGNED_UPLOAD_EXPIRY",
+            DEFAULT_PRESIGNED_UPLOAD_EXPIRY,
+        )
+    )
+
+
+def get_upload_finalize_window(settings_obj: Any | Mapping[str, Any]) -> int:
+    """Return how long after issue an upload token can be finalized, in seconds."""
+    return int(
+        _read_setting(
+            settings_obj,
+            "QUICKSCALE_STORAGE_UPLOAD_FINALIZE_WINDOW",
+            DEFAULT_UPLOAD_FINALIZE_WINDOW,
+        )
+    )
+
+
+def build_s3_client(selection: StorageBackendSelection) -> Any:
+    """Return a boto3 S3 client for an S3-compatible storage selection."""
+    import boto3
+    from botocore.config import Config
+
+    options = selection.options
+    client_kwargs = {
+        "endpoint_url": options.get("endpoint_url"),
+        "region_name": options.get("region_name"),
+        "aws_access_key_id": options.get("access_key_id"),
+        "aws_secret_access_key": options.get("secret_access_key"),
+    }
+    return boto3.client(
+        "s3",
+        config=Config(signature_version="s3v4"),
+        **{name: value for name, value in client_kwargs.items() if value},
+    )
+
+
+def sign_upload_token(
+    key: str,
+    *,
+    content_type: str,
+    max_size_bytes: int,
+    claims: Mapping[str, Any] | None = None,
+) -> str:
+    """Return a signed token naming the only key an upload may write."""
+    return signing.dumps(
+        {
+            "key": key,
+            "content_type": content_type,
+            "max_size_bytes": int(max_size_bytes),
+            "claims": dict(claims or {}),
+        },
+        salt=_UPLOAD_TOKEN_SALT,
+        compress=True,
+    )
+
+
+def read_upload_token(token: str, *, max_age: int) -> UploadTicket:
+    """Verify an upload token and return its claims."""
+    try:
+        payload = signing.loads(token, salt=_UPLOAD_TOKEN_SALT, max_age=max_age)
+    except signing.SignatureExpired as exc:
+        raise ValueError("Upload token has expired") from exc
+    except signing.BadSignature as exc:
+        raise ValueError("Invalid upload token") from exc
+
+    return UploadTicket(
+        key=str(payload["key"]),
+        content_type=str(payload["content_type"]),
+        max_size_bytes=int(payload["max_size_bytes"]),
+        claims=dict(payload.get("claims") or {}),
+    )
+
+
+def create_presigned_upload(
+    settings_obj: Any | Mapping[str, Any],
+    *,
+    module_name: str,
+    asset_kind: str,
+    filename: str,
+    content_type: str,
+    max_size_bytes: int,
+    method: str = "POST",
+    claims: Mapping[str, Any] | None = None,
+    client: Any | None = None,
+) -> PresignedUpload:
+    """Issue a presigned POST or PUT for a new `build_upload_path()` key.
+
+    Presigned POSTs enforce ``max_size_bytes`` and ``content_type`` at the
+    bucket. Presigned PUTs cannot bound the body size, so finalization checks
+    it again from the stored object.
+    """
+    method = method.upper()
+    if method not in PRESIGNED_UPLOAD_METHODS:
+        raise ValueError(
+            "Upload method must be one of: " + ", ".join(PRESIGNED_UPLOAD_METHODS)
+        )
+
+    key = build_upload_path(module_name, asset_kind, filename)
+    expires_in = get_presigned_upload_expiry(settings_obj)
+    upload_token = sign_upload_token(
+        key,
+        content_type=content_type,
+        max_size_bytes=max_size_bytes,
+        claims=claims,
+    )
+    selection = select_storage_backend(settings_obj)
+
+    if not selection.use_s3_compatible:
+        try:
+            url = reverse("quickscale_storage:direct_upload", args=[upload_token])
+        except NoReverseMatch as exc:
+            raise ImproperlyConfigured(
+                "Include quickscale_modules_storage.urls to use direct uploads "
+                "with the local storage backend"
+            ) from exc
+        # Same shape as the S3 response: POST form fields, or PUT headers
+        content_type_field = {"Content-Type": content_type}
+        return PresignedUpload(
+            key=key,
+            method=method,
+            url=url,
+            expires_in=expires_in,
+            upload_token=upload_token,
+            fields=content_type_field if method == "POST" else {},
+            headers=content_type_field if method == "PUT" else {},
+        )
+
+    client = client or build_s3_client(selection)
+    bucket = selection.options["bucket_name"]
+    default_acl = str(selection.options.get("default_acl") or "")
+
+    if method == "POST":
+        fields = {"Content-Type": content_type}
+        conditions: list[Any] = [
+            {"Content-Type": content_type},
+            ["content-length-range", 1, int(max_size_bytes)],
+        ]
+        if default_acl:
+            fields["acl"] = default_acl
+            conditions.append({"acl": default_acl})
+        presigned = client.generate_presigned_post(
+            Bucket=bucket,
+            Key=key,
+            Fields=fields,
+            Conditions=conditions,
+            ExpiresIn=expires_in,
+        )
+        return PresignedUpload(
+            key=key,
+            method=method,
+            url=presigned["url"],
+            expires_in=expires_in,
+            upload_token=upload_token,
+            fields=dict(presigned["fields"]),
+        )
+
+    params = {"Bucket": bucket, "Key": key, "ContentType": content_type}
+    headers = {"Content-Type": content_type}
+    if default_acl:
+        params["ACL"] = default_acl
+        headers["x-amz-acl"] = default_acl
+    url = client.generate_presigned_url(
+        "put_object", Params=params, ExpiresIn=expires_in, HttpMethod="PUT"
+    )
+    return PresignedUpload(
+        key=key,
+        method=method,
+        url=url,
+        expires_in=expires_in,
+        upload_token=upload_token,
+        headers=headers,
+    )
+
+
+def read_object_header(
+    settings_obj: Any | Mapping[str, Any],
+    key: str,
+    *,
+    length: int = DEFAULT_HEADER_READ_BYTES,
+    client: Any | None = None,
+    storage: Storage | None = None,
+) -> tuple[int, bytes]:
+    """Return ``(total_size, leading_bytes)`` of a stored object.
+
+    For S3-compatible backends this is a single ranged ``GetObject``; the total
+    size comes from its ``Content-Range`` header, so the rest of the object is
+    never transferred.
+    """
+    selection = select_storage_backend(settings_obj)
+    if not selection.use_s3_compatible:
+        storage = storage or default_storage
+        if not storage.exists(key):
+            raise ValueError("Uploaded object was not found")
+        with storage.open(key, "rb") as stored_file:
+            header = stored_file.read(length)
+        return int(storage.size(key)), header
+
+    from botocore.exceptions import ClientError
+
+    client = client or build_s3_client(selection)
+    try:
+        response = client.get_object(
+            Bucket=selection.options["bucket_name"],
+            Key=key,
+            Range=f"bytes=0-{length - 1}",
+        )
+    except ClientError as exc:
+        error_code = str(exc.response.get("Error", {}).get("Code", ""))
+        if error_code in {"NoSuchKey", "404"}:
+            raise ValueError("Uploaded object was not found") from exc
+        if error_code == "InvalidRange":
+            raise ValueError("Uploaded object is empty") from exc
+        raise
+
+    header = response["Body"].read()
+    content_range = str(response.get("ContentRange") or "")
+    if "/" in content_range:
+        total_size = int(content_range.rsplit("/", 1)[1])
+    else:
+        total_size = int(response.get("ContentLength") or len(header))
+    return total_size, header
+
+
+def validate_uploaded_object(
+    settings_obj: Any | Mapping[str, Any],
+    key: str,
+    *,
+    max_size_bytes: int,
+    allowed_image_formats: set[str],
+    max_width: int | None = None,
+    max_height: int | None = None,
+    max_pixels: int | None = DEFAULT_MAX_IMAGE_PIXELS,
+    header_bytes: int = DEFAULT_HEADER_READ_BYTES,
+    client: Any | None = None,
+    storage: Storage | None = None,
+) -> ValidatedUpload:
+    """Validate a directly uploaded image from its size and header alone."""
+    size_bytes, header = read_object_header(
+        settings_obj, key, length=header_bytes, client=client, storage=storage
+    )
+    if size_bytes > max_size_bytes:
+        raise ValueError(f"File exceeds maximum upload size of {max_size_bytes} bytes")
+
+    image_format, width, height = inspect_image_header(
+        BytesIO(header),
+        allowed_image_formats=allowed_image_formats,
+        max_width=max_width,
+        max_height=max_height,
+        max_pixels=max_pixels,
+    )
+    Image.init()
+    return ValidatedUpload(
+        size_bytes=size_bytes,
+        content_type=Image.MIME.get(image_format, "application/octet-stream"),
+        width=width,
+        height=height,
+        format=image_format,
+    )
+
+
+__all__ = [
+    "DEFAULT_HEADER_READ_BYTES",
+    "DEFAULT_PRESIGNED_UPLOAD_EXPIRY",
+    "DEFAULT_UPLOAD_FINALIZE_WINDOW",
+    "PRESIGNED_UPLOAD_METHODS",
+    "PresignedUpload",
+    "UploadTicket",
+    "build_s3_client",
+    "create_presigned_upload",
+    "get_presigned_upload_expiry",
+    "get_upload_finalize_window",
+    "read_object_header",
+    "read_upload_token",
+    "sign_upload_token",
+    "validate_uploaded_object",
+]
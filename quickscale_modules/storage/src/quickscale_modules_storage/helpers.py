@@ -17,6 +17,14 @@ from django.utils.text import slugify
 from PIL import Image, UnidentifiedImageError
 
 
+# Largest image accepted by default (50 megapixels); header-checked before decoding
+DEFAULT_MAX_IMAGE_PIXELS = 50_000_000
+HASH_CHUNK_SIZE = 64 * 1024
+# Namespace shared by every module so identical uploads resolve to one object
+SHARED_MEDIA_MODULE = "shared"
+SHARED_MEDIA_KIND = "images"
+
+
 @dataclass(frozen=True)
 class StorageBackendSelection:
     """Resolved storage backend selection and optional provider options."""
@@ -27,6 +35,15 @@ class StorageBackendSelection:
     options: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class StoredUpload:
+    """Result of `store_deduplicated_upload`."""
+
+    name: str
+    digest: str
+    created: bool
+
+
 @dataclass(frozen=True)
 class ValidatedUpload:
     """Validated upload metadata returned by `validate_file_upload`."""
@@ -144,16 +161,78 @@ def build_upload_path(
     now: datetime | None = None,
     content: bytes | None = None,
     version: str | None = None,
+    content_digest: str | None = None,
 ) -> str:
-    """Build a cache-friendly upload path segmented by module and year/month."""
-    timestamp = now or datetime.now(tz=timezone.utc)
+    """Build a cache-friendly upload path segmented by module and year/month.
+
+    With ``content_digest`` the path is content-addressed instead: it depends
+    only on the digest and extension, so identical files map to one object.
+    """
     module_segment = slugify(module_name) or "module"
     kind_segment = slugify(asset_kind) or "asset"
     extension = Path(filename).suffix.lower() or ".bin"
+    if content_digest:
+        digest = content_digest.lower()
+        return f"{module_segment}/{kind_segment}/{digest[:2]}/{digest}{extension}"
+
+    timestamp = now or datetime.now(tz=timezone.utc)
     name = make_cache_friendly_name(filename, content=content, version=version)
     return f"{module_segment}/{kind_segment}/{timestamp:%Y/%m}/{name}{extension}"
 
 
+def hash_file_content(file_obj: Any) -> str:
+    """Return the SHA-256 hex digest of a file, read in one streaming pass."""
+    digest = hashlib.sha256()
+    if hasattr(file_obj, "chunks"):
+        chunks = file_obj.chunks(HASH_CHUNK_SIZE)
+    else:
+        file_obj.seek(0)
+        chunks = iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b"")
+    for chunk in chunks:
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+def deduplicated_uploads_enabled(settings_obj: Any | Mapping[str, Any]) -> bool:
+    """Return whether uploads should be stored content-addressed."""
+    return bool(
+        _read_setting(settings_obj, "QUICKSCALE_STORAGE_DEDUPLICATE_UPLOADS", True)
+    )
+
+
+def store_deduplicated_upload(
+    storage: Any,
+    file_obj: Any,
+    filename: str | None = None,
+    *,
+    module_name: str = SHARED_MEDIA_MODULE,
+    asset_kind: str = SHARED_MEDIA_KIND,
+) -> StoredUpload:
+    """Store a file under its content-addressed path unless it already exists.
+
+    The file is hashed in a streaming pass, so it is never held in memory. The
+    default namespace is shared across modules, so the same image uploaded to
+    the blog and to listings is stored once and served from one URL.
+    """
+    digest = hash_file_content(file_obj)
+    name = build_upload_path(
+        module_name,
+        asset_kind,
+        filename or str(getattr(file_obj, "name", "") or ""),
+        content_digest=digest,
+    )
+    if storage.exists(name):
+        return StoredUpload(name=name, digest=digest, created=False)
+
+    saved_name = storage.save(name, file_obj)
+    if saved_name != name:
+        # A concurrent upload of the same content won; keep the canonical copy.
+        storage.delete(saved_name)
+        return StoredUpload(name=name, digest=digest, created=False)
+    return StoredUpload(name=saved_name, digest=digest, created=True)
+
+
 def build_public_media_url(
     stored_reference: str,
     *,
@@ -187,42 +266,82 @@ def build_public_media_url(
     return relative_path
 
 
-def validate_file_upload(
-    uploaded_file: UploadedFile,
+def inspect_image_header(
+    stream: Any,
     *,
-    max_size_bytes: int,
     allowed_image_formats: set[str],
     max_width: int | None = None,
     max_height: int | None = None,
-) -> ValidatedUpload:
-    """Validate uploaded image by size, format, and optional dimensions."""
-    size_bytes = int(uploaded_file.size or 0)
-    if size_bytes > max_size_bytes:
-        raise ValueError(f"File exceeds maximum upload size of {max_size_bytes} bytes")
-
+    max_pixels: int | None = DEFAULT_MAX_IMAGE_PIXELS,
+    deep_verify: bool = False,
+) -> tuple[str, int, int]:
+    """Return ``(format, width, height)`` read from an image header.
+
+    ``stream`` only needs to hold the leading bytes of the image unless
+    ``deep_verify`` is set, so a ranged read of a stored object is enough.
+    """
     try:
-        uploaded_file.seek(0)
-        image = Image.open(uploaded_file)
-        image.load()
+        stream.seek(0)
+        with Image.open(stream) as image:
+            image_format = str(image.format or "").upper()
+            width, height = (int(value) for value in image.size)
+            if max_pixels is not None and width * height > max_pixels:
+                raise ValueError(
+                    f"Image exceeds maximum of {max_pixels} pixels ({width}x{height})"
+                )
+            if deep_verify:
+                image.load()
+    except Image.DecompressionBombError as exc:
+        raise ValueError("Image dimensions are too large to process safely") from exc
     except (UnidentifiedImageError, OSError) as exc:
         raise ValueError("Unsupported or invalid image file") from exc
-    finally:
-        uploaded_file.seek(0)
 
-    image_format = str(image.format or "").upper()
     if image_format not in allowed_image_formats:
         allowed_list = ", ".join(sorted(allowed_image_formats))
         raise ValueError(f"Unsupported image format. Allowed formats: {allowed_list}")
 
-    width = int(image.width)
-    height = int(image.height)
-
     if max_width is not None and width > max_width:
         raise ValueError(f"Image width exceeds maximum of {max_width} pixels")
 
     if max_height is not None and height > max_height:
         raise ValueError(f"Image height exceeds maximum of {max_height} pixels")
 
+    return image_format, width, height
+
+
+def validate_file_upload(
+    uploaded_file: UploadedFile,
+    *,
+    max_size_bytes: int,
+    allowed_image_formats: set[str],
+    max_width: int | None = None,
+    max_height: int | None = None,
+    max_pixels: int | None = DEFAULT_MAX_IMAGE_PIXELS,
+    deep_verify: bool = False,
+) -> ValidatedUpload:
+    """Validate uploaded image by size, format, and optional dimensions.
+
+    Format and dimensions come from the image header, so validation does not
+    decode pixel data. Images above ``max_pixels`` are rejected before any
+    decoding. Pass ``deep_verify=True`` to also decode the full image and
+    catch truncated or corrupt pixel data.
+    """
+    size_bytes = int(uploaded_file.size or 0)
+    if size_bytes > max_size_bytes:
+        raise ValueError(f"File exceeds maximum upload size of {max_size_bytes} bytes")
+
+    try:
+        image_format, width, height = inspect_image_header(
+            uploaded_file,
+            allowed_image_formats=allowed_image_formats,
+            max_width=max_width,
+            max_height=max_height,
+            max_pixels=max_pixels,
+            deep_verify=deep_verify,
+        )
+    finally:
+        uploaded_file.seek(0)
+
     content_type = str(uploaded_file.content_type or "application/octet-stream")
 
     return ValidatedUpload(
@@ -241,12 +360,20 @@ def sanitize_relative_media_path(path: str) -> str:
 
 
 __all__ = [
+    "DEFAULT_MAX_IMAGE_PIXELS",
+    "SHARED_MEDIA_KIND",
+    "SHARED_MEDIA_MODULE",
     "StorageBackendSelection",
+    "StoredUpload",
     "ValidatedUpload",
     "build_public_media_url",
     "build_upload_path",
+    "deduplicated_uploads_enabled",
+    "hash_file_content",
+    "inspect_image_header",
     "make_cache_friendly_name",
     "sanitize_relative_media_path",
     "select_storage_backend",
+    "store_deduplicated_upload",
     "validate_file_upload",
 ]
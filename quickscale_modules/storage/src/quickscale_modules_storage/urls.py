@@ -0,0 +1,16 @@
+"""URL configuration for QuickScale storage module."""
+
+from django.urls import path
+
+from . import views
+
+app_name = "quickscale_storage"
+
+urlpatterns = [
+    path("uploads/<str:token>/", views.direct_upload, name="direct_upload"),
+    path(
+        "variants/<int:width>/<str:image_format>/<path:source>",
+        views.image_variant,
+        name="image_variant",
+    ),
+]
@@ -0,0 +1,292 @@
+"""On-demand image variants persisted next to their originals.
+
+A variant is a stored image resized to one whitelisted width and encoded in
+one whitelisted format. It is generated the first time it is requested and
+saved under ``<dir>/variants/<filename>-<width>w.<ext>`` beside the original,
+so every later request is answered from storage (or the CDN in front of it)
+without decoding anything. Generation is guarded by a per-variant cache lock:
+concurrent first requests wait for the one doing the work instead of all
+resizing the same image.
+
+Only sources under ``QUICKSCALE_STORAGE_VARIANT_SOURCE_PREFIXES`` can be
+rendered, because the variant endpoint is public and republishes what it reads.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Any, Mapping
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .helpers import (
+    DEFAULT_MAX_IMAGE_PIXELS,
+    _read_setting,
+    sanitize_relative_media_path,
+)
+
+DEFAULT_VARIANT_WIDTHS = (160, 320, 480, 800, 1200, 1600)
+DEFAULT_VARIANT_FORMATS = ("webp", "avif", "jpeg", "png")
+DEFAULT_VARIANT_SOURCE_PREFIXES = ("blog/", "listings/", "shared/")
+DEFAULT_VARIANT_LOCK_TIMEOUT = 30
+DEFAULT_VARIANT_CACHE_SECONDS = 24 * 60 * 60
+VARIANTS_DIRECTORY = "variants"
+_LOCK_POLL_SECONDS = 0.05
+_LOCK_KEY_PREFIX = "quickscale:storage:variant-lock"
+_EXIF_ORIENTATION = 0x0112
+_VARIANT_FORMATS = {
+    "avif": ("AVIF", ".avif"),
+    "jpeg": ("JPEG", ".jpg"),
+    "png": ("PNG", ".png"),
+    "webp": ("WEBP", ".webp"),
+}
+_SAVE_KWARGS: dict[str, dict[str, Any]] = {
+    "AVIF": {"quality": 60},
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 80, "method": 4},
+}
+
+
+class VariantNotAllowed(ValueError):
+    """Requested width, format or source is outside the variant whitelist."""
+
+
+class VariantSourceNotFound(ValueError):
+    """The original image is missing or is not a decodable image."""
+
+
+class VariantBusy(RuntimeError):
+    """Another worker is still generating the variant."""
+
+
+def get_variant_widths(settings_obj: Any | Mapping[str, Any] = settings) -> set[int]:
+    """Return the whitelisted variant widths."""
+    widths = _read_setting(
+        settings_obj, "QUICKSCALE_STORAGE_VARIANT_WIDTHS", DEFAULT_VARIANT_WIDTHS
+    )
+    return {int(width) for width in widths if int(width) > 0}
+
+
+def get_variant_formats(settings_obj: Any | Mapping[str, Any] = settings) -> set[str]:
+    """Return whitelisted variant formats that Pillow can encode here."""
+    Image.init()
+    configured = _read_setting(
+        settings_obj, "QUICKSCALE_STORAGE_VARIANT_FORMATS", DEFAULT_VARIANT_FORMATS
+    )
+    formats = set()
+    for image_format in configured:
+        normalized = str(image_format).lower()
+        if normalized in _VARIANT_FORMATS and (
+            _VARIANT_FORMATS[normalized][0] in Image.SAVE
+        ):
+            formats.add(normalized)
+    return formats
+
+
+def get_variant_source_prefixes(
+    settings_obj: Any | Mapping[str, Any] = settings,
+) -> tuple[str, ...]:
+    """Return the media prefixes whose images may be served as variants."""
+    configured = _read_setting(
+        settings_obj,
+        "QUICKSCALE_STORAGE_VARIANT_SOURCE_PREFIXES",
+        DEFAULT_VARIANT_SOURCE_PREFIXES,
+    )
+    return tuple(
+        f"{str(prefix).strip('/')}/" for prefix in configured if str(prefix).strip("/")
+    )
+
+
+def get_variant_cache_seconds(settings_obj: Any | Mapping[str, Any] = settings) -> int:
+    """Return how long clients and CDNs may cache a variant redirect."""
+    return int(
+        _read_setting(
+            settings_obj,
+            "QUICKSCALE_STORAGE_VARIANT_CACHE_SECONDS",
+            DEFAULT_VARIANT_CACHE_SECONDS,
+        )
+    )
+
+
+def build_variant_name(source_name: str, width: int, image_format: str) -> str:
+    """Return where the ``width``/``image_format`` variant of a source is stored.
+
+    The full source filename, extension included, is kept in the variant name
+    so ``photo.jpg`` and ``photo.png`` in one directory get distinct variants.
+    """
+    directory, filename = posixpath.split(source_name)
+    extension = _VARIANT_FORMATS[image_format][1]
+    return posixpath.join(
+        directory, VARIANTS_DIRECTORY, f"{filename}-{width}w{extension}"
+    )
+
+
+def build_image_variant_url(source_name: str, width: int, image_format: str) -> str:
+    """Return the variant endpoint path for a stored image."""
+    return reverse(
+        "quickscale_storage:image_variant",
+        kwargs={
+            "width": width,
+            "image_format": image_format,
+            "source": sanitize_relative_media_path(source_name),
+        },
+    )
+
+
+def _clean_variant_request(
+    source_name: str, width: int, image_format: str
+) -> tuple[str, str]:
+    """Return the sanitized source and format, or raise `VariantNotAllowed`."""
+    image_format = image_format.lower()
+    if width not in get_variant_widths():
+        raise VariantNotAllowed(f"Width {width} is not an allowed variant width")
+    if image_format not in get_variant_formats():
+        raise VariantNotAllowed(f"Format {image_format} is not an allowed variant")
+
+    source = sanitize_relative_media_path(source_name)
+    segments = source.split("/")
+    if (
+        not source
+        or source != source_name.lstrip("/")
+        or ".." in segments
+        or VARIANTS_DIRECTORY in segments[:-1]
+    ):
+        raise VariantNotAllowed("Invalid variant source")
+    if not source.startswith(get_variant_source_prefixes()):
+        raise VariantNotAllowed("Variant source is not under a public prefix")
+    return source, image_format
+
+
+@contextmanager
+def variant_lock(name: str, *, timeout: int) -> Iterator[bool]:
+    """Hold the generation lock for one variant, yielding whether it was won.
+
+    The lock is a cache entry created with ``cache.add``, which is atomic on
+    shared cache backends, so it also serializes workers on different hosts.
+    It expires after ``timeout`` seconds in case its holder dies.
+    """
+    key = f"{_LOCK_KEY_PREFIX}:{name}"
+    owner = uuid.uuid4().hex
+    acquired = cache.add(key, owner, timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired and cache.get(key) == owner:
+            cache.delete(key)
+
+
+def _render_variant(
+    storage: Storage, source: str, width: int, image_format: str
+) -> bytes:
+    """Decode ``source`` once and return it encoded as the requested variant."""
+    pillow_format = _VARIANT_FORMATS[image_format][0]
+    try:
+        with storage.open(source, "rb") as source_file:
+            with Image.open(source_file) as image:
+                if image.width * image.height > DEFAULT_MAX_IMAGE_PIXELS:
+                    raise VariantSourceNotFound("Source image is too large")
+                # JPEG sources can be decoded at a reduced scale directly; a
+                # rotated source must keep ``width`` along both axes.
+                rotated = image.getexif().get(_EXIF_ORIENTATION, 1) in {5, 6, 7, 8}
+                draft_height = width if rotated else width * image.height // image.width
+                image.draft("RGB", (width, max(1, draft_height)))
+                rendered = ImageOps.exif_transpose(image)
+                # Never upscale: a width above the original keeps its size.
+                target_width = min(width, rendered.width)
+                target_size = (
+                    target_width,
+                    max(1, round(rendered.height * target_width / rendered.width)),
+                )
+                rendered = rendered.resize(target_size, Image.Resampling.LANCZOS)
+    except FileNotFoundError as exc:
+        raise VariantSourceNotFound("Source image was not found") from exc
+    except (Image.DecompressionBombError, UnidentifiedImageError, OSError) as exc:
+        raise VariantSourceNotFound("Source is not a valid image") from exc
+
+    if pillow_format == "JPEG" and rendered.mode not in {"RGB", "L"}:
+        rendered = rendered.convert("RGB")
+    elif pillow_format in {"AVIF", "WEBP"} and rendered.mode not in {"RGB", "RGBA"}:
+        rendered = rendered.convert("RGBA")
+    output = BytesIO()
+    rendered.save(output, format=pillow_format, **_SAVE_KWARGS[pillow_format])
+    return output.getvalue()
+
+
+def get_or_create_variant(
+    source_name: str,
+    width: int,
+    image_format: str,
+    *,
+    storage: Storage | None = None,
+    lock_timeout: int | None = None,
+    wait_timeout: float | None = None,
+) -> str:
+    """Return the stored name of a variant, generating it on first request.
+
+    Existing variants cost one ``exists`` check. Otherwise the per-variant lock
+    is taken, for at most ``lock_timeout`` seconds, and the variant rendered
+    and saved. Callers that lose the lock wait up to ``wait_timeout`` seconds
+    (default: ``lock_timeout``) for it to appear before raising `VariantBusy`.
+    """
+    storage = storage or default_storage
+    source, image_format = _clean_variant_request(source_name, width, image_format)
+    name = build_variant_name(source, width, image_format)
+    if storage.exists(name):
+        return name
+
+    if lock_timeout is None:
+        lock_timeout = int(
+            _read_setting(
+                settings,
+                "QUICKSCALE_STORAGE_VARIANT_LOCK_TIMEOUT",
+                DEFAULT_VARIANT_LOCK_TIMEOUT,
+            )
+        )
+    if wait_timeout is None:
+        wait_timeout = lock_timeout
+    deadline = time.monotonic() + wait_timeout
+    while True:
+        with variant_lock(name, timeout=lock_timeout) as acquired:
+            if acquired:
+                if storage.exists(name):
+                    return name
+                content = _render_variant(storage, source, width, image_format)
+                saved_name = storage.save(name, ContentFile(content))
+                if saved_name != name:
+                    # Written concurrently by a worker not sharing this cache.
+                    storage.delete(saved_name)
+                return name
+
+        if storage.exists(name):
+            return name
+        if time.monotonic() >= deadline:
+            raise VariantBusy("Variant is still being generated")
+        time.sleep(_LOCK_POLL_SECONDS)
+
+
+__all__ = [
+    "DEFAULT_VARIANT_FORMATS",
+    "DEFAULT_VARIANT_SOURCE_PREFIXES",
+    "DEFAULT_VARIANT_WIDTHS",
+    "VariantBusy",
+    "VariantNotAllowed",
+    "VariantSourceNotFound",
+    "build_image_variant_url",
+    "build_variant_name",
+    "get_or_create_variant",
+    "get_variant_formats",
+    "get_variant_source_prefixes",
+    "get_variant_widths",
+    "variant_lock",
+]
@@ -0,0 +1,135 @@
+"""Views for QuickScale storage module."""
+
+from __future__ import annotations
+
+from tempfile import SpooledTemporaryFile
+from typing import IO
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+)
+from django.utils.cache import patch_cache_control
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_safe
+
+from .direct_uploads import get_presigned_upload_expiry, read_upload_token
+from .helpers import build_public_media_url
+from .variants import (
+    VariantBusy,
+    VariantNotAllowed,
+    VariantSourceNotFound,
+    get_or_create_variant,
+    get_variant_cache_seconds,
+)
+
+_PUT_READ_CHUNK_BYTES = 64 * 1024
+# Larger PUT bodies spill to a temporary file instead of staying in memory
+_PUT_SPOOL_MEMORY_BYTES = 1024 * 1024
+# Public requests answer 503 quickly instead of holding a worker for the lock
+_VARIANT_VIEW_WAIT_SECONDS = 0.25
+
+
+@csrf_exempt
+def direct_upload(request: HttpRequest, token: str) -> HttpResponse:
+    """Accept a presigned POST or PUT for the local backend.
+
+    This stands in for the bucket endpoint when media is stored on the local
+    filesystem: the signed token names the only key the request may write, and
+    the size and content type limits match those of a presigned S3 POST.
+    """
+    if request.method not in {"POST", "PUT"}:
+        return JsonResponse(
+            {"error": "Method not allowed", "allowed_methods": ["POST", "PUT"]},
+            status=405,
+        )
+
+    try:
+        ticket = read_upload_token(token, max_age=get_presigned_upload_expiry(settings))
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=403)
+
+    if request.method == "POST":
+        uploaded = request.FILES.get("file")
+        if uploaded is None:
+            return JsonResponse({"error": "Missing file field"}, status=400)
+        content_type = request.POST.get("Content-Type", "")
+    else:
+        uploaded = None
+        content_type = request.content_type or ""
+
+    if content_type != ticket.content_type:
+        return JsonResponse({"error": "Content type does not match"}, status=403)
+    if default_storage.exists(ticket.key):
+        return JsonResponse({"error": "Object already exists"}, status=409)
+
+    with SpooledTemporaryFile(max_size=_PUT_SPOOL_MEMORY_BYTES) as spooled:
+        if uploaded is None:
+            # Stream the body rather than reading request.body, which is held
+            # in memory and capped by DATA_UPLOAD_MAX_MEMORY_SIZE. At most one
+            # byte more than allowed is read to detect oversize uploads.
+            size_bytes = _copy_request_body(
+                request, spooled, limit=ticket.max_size_bytes + 1
+            )
+            spooled.seek(0)
+            uploaded = File(spooled, name=ticket.key)
+        else:
+            size_bytes = int(uploaded.size or 0)
+
+        if not 0 < size_bytes <= ticket.max_size_bytes:
+            return JsonResponse(
+                {"error": f"Upload must be 1 to {ticket.max_size_bytes} bytes"},
+                status=413,
+            )
+        default_storage.save(ticket.key, uploaded)
+    return HttpResponse(status=204)
+
+
+def _copy_request_body(request: HttpRequest, target: IO[bytes], *, limit: int) -> int:
+    """Copy up to ``limit`` bytes of the request body and return the count."""
+    copied = 0
+    while copied < limit:
+        chunk = request.read(min(_PUT_READ_CHUNK_BYTES, limit - copied))
+        if not chunk:
+            break
+        target.write(chunk)
+        copied += len(chunk)
+    return copied
+
+
+@require_safe
+def image_variant(
+    request: HttpRequest, width: int, image_format: str, source: str
+) -> HttpResponse:
+    """Redirect to a stored image variant, generating it on first request."""
+    try:
+        name = get_or_create_variant(
+            source, width, image_format, wait_timeout=_VARIANT_VIEW_WAIT_SECONDS
+        )
+    except (VariantNotAllowed, VariantSourceNotFound) as exc:
+        raise Http404(str(exc)) from exc
+    except VariantBusy:
+        response = JsonResponse(
+            {"error": "Variant is being generated, retry shortly"}, status=503
+        )
+        response["Retry-After"] = "1"
+        return response
+
+    response = HttpResponseRedirect(
+        build_public_media_url(
+            name,
+            request=request,
+            public_base_url=str(
+                getattr(settings, "QUICKSCALE_STORAGE_PUBLIC_BASE_URL", "")
+            ),
+            media_url=str(getattr(settings, "MEDIA_URL", "/media/")),
+        )
+    )
+    patch_cache_control(response, public=True, max_age=get_variant_cache_seconds())
+    return response
@@ -0,0 +1,288 @@
+"""Tests for presigned direct uploads."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from quickscale_modules_storage.direct_uploads import (
+    build_s3_client,
+    create_presigned_upload,
+    read_object_header,
+    read_upload_token,
+    sign_upload_token,
+    validate_uploaded_object,
+)
+from quickscale_modules_storage.helpers import select_storage_backend
+
+S3_SETTINGS = {
+    "QUICKSCALE_STORAGE_BACKEND": "s3",
+    "AWS_STORAGE_BUCKET_NAME": "media-bucket",
+    "AWS_S3_REGION_NAME": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "test-key",
+    "AWS_SECRET_ACCESS_KEY": "test-secret",
+}
+
+
+def _png_bytes(size: tuple[int, int] = (64, 48)) -> bytes:
+    image_bytes = BytesIO()
+    Image.new("RGB", size, color="orange").save(image_bytes, format="PNG")
+    return image_bytes.getvalue()
+
+
+def _s3_client():
+    return build_s3_client(select_storage_backend(S3_SETTINGS))
+
+
+def _ranged_response(data: bytes, total_size: int) -> dict:
+    return {
+        "Body": StreamingBody(BytesIO(data), len(data)),
+        "ContentLength": len(data),
+        "ContentRange": f"bytes 0-{len(data) - 1}/{total_size}",
+    }
+
+
+class TestPresignedUploads:
+    def test_presigned_post_is_scoped_to_key_type_and_size(self) -> None:
+        presigned = create_presigned_upload(
+            S3_SETTINGS,
+            module_name="blog",
+            asset_kind="uploads",
+            filename="Hero.PNG",
+            content_type="image/png",
+            max_size_bytes=1024,
+            client=_s3_client(),
+        )
+
+        assert presigned.method == "POST"
+        assert presigned.key.startswith("blog/uploads/")
+        assert presigned.key.endswith(".png")
+        assert "media-bucket" in presigned.url
+        assert presigned.fields["key"] == presigned.key
+        assert presigned.fields["Content-Type"] == "image/png"
+        assert "policy" in presigned.fields
+        ticket = read_upload_token(presigned.upload_token, max_age=60)
+        assert ticket.key == presigned.key
+        assert ticket.max_size_bytes == 1024
+
+    def test_presigned_put_signs_key_and_content_type(self) -> None:
+        presigned = create_presigned_upload(
+            {**S3_SETTINGS, "AWS_DEFAULT_ACL": "public-read"},
+            module_name="blog",
+            asset_kind="uploads",
+            filename="hero.png",
+            content_type="image/png",
+            max_size_bytes=1024,
+            method="put",
+            client=_s3_client(),
+        )
+
+        parsed = urlparse(presigned.url)
+        assert presigned.method == "PUT"
+        assert parsed.path.endswith(presigned.key)
+        assert "X-Amz-Signature" in parse_qs(parsed.query)
+        assert presigned.headers == {
+            "Content-Type": "image/png",
+            "x-amz-acl": "public-read",
+        }
+
+    def test_unknown_method_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Upload method"):
+            create_presigned_upload(
+                S3_SETTINGS,
+                module_name="blog",
+                asset_kind="uploads",
+                filename="hero.png",
+                content_type="image/png",
+                max_size_bytes=1024,
+                method="PATCH",
+                client=_s3_client(),
+            )
+
+    def test_tampered_token_is_rejected(self) -> None:
+        token = sign_upload_token(
+            "blog/a.png", content_type="image/png", max_size_bytes=1
+        )
+
+        with pytest.raises(ValueError, match="Invalid upload token"):
+            read_upload_token(token[:-2] + "xx", max_age=60)
+
+    def test_local_backend_requires_storage_urls(self, settings) -> None:
+        settings.ROOT_URLCONF = "tests.settings"
+
+        with pytest.raises(ImproperlyConfigured):
+            create_presigned_upload(
+                {},
+                module_name="blog",
+                asset_kind="uploads",
+                filename="hero.png",
+                content_type="image/png",
+                max_size_bytes=1024,
+            )
+
+
+class TestRangedValidation:
+    def test_read_object_header_uses_one_ranged_get(self) -> None:
+        client = _s3_client()
+        data = _png_bytes()
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "get_object",
+                _ranged_response(data[:100], 5000),
+                {"Bucket": "media-bucket", "Key": "blog/a.png", "Range": "bytes=0-99"},
+            )
+            size, header = read_object_header(
+                S3_SETTINGS, "blog/a.png", length=100, client=client
+            )
+
+        assert size == 5000
+        assert header == data[:100]
+
+    def test_validate_uploaded_object_reads_dimensions_from_header(self) -> None:
+        client = _s3_client()
+        data = _png_bytes(size=(320, 200))
+        with Stubber(client) as stubber:
+            stubber.add_response("get_object", _ranged_response(data, len(data)))
+            validated = validate_uploaded_object(
+                S3_SETTINGS,
+                "blog/a.png",
+                max_size_bytes=1024 * 1024,
+                allowed_image_formats={"PNG"},
+                client=client,
+            )
+
+        assert (validated.width, validated.height) == (320, 200)
+        assert validated.format == "PNG"
+        assert validated.content_type == "image/png"
+        assert validated.size_bytes == len(data)
+
+    def test_validate_uploaded_object_rejects_oversize_from_content_range(
+        self,
+    ) -> None:
+        client = _s3_client()
+        data = _png_bytes()
+        with Stubber(client) as stubber:
+            stubber.add_response("get_object", _ranged_response(data, 50_000_000))
+            with pytest.raises(ValueError, match="maximum upload size"):
+                validate_uploaded_object(
+                    S3_SETTINGS,
+                    "blog/a.png",
+                    max_size_bytes=1024,
+                    allowed_image_formats={"PNG"},
+                    client=client,
+                )
+
+    def test_missing_object_is_reported(self) -> None:
+        client = _s3_client()
+        with Stubber(client) as stubber:
+            stubber.add_client_error("get_object", service_error_code="NoSuchKey")
+            with pytest.raises(ValueError, match="not found"):
+                read_object_header(S3_SETTINGS, "blog/missing.png", client=client)
+
+
+class TestLocalDirectUploadView:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.QUICKSCALE_STORAGE_BACKEND = "local"
+        return tmp_path
+
+    def _presign(self, settings, method: str = "PUT"):
+        return create_presigned_upload(
+            settings,
+            module_name="blog",
+            asset_kind="uploads",
+            filename="hero.png",
+            content_type="image/png",
+            max_size_bytes=10_000,
+            method=method,
+        )
+
+    def test_put_stores_object_at_signed_key(self, client, settings) -> None:
+        presigned = self._presign(settings)
+        data = _png_bytes()
+
+        response = client.put(presigned.url, data=data, content_type="image/png")
+
+        assert response.status_code == 204
+        validated = validate_uploaded_object(
+            settings,
+            presigned.key,
+            max_size_bytes=10_000,
+            allowed_image_formats={"PNG"},
+        )
+        assert (validated.width, validated.height) == (64, 48)
+
+    def test_post_stores_object_at_signed_key(
+        self, client, settings, media_root
+    ) -> None:
+        presigned = self._presign(settings, method="POST")
+
+        response = client.post(
+            presigned.url,
+            data={
+                **presigned.fields,
+                "file": SimpleUploadedFile("hero.png", _png_bytes()),
+            },
+        )
+
+        assert presigned.fields == {"Content-Type": "image/png"}
+        assert response.status_code == 204
+        assert (media_root / presigned.key).exists()
+
+    def test_put_streams_bodies_above_memory_upload_limit(
+        self, client, settings, media_root
+    ) -> None:
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 1_000
+        presigned = self._presign(settings)
+        data = b"x" * 5_000
+
+        response = client.put(presigned.url, data=data, content_type="image/png")
+
+        assert response.status_code == 204
+        assert (media_root / presigned.key).read_bytes() == data
+
+    def test_oversize_put_is_rejected(self, client, settings, media_root) -> None:
+        presigned = self._presign(settings)
+
+        response = client.put(
+            presigned.url, data=b"x" * 10_001, content_type="image/png"
+        )
+
+        assert response.status_code == 413
+        assert not (media_root / presigned.key).exists()
+
+    def test_content_type_must_match_token(self, client, settings) -> None:
+        presigned = self._presign(settings)
+
+        response = client.put(presigned.url, data=b"x", content_type="image/gif")
+
+        assert response.status_code == 403
+
+    def test_token_cannot_overwrite_existing_object(self, client, settings) -> None:
+        presigned = self._presign(settings)
+        client.put(presigned.url, data=_png_bytes(), content_type="image/png")
+
+        response = client.put(
+            presigned.url, data=_png_bytes(), content_type="image/png"
+        )
+
+        assert response.status_code == 409
+
+    def test_invalid_token_is_forbidden(self, client) -> None:
+        response = client.put(
+            "/storage/uploads/not-a-token/", data=b"x", content_type="image/png"
+        )
+
+        assert response.status_code == 403
+
+    def test_missing_local_object_is_reported(self, settings) -> None:
+        with pytest.raises(ValueError, match="not found"):
+            read_object_header(settings, "blog/uploads/missing.png")
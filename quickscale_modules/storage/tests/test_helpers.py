@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from io import BytesIO
+from unittest.mock import patch
 
 import pytest
+from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
 
 from quickscale_modules_storage.helpers import (
     build_public_media_url,
     build_upload_path,
+    deduplicated_uploads_enabled,
+    hash_file_content,
     make_cache_friendly_name,
     sanitize_relative_media_path,
     select_storage_backend,
+    store_deduplicated_upload,
     validate_file_upload,
 )
 
@@ -97,6 +103,80 @@ class TestUploadPathAndNaming:
         assert path.startswith("blog/uploads/2026/03/")
         assert path.endswith(".png")
 
+    def test_build_upload_path_with_digest_is_content_addressed(self) -> None:
+        digest = "AB" + "c" * 62
+        path = build_upload_path(
+            "shared",
+            "images",
+            "Hero.JPG",
+            now=datetime(2026, 3, 18, tzinfo=timezone.utc),
+            content_digest=digest,
+        )
+        assert path == f"shared/images/ab/{digest.lower()}.jpg"
+
+
+class TestDeduplicatedUploads:
+    def test_hash_file_content_streams_and_rewinds(self) -> None:
+        upload = SimpleUploadedFile("a.bin", b"x" * 200_000)
+
+        digest = hash_file_content(upload)
+
+        assert len(digest) == 64
+        assert upload.read(1) == b"x"
+
+    def test_identical_content_is_stored_once(self, tmp_path) -> None:
+        storage = FileSystemStorage(location=str(tmp_path))
+        content = _uploaded_image().read()
+
+        first = store_deduplicated_upload(
+            storage, SimpleUploadedFile("hero.png", content)
+        )
+        with patch.object(storage, "save", wraps=storage.save) as save_spy:
+            second = store_deduplicated_upload(
+                storage, SimpleUploadedFile("renamed.png", content)
+            )
+
+        assert first.created is True
+        assert second.created is False
+        assert second.name == first.name
+        assert first.name.startswith(f"shared/images/{first.digest[:2]}/")
+        save_spy.assert_not_called()
+        assert len(list(tmp_path.rglob("*.png"))) == 1
+
+    def test_different_content_gets_distinct_paths(self, tmp_path) -> None:
+        storage = FileSystemStorage(location=str(tmp_path))
+
+        first = store_deduplicated_upload(storage, _uploaded_image(size=(10, 10)))
+        second = store_deduplicated_upload(storage, _uploaded_image(size=(20, 20)))
+
+        assert first.name != second.name
+        assert second.created is True
+
+    def test_renamed_concurrent_write_is_discarded(self, tmp_path) -> None:
+        storage = FileSystemStorage(location=str(tmp_path))
+        upload = _uploaded_image()
+        digest = hash_file_content(upload)
+
+        with (
+            patch.object(storage, "exists", return_value=False),
+            patch.object(storage, "save", return_value="shared/images/dup.png"),
+            patch.object(storage, "delete") as delete_spy,
+        ):
+            stored = store_deduplicated_upload(storage, upload)
+
+        delete_spy.assert_called_once_with("shared/images/dup.png")
+        assert stored.created is False
+        assert stored.name.endswith(f"{digest}.png")
+
+    def test_deduplication_is_enabled_by_default(self) -> None:
+        assert deduplicated_uploads_enabled({}) is True
+        assert (
+            deduplicated_uploads_enabled(
+                {"QUICKSCALE_STORAGE_DEDUPLICATE_UPLOADS": False}
+            )
+            is False
+        )
+
 
 class TestPublicUrlHelpers:
     class _Request:
@@ -215,6 +295,69 @@ class TestValidateFileUpload:
                 max_height=360,
             )
 
+    def test_validate_file_upload_reads_header_without_decoding(self) -> None:
+        uploaded = _uploaded_image(image_format="PNG", size=(320, 200))
+
+        with patch.object(Image.Image, "load", autospec=True) as load:
+            validated = validate_file_upload(
+                uploaded,
+                max_size_bytes=2_000_000,
+                allowed_image_formats={"PNG"},
+            )
+
+        assert (validated.width, validated.height) == (320, 200)
+        load.assert_not_called()
+        assert uploaded.tell() == 0
+
+    def test_validate_file_upload_rejects_excessive_pixel_count(self) -> None:
+        uploaded = _uploaded_image(image_format="PNG", size=(100, 100))
+
+        with pytest.raises(ValueError, match="maximum of 9999 pixels"):
+            validate_file_upload(
+                uploaded,
+                max_size_bytes=2_000_000,
+                allowed_image_formats={"PNG"},
+                max_pixels=9_999,
+            )
+
+    def test_validate_file_upload_maps_decompression_bombs_to_value_error(
+        self,
+    ) -> None:
+        uploaded = _uploaded_image(image_format="PNG", size=(100, 100))
+
+        with (
+            patch.object(Image, "MAX_IMAGE_PIXELS", 1_000),
+            pytest.raises(ValueError, match="too large to process safely"),
+        ):
+            validate_file_upload(
+                uploaded,
+                max_size_bytes=2_000_000,
+                allowed_image_formats={"PNG"},
+                max_pixels=None,
+            )
+
+    def test_validate_file_upload_deep_verify_detects_truncated_data(self) -> None:
+        image_bytes = BytesIO()
+        Image.frombytes("L", (128, 128), os.urandom(128 * 128)).save(
+            image_bytes, format="PNG"
+        )
+        truncated = image_bytes.getvalue()[:-2048]
+
+        header_only = validate_file_upload(
+            SimpleUploadedFile("cut.png", truncated, content_type="image/png"),
+            max_size_bytes=2_000_000,
+            allowed_image_formats={"PNG"},
+        )
+        assert header_only.width == 128
+
+        with pytest.raises(ValueError, match="Unsupported or invalid image file"):
+            validate_file_upload(
+                SimpleUploadedFile("cut.png", truncated, content_type="image/png"),
+                max_size_bytes=2_000_000,
+                allowed_image_formats={"PNG"},
+                deep_verify=True,
+            )
+
 
 class TestPathSanitization:
     def test_sanitize_relative_media_path_removes_leading_slashes_and_traversal(
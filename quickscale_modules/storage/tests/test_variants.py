@@ -0,0 +1,260 @@
+"""Tests for on-demand image variants."""
+
+from __future__ import annotations
+
+import threading
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from quickscale_modules_storage import variants
+from quickscale_modules_storage.variants import (
+    VariantBusy,
+    VariantNotAllowed,
+    build_image_variant_url,
+    build_variant_name,
+    get_or_create_variant,
+    variant_lock,
+)
+
+
+def _store_image(
+    name: str = "blog/uploads/2026/03/hero.png",
+    *,
+    size: tuple[int, int] = (1600, 900),
+    image_format: str = "PNG",
+) -> str:
+    image_bytes = BytesIO()
+    Image.new("RGB", size, color="teal").save(image_bytes, format=image_format)
+    return default_storage.save(name, ContentFile(image_bytes.getvalue()))
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    cache.clear()
+    return tmp_path
+
+
+class TestVariantNames:
+    def test_variant_is_stored_next_to_original(self) -> None:
+        assert (
+            build_variant_name("blog/uploads/2026/03/hero.png", 800, "webp")
+            == "blog/uploads/2026/03/variants/hero.png-800w.webp"
+        )
+
+    def test_sources_differing_only_in_extension_get_distinct_variants(
+        self,
+    ) -> None:
+        jpeg_source = _store_image("blog/photos/photo.jpg", image_format="JPEG")
+        png_source = _store_image("blog/photos/photo.png", size=(400, 300))
+
+        jpeg_variant = get_or_create_variant(jpeg_source, 320, "webp")
+        png_variant = get_or_create_variant(png_source, 320, "webp")
+
+        assert jpeg_variant == "blog/photos/variants/photo.jpg-320w.webp"
+        assert png_variant == "blog/photos/variants/photo.png-320w.webp"
+        with default_storage.open(png_variant, "rb") as variant_file:
+            with Image.open(variant_file) as variant:
+                assert variant.size == (320, 240)
+
+    def test_variant_url_embeds_width_format_and_source(self) -> None:
+        assert (
+            build_image_variant_url("/shared/images/ab/abc.png", 480, "avif")
+            == "/storage/variants/480/avif/shared/images/ab/abc.png"
+        )
+
+
+class TestGetOrCreateVariant:
+    def test_first_request_renders_and_persists_variant(self) -> None:
+        source = _store_image()
+
+        name = get_or_create_variant(source, 800, "webp")
+
+        assert name == "blog/uploads/2026/03/variants/hero.png-800w.webp"
+        with default_storage.open(name, "rb") as variant_file:
+            with Image.open(variant_file) as variant:
+                assert variant.format == "WEBP"
+                assert variant.size == (800, 450)
+
+    def test_existing_variant_is_not_rendered_again(self) -> None:
+        source = _store_image()
+        get_or_create_variant(source, 480, "jpeg")
+
+        with patch.object(variants, "_render_variant") as render_spy:
+            name = get_or_create_variant(source, 480, "jpeg")
+
+        render_spy.assert_not_called()
+        assert name.endswith("variants/hero.png-480w.jpg")
+
+    def test_variants_never_upscale(self) -> None:
+        source = _store_image(size=(300, 200))
+
+        name = get_or_create_variant(source, 1600, "png")
+
+        with default_storage.open(name, "rb") as variant_file:
+            with Image.open(variant_file) as variant:
+                assert variant.size == (300, 200)
+
+    @pytest.mark.parametrize(
+        ("source", "width", "image_format"),
+        [
+            ("blog/hero.png", 801, "webp"),
+            ("blog/hero.png", 800, "tiff"),
+            ("blog/../secrets.png", 800, "webp"),
+            ("blog/variants/hero.png-800w.webp", 800, "webp"),
+        ],
+    )
+    def test_requests_outside_whitelist_are_rejected(
+        self, source: str, width: int, image_format: str
+    ) -> None:
+        with pytest.raises(VariantNotAllowed):
+            get_or_create_variant(source, width, image_format)
+
+    def test_whitelist_is_configurable(self, settings) -> None:
+        settings.QUICKSCALE_STORAGE_VARIANT_WIDTHS = [640]
+        settings.QUICKSCALE_STORAGE_VARIANT_FORMATS = ["jpeg"]
+        source = _store_image()
+
+        assert get_or_create_variant(source, 640, "jpeg").endswith("hero.png-640w.jpg")
+        with pytest.raises(VariantNotAllowed):
+            get_or_create_variant(source, 800, "jpeg")
+        with pytest.raises(VariantNotAllowed):
+            get_or_create_variant(source, 640, "webp")
+
+    def test_concurrent_first_requests_render_once(self) -> None:
+        source = _store_image()
+        render = variants._render_variant
+        calls: list[str] = []
+
+        def slow_render(*args, **kwargs):
+            calls.append(args[1])
+            threading.Event().wait(0.2)
+            return render(*args, **kwargs)
+
+        results: list[str] = []
+        with patch.object(variants, "_render_variant", side_effect=slow_render):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        get_or_create_variant(source, 320, "webp")
+                    )
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1
+        assert len(set(results)) == 1
+        assert len(results) == 4
+
+    def test_waiting_for_held_lock_times_out(self) -> None:
+        source = _store_image()
+        name = build_variant_name(source, 320, "webp")
+
+        with variant_lock(name, timeout=30) as acquired:
+            assert acquired is True
+            with pytest.raises(VariantBusy):
+                get_or_create_variant(source, 320, "webp", lock_timeout=0)
+
+    def test_wait_is_bounded_separately_from_lock_lifetime(self) -> None:
+        source = _store_image()
+        name = build_variant_name(source, 320, "webp")
+
+        with variant_lock(name, timeout=30) as acquired:
+            assert acquired is True
+            started = time.monotonic()
+            with pytest.raises(VariantBusy):
+                get_or_create_variant(
+                    source, 320, "webp", lock_timeout=30, wait_timeout=0
+                )
+
+        assert time.monotonic() - started < 1
+
+
+class TestImageVariantView:
+    def test_view_redirects_to_stored_variant(self, client) -> None:
+        source = _store_image()
+
+        response = client.get(build_image_variant_url(source, 800, "webp"))
+
+        assert response.status_code == 302
+        assert response["Location"] == (
+            "http://testserver/media/blog/uploads/2026/03/variants/hero.png-800w.webp"
+        )
+        assert "max-age=86400" in response["Cache-Control"]
+        assert "public" in response["Cache-Control"]
+
+    def test_view_uses_public_base_url(self, client, settings) -> None:
+        settings.QUICKSCALE_STORAGE_PUBLIC_BASE_URL = "https://cdn.example.com/media"
+        source = _store_image()
+
+        response = client.get(build_image_variant_url(source, 480, "jpeg"))
+
+        assert response["Location"] == (
+            "https://cdn.example.com/media/blog/uploads/2026/03/variants/hero.png-480w.jpg"
+        )
+
+    def test_view_returns_404_for_missing_or_invalid_sources(self, client) -> None:
+        default_storage.save("blog/not-image.png", ContentFile(b"plain text"))
+
+        for path in (
+            "/storage/variants/800/webp/blog/missing.png",
+            "/storage/variants/800/webp/blog/not-image.png",
+            "/storage/variants/799/webp/blog/not-image.png",
+        ):
+            assert client.get(path).status_code == 404
+
+    def test_view_refuses_sources_outside_public_prefixes(
+        self, client, settings
+    ) -> None:
+        source = _store_image("private/invoices/scan.png")
+
+        assert client.get(build_image_variant_url(source, 800, "webp")).status_code == (
+            404
+        )
+
+        settings.QUICKSCALE_STORAGE_VARIANT_SOURCE_PREFIXES = ["private/invoices"]
+        assert client.get(build_image_variant_url(source, 800, "webp")).status_code == (
+            302
+        )
+
+    def test_view_reports_busy_variant(self, client) -> None:
+        source = _store_image()
+
+        with patch(
+            "quickscale_modules_storage.views.get_or_create_variant",
+            side_effect=VariantBusy("busy"),
+        ):
+            response = client.get(build_image_variant_url(source, 800, "webp"))
+
+        assert response.status_code == 503
+        assert response["Retry-After"] == "1"
+
+    def test_view_does_not_wait_out_a_held_lock(self, client) -> None:
+        source = _store_image()
+        name = build_variant_name(source, 800, "webp")
+
+        with variant_lock(name, timeout=30) as acquired:
+            assert acquired is True
+            started = time.monotonic()
+            response = client.get(build_image_variant_url(source, 800, "webp"))
+
+        assert response.status_code == 503
+        assert time.monotonic() - started < 5
+
+    def test_view_rejects_unsafe_methods(self, client) -> None:
+        source = _store_image()
+
+        response = client.post(build_image_variant_url(source, 800, "webp"))
+
+        assert response.status_code == 405
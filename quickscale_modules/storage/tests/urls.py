@@ -1,7 +1,8 @@
 """URL configuration for storage module tests."""
 
-from django.urls import path
+from django.urls import include, path
 
 urlpatterns = [
     path("health/", lambda request: None),
+    path("storage/", include("quickscale_modules_storage.urls")),
 ]